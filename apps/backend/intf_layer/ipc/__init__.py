@@ -31,8 +31,9 @@ from apps.backend.telemetry_layer import F1TelemetryHandler
 from lib.ipc import IpcServerAsync, IpcPublisherAsync, IpcDealerAsync
 from lib.child_proc_mgmt import report_ipc_port_from_child
 
-from .command_handlers import (handleForwardingConfigChange, handleGetStats, handleManualSave,
-                               handleHeartbeatMissed, handleShutdown, handleUdpActionCodeChange)
+from .command_handlers import (handleCaptureDump, handleForwardingConfigChange, handleGetStats,
+                               handleManualSave, handleHeartbeatMissed, handleShutdown,
+                               handleUdpActionCodeChange)
 from ..telemetry_web_server import TelemetryWebServer
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
@@ -79,7 +80,12 @@ def registerIpcTask(
 
     @server.on("manual-save")
     async def _handle_manual_save(_args: dict):
-        return await handleManualSave(logger=logger, session_state=session_state)
+        return await handleManualSave(logger=logger, session_state=session_state,
+                                      file_format=telemetry_handler.m_capture_settings.save_file_format)
+
+    @server.on("capture-dump")
+    async def _handle_capture_dump(_args: dict):
+        return await handleCaptureDump(logger=logger, telemetry_handler=telemetry_handler)
 
     @server.on("udp-action-code-change")
     async def _handle_udp_action_code_change(args: dict):
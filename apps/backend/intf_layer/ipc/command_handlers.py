@@ -28,6 +28,7 @@ import os
 from apps.backend.state_mgmt_layer import SessionState
 from apps.backend.state_mgmt_layer.intf import ManualSaveRsp
 from apps.backend.telemetry_layer import F1TelemetryHandler
+from lib.config import SaveFileFormat
 from lib.error_status import PNG_LOST_CONN_TO_PARENT
 from lib.inter_task_communicator import AsyncInterTaskCommunicator
 
@@ -39,16 +40,28 @@ from ..telemetry_web_server import TelemetryWebServer
 async def handleManualSave(
         logger: logging.Logger,
         session_state: SessionState,
+        file_format: SaveFileFormat = SaveFileFormat.JSON,
         ) -> dict:
     """Handle manual save command"""
     try:
-        return await ManualSaveRsp(logger, session_state).saveToDisk()
+        return await ManualSaveRsp(logger, session_state, file_format=file_format).saveToDisk()
     except ValueError as e:
         return {"status": "error", "message": str(e)}
     except Exception as e:  # pylint: disable=broad-except
         logger.exception("Unexpected error during manual save")
         return {"status": "error", "message": f"{e.__class__.__name__}: {e}"}
 
+async def handleCaptureDump(
+        logger: logging.Logger,
+        telemetry_handler: F1TelemetryHandler,
+        ) -> dict:
+    """Handle capture-dump command: write the rolling packet capture buffer to disk"""
+    try:
+        return await telemetry_handler.dumpPacketRing()
+    except OSError as e:
+        logger.exception("Failed to dump rolling packet capture")
+        return {"status": "error", "message": str(e)}
+
 async def handleShutdown(msg: dict, logger: logging.Logger) -> dict:
     """Handle shutdown command"""
 
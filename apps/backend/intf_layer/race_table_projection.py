@@ -0,0 +1,139 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class RaceTableProjection:
+    """The part of the race-table-update payload a client registered for.
+
+    Registered as the "projection" of the register-client message, all keys optional:
+        {
+            "fields": ["driver-info", "lap-info.best-lap"],   # Table entry sections, or single keys within a section
+            "session-fields": ["circuit", "current-lap"],    # Keys outside the table
+            "around-player": 3                               # Only drivers within 3 positions of the player
+        }
+    In spectator mode the spectated car stands in for the player. driver-info.index is always kept, so clients can
+    tell the rows apart. The time trial payload has no table entries and is only trimmed by session-fields.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        """
+        Args:
+            spec (Dict[str, Any]): Projection as registered by the client. Malformed parts are ignored
+        """
+        self.m_sections: Optional[Dict[str, Optional[Tuple[str, ...]]]] = None
+        if isinstance(fields := spec.get("fields"), list):
+            sections: Dict[str, Optional[List[str]]] = {"driver-info": ["index"]}
+            for field in filter(lambda f: isinstance(f, str), fields):
+                section, _, key = field.partition(".")
+                if not key:
+                    sections[section] = None # Whole section
+                elif sections.get(section, []) is not None:
+                    sections.setdefault(section, []).append(key)
+            self.m_sections = {section: tuple(keys) if keys is not None else None
+                               for section, keys in sections.items()}
+
+        session_fields = spec.get("session-fields")
+        self.m_session_fields: Optional[Tuple[str, ...]] = \
+            tuple(f for f in session_fields if isinstance(f, str)) if isinstance(session_fields, list) else None
+
+        around = spec.get("around-player")
+        self.m_around_player: Optional[int] = \
+            around if isinstance(around, int) and not isinstance(around, bool) and around >= 0 else None
+
+    def apply(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Project a race-table-update payload. The payload is not modified.
+
+        Args:
+            data (Dict[str, Any]): Full payload (PeriodicUpdateData JSON)
+
+        Returns:
+            Dict[str, Any]: Projected payload
+        """
+        if self.m_session_fields is None:
+            projected = dict(data)
+        else:
+            projected = {key: data[key] for key in self.m_session_fields if key in data}
+            if "tt-data" in data:
+                projected["tt-data"] = data["tt-data"]
+
+        if (entries := data.get("table-entries")) is not None:
+            if self.m_around_player is not None:
+                entries = self._aroundPlayer(entries, data.get("spectator-car-index") if data.get("is-spectating") \
+                                             else None)
+            if self.m_sections is not None:
+                entries = [self._projectEntry(entry) for entry in entries]
+            projected["table-entries"] = entries
+        return projected
+
+    def _aroundPlayer(self, entries: List[Dict[str, Any]], spectated_index: Optional[int]) -> List[Dict[str, Any]]:
+        """Entries of the drivers within m_around_player positions of the reference car."""
+        def isReference(entry: Dict[str, Any]) -> bool:
+            info = entry.get("driver-info", {})
+            return info.get("index") == spectated_index if spectated_index is not None else info.get("is-player")
+
+        reference = next((entry for entry in entries if isReference(entry)), None)
+        if reference is None:
+            return entries
+        ref_pos = reference["driver-info"].get("position")
+        if ref_pos is None:
+            return entries
+        return [entry for entry in entries
+                if abs(entry.get("driver-info", {}).get("position", ref_pos) - ref_pos) <= self.m_around_player]
+
+    def _projectEntry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the registered sections and keys of a table entry."""
+        projected = {}
+        for section, keys in self.m_sections.items():
+            if (value := entry.get(section)) is None:
+                continue
+            if keys is None or not isinstance(value, dict):
+                projected[section] = value
+            else:
+                projected[section] = {key: value[key] for key in keys if key in value}
+        return projected
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def projectRaceTable(data: Dict[str, Any], projection_key: str) -> Dict[str, Any]:
+    """Project a race-table-update payload for the clients that registered this projection.
+
+    Args:
+        data (Dict[str, Any]): Full payload (PeriodicUpdateData JSON)
+        projection_key (str): Canonical JSON of the registered projection
+
+    Returns:
+        Dict[str, Any]: Projected payload
+    """
+    return _parseProjection(projection_key).apply(data)
+
+@lru_cache(maxsize=64)
+def _parseProjection(projection_key: str) -> RaceTableProjection:
+    """Parse a projection once, clients with the same projection share the key."""
+    return RaceTableProjection(orjson.loads(projection_key))
@@ -27,7 +27,8 @@ from enum import Enum, auto
 from typing import Any, Dict, Optional
 
 from apps.backend.state_mgmt_layer import SessionState
-from apps.backend.state_mgmt_layer.intf import DriverInfoRsp
+from apps.backend.state_mgmt_layer.intf import (DriverInfoRsp, RaceControlRsp,
+                                                StrategyRsp)
 
 # -------------------------------------- TYPES -------------------------------------------------------------------------
 
@@ -67,6 +68,67 @@ def handleDriverInfoRequest(session_state: SessionState, index_arg: Any) -> Driv
         DriverInfoResult: Transport-agnostic result; inspect .ok to determine success.
     """
 
+    if error := _validateIndexArg(session_state, index_arg):
+        return error
+    return DriverInfoResult.success(DriverInfoRsp(session_state, int(index_arg)).toJSON())
+
+def handleStrategyRequest(session_state: SessionState, index_arg: Any) -> DriverInfoResult:
+    """Process a pit strategy request given a raw index argument.
+
+    Args:
+        session_state (SessionState): The session state.
+        index_arg (Any): Raw index value (string from HTTP query param or dict value from IPC).
+
+    Returns:
+        DriverInfoResult: Transport-agnostic result; inspect .ok to determine success.
+    """
+
+    if error := _validateIndexArg(session_state, index_arg):
+        return error
+    return DriverInfoResult.success(StrategyRsp(session_state, int(index_arg)).toJSON())
+
+def handleRaceControlRequest(session_state: SessionState,
+                             since_id_arg: Any = None,
+                             index_arg: Any = None,
+                             limit_arg: Any = None) -> DriverInfoResult:
+    """Process an incremental race control messages request given raw arguments. All arguments are optional.
+
+    Args:
+        session_state (SessionState): The session state.
+        since_id_arg (Any): Raw cursor value ("last-id" from the previous response).
+        index_arg (Any): Raw driver index value, to only get the messages involving that driver.
+        limit_arg (Any): Raw maximum number of messages.
+
+    Returns:
+        DriverInfoResult: Transport-agnostic result; inspect .ok to determine success.
+    """
+
+    if index_arg is not None and (error := _validateIndexArg(session_state, index_arg)):
+        return error
+    for name, arg in (("since-id", since_id_arg), ("limit", limit_arg)):
+        if arg is not None and not isinstance(arg, int) and not str(arg).isdigit():
+            return DriverInfoResult.failure(RequestError.INVALID_PARAM, f'"{name}" parameter must be numeric')
+    if limit_arg is not None and int(limit_arg) < 1:
+        return DriverInfoResult.failure(RequestError.INVALID_PARAM, '"limit" parameter must be at least 1')
+
+    return DriverInfoResult.success(RaceControlRsp(
+        session_state,
+        since_id=None if since_id_arg is None else int(since_id_arg),
+        index=None if index_arg is None else int(index_arg),
+        limit=None if limit_arg is None else int(limit_arg),
+    ).toJSON())
+
+def _validateIndexArg(session_state: SessionState, index_arg: Any) -> Optional[DriverInfoResult]:
+    """Validate a raw driver index argument.
+
+    Args:
+        session_state (SessionState): The session state.
+        index_arg (Any): Raw index value (string from HTTP query param or dict value from IPC).
+
+    Returns:
+        Optional[DriverInfoResult]: The failure result if the index is unusable, else None.
+    """
+
     if index_arg is None:
         return DriverInfoResult.failure(RequestError.MISSING_PARAM, 'Provide "index" parameter')
 
@@ -77,4 +139,4 @@ def handleDriverInfoRequest(session_state: SessionState, index_arg: Any) -> Driv
     if not session_state.isIndexValid(index_int):
         return DriverInfoResult.failure(RequestError.NOT_FOUND, f'No driver at index {index_int}')
 
-    return DriverInfoResult.success(DriverInfoRsp(session_state, index_int).toJSON())
+    return None
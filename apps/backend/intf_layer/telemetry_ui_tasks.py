@@ -25,19 +25,24 @@
 import asyncio
 import logging
 import random
-from typing import Any, Awaitable, Callable, List, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import msgpack
 
 from apps.backend.state_mgmt_layer import SessionState
 from apps.backend.state_mgmt_layer.intf import (PeriodicUpdateData,
+                                                RaceInfoData,
                                                 StreamOverlayData)
 from apps.backend.telemetry_layer import F1TelemetryHandler
 from lib.config import PngSettings
 from lib.inter_task_communicator import AsyncInterTaskCommunicator
 from lib.ipc import IpcDealerAsync, IpcPublisherAsync, PngAppId
-from lib.web_server import ClientType
+from lib.web_server import ClientType, fanout_topic
 
 from .ipc import registerIpcTask
-from .request_handlers import handleDriverInfoRequest
+from .race_table_projection import projectRaceTable
+from .request_handlers import (DriverInfoResult, handleDriverInfoRequest,
+                               handleRaceControlRequest, handleStrategyRequest)
 from .telemetry_web_server import TelemetryWebServer
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
@@ -56,13 +61,32 @@ def _initDealer(
     @dealer.route("driver-info-request")
     async def _handle_driver_info_request(data: dict, sender: str) -> dict:
         logger.debug("Received driver info request via router: %s from %s", data, sender)
-        result = handleDriverInfoRequest(session_state, data.get("index"))
-        if result.ok:
-            return {"ok": True, "data": result.data}
-        return {"ok": False, "error": result.detail, "data": None}
+        return _toIpcReply(handleDriverInfoRequest(session_state, data.get("index")))
+
+    @dealer.route("strategy-request")
+    async def _handle_strategy_request(data: dict, sender: str) -> dict:
+        logger.debug("Received strategy request via router: %s from %s", data, sender)
+        return _toIpcReply(handleStrategyRequest(session_state, data.get("index")))
+
+    @dealer.route("race-control-request")
+    async def _handle_race_control_request(data: dict, sender: str) -> dict:
+        logger.debug("Received race control request via router: %s from %s", data, sender)
+        return _toIpcReply(handleRaceControlRequest(
+            session_state, data.get("since-id"), data.get("index"), data.get("limit")))
+
+    @dealer.route("race-info-request")
+    async def _handle_race_info_request(data: dict, sender: str) -> dict:
+        logger.debug("Received race info request via router: %s from %s", data, sender)
+        return {"ok": True, "data": RaceInfoData(session_state).toJSON()}
 
     return dealer
 
+def _toIpcReply(result: DriverInfoResult) -> dict:
+    """Map a transport-agnostic request result to a router reply. error-type is the RequestError name"""
+    if result.ok:
+        return {"ok": True, "data": result.data}
+    return {"ok": False, "error": result.detail, "error-type": result.error.name, "data": None}
+
 def initUiIntfLayer(
     settings: PngSettings,
     logger: logging.Logger,
@@ -101,6 +125,8 @@ def initUiIntfLayer(
     )
     ipc_pub = IpcPublisherAsync(logger=logger, port=settings.Network.broker_xsub_port)
     tasks.append(ipc_pub.get_task())
+    # The web fan-out processes get the web client updates from the broker
+    fanout_pub = ipc_pub if settings.Network.web_fanout_processes else None
     tasks.append(asyncio.create_task(web_server.run(), name="Web Server Task"))
 
     dealer = _initDealer(settings, logger, session_state)
@@ -124,7 +150,8 @@ def initUiIntfLayer(
             webClientUpdateTask,
             web_server,
             session_state,
-            settings.StreamOverlay.show_sample_data_at_start), name="Web Client Update Task"))
+            settings.StreamOverlay.show_sample_data_at_start,
+            fanout_pub), name="Web Client Update Task"))
     tasks.append(asyncio.create_task(
         _periodic_task(
             settings.Display.hud_refresh_interval,
@@ -135,7 +162,7 @@ def initUiIntfLayer(
             ipc_pub), name="High Frequency Local Update Task"))
 
     # Interrupt/event driven tasks
-    tasks.append(asyncio.create_task(frontEndMessageTask(web_server, shutdown_event),
+    tasks.append(asyncio.create_task(frontEndMessageTask(web_server, shutdown_event, fanout_pub),
                                      name="Front End Message Task"))
     tasks.append(asyncio.create_task(hudInteractionTask(dealer, shutdown_event),
                                      name="HUD Interaction Task"))
@@ -172,43 +199,56 @@ async def highFreqLocalUpdateTask(
 async def webClientUpdateTask(
     server: TelemetryWebServer,
     session_state: SessionState,
-    stream_overlay_start_sample_data: bool) -> None:
+    stream_overlay_start_sample_data: bool,
+    fanout_pub: Optional[IpcPublisherAsync] = None) -> None:
     """Task to update web clients with telemetry data
 
     Args:
         server (TelemetryWebServer): The telemetry web server
         session_state (SessionState): The session state
         stream_overlay_start_sample_data (bool): Whether to show sample data at start
+        fanout_pub (Optional[IpcPublisherAsync]): Publisher for the web fan-out processes, None if they are disabled
     """
 
-    if server.is_any_client_interested_in_event('race-table-update'):
-        await server.send_to_clients_interested_in_event(
+    if fanout_pub or server.is_any_client_interested_in_event('race-table-update'):
+        await _sendWebClientUpdate(
+            server,
+            fanout_pub,
             event='race-table-update',
-            data=PeriodicUpdateData(session_state, send_position_data=True).toJSON()
+            data=PeriodicUpdateData(session_state, send_position_data=True).toJSON(),
+            projector=projectRaceTable
         )
 
-    if server.is_any_client_interested_in_event('stream-overlay-update'):
-        await server.send_to_clients_interested_in_event(
+    if fanout_pub or server.is_any_client_interested_in_event('stream-overlay-update'):
+        await _sendWebClientUpdate(
+            server,
+            fanout_pub,
             event='stream-overlay-update',
             data=StreamOverlayData(session_state).toJSON(stream_overlay_start_sample_data)
         )
 
 async def frontEndMessageTask(
     server: TelemetryWebServer,
-    shutdown_event: asyncio.Event) -> None:
+    shutdown_event: asyncio.Event,
+    fanout_pub: Optional[IpcPublisherAsync] = None) -> None:
     """Task to update clients with telemetry data
 
     Args:
         server (TelemetryWebServer): The telemetry web server
         shutdown_event (asyncio.Event): Event to signal shutdown
+        fanout_pub (Optional[IpcPublisherAsync]): Publisher for the web fan-out processes, None if they are disabled
     """
 
     while not shutdown_event.is_set():
         if message := await AsyncInterTaskCommunicator().receive("frontend-update"):
+            packed = msgpack.packb(message.toJSON(), use_bin_type=True)
+            if fanout_pub:
+                await fanout_pub.publish_raw(fanout_topic('frontend-update'), packed)
             await server.send_to_clients_of_type(
                 event='frontend-update',
-                data=message.toJSON(),
-                client_type=ClientType.RACE_TABLE)
+                data=None,
+                client_type=ClientType.RACE_TABLE,
+                packed=packed)
 
     server.m_logger.debug("Shutting down front end message task")
 
@@ -228,6 +268,28 @@ async def hudInteractionTask(
 
 # -------------------------------------- UTILS -------------------------------------------------------------------------
 
+async def _sendWebClientUpdate(
+    server: TelemetryWebServer,
+    fanout_pub: Optional[IpcPublisherAsync],
+    event: str,
+    data: Dict[str, Any],
+    projector: Optional[Callable[[Dict[str, Any], str], Any]] = None) -> None:
+    """Send a periodic update to the web clients of this process and publish it for the fan-out processes.
+    The update is packed once for both.
+
+    Args:
+        server (TelemetryWebServer): The telemetry web server
+        fanout_pub (Optional[IpcPublisherAsync]): Publisher for the web fan-out processes, None if they are disabled
+        event (str): Socket.IO event
+        data (Dict[str, Any]): Update payload
+        projector (Optional[Callable[[Dict[str, Any], str], Any]]): Builds per-client projections of the payload
+    """
+    packed = msgpack.packb(data, use_bin_type=True)
+    if fanout_pub:
+        await fanout_pub.publish_raw(fanout_topic(event), packed)
+    if server.is_any_client_interested_in_event(event):
+        await server.send_to_clients_interested_in_event(event, data, projector=projector, packed=packed)
+
 async def _initial_random_sleep() -> None:
     """Sleep for a random amount of time to avoid bursty events"""
     await asyncio.sleep(random.uniform(0, 0.2))
@@ -25,7 +25,9 @@
 import logging
 import webbrowser
 from http import HTTPStatus
-from typing import Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from quart import Response
 
 from apps.backend.state_mgmt_layer import SessionState
 from apps.backend.state_mgmt_layer.intf import (PeriodicUpdateData,
@@ -35,7 +37,10 @@ from lib.child_proc_mgmt import notify_parent_init_complete
 from lib.config import PngSettings
 from lib.web_server import BaseWebServer, ClientType
 
-from .request_handlers import RequestError, handleDriverInfoRequest
+from .request_handlers import (DriverInfoResult, RequestError,
+                               handleDriverInfoRequest,
+                               handleRaceControlRequest,
+                               handleStrategyRequest)
 
 # -------------------------------------- GLOBALS -----------------------------------------------------------------------
 
@@ -62,8 +67,10 @@ class TelemetryWebServer(BaseWebServer):
                  settings: PngSettings,
                  ver_str: str,
                  logger: logging.Logger,
-                 session_state: SessionState,
-                 debug_mode: bool = False):
+                 session_state: Optional[SessionState],
+                 debug_mode: bool = False,
+                 port: Optional[int] = None,
+                 reuse_port: bool = False):
         """
         Initialize the TelemetryWebServer.
 
@@ -71,11 +78,14 @@ class TelemetryWebServer(BaseWebServer):
             settings (PngSettings): App settings.
             ver_str (str): The version string.
             logger (logging.Logger): The logger instance.
-            session_state (SessionState): Handle to the session state
+            session_state (Optional[SessionState]): Handle to the session state. None in the web fan-out processes,
+                which override the data routes.
             debug_mode (bool, optional): Enable or disable debug mode. Defaults to False.
+            port (Optional[int], optional): Port to serve on. Defaults to the HTTP server port setting.
+            reuse_port (bool, optional): Share the port with other server processes. Defaults to False.
         """
         super().__init__(
-            port=settings.Network.server_port,
+            port=port or settings.Network.server_port,
             ver_str=ver_str,
             logger=logger,
             bind_address=settings.Network.bind_address,
@@ -85,7 +95,10 @@ class TelemetryWebServer(BaseWebServer):
             },
             cert_path=settings.HTTPS.cert_path,
             key_path=settings.HTTPS.key_path,
-            debug_mode=debug_mode)
+            debug_mode=debug_mode,
+            binary_stream_topics=['race-table-update', 'stream-overlay-update'],
+            reuse_port=reuse_port,
+            batch_emits=True)
         self.define_routes()
         self.register_post_start_callback(self._post_start)
         self.m_show_start_sample_data = settings.StreamOverlay.show_sample_data_at_start
@@ -109,53 +122,54 @@ class TelemetryWebServer(BaseWebServer):
         Sets up routes for the main index page and stream overlay page.
         """
         @self.http_route('/')
-        async def index() -> str:
+        async def index() -> Response:
             """
             Render the main index page.
 
             Returns:
-                str: Rendered HTML content for the index page.
+                Response: Rendered HTML content for the index page.
             """
-            return await self.render_template('driver-view.html', live_data_mode=True, version=self.m_ver_str)
+            return await self.render_page('driver-view.html', live_data_mode=True, version=self.m_ver_str)
 
         @self.http_route('/eng-view')
-        async def engineerView() -> str:
+        async def engineerView() -> Response:
             """
             Render the engineer view page.
 
             Returns:
-                str: Rendered HTML content for the stream overlay page.
+                Response: Rendered HTML content for the stream overlay page.
             """
-            return await self.render_template('eng-view.html', live_data_mode=True, version=self.m_ver_str)
+            return await self.render_page('eng-view.html', live_data_mode=True, version=self.m_ver_str)
 
         @self.http_route('/eng-view/trackmap')
-        async def engineerViewTrackmap() -> str:
+        async def engineerViewTrackmap() -> Response:
             """
             Render the fullscreen track map page.
 
             Returns:
-                str: Rendered HTML content for the fullscreen track map.
+                Response: Rendered HTML content for the fullscreen track map.
             """
-            return await self.render_template('eng-view-trackmap.html', live_data_mode=True, version=self.m_ver_str)
+            return await self.render_page('eng-view-trackmap.html', live_data_mode=True, version=self.m_ver_str)
 
         @self.http_route('/player-stream-overlay')
-        async def playerStreamOverlay() -> str:
+        async def playerStreamOverlay() -> Response:
             """
             Render the player stream overlay page.
 
             Returns:
-                str: Rendered HTML content for the stream overlay page.
+                Response: Rendered HTML content for the stream overlay page.
             """
-            return await self.render_template('player-stream-overlay.html')
+            return await self.render_page('player-stream-overlay.html')
 
     def _defineDataRoutes(self) -> None:
         """
         Define HTTP routes for retrieving telemetry and race-related data.
 
         Sets up endpoints for fetching race info, telemetry info,
-        driver info, and stream overlay info.
+        driver info, strategy info, race control messages and stream overlay info.
+        The polled info routes answer If-None-Match with 304 and gzip their body for clients that accept it.
         """
-        @self.http_route('/telemetry-info')
+        @self.http_route('/telemetry-info', conditional=True)
         async def telemetryInfoHTTP() -> Tuple[str, int]:
             """
             Provide telemetry information via HTTP.
@@ -165,7 +179,7 @@ class TelemetryWebServer(BaseWebServer):
             """
             return PeriodicUpdateData(self.m_session_state).toJSON(), HTTPStatus.OK
 
-        @self.http_route('/race-info')
+        @self.http_route('/race-info', conditional=True)
         async def raceInfoHTTP() -> Tuple[str, int]:
             """
             Provide overall race statistics via HTTP.
@@ -175,7 +189,7 @@ class TelemetryWebServer(BaseWebServer):
             """
             return RaceInfoData(self.m_session_state).toJSON(), HTTPStatus.OK
 
-        @self.http_route('/driver-info')
+        @self.http_route('/driver-info', conditional=True)
         async def driverInfoHTTP() -> Tuple[str, int]:
             """
             Provide driver information based on the index parameter.
@@ -183,17 +197,31 @@ class TelemetryWebServer(BaseWebServer):
             Returns:
                 Tuple[str, int]: JSON response and HTTP status code.
             """
-            result = handleDriverInfoRequest(self.m_session_state, self.request.args.get('index'))
-            if result.ok:
-                return result.data, HTTPStatus.OK
-            http_status = {
-                RequestError.MISSING_PARAM: HTTPStatus.BAD_REQUEST,
-                RequestError.INVALID_PARAM: HTTPStatus.BAD_REQUEST,
-                RequestError.NOT_FOUND:     HTTPStatus.NOT_FOUND,
-            }[result.error]
-            return {'error': result.detail}, http_status
-
-        @self.http_route('/stream-overlay-info')
+            return _toHttpResponse(handleDriverInfoRequest(self.m_session_state, self.request.args.get('index')))
+
+        @self.http_route('/strategy-info')
+        async def strategyInfoHTTP() -> Tuple[str, int]:
+            """
+            Provide the ranked pit strategies of the driver based on the index parameter.
+
+            Returns:
+                Tuple[str, int]: JSON response and HTTP status code.
+            """
+            return _toHttpResponse(handleStrategyRequest(self.m_session_state, self.request.args.get('index')))
+
+        @self.http_route('/race-control')
+        async def raceControlHTTP() -> Tuple[str, int]:
+            """
+            Provide the race control messages newer than the since-id parameter (all optional: since-id, index, limit).
+
+            Returns:
+                Tuple[str, int]: JSON response and HTTP status code.
+            """
+            args = self.request.args
+            return _toHttpResponse(handleRaceControlRequest(
+                self.m_session_state, args.get('since-id'), args.get('index'), args.get('limit')))
+
+        @self.http_route('/stream-overlay-info', conditional=True)
         async def streamOverlayInfoHTTP() -> Tuple[str, int]:
             """
             Provide stream overlay telemetry information via HTTP.
@@ -210,3 +238,23 @@ class TelemetryWebServer(BaseWebServer):
         if not self.m_disable_browser_autoload:
             proto = 'https' if self.m_cert_path else 'http'
             webbrowser.open(f'{proto}://localhost:{self.m_port}', new=2)
+
+# -------------------------------------- UTILS -------------------------------------------------------------------------
+
+def _toHttpResponse(result: DriverInfoResult) -> Tuple[Dict[str, Any], int]:
+    """Map a transport-agnostic request result to a JSON response and HTTP status code.
+
+    Args:
+        result (DriverInfoResult): The request result
+
+    Returns:
+        Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+    """
+    if result.ok:
+        return result.data, HTTPStatus.OK
+    http_status = {
+        RequestError.MISSING_PARAM: HTTPStatus.BAD_REQUEST,
+        RequestError.INVALID_PARAM: HTTPStatus.BAD_REQUEST,
+        RequestError.NOT_FOUND:     HTTPStatus.NOT_FOUND,
+    }[result.error]
+    return {'error': result.detail}, http_status
@@ -23,6 +23,7 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 from .state_layer_init import initStateManagementLayer, SessionState
+from .session_journal import SessionJournal
 from . import intf
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
@@ -33,6 +34,7 @@ __all__ = [
 
     # Data structure
     "SessionState",
+    "SessionJournal",
 
     # Module
     "intf",
@@ -25,7 +25,7 @@ from .data_per_driver import DataPerDriver
 from .driver_info import DriverInfo
 from .lap_info import LapInfo
 from .packet_copies import PacketCopies
-from .per_lap_snapshot import PerLapSnapshotEntry
+from .per_lap_snapshot import PerLapSnapshotEntry, SnapshotBlobPool
 from .tyre_info import (TyreInfo, TyreSetHistoryEntry, TyreSetHistoryManager,
                         TyreSetInfo)
 from .warns_pens_info import WarningPenaltyEntry, WarningPenaltyHistory
@@ -40,6 +40,7 @@ __all__ = [
     'WarningPenaltyHistory',
 
     'PerLapSnapshotEntry',
+    'SnapshotBlobPool',
 
     'DriverInfo',
 
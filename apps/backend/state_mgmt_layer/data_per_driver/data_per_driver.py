@@ -26,8 +26,7 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from lib.collisions_analyzer import (CollisionAnalyzer, CollisionAnalyzerMode,
-                                     CollisionRecord)
+from lib.collisions_analyzer import StreamingCollisionAnalyzer
 from lib.delta import LapDeltaManager
 from lib.f1_types import (CarDamageData, CarStatusData, F1Utils, LapData,
                           PacketLapPositionsData, ResultStatus, SafetyCarType,
@@ -36,13 +35,17 @@ from lib.pending_events import DriverPendingEvents, PendingEventsManager
 from lib.race_ctrl import (CarDamageRaceControlMessage,
                            DriverPittingRaceCtrlMsg, DriverRaceControlManager,
                            TyreChangeRaceControlMessage, WingChangeRaceCtrlMsg)
+from lib.strategy_simulator import (CompoundModel, LapSample, StrategyInput,
+                                    estimateCompoundPace,
+                                    extrapolateCompoundPace,
+                                    extrapolateWearRate, isDryCompound)
 from lib.tyre_wear_extrapolator import TyreWearPerLap
 
 from .car_info import CarInfo
 from .driver_info import DriverInfo
 from .lap_info import LapInfo
 from .packet_copies import PacketCopies
-from .per_lap_snapshot import PerLapSnapshotEntry
+from .per_lap_snapshot import PerLapSnapshotEntry, SnapshotBlobPool
 from .pit_info import PitInfo
 from .tyre_info import TyreInfo, TyreSetHistoryEntry, TyreSetInfo
 from .warns_pens_info import WarningPenaltyHistory
@@ -66,10 +69,11 @@ class DataPerDriver:
         m_tyre_info (TyreInfo): Information about the driver's tire usage and condition.
         m_pit_info (PitInfo): Information about the driver's pit stops.
         m_car_info (CarInfo): Data related to the driver's car performance.
-        m_collision_records (List[CollisionRecord]): List of collision records involving the driver.
+        m_collision_analyzer (StreamingCollisionAnalyzer): Collision records involving the driver, with running stats.
         m_warning_penalty_history (WarningPenaltyHistory): History of warnings and penalties received by the driver.
         m_packet_copies (PacketCopies): Copies of various data packets related to the driver's performance.
         m_per_lap_snapshots (Dict[int, PerLapSnapshotEntry]): Snapshots of the driver's performance per lap
+        m_snapshot_blob_pool (SnapshotBlobPool): Shared storage for snapshot data that repeats across laps
         m_position_history (List[int]): List of positions of the driver
         m_pending_events_mgr_weird_track (PendingEventsManager): Manager for pending events involving the driver.
         m_pending_events_mgr_normal_track (PendingEventsManager): Manager for pending events involving the driver.
@@ -86,10 +90,11 @@ class DataPerDriver:
         "m_tyre_info",
         "m_pit_info",
         "m_car_info",
-        "m_collision_records",
+        "m_collision_analyzer",
         "m_warning_penalty_history",
         "m_packet_copies",
         "m_per_lap_snapshots",
+        "m_snapshot_blob_pool",
         "m_position_history",
         "m_pending_events_mgr_weird_track",
         "m_pending_events_mgr_normal_track",
@@ -158,7 +163,7 @@ class DataPerDriver:
         self.m_pit_info: PitInfo = PitInfo()
         self.m_car_info: CarInfo = CarInfo(total_laps, harvest_power_window_size)
 
-        self.m_collision_records: List[CollisionRecord] = []
+        self.m_collision_analyzer: StreamingCollisionAnalyzer = StreamingCollisionAnalyzer()
         self.m_warning_penalty_history: WarningPenaltyHistory = WarningPenaltyHistory()
 
         # packet copies
@@ -166,6 +171,7 @@ class DataPerDriver:
 
         # Per lap snapshot
         self.m_per_lap_snapshots: Dict[int, PerLapSnapshotEntry] = {}
+        self.m_snapshot_blob_pool: SnapshotBlobPool = SnapshotBlobPool()
 
         # Positions history (F1 25+)
         if total_laps:
@@ -360,6 +366,117 @@ class DataPerDriver:
                 predictions_list.append(final_lap_prediction.toJSON())
         return predictions_list
 
+    def getStrategyInput(self, total_laps: int, pit_time_loss: float) -> Optional[StrategyInput]:
+        """Build the pit strategy simulator input for this driver from the laps completed so far
+
+        Args:
+            total_laps (int): Total laps in the race
+            pit_time_loss (float): Time lost by a pit stop in seconds
+
+        Returns:
+            Optional[StrategyInput]: The simulator input. None if there is not enough data yet
+        """
+
+        tyre_sets = self.m_packet_copies.m_packet_tyre_sets
+        session_history = self.m_packet_copies.m_packet_session_history
+        current_lap = self.m_lap_info.m_current_lap
+        if not (tyre_sets and session_history and current_lap and total_laps and self.m_tyre_info.tyre_vis_compound):
+            return None
+
+        fuel_at_lap_end = {
+            entry.m_lap_number: entry.m_fuel_remaining
+            for entry in self.m_car_info.m_fuel_rate_recommender.m_fuel_remaining_history
+        }
+        samples: List[LapSample] = []
+        observed_wear_rates: Dict[str, float] = {}
+        compounds_used = set()
+        stints = self.m_tyre_info.m_tyre_set_history_manager.getEntries()
+        for stint_index, stint in enumerate(stints):
+            if not (0 <= stint.m_fitted_index < len(tyre_sets.m_tyreSetData)):
+                continue
+            compound = str(tyre_sets.m_tyreSetData[stint.m_fitted_index].m_visualTyreCompound)
+            compounds_used.add(compound)
+            wear_history = stint.m_tyre_wear_history
+            if len(wear_history) >= 2:
+                stint_laps = wear_history[-1].lap_number - wear_history[0].lap_number
+                if stint_laps > 0:
+                    observed_wear_rates[compound] = (
+                        _maxCornerWear(wear_history[-1]) - _maxCornerWear(wear_history[0])) / stint_laps
+
+            # Each pair of consecutive entries is one completed lap, with the wear at its start.
+            # The out lap and the in lap (if the stint is over) are not representative, so skip them
+            is_last_stint = stint_index == len(stints) - 1
+            laps = list(zip(wear_history, wear_history[1:]))[1:] if is_last_stint else \
+                    list(zip(wear_history, wear_history[1:]))[1:-1]
+            for wear_at_start, wear_at_end in laps:
+                lap_number = wear_at_end.lap_number
+                if not (1 < lap_number <= len(session_history.m_lapHistoryData)):
+                    continue
+                lap_history = session_history.m_lapHistoryData[lap_number - 1]
+                snapshot = self.m_per_lap_snapshots.get(lap_number)
+                samples.append(LapSample(
+                    lap_number=lap_number,
+                    lap_time_s=lap_history.m_lapTimeInMS / 1000.0,
+                    compound=compound,
+                    wear=_maxCornerWear(wear_at_start),
+                    fuel_kg=fuel_at_lap_end.get(lap_number - 1),
+                    is_clean=bool(lap_history.isLapValid()) and bool(snapshot) and
+                        snapshot.m_max_sc_status == SafetyCarType.NO_SAFETY_CAR,
+                ))
+
+        pace = estimateCompoundPace(samples)
+        current_compound = str(self.m_tyre_info.tyre_vis_compound)
+        extrapolator = self.m_tyre_info.m_tyre_wear_extrapolator
+        if extrapolator.isDataSufficient():
+            observed_wear_rates[current_compound] = max(
+                extrapolator.fl_rate, extrapolator.fr_rate, extrapolator.rl_rate, extrapolator.rr_rate)
+        current_pace = extrapolateCompoundPace(pace, current_compound)
+        current_rate = extrapolateWearRate(observed_wear_rates, current_compound)
+        latest_wear = self.m_tyre_info.tyre_wear.latest
+        if current_pace is None or current_rate is None or latest_wear is None:
+            return None
+
+        # Best unused set of every compound still available
+        candidates: Dict[str, CompoundModel] = {}
+        for tyre_set in tyre_sets.m_tyreSetData:
+            if not tyre_set.m_available or tyre_set.m_fitted:
+                continue
+            compound = str(tyre_set.m_visualTyreCompound)
+            if compound in candidates:
+                candidates[compound].num_sets += 1
+                candidates[compound].initial_wear = min(candidates[compound].initial_wear, tyre_set.m_wear)
+                continue
+            base = extrapolateCompoundPace(pace, compound)
+            rate = extrapolateWearRate(observed_wear_rates, compound)
+            if base is None or rate is None:
+                continue
+            candidates[compound] = CompoundModel(
+                name=compound,
+                base_lap_time_s=base,
+                wear_rate=rate,
+                initial_wear=float(tyre_set.m_wear),
+                is_dry=isDryCompound(compound),
+            )
+
+        car_status = self.m_packet_copies.m_packet_car_status
+        return StrategyInput(
+            index=self.m_index,
+            current_lap=current_lap,
+            total_laps=total_laps,
+            current_compound=CompoundModel(
+                name=current_compound,
+                base_lap_time_s=current_pace,
+                wear_rate=current_rate,
+                initial_wear=_maxCornerWear(latest_wear),
+                is_dry=isDryCompound(current_compound),
+            ),
+            candidate_compounds=list(candidates.values()),
+            pit_time_loss_s=pit_time_loss,
+            compounds_used=frozenset(name for name in compounds_used if isDryCompound(name)),
+            fuel_kg=car_status.m_fuelInTank if car_status else None,
+            fuel_rate_kg=self.m_car_info.m_fuel_rate_recommender.curr_fuel_rate,
+        )
+
     def getCurrentTyreWearJSON(self) -> Dict[str, Any]:
         """Get the current tyre wear in JSON format
 
@@ -401,12 +518,13 @@ class DataPerDriver:
         range_of_laps = range(start_lap, end_lap + 1)
         tyre_wear_history = []
         if start_lap == 1:
+            zeroth_lap_car_damage = self.m_per_lap_snapshots[0].m_car_damage_packet
             tyre_wear_history.append({
                 'lap-number': 0,
-                'front-right-wear': self.m_per_lap_snapshots[0].m_car_damage_packet.m_tyresWear[F1Utils.INDEX_FRONT_RIGHT],
-                'front-left-wear': self.m_per_lap_snapshots[0].m_car_damage_packet.m_tyresWear[F1Utils.INDEX_FRONT_LEFT],
-                'rear-right-wear': self.m_per_lap_snapshots[0].m_car_damage_packet.m_tyresWear[F1Utils.INDEX_REAR_RIGHT],
-                'rear-left-wear': self.m_per_lap_snapshots[0].m_car_damage_packet.m_tyresWear[F1Utils.INDEX_REAR_LEFT],
+                'front-right-wear': zeroth_lap_car_damage.m_tyresWear[F1Utils.INDEX_FRONT_RIGHT],
+                'front-left-wear': zeroth_lap_car_damage.m_tyresWear[F1Utils.INDEX_FRONT_LEFT],
+                'rear-right-wear': zeroth_lap_car_damage.m_tyresWear[F1Utils.INDEX_REAR_RIGHT],
+                'rear-left-wear': zeroth_lap_car_damage.m_tyresWear[F1Utils.INDEX_REAR_LEFT],
             })
         for lap_number in range_of_laps:
             if lap_number in self.m_per_lap_snapshots:
@@ -488,20 +606,20 @@ class DataPerDriver:
                 if not lap_snapshot:
                     self.m_logger.debug("%s - No lap snapshot found for lap number %s. Possible red flag",
                         str(self), tyre_wear.lap_number)
-                elif not lap_snapshot.m_tyre_sets_packet:
+                elif lap_snapshot.m_tyre_sets_blob is None:
                     self.m_logger.warning("%s - No tyre sets packet found for lap number %s",
                                         str(self), tyre_wear.lap_number)
-                elif not (0 <= tyre_set_meta_data.m_fitted_index < len(lap_snapshot.m_tyre_sets_packet.m_tyreSetData)):
-                    self.m_logger.warning("%s - Tyre set index %s out of bounds for lap number %s (array size: %s)",
-                        str(self), tyre_set_meta_data.m_fitted_index,tyre_wear.lap_number,
-                        len(lap_snapshot.m_tyre_sets_packet.m_tyreSetData))
                 else:
-                    tyre_set_data = lap_snapshot.m_tyre_sets_packet.m_tyreSetData[tyre_set_meta_data.m_fitted_index]
+                    # Uses the snapshot's cached JSON dump instead of parsing the packet again
+                    tyre_set_data = lap_snapshot.getTyreSetJSON(tyre_set_meta_data.m_fitted_index)
+                    if tyre_set_data is None:
+                        self.m_logger.warning("%s - Tyre set index %s out of bounds for lap number %s",
+                            str(self), tyre_set_meta_data.m_fitted_index, tyre_wear.lap_number)
 
                 ret.append({
                     'tyre-wear' : tyre_wear.toJSON(),
                     'lap-number' : tyre_wear.lap_number,
-                    'tyre-set' : tyre_set_data.toJSON() if tyre_set_data else None,
+                    'tyre-set' : tyre_set_data,
                 })
         return ret
 
@@ -614,7 +732,10 @@ class DataPerDriver:
             ers_harv_mguh_j=self.m_car_info.m_curr_lap_ers_harv_mguh_j,
             ers_harv_mguk_j=self.m_car_info.m_curr_lap_ers_harv_mguk_j,
             ers_harv_limit_mguk_j=mguk_harv_limit,
+            blob_pool=self.m_snapshot_blob_pool,
         )
+        # Build the lap's JSON dump now, so that the session save at the end only has to assemble it
+        self.m_per_lap_snapshots[old_lap_number].buildJSONCache()
 
         # Add the tyre wear data into the tyre stint history
         tyre_set_key = self._getCurrentTyreSetKey()
@@ -996,10 +1117,7 @@ class DataPerDriver:
             Dict[str, Any]: Collision stats JSON
         """
 
-        collision_analyzer = CollisionAnalyzer(
-            input_mode=CollisionAnalyzerMode.INPUT_MODE_LIST_COLLISION_RECORDS,
-            input_data=self.m_collision_records)
-        return collision_analyzer.toJSON()
+        return self.m_collision_analyzer.toJSON()
 
     def getFuelStatsJSON(self) -> Dict[str, Any]:
         """Get the fuel stats JSON.
@@ -1359,7 +1477,7 @@ class DataPerDriver:
                 if self.m_packet_copies.m_packet_lap_data:
                     _lap_data = self.m_packet_copies.m_packet_lap_data
                     msg.lap_distance = _lap_data.m_lapDistance
-                    msg.segment_info = self.m_state_ref._lookup_segment_info(msg.lap_distance)
+                    msg.segment_info = self.m_state_ref._lookup_segment_info(self.m_index)
                     msg.sector = str(_lap_data.m_sector)
                 self.m_race_ctrl.add_message(msg)
 
@@ -1401,3 +1519,16 @@ class DataPerDriver:
                     "Driver %s - unexpected damage decrease for %s: %s - %s",
                     str(self), field, old, new
                 )
+
+# -------------------------------------- UTILS -------------------------------------------------------------------------
+
+def _maxCornerWear(tyre_wear: TyreWearPerLap) -> float:
+    """Get the wear of the most worn corner
+
+    Args:
+        tyre_wear (TyreWearPerLap): Tyre wear of all four corners
+
+    Returns:
+        float: Wear of the most worn corner, in percent
+    """
+    return max(tyre_wear.fl_tyre_wear, tyre_wear.fr_tyre_wear, tyre_wear.rl_tyre_wear, tyre_wear.rr_tyre_wear)
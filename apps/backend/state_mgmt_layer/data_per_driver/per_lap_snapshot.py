@@ -22,67 +22,178 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-from typing import Any, Dict
+import struct
+from typing import Any, Dict, Optional, Union
 
-from lib.f1_types import (CarDamageData, CarStatusData, PacketTyreSetsData,
-                          SafetyCarType)
+import msgpack
+
+from lib.f1_types import (CarDamageData, CarStatusData, PacketHeader,
+                          PacketTyreSetsData, SafetyCarType)
 
 # -------------------------------------- GLOBALS -----------------------------------------------------------------------
 
 # -------------------------------------- CLASS DEFINITIONS -------------------------------------------------------------
 
+class SnapshotBlobPool:
+    """
+    Content addressed store for snapshot blobs. Identical blobs (e.g. the tyre sets of consecutive laps) are stored
+    once and shared by every snapshot that references them.
+    """
+
+    __slots__ = ("m_blobs",)
+
+    def __init__(self) -> None:
+        """Init the empty pool"""
+        self.m_blobs: Dict[bytes, bytes] = {}
+
+    def intern(self, blob: bytes) -> bytes:
+        """Get the canonical copy of the given blob, adding it to the pool if not already present
+
+        Args:
+            blob (bytes): The blob
+
+        Returns:
+            bytes: The shared copy with the same content
+        """
+        return self.m_blobs.setdefault(blob, blob)
+
+    def clear(self) -> None:
+        """Drop all blobs. Snapshots already holding a blob are unaffected"""
+        self.m_blobs.clear()
+
+    def __len__(self) -> int:
+        """Number of unique blobs in the pool"""
+        return len(self.m_blobs)
+
 class PerLapSnapshotEntry:
     """
-    Class that captures one lap's snapshot data
+    Class that captures one lap's snapshot data.
+
+    The packets are stored in their compact wire format and are only parsed when accessed, since a session holds one
+    snapshot per driver per lap but only a few of them are ever read back. The tyre sets data rarely changes between
+    laps, so its blob is shared via the SnapshotBlobPool. Packets that cannot be serialised (e.g. enum values unknown
+    to this version) are kept as objects.
+
+    Dumping the packets to JSON is the bulk of the cost of building a session save, and the snapshot of a completed
+    lap never changes. So the packets' JSON dump is built once (see buildJSONCache) and kept msgpack encoded,
+    which is both compact and cheap to decode.
 
     Attributes:
-        m_car_damage_packet (CarDamageData): The Car damage packet
-        m_car_status_packet (CarStatusData): The Car Status packet
+        m_car_damage_packet (Optional[CarDamageData]): The Car damage packet
+        m_car_status_packet (Optional[CarStatusData]): The Car Status packet
         m_track_position (int): The lap's track position
         m_tyre_sets_packet (Optional[PacketTyreSetsData]): The Tyre Sets packet
         m_max_sc_status (PacketSessionData.SafetyCarStatus): The lap's maximum safety car status value
         m_top_speed_kmph (float): The lap's top speed in kmph
     """
 
+    __slots__ = (
+        "m_car_damage_blob",
+        "m_car_status_blob",
+        "m_tyre_sets_header_blob",
+        "m_tyre_sets_blob",
+        "m_max_sc_status",
+        "m_track_position",
+        "m_top_speed_kmph",
+        "m_ers_harv_mguh_j",
+        "m_ers_harv_mguk_j",
+        "m_ers_deployed_j",
+        "m_ers_harv_limit_mguk_j",
+        "m_packets_json_blob",
+    )
+
     def __init__(self,
-        car_damage : CarDamageData,
-        car_status : CarStatusData,
+        car_damage : Optional[CarDamageData],
+        car_status : Optional[CarStatusData],
         max_sc_status  : SafetyCarType,
-        tyre_sets  : PacketTyreSetsData,
+        tyre_sets  : Optional[PacketTyreSetsData],
         track_position: int,
         top_speed_kmph: int,
         ers_harv_mguh_j: float,
         ers_harv_mguk_j: float,
         ers_deployed_j: float,
-        ers_harv_limit_mguk_j: float
+        ers_harv_limit_mguk_j: float,
+        blob_pool: Optional[SnapshotBlobPool] = None,
         ):
         """Init the snapshot entry object
 
         Args:
-            car_damage (CarDamageData): The Car damage packet
-            car_status (CarStatusData): The Car Status packet
+            car_damage (Optional[CarDamageData]): The Car damage packet
+            car_status (Optional[CarStatusData]): The Car Status packet
             max_sc_status (PacketSessionData.SafetyCarStatus): The lap's maximum safety car status value
-            tyre_sets (PacketTyreSetsData): The Tyre Sets packet
+            tyre_sets (Optional[PacketTyreSetsData]): The Tyre Sets packet
             track_position (int): The lap's track position
             top_speed_kmph (float): The lap's top speed in kmph
             ers_harv_mguh_j (float): The lap's total ERS energy harvested by MGU-H in joules
             ers_harv_mguk_j (float): The lap's total ERS energy harvested by MGU-K in joules
             ers_deployed_j (float): The lap's total ERS energy deployed in joules
-            ers_harv_limit_mguk_j (float): The lap's total ERS energy harvested limit by MGU-K in joules
             ers_harv_limit_mguk_j (float): The lap's total ERS energy harvested limit by MGU-K in joules
                     May change per lap in 2026 regs, fixed in older regs
+            blob_pool (Optional[SnapshotBlobPool]): Pool used to share the tyre sets blob with other laps.
+                    If None, the blob is not shared
         """
 
-        self.m_car_damage_packet: CarDamageData = car_damage
-        self.m_car_status_packet: CarStatusData = car_status
+        self.m_car_damage_blob: Union[bytes, CarDamageData, None] = _toBlob(car_damage)
+        self.m_car_status_blob: Union[bytes, CarStatusData, None] = _toBlob(car_status)
+        self.m_tyre_sets_header_blob: Optional[bytes] = None
+        self.m_tyre_sets_blob: Union[bytes, PacketTyreSetsData, None] = _toBlob(tyre_sets)
+        if isinstance(self.m_tyre_sets_blob, bytes):
+            self.m_tyre_sets_header_blob = self.m_tyre_sets_blob[:PacketHeader.PACKET_LEN]
+            body = self.m_tyre_sets_blob[PacketHeader.PACKET_LEN:]
+            self.m_tyre_sets_blob = blob_pool.intern(body) if blob_pool is not None else body
         self.m_max_sc_status: SafetyCarType = max_sc_status
-        self.m_tyre_sets_packet: PacketTyreSetsData = tyre_sets
         self.m_track_position: int = track_position
         self.m_top_speed_kmph: float = top_speed_kmph
         self.m_ers_harv_mguh_j: float = ers_harv_mguh_j
         self.m_ers_harv_mguk_j: float = ers_harv_mguk_j
         self.m_ers_deployed_j: float = ers_deployed_j
         self.m_ers_harv_limit_mguk_j: float = ers_harv_limit_mguk_j
+        self.m_packets_json_blob: Optional[bytes] = None
+
+    @property
+    def m_car_damage_packet(self) -> Optional[CarDamageData]:
+        """The Car damage packet, parsed from the stored blob. None if unavailable"""
+        if isinstance(self.m_car_damage_blob, bytes):
+            return CarDamageData(self.m_car_damage_blob[2:], _packetFormat(self.m_car_damage_blob))
+        return self.m_car_damage_blob
+
+    @property
+    def m_car_status_packet(self) -> Optional[CarStatusData]:
+        """The Car Status packet, parsed from the stored blob. None if unavailable"""
+        if isinstance(self.m_car_status_blob, bytes):
+            return CarStatusData(self.m_car_status_blob[2:], _packetFormat(self.m_car_status_blob))
+        return self.m_car_status_blob
+
+    @property
+    def m_tyre_sets_packet(self) -> Optional[PacketTyreSetsData]:
+        """The Tyre Sets packet, parsed from the stored blob. None if unavailable"""
+        if isinstance(self.m_tyre_sets_blob, bytes):
+            return PacketTyreSetsData(PacketHeader(self.m_tyre_sets_header_blob), self.m_tyre_sets_blob)
+        return self.m_tyre_sets_blob
+
+    def buildJSONCache(self) -> None:
+        """Dump the packets to JSON and cache the result. Does nothing if already cached, or if the dump cannot be
+        encoded (it is then rebuilt on every call)"""
+        if self.m_packets_json_blob is not None:
+            return
+        try:
+            self.m_packets_json_blob = msgpack.packb(self._dumpPackets())
+        except (TypeError, ValueError):
+            pass
+
+    def getTyreSetJSON(self, index: int) -> Optional[Dict[str, Any]]:
+        """Get the JSON dump of one tyre set of this lap's tyre sets packet
+
+        Args:
+            index (int): Index into the tyre set data array
+
+        Returns:
+            Optional[Dict[str, Any]]: The JSON dump. None if the packet is unavailable or the index is out of bounds
+        """
+        tyre_sets = self._getPacketsJSON()["tyre-sets-data"]
+        if not tyre_sets or not (0 <= index < len(tyre_sets["tyre-set-data"])):
+            return None
+        return tyre_sets["tyre-set-data"][index]
 
     def toJSON(self, lap_number : int) -> Dict[str, Any]:
         """Dump this object into JSON
@@ -94,12 +205,13 @@ class PerLapSnapshotEntry:
             Dict[str, Any]: The JSON dump
         """
 
+        packets_json = self._getPacketsJSON()
         return {
             "lap-number" : lap_number,
-            "car-damage-data" : self.m_car_damage_packet.toJSON() if self.m_car_damage_packet else None,
-            "car-status-data" : self.m_car_status_packet.toJSON() if self.m_car_status_packet else None,
+            "car-damage-data" : packets_json["car-damage-data"],
+            "car-status-data" : packets_json["car-status-data"],
             "max-safety-car-status" : str(self.m_max_sc_status) if self.m_max_sc_status else None,
-            "tyre-sets-data" : self.m_tyre_sets_packet.toJSON() if self.m_tyre_sets_packet else None,
+            "tyre-sets-data" : packets_json["tyre-sets-data"],
             "track-position" : self.m_track_position or None,
             "top-speed-kmph" : self.m_top_speed_kmph,
             "ers-stats" : {
@@ -109,3 +221,65 @@ class PerLapSnapshotEntry:
                 "ers-harv-limit-mguk-j" : self.m_ers_harv_limit_mguk_j,
             },
         }
+
+    def _getPacketsJSON(self) -> Dict[str, Any]:
+        """Get the JSON dump of the packets. Every call returns a new copy, so the caller may modify it
+
+        Returns:
+            Dict[str, Any]: The car damage, car status and tyre sets dumps
+        """
+        self.buildJSONCache()
+        if self.m_packets_json_blob is None:
+            return self._dumpPackets()
+        return msgpack.unpackb(self.m_packets_json_blob)
+
+    def _dumpPackets(self) -> Dict[str, Any]:
+        """Dump the packets to JSON, parsing them from the stored blobs
+
+        Returns:
+            Dict[str, Any]: The car damage, car status and tyre sets dumps
+        """
+        car_damage = self.m_car_damage_packet
+        car_status = self.m_car_status_packet
+        tyre_sets = self.m_tyre_sets_packet
+        return {
+            "car-damage-data" : car_damage.toJSON() if car_damage else None,
+            "car-status-data" : car_status.toJSON() if car_status else None,
+            "tyre-sets-data" : tyre_sets.toJSON() if tyre_sets else None,
+        }
+
+# -------------------------------------- UTILS -------------------------------------------------------------------------
+
+_PACKET_FORMAT_STRUCT = struct.Struct("<H")
+
+def _toBlob(packet: Any) -> Any:
+    """Serialise a packet into its wire format. Sub packets are prefixed with their packet format, since their
+        layout depends on it (full packets carry it in the header)
+
+    Args:
+        packet (Any): The packet object. May be None
+
+    Returns:
+        Any: The blob. The object itself if it cannot be serialised, None if the packet is None
+    """
+    if packet is None:
+        return None
+    try:
+        raw = packet.to_bytes()
+    except (AttributeError, TypeError, struct.error):
+        # Raw values outside the known enums are stored as plain ints and cannot be packed
+        return packet
+    if isinstance(packet, PacketTyreSetsData):
+        return raw
+    return _PACKET_FORMAT_STRUCT.pack(packet.m_packetFormat) + raw
+
+def _packetFormat(blob: bytes) -> int:
+    """Get the packet format prefixed to a sub packet blob
+
+    Args:
+        blob (bytes): The blob
+
+    Returns:
+        int: The packet format
+    """
+    return _PACKET_FORMAT_STRUCT.unpack_from(blob)[0]
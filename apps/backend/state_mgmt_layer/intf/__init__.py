@@ -22,7 +22,7 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-from .readers import PeriodicUpdateData, RaceInfoData, DriverInfoRsp, StreamOverlayData
+from .readers import PeriodicUpdateData, RaceInfoData, DriverInfoRsp, StreamOverlayData, StrategyRsp, RaceControlRsp
 from .writers import ManualSaveRsp
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
@@ -34,6 +34,8 @@ __all__ = [
     "RaceInfoData",
     "DriverInfoRsp",
     "StreamOverlayData",
+    "StrategyRsp",
+    "RaceControlRsp",
 
     # Writers
     "ManualSaveRsp",
@@ -26,6 +26,8 @@ from .periodic_update_data import PeriodicUpdateData
 from .race_info import RaceInfoData
 from .driver_info import DriverInfoRsp
 from .stream_overlay import StreamOverlayData
+from .strategy import StrategyRsp
+from .race_control import RaceControlRsp
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
 
@@ -35,5 +37,7 @@ __all__ = [
     "RaceInfoData",
     "StreamOverlayData",
     "PeriodicUpdateData",
+    "StrategyRsp",
+    "RaceControlRsp",
 
 ]
@@ -143,7 +143,7 @@ class StreamOverlayData(BaseAPI):
             self.m_corner_cutting_warnings = self.m_ref_obj.m_packet_copies.m_packet_lap_data.m_cornerCuttingWarnings
             self.m_num_dt = self.m_ref_obj.m_packet_copies.m_packet_lap_data.m_numUnservedDriveThroughPens
             self.m_num_sg = self.m_ref_obj.m_packet_copies.m_packet_lap_data.m_numUnservedStopGoPens
-            self.m_num_collisions = len(self.m_ref_obj.m_collision_records)
+            self.m_num_collisions = len(self.m_ref_obj.m_collision_analyzer.m_collision_records)
         else:
             self.m_penalties = 0
             self.m_total_warnings = 0
@@ -27,7 +27,8 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from apps.backend.state_mgmt_layer.session_state import SessionState
-from lib.save_to_disk import save_json_to_file
+from lib.config import SaveFileFormat
+from lib.save_to_disk import get_save_file_name, save_session_to_file
 
 # ------------------------- API - CLASSES ------------------------------------------------------------------------------
 
@@ -36,20 +37,26 @@ class ManualSaveRsp:
     Manual save response class.
     """
 
-    def __init__(self, logger: logging.Logger, session_state: SessionState, reason: str = "Manual"):
+    def __init__(self,
+                 logger: logging.Logger,
+                 session_state: SessionState,
+                 reason: str = "Manual",
+                 file_format: SaveFileFormat = SaveFileFormat.JSON):
         """Prepare all data for saving. The saveToDisk method only performs the async write.
 
         Args:
             logger (logging.Logger): Logger
             session_state (SessionState): Reference to the session state
             reason (str, optional): Reason for the save. Defaults to "Manual".
+            file_format (SaveFileFormat, optional): Save file format. Defaults to JSON.
         """
 
         self.m_logger: logging.Logger = logger
+        self.m_file_format: SaveFileFormat = file_format
 
         event_str, final_json = self._prepareData(session_state)
         now = datetime.now().astimezone()
-        self.m_file_name: str = self._buildFileName(event_str, reason, now)
+        self.m_file_name: str = self._buildFileName(event_str, reason, now, file_format)
         self.m_final_json: Dict[str, Any] = self._injectDebugFields(final_json, session_state, now, reason, self.m_file_name)
 
     @staticmethod
@@ -73,12 +80,15 @@ class ManualSaveRsp:
         return event_str, final_json
 
     @staticmethod
-    def _buildFileName(event_str: str, reason: str, now: datetime) -> str:
-        """Construct the output filename from event, reason, and timestamp.
+    def _buildFileName(event_str: str,
+                       reason: str,
+                       now: datetime,
+                       file_format: SaveFileFormat = SaveFileFormat.JSON) -> str:
+        """Construct the output filename from event, reason, timestamp and file format.
 
         Note: event_str is already suffixed with an underscore.
         """
-        return f"{event_str}{reason}_{now.strftime('%Y_%m_%d_%H_%M_%S')}.json"
+        return get_save_file_name(f"{event_str}{reason}_{now.strftime('%Y_%m_%d_%H_%M_%S')}", file_format)
 
     @staticmethod
     def _injectDebugFields(
@@ -111,7 +121,7 @@ class ManualSaveRsp:
         """
 
         try:
-            path = await save_json_to_file(self.m_final_json, self.m_file_name)
+            path = await save_session_to_file(self.m_final_json, self.m_file_name, self.m_file_format)
             self.m_logger.info("Wrote session info to %s", self.m_file_name)
             return {"status": "success", "message": f"Data saved to {path}"}
         except Exception as e:  # pylint: disable=broad-except
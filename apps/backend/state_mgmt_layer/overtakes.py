@@ -25,7 +25,7 @@
 from logging import Logger
 from typing import List, Optional
 from enum import Enum, auto
-from lib.overtake_analyzer import OvertakeRecord
+from lib.overtake_analyzer import OvertakeRecord, StreamingOvertakeAnalyzer
 
 # -------------------------------------- GLOBALS -----------------------------------------------------------------------
 
@@ -70,6 +70,7 @@ class OvertakesHistory:
         """
 
         self.m_overtakes_history: List[OvertakeRecord] = []
+        self.m_analyzer = StreamingOvertakeAnalyzer()
         self.m_logger = logger
 
     def insert(self, overtake_record: OvertakeRecord) -> None:
@@ -82,17 +83,20 @@ class OvertakesHistory:
         if len(self.m_overtakes_history) == 0:
             overtake_record.m_row_id = 0
             self.m_overtakes_history.append(overtake_record)
+            self.m_analyzer.processOvertakeRecord(overtake_record)
         elif (self.m_overtakes_history[-1] == overtake_record) and self.m_logger:
             self.m_logger.debug("not adding repeated overtake record %s", str(overtake_record))
         else:
             overtake_record.m_row_id = len(self.m_overtakes_history)
             self.m_overtakes_history.append(overtake_record)
+            self.m_analyzer.processOvertakeRecord(overtake_record)
 
     def clear(self) -> None:
         """Clear the overtakes history tracker
         """
 
         self.m_overtakes_history.clear()
+        self.m_analyzer.clear()
 
     def getRecords(self) -> List[OvertakeRecord]:
         """Get the overtake records
@@ -102,3 +106,12 @@ class OvertakesHistory:
         """
 
         return self.m_overtakes_history
+
+    def getAnalyzer(self) -> StreamingOvertakeAnalyzer:
+        """Get the analyzer holding the running aggregates of the overtakes recorded so far
+
+        Returns:
+            StreamingOvertakeAnalyzer: The analyzer
+        """
+
+        return self.m_analyzer
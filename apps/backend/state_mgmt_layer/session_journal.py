@@ -0,0 +1,631 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+import io
+import logging
+import os
+import pickle
+import struct
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from apps.backend.state_mgmt_layer.data_per_driver import DataPerDriver
+from apps.backend.state_mgmt_layer.data_per_driver.tyre_info import TyreWearRecentHistory
+from apps.backend.state_mgmt_layer.session_state import SessionState
+from lib.race_ctrl import DriverRaceControlManager
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+CHECKPOINT_INTERVAL_LAPS = 10
+
+_JOURNAL_SUFFIX = ".journal"
+_CHECKPOINT_SUFFIX = ".ckpt"
+_RECORD_HEADER = struct.Struct("<II") # Payload length, CRC32 of the payload
+_PICKLE_PROTOCOL = pickle.HIGHEST_PROTOCOL
+_LOOP_TIME_WINDOW = 512 # Latest per record loop times kept for the stats, per record type
+
+# SessionState members that are config or runtime status rather than session data. These are never journaled and
+# keep their current values on recovery
+_SESSION_RUNTIME_ATTRS = frozenset({
+    "m_logger",
+    "m_version",
+    "m_process_car_setups",
+    "m_save_race_ctrl_msgs",
+    "m_weather_aware_prediction",
+    "m_tyre_wear_window_size",
+    "m_power_filter_window_size",
+    "m_connected_to_sim",
+    "m_in_menu",
+    "m_track_segments_db",
+    "m_strategy_simulator",
+    "m_strategy_cache_key",
+    "m_strategy_cache",
+})
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class _StatePickler(pickle.Pickler):
+    """Pickler for the session state and driver records. The logger and the objects that belong to another record (the
+    session state, referenced by every driver, and the race control managers, which the session record holds) are
+    stored as references and bound to the live objects on load. Data of other drivers must not be reachable at all"""
+
+    def __init__(self, file: IO[bytes], root: Any, refs: Dict[int, str]):
+        super().__init__(file, protocol=_PICKLE_PROTOCOL)
+        self.m_root = root
+        self.m_refs = refs
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if (ref := self.m_refs.get(id(obj))) is not None:
+            return ref
+        if isinstance(obj, logging.Logger):
+            return "logger"
+        if isinstance(obj, DataPerDriver) and obj is not self.m_root:
+            raise pickle.PicklingError(f"Data of driver {obj.m_index} is referenced outside its own record")
+        return None
+
+class _StateUnpickler(pickle.Unpickler):
+    """Counterpart of _StatePickler"""
+
+    def __init__(self, file: IO[bytes], session_state: SessionState):
+        super().__init__(file)
+        self.m_session_state = session_state
+
+    def persistent_load(self, pid: str) -> Any:
+        if pid == "session-state":
+            return self.m_session_state
+        if pid == "logger":
+            return self.m_session_state.m_logger
+        if pid == "race-ctrl":
+            return self.m_session_state.m_race_ctrl
+        if pid.startswith("race-ctrl:"):
+            # Missing if the driver joined after the last session record
+            index = int(pid.split(":")[1])
+            race_ctrl = self.m_session_state.m_race_ctrl
+            if index not in race_ctrl.drivers:
+                race_ctrl.register_driver(index, DriverRaceControlManager(index))
+            return race_ctrl.drivers[index]
+        raise pickle.UnpicklingError(f"Unknown persistent ID {pid}")
+
+class _JournalModel:
+    """
+    The journal contents, folded into the latest value of everything. This is what a checkpoint stores, and what
+    the session state is rebuilt from.
+
+    Records are tuples:
+        ("state", leader_lap, snapshot_laps, state_blob) - The session state, without the driver data
+        ("driver", index, snapshot_laps, snapshots, best_lap, driver_blob) - A driver's per lap data that changed since
+            its last record, and the rest of its data (None if unchanged)
+
+    snapshot_laps is the list of laps a driver has snapshots for at that time (so that laps dropped by a flashback are
+    dropped here as well), snapshots maps lap number to a pickled PerLapSnapshotEntry and best_lap is None or
+    (lap number, pickled delta trace points)
+    """
+
+    def __init__(self) -> None:
+        self.m_leader_lap: int = 0
+        self.m_state_blob: Optional[bytes] = None
+        self.m_driver_blobs: Dict[int, bytes] = {}
+        self.m_snapshot_laps: Dict[int, List[int]] = {}
+        self.m_snapshots: Dict[int, Dict[int, bytes]] = {}
+        self.m_best_laps: Dict[int, Tuple[int, bytes]] = {}
+
+    def apply(self, record: Tuple[Any, ...]) -> None:
+        """Fold a journal record into the model
+
+        Args:
+            record (Tuple[Any, ...]): The record
+        """
+        if record[0] == "state":
+            _, self.m_leader_lap, snapshot_laps, self.m_state_blob = record
+            self.m_snapshot_laps.update(snapshot_laps)
+        elif record[0] == "driver":
+            _, index, snapshot_laps, snapshots, best_lap, driver_blob = record
+            self.m_snapshot_laps[index] = snapshot_laps
+            self.m_snapshots.setdefault(index, {}).update(snapshots)
+            if best_lap is not None:
+                self.m_best_laps[index] = best_lap
+            if driver_blob is not None:
+                self.m_driver_blobs[index] = driver_blob
+
+    def compact(self) -> None:
+        """Drop the snapshots of laps that no longer exist"""
+        for index, snapshots in self.m_snapshots.items():
+            live_laps = set(self.m_snapshot_laps.get(index, ()))
+            for lap in [lap for lap in snapshots if lap not in live_laps]:
+                del snapshots[lap]
+
+    def toRecord(self) -> Tuple[Any, ...]:
+        """Dump the model as a checkpoint record"""
+        return ("checkpoint", self.m_leader_lap, self.m_state_blob, self.m_driver_blobs, self.m_snapshot_laps,
+                self.m_snapshots, self.m_best_laps)
+
+    @classmethod
+    def fromRecord(cls, record: Tuple[Any, ...]) -> "_JournalModel":
+        """Load a model from a checkpoint record"""
+        model = cls()
+        (_, model.m_leader_lap, model.m_state_blob, model.m_driver_blobs, model.m_snapshot_laps, model.m_snapshots,
+         model.m_best_laps) = record
+        return model
+
+    def restore(self, session_state: SessionState) -> int:
+        """Rebuild the session state from this model. Runtime and config members of the session state are kept. Each
+        driver is restored as of its own last record.
+
+        Args:
+            session_state (SessionState): The session state to be overwritten
+
+        Returns:
+            int: Number of lap snapshots restored
+        """
+        state_attrs: Dict[str, Any] = _StateUnpickler(io.BytesIO(self.m_state_blob), session_state).load()
+        for attr, value in state_attrs.items():
+            setattr(session_state, attr, value)
+        for index, blob in sorted(self.m_driver_blobs.items()):
+            session_state.m_driver_data[index] = _StateUnpickler(io.BytesIO(blob), session_state).load()
+
+        num_snapshots = 0
+        for index, driver in enumerate(session_state.m_driver_data):
+            if not driver:
+                continue
+            snapshots = self.m_snapshots.get(index, {})
+            for lap in self.m_snapshot_laps.get(index, ()):
+                if blob := snapshots.get(lap):
+                    entry = pickle.loads(blob)
+                    if isinstance(entry.m_tyre_sets_blob, bytes):
+                        entry.m_tyre_sets_blob = driver.m_snapshot_blob_pool.intern(entry.m_tyre_sets_blob)
+                    driver.m_per_lap_snapshots[lap] = entry
+                    num_snapshots += 1
+            if best_lap := self.m_best_laps.get(index):
+                driver.m_delta_mgr.restore_lap(best_lap[0], pickle.loads(best_lap[1]))
+        return num_snapshots
+
+class SessionJournal:
+    """
+    Append-only journal of the live session, to rebuild the session state after a backend crash.
+
+    - When a driver starts a new lap, that driver is journaled: the per lap data that changed (the new lap snapshots
+      and the best lap's delta trace) and the rest of its data, with the tyre wear window trimmed. Drivers that have
+      not started a lap for a whole leader lap (e.g. retired) are journaled when the leader starts the next one
+    - When the leader starts a new lap, the session state without the driver data is journaled
+    - Every CHECKPOINT_INTERVAL_LAPS leader laps, the journal is folded into a checkpoint file and truncated
+
+    This spreads the pickling across the lap, one driver at a time, and only the pickling happens on the event loop.
+    Compression and file writes happen in a single writer thread, in order. There is one journal per session UID;
+    starting a journal removes those of other sessions.
+
+    Attributes:
+        m_logger (logging.Logger): Logger
+        m_journal_dir (Path): Directory holding the journal and checkpoint files
+        m_checkpoint_interval_laps (int): Leader laps between checkpoints
+    """
+
+    def __init__(self,
+                 logger: logging.Logger,
+                 journal_dir: Path,
+                 checkpoint_interval_laps: int = CHECKPOINT_INTERVAL_LAPS):
+        """Create the journal. No file is created until the first lap data of a session
+
+        Args:
+            logger (logging.Logger): Logger
+            journal_dir (Path): Directory holding the journal and checkpoint files
+            checkpoint_interval_laps (int): Leader laps between checkpoints
+        """
+        self.m_logger: logging.Logger = logger
+        self.m_journal_dir: Path = Path(journal_dir)
+        self.m_checkpoint_interval_laps: int = checkpoint_interval_laps
+        self.m_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="Session Journal")
+
+        # Event loop side
+        self.m_session_uid: Optional[int] = None
+        self.m_paused: bool = False
+        self.m_leader_lap: int = 0
+        self.m_driver_laps: Dict[int, int] = {}
+        self.m_journaled_drivers: Set[int] = set() # Drivers journaled since the leader started the current lap
+        self.m_sent_snapshots: Dict[int, Dict[int, Any]] = {}
+        self.m_sent_best_laps: Dict[int, Tuple[int, int]] = {}
+
+        # Writer thread side
+        self.m_model: _JournalModel = _JournalModel()
+        self.m_file: Optional[IO[bytes]] = None
+
+        # Stats
+        self.m_num_records: int = 0
+        self.m_num_checkpoints: int = 0
+        self.m_bytes_written: int = 0
+        self.m_loop_sec: float = 0.0
+        self.m_record_loop_sec: Dict[str, Deque[float]] = {}
+        self.m_last_recovery_ms: Optional[float] = None
+
+    # ---------------------------------------------------------------------
+    # Event loop API
+    # ---------------------------------------------------------------------
+
+    def onLapData(self, session_state: SessionState) -> None:
+        """Journal what changed since the last call. Call after every lap data update. Cheap unless a driver started
+        a new lap.
+
+        Args:
+            session_state (SessionState): The session state
+        """
+        session_uid = session_state.m_session_info.m_session_uid
+        if session_uid is None:
+            return
+        if session_uid != self.m_session_uid:
+            self._resetSession(session_uid)
+            self.m_executor.submit(self._guarded, self._openSession, session_uid, False)
+        if self.m_paused:
+            return
+
+        start = time.perf_counter()
+        leader_lap = 0
+        new_lap_drivers = set()
+        for index, driver in enumerate(session_state.m_driver_data):
+            if not driver or driver.m_lap_info.m_current_lap is None:
+                continue
+            lap = driver.m_lap_info.m_current_lap
+            leader_lap = max(leader_lap, lap)
+            if self.m_driver_laps.get(index) != lap:
+                self.m_driver_laps[index] = lap
+                new_lap_drivers.add(index)
+                self._journalDriver(index, driver, session_state)
+
+        if leader_lap > self.m_leader_lap:
+            self.m_leader_lap = leader_lap
+            for index, driver in enumerate(session_state.m_driver_data):
+                if driver and index in self.m_driver_laps and index not in new_lap_drivers:
+                    # Pick up per lap data that was created after the driver's own record, and the rest of the data
+                    # of drivers that are no longer starting laps
+                    self._journalDriver(index, driver, session_state,
+                                        only_lap_data=index in self.m_journaled_drivers)
+            self.m_journaled_drivers = new_lap_drivers
+            self._journalState(session_state)
+            if leader_lap % self.m_checkpoint_interval_laps == 0:
+                self.m_executor.submit(self._guarded, self._writeCheckpoint)
+        else:
+            self.m_journaled_drivers |= new_lap_drivers
+        self.m_loop_sec += time.perf_counter() - start
+
+    async def recover(self, session_uid: int, session_state: SessionState) -> bool:
+        """Rebuild the session state from the checkpoint and journal of the given session, if any, and continue
+        journaling that session. Call when the session UID changes (the session state has just been cleared).
+
+        Args:
+            session_uid (int): The new session UID
+            session_state (SessionState): The session state to be rebuilt
+
+        Returns:
+            bool: True if the session state was rebuilt
+        """
+        if session_uid == self.m_session_uid:
+            return False
+        self._resetSession(session_uid)
+        self.m_paused = True
+        try:
+            start = time.perf_counter()
+            model: Optional[_JournalModel] = await asyncio.get_running_loop().run_in_executor(
+                self.m_executor, self._guarded, self._openSession, session_uid, True)
+            if not model or model.m_state_blob is None:
+                return False
+            num_snapshots = model.restore(session_state)
+            self._markRestored(session_state, model.m_leader_lap)
+            self.m_last_recovery_ms = (time.perf_counter() - start) * 1000
+            self.m_logger.info("Rebuilt session %d from the journal in %.1f ms. Leader lap %d, %d lap snapshots",
+                               session_uid, self.m_last_recovery_ms, model.m_leader_lap, num_snapshots)
+            return True
+        except Exception: # pylint: disable=broad-exception-caught
+            # A broken journal must not stop the session from starting afresh
+            self.m_logger.exception("Failed to rebuild session %d from the journal", session_uid)
+            session_state.clear("Journal recovery failed")
+            self._resetSession(session_uid)
+            return False
+        finally:
+            self.m_paused = False
+
+    def discard(self) -> None:
+        """Delete the journal of the current session and stop journaling it, e.g. once it has been saved"""
+        self.m_paused = True
+        self.m_executor.submit(self._guarded, self._deleteFiles, self.m_session_uid)
+
+    def close(self) -> None:
+        """Write out everything pending and close the journal. Blocks until done"""
+        self.m_executor.submit(self._guarded, self._closeFile)
+        self.m_executor.shutdown(wait=True)
+
+    def getStats(self) -> Dict[str, Any]:
+        """Get the journal stats.
+
+        Returns:
+            Dict[str, Any]: The stats
+        """
+        return {
+            "session-uid": self.m_session_uid,
+            "records": self.m_num_records,
+            "checkpoints": self.m_num_checkpoints,
+            "bytes-written": self.m_bytes_written,
+            "loop-ms": round(self.m_loop_sec * 1000, 3),
+            "record-loop-ms": {
+                record_type: {
+                    "count": len(times),
+                    "last": round(times[-1] * 1000, 3),
+                    "p50": round(sorted(times)[len(times) // 2] * 1000, 3),
+                    "max": round(max(times) * 1000, 3),
+                }
+                for record_type, times in self.m_record_loop_sec.items()
+            },
+            "last-recovery-ms": round(self.m_last_recovery_ms, 3) if self.m_last_recovery_ms is not None else None,
+        }
+
+    # ---------------------------------------------------------------------
+    # Event loop helpers
+    # ---------------------------------------------------------------------
+
+    def _resetSession(self, session_uid: int) -> None:
+        """Reset the change tracking for a new session"""
+        self.m_session_uid = session_uid
+        self.m_paused = False
+        self.m_leader_lap = 0
+        self.m_driver_laps.clear()
+        self.m_journaled_drivers.clear()
+        self.m_sent_snapshots.clear()
+        self.m_sent_best_laps.clear()
+
+    def _journalDriver(self,
+                       index: int,
+                       driver: DataPerDriver,
+                       session_state: SessionState,
+                       only_lap_data: bool = False) -> None:
+        """Journal a driver: the per lap data that changed since the last record and the rest of its data. With
+        only_lap_data, the rest is left out and nothing is written if no per lap data changed"""
+        start = time.perf_counter()
+        sent = self.m_sent_snapshots.setdefault(index, {})
+        snapshots = {}
+        for lap, entry in driver.m_per_lap_snapshots.items():
+            if sent.get(lap) is not entry:
+                snapshots[lap] = pickle.dumps(entry, protocol=_PICKLE_PROTOCOL)
+                sent[lap] = entry
+
+        best_lap = None
+        if (best_lap_num := driver.m_delta_mgr.best_lap_num) is not None:
+            points = driver.m_delta_mgr.get_lap_points(best_lap_num)
+            if points and self.m_sent_best_laps.get(index) != (best_lap_num, len(points)):
+                self.m_sent_best_laps[index] = (best_lap_num, len(points))
+                best_lap = (best_lap_num, pickle.dumps(points, protocol=_PICKLE_PROTOCOL))
+
+        driver_blob = None
+        if only_lap_data:
+            if not snapshots and best_lap is None:
+                return
+        elif (driver_blob := self._dumpDriver(driver, session_state)) is None:
+            return
+        record = ("driver", index, list(driver.m_per_lap_snapshots), snapshots, best_lap, driver_blob)
+        self._submitRecord(record, start)
+
+    def _dumpDriver(self, driver: DataPerDriver, session_state: SessionState) -> Optional[bytes]:
+        """Pickle a driver's data, without the per lap data (which the driver records cover separately) and with the
+        tyre wear window trimmed"""
+        race_ctrl = session_state.m_race_ctrl
+        refs = {id(session_state): "session-state", id(race_ctrl): "race-ctrl"}
+        refs.update((id(mgr), f"race-ctrl:{driver_index}") for driver_index, mgr in race_ctrl.drivers.items())
+        saved = (driver.m_per_lap_snapshots, driver.m_delta_mgr, driver.m_tyre_info.tyre_wear)
+        try:
+            # Swapped out only for the duration of this synchronous dump
+            driver.m_per_lap_snapshots = {}
+            driver.m_delta_mgr = driver.m_delta_mgr.without_laps()
+            driver.m_tyre_info.tyre_wear = _trimTyreWear(driver.m_tyre_info.tyre_wear)
+            return self._dump(driver, refs)
+        finally:
+            driver.m_per_lap_snapshots, driver.m_delta_mgr, driver.m_tyre_info.tyre_wear = saved
+
+    def _journalState(self, session_state: SessionState) -> None:
+        """Journal the session state, without the driver data"""
+        start = time.perf_counter()
+        attrs = {
+            attr: getattr(session_state, attr)
+            for attr in session_state.__slots__
+            if attr not in _SESSION_RUNTIME_ATTRS and attr != "m_driver_data" and hasattr(session_state, attr)
+        }
+        if (state_blob := self._dump(attrs, {id(session_state): "session-state"})) is None:
+            return
+        snapshot_laps = {
+            index: list(driver.m_per_lap_snapshots)
+            for index, driver in enumerate(session_state.m_driver_data) if driver
+        }
+        self._submitRecord(("state", self.m_leader_lap, snapshot_laps, state_blob), start)
+
+    def _dump(self, root: Any, refs: Dict[int, str]) -> Optional[bytes]:
+        """Pickle a record's data. On failure, journaling is paused for this session
+
+        Returns:
+            Optional[bytes]: The pickled data, None on failure
+        """
+        buffer = io.BytesIO()
+        try:
+            _StatePickler(buffer, root, refs).dump(root)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            self.m_logger.exception("Failed to journal the session state. Journaling paused for this session")
+            self.m_paused = True
+            return None
+        return buffer.getvalue()
+
+    def _submitRecord(self, record: Tuple[Any, ...], start: float) -> None:
+        """Hand a record over to the writer thread and note the time it took on the event loop, since start"""
+        self.m_executor.submit(self._guarded, self._writeRecord, record)
+        if (times := self.m_record_loop_sec.get(record[0])) is None:
+            times = self.m_record_loop_sec[record[0]] = deque(maxlen=_LOOP_TIME_WINDOW)
+        times.append(time.perf_counter() - start)
+
+    def _markRestored(self, session_state: SessionState, leader_lap: int) -> None:
+        """Mark everything in a just rebuilt session state as journaled"""
+        self.m_leader_lap = leader_lap
+        for index, driver in enumerate(session_state.m_driver_data):
+            if not driver:
+                continue
+            self.m_driver_laps[index] = driver.m_lap_info.m_current_lap
+            self.m_journaled_drivers.add(index)
+            self.m_sent_snapshots[index] = dict(driver.m_per_lap_snapshots)
+            if (best_lap_num := driver.m_delta_mgr.best_lap_num) is not None:
+                self.m_sent_best_laps[index] = (best_lap_num, len(driver.m_delta_mgr.get_lap_points(best_lap_num)))
+
+    # ---------------------------------------------------------------------
+    # Writer thread
+    # ---------------------------------------------------------------------
+
+    def _guarded(self, fn, *args) -> Any:
+        """Run a writer thread job, logging instead of raising, since nobody waits for most of them"""
+        try:
+            return fn(*args)
+        except Exception: # pylint: disable=broad-exception-caught
+            self.m_logger.exception("Session journal %s failed", fn.__name__)
+            return None
+
+    def _paths(self, session_uid: int) -> Tuple[Path, Path]:
+        """Get the journal and checkpoint file paths of a session"""
+        return (self.m_journal_dir / f"{session_uid}{_JOURNAL_SUFFIX}",
+                self.m_journal_dir / f"{session_uid}{_CHECKPOINT_SUFFIX}")
+
+    def _openSession(self, session_uid: int, resume: bool) -> Optional[_JournalModel]:
+        """Switch the writer to a session. Journals of other sessions are deleted.
+
+        Args:
+            session_uid (int): The session UID
+            resume (bool): Load and continue the session's existing journal instead of starting afresh
+
+        Returns:
+            Optional[_JournalModel]: The loaded model, None if not resuming or nothing was journaled
+        """
+        self._closeFile()
+        self.m_journal_dir.mkdir(parents=True, exist_ok=True)
+        journal_path, checkpoint_path = self._paths(session_uid)
+        for path in self.m_journal_dir.iterdir():
+            if path.suffix in (_JOURNAL_SUFFIX, _CHECKPOINT_SUFFIX) and path not in (journal_path, checkpoint_path):
+                path.unlink(missing_ok=True)
+
+        model = None
+        if resume and (journal_path.exists() or checkpoint_path.exists()):
+            model = loadJournal(journal_path, checkpoint_path)
+            self.m_model = model
+            self.m_file = open(journal_path, "ab") # pylint: disable=consider-using-with
+        else:
+            self.m_model = _JournalModel()
+            checkpoint_path.unlink(missing_ok=True)
+            self.m_file = open(journal_path, "wb") # pylint: disable=consider-using-with
+        return model
+
+    def _writeRecord(self, record: Tuple[Any, ...]) -> None:
+        """Fold a record into the model and append it to the journal"""
+        self.m_model.apply(record)
+        if self.m_file:
+            self.m_bytes_written += _writeFramed(self.m_file, record)
+            self.m_file.flush()
+            self.m_num_records += 1
+
+    def _writeCheckpoint(self) -> None:
+        """Write the model as the checkpoint (atomically) and truncate the journal"""
+        if not self.m_file or self.m_model.m_state_blob is None:
+            return
+        journal_path = Path(self.m_file.name)
+        checkpoint_path = journal_path.with_suffix(_CHECKPOINT_SUFFIX)
+        self.m_model.compact()
+        tmp_path = checkpoint_path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            self.m_bytes_written += _writeFramed(f, self.m_model.toRecord())
+        os.replace(tmp_path, checkpoint_path)
+        # A crash between the two only means the journal records are applied again on top, which is harmless
+        self.m_file.truncate(0)
+        self.m_file.seek(0)
+        self.m_num_checkpoints += 1
+
+    def _deleteFiles(self, session_uid: Optional[int]) -> None:
+        """Close and delete the files of a session"""
+        self._closeFile()
+        self.m_model = _JournalModel()
+        if session_uid is not None:
+            for path in self._paths(session_uid):
+                path.unlink(missing_ok=True)
+
+    def _closeFile(self) -> None:
+        """Close the journal file"""
+        if self.m_file:
+            self.m_file.close()
+            self.m_file = None
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def loadJournal(journal_path: Path, checkpoint_path: Path) -> _JournalModel:
+    """Load a session's checkpoint (if present) and apply its journal on top. A record that was cut short by a crash
+    ends the journal.
+
+    Args:
+        journal_path (Path): The journal file
+        checkpoint_path (Path): The checkpoint file
+
+    Returns:
+        _JournalModel: The journal model
+    """
+    model = _JournalModel()
+    if checkpoint_path.exists():
+        with open(checkpoint_path, "rb") as f:
+            for record in _readFramed(f):
+                model = _JournalModel.fromRecord(record)
+    if journal_path.exists():
+        with open(journal_path, "rb") as f:
+            for record in _readFramed(f):
+                model.apply(record)
+    return model
+
+def _trimTyreWear(tyre_wear: TyreWearRecentHistory) -> TyreWearRecentHistory:
+    """Copy of the tyre wear window with only the samples that matter across a restart, i.e. the max average (used
+    for delayed tyre set changes) and the latest. The window is refilled within seconds of live telemetry"""
+    trimmed = TyreWearRecentHistory(maxlen=tyre_wear.maxlen)
+    _, max_average = tyre_wear.get_max_average_with_index()
+    if max_average is not None:
+        trimmed.push(max_average)
+        if tyre_wear.latest is not max_average:
+            trimmed.push(tyre_wear.latest)
+    return trimmed
+
+def _writeFramed(f: IO[bytes], record: Tuple[Any, ...]) -> int:
+    """Write a compressed, length and checksum prefixed record
+
+    Returns:
+        int: Number of bytes written
+    """
+    payload = zlib.compress(pickle.dumps(record, protocol=_PICKLE_PROTOCOL), 1)
+    f.write(_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+    f.write(payload)
+    return _RECORD_HEADER.size + len(payload)
+
+def _readFramed(f: IO[bytes]) -> Iterator[Tuple[Any, ...]]:
+    """Read the records written by _writeFramed, stopping at the first incomplete or corrupt one"""
+    while len(header := f.read(_RECORD_HEADER.size)) == _RECORD_HEADER.size:
+        length, crc = _RECORD_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) != length or zlib.crc32(payload) != crc:
+            return
+        yield pickle.loads(zlib.decompress(payload))
@@ -23,6 +23,7 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 import json
+import math
 import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -30,8 +31,8 @@ from typing import Any, Dict, List, Optional, Tuple
 from apps.backend.state_mgmt_layer.data_per_driver import DataPerDriver
 from apps.backend.state_mgmt_layer.overtakes import (GetOvertakesStatus,
                                                      OvertakesHistory)
-from lib.collisions_analyzer import (CollisionAnalyzer, CollisionAnalyzerMode,
-                                     CollisionRecord)
+from lib.collisions_analyzer import (CollisionRecord,
+                                     StreamingCollisionAnalyzer)
 from lib.config import PngSettings
 from lib.custom_marker_tracker import CustomMarkerEntry, CustomMarkersHistory
 from lib.f1_types import (ActualTyreCompound, CarStatusData, F1Utils,
@@ -46,18 +47,20 @@ from lib.f1_types import (ActualTyreCompound, CarStatusData, F1Utils,
                           PacketTyreSetsData, ResultReason, ResultStatus,
                           SafetyCarType, SessionType, TrackID,
                           VisualTyreCompound, WeatherForecastSample)
+from lib.file_path import resolve_fixed_file
 from lib.inter_task_communicator import (AsyncInterTaskCommunicator,
                                          SessionChangeNotification,
                                          TyreDeltaMessage)
 from lib.logger import PngLogger
 from lib.openf1 import MostRecentPoleLap
-from lib.overtake_analyzer import (OvertakeAnalyzer, OvertakeAnalyzerMode,
-                                   OvertakeRecord)
+from lib.overtake_analyzer import OvertakeRecord
 from lib.pending_events import DriverPendingEvents
 from lib.race_analyzer import getFastestTimesJson, getTyreStintRecordsDict
 from lib.race_ctrl import (DriverAiStatusChange, SessionRaceControlManager,
                            race_ctrl_event_msg_factory)
+from lib.strategy_simulator import StrategyOption, StrategySimulator
 from lib.track_segment_info import TrackSegmentsDatabase
+from lib.track_segment_info.types import BaseSegmentInfo
 from lib.tyre_wear_extrapolator import TyreWearPerLap
 
 # -------------------------------------- CLASS DEFINITIONS -------------------------------------------------------------
@@ -313,7 +316,7 @@ class SessionState:
         'm_race_completed',
         'm_is_player_dnf',
         'm_ideal_pit_stop_window',
-        'm_collision_records',
+        'm_collision_analyzer',
         'm_fastest_s1_ms',
         'm_fastest_s2_ms',
         'm_fastest_s3_ms',
@@ -336,6 +339,10 @@ class SessionState:
         'm_flashback_occurred',
         'm_in_menu',
         'm_track_segments_db',
+        'm_car_segments',
+        'm_strategy_simulator',
+        'm_strategy_cache_key',
+        'm_strategy_cache',
     )
 
     def __init__(self,
@@ -360,7 +367,7 @@ class SessionState:
         self.m_race_completed: Optional[bool] = None
         self.m_is_player_dnf : Optional[bool] = None
         self.m_ideal_pit_stop_window : Optional[int] = None
-        self.m_collision_records : List[CollisionRecord] = []
+        self.m_collision_analyzer = StreamingCollisionAnalyzer()
         self.m_fastest_s1_ms: Optional[int] = None
         self.m_fastest_s2_ms: Optional[int] = None
         self.m_fastest_s3_ms: Optional[int] = None
@@ -387,8 +394,13 @@ class SessionState:
         self.m_race_ctrl: SessionRaceControlManager = SessionRaceControlManager()
         self.m_flashback_occurred: bool = False
         self.m_track_segments_db = TrackSegmentsDatabase(
-            Path(__file__).parents[3] / "assets/track-segments"
+            Path(__file__).parents[3] / "assets/track-segments",
+            cache_path=resolve_fixed_file("track_segments.cache")
         )
+        self.m_car_segments: Optional[List[Optional[BaseSegmentInfo]]] = None
+        self.m_strategy_simulator = StrategySimulator()
+        self.m_strategy_cache_key: Optional[Tuple] = None
+        self.m_strategy_cache: Dict[int, List[StrategyOption]] = {}
 
     ####### Control Methods ########
 
@@ -406,7 +418,7 @@ class SessionState:
         self.m_race_completed = None
         self.m_is_player_dnf = None
         self.m_ideal_pit_stop_window = None
-        self.m_collision_records.clear()
+        self.m_collision_analyzer.clear()
         self.m_fastest_s1_ms = None
         self.m_fastest_s2_ms = None
         self.m_fastest_s3_ms = None
@@ -416,6 +428,9 @@ class SessionState:
         self.m_custom_markers_history.clear()
         self.m_race_ctrl.clear()
         self.m_flashback_occurred = False
+        self.m_car_segments = None
+        self.m_strategy_cache_key = None
+        self.m_strategy_cache = {}
 
         self.m_pkt_count = 0
         self.m_pkt_fmt = None
@@ -481,6 +496,7 @@ class SessionState:
             packet (PacketLapData): Lap data object
         """
 
+        self.m_car_segments = None # Resolved on demand by _lookup_segment_info()
         num_active_cars = 0
         should_recompute_fastest_lap = False
         for index, lap_data in enumerate(packet.m_lapData):
@@ -678,7 +694,7 @@ class SessionState:
                     if obj_to_be_updated.m_packet_copies.m_packet_lap_data:
                         _lap_data = obj_to_be_updated.m_packet_copies.m_packet_lap_data
                         msg.lap_distance = _lap_data.m_lapDistance
-                        msg.segment_info = self._lookup_segment_info(msg.lap_distance)
+                        msg.segment_info = self._lookup_segment_info(index)
                         msg.sector = str(_lap_data.m_sector)
                     obj_to_be_updated.m_race_ctrl.add_message(msg)
 
@@ -1102,9 +1118,9 @@ class SessionState:
 
         collision_obj = self._getCollisionObj(packet.m_vehicle_1_index, packet.m_vehicle_2_index)
         if collision_obj:
-            self.m_driver_data[packet.m_vehicle_1_index].m_collision_records.append(collision_obj)
-            self.m_driver_data[packet.m_vehicle_2_index].m_collision_records.append(collision_obj)
-            self.m_collision_records.append(collision_obj)
+            self.m_driver_data[packet.m_vehicle_1_index].m_collision_analyzer.processCollisionRecord(collision_obj)
+            self.m_driver_data[packet.m_vehicle_2_index].m_collision_analyzer.processCollisionRecord(collision_obj)
+            self.m_collision_analyzer.processCollisionRecord(collision_obj)
 
     def processOvertakeEvent(self, record: PacketEventData.Overtake) -> None:
         """Processes an overtake event and adds it to the overtake history
@@ -1147,7 +1163,7 @@ class SessionState:
                 if driver_obj and driver_obj.m_packet_copies.m_packet_lap_data:
                     _lap_data = driver_obj.m_packet_copies.m_packet_lap_data
                     msg.lap_distance = _lap_data.m_lapDistance
-                    msg.segment_info = self._lookup_segment_info(msg.lap_distance)
+                    msg.segment_info = self._lookup_segment_info(msg.involved_drivers[0])
                     msg.sector = str(_lap_data.m_sector)
             self.m_race_ctrl.add_message(msg)
 
@@ -1194,6 +1210,30 @@ class SessionState:
 
         return final_json
 
+    def getStrategyJSON(self, index: int) -> Optional[Dict[str, Any]]:
+        """Get the ranked pit strategies for the specified driver.
+
+        Args:
+            index (int): Index of the driver
+
+        Returns:
+            Optional[Dict[str, Any]]: Strategy JSON. None if invalid index or data not yet available
+        """
+
+        driver_info_obj = self._getObjectByIndex(index, create=False)
+        if not driver_info_obj:
+            return None
+        options = self._getStrategyOptions().get(index)
+        return {
+            "index": index,
+            "driver-name": driver_info_obj.m_driver_info.name,
+            "current-lap": driver_info_obj.m_lap_info.m_current_lap,
+            "total-laps": self.m_session_info.m_total_laps,
+            "pit-time-loss": self.m_session_info.m_pit_time_loss,
+            "status": options is not None,
+            "strategies": [option.toJSON() for option in options] if options else [],
+        }
+
     def getRaceInfoJSON(self) -> Dict[str, Any]:
         """Get the race info JSON.
 
@@ -1217,10 +1257,7 @@ class SessionState:
             Dict[str, Any]: Collision stats JSON
         """
 
-        collision_analyzer = CollisionAnalyzer(
-            input_mode=CollisionAnalyzerMode.INPUT_MODE_LIST_COLLISION_RECORDS,
-            input_data=self.m_collision_records)
-        return collision_analyzer.toJSON()
+        return self.m_collision_analyzer.toJSON()
 
     def getOvertakeJSON(self, driver_name: str=None) -> Tuple[GetOvertakesStatus, Dict[str, Any]]:
         """Get the JSON value containing key overtake information
@@ -1235,16 +1272,12 @@ class SessionState:
         if not final_classification_received:
             if len(self.m_overtakes_history.m_overtakes_history) == 0:
                 return GetOvertakesStatus.NO_DATA, {}
-            return GetOvertakesStatus.RACE_ONGOING, OvertakeAnalyzer(
-                input_mode=OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS,
-                input_data=self.m_overtakes_history.m_overtakes_history).toJSON(
-                    driver_name=driver_name,
-                    is_case_sensitive=True)
-        return GetOvertakesStatus.RACE_COMPLETED, OvertakeAnalyzer(
-            input_mode=OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS,
-            input_data=self.m_overtakes_history.m_overtakes_history).toJSON(
+            return GetOvertakesStatus.RACE_ONGOING, self.m_overtakes_history.getAnalyzer().toJSON(
                 driver_name=driver_name,
                 is_case_sensitive=True)
+        return GetOvertakesStatus.RACE_COMPLETED, self.m_overtakes_history.getAnalyzer().toJSON(
+            driver_name=driver_name,
+            is_case_sensitive=True)
 
     def getTyreDeltaNotificationMessages(self) -> List[TyreDeltaMessage]:
         """Returns a list of tyre delta notification messages
@@ -1478,6 +1511,29 @@ class SessionState:
             driver_info_dict = self._getRaceCtrlHelperDict()
         return self.m_race_ctrl.toJSON(driver_info_dict)
 
+    def getRaceControlUpdateJSON(self,
+                                 since_id: Optional[int] = None,
+                                 driver_index: Optional[int] = None,
+                                 limit: Optional[int] = None) -> Dict[str, Any]:
+        """Get the race control messages newer than a cursor.
+
+        Args:
+            since_id (Optional[int]): Only messages with an ID greater than this. None for all messages.
+            driver_index (Optional[int]): Only messages involving this driver. None for all drivers.
+            limit (Optional[int]): Maximum number of messages (the oldest ones are returned first).
+
+        Returns:
+            Dict[str, Any]: "messages" and "last-id" (the cursor for the next request, None if there are no messages)
+        """
+
+        messages = self.m_race_ctrl.toJSON(self._getRaceCtrlHelperDict(), since_id=since_id, limit=limit,
+                                           driver_index=driver_index)
+        return {
+            "messages" : messages,
+            # Nothing matched after since_id, so the clients can skip ahead. This also rewinds stale cursors on session change
+            "last-id" : messages[-1]["id"] if messages else self.m_race_ctrl.last_id,
+        }
+
     ##### Utils #####
 
     def isIndexValid(self, index: int) -> bool:
@@ -1524,11 +1580,18 @@ class SessionState:
 
     ##### Internal Helpers #####
 
-    def _lookup_segment_info(self, lap_distance: float) -> Optional[Dict[str, Any]]:
-        """Return rendered segment info for the current track at lap_distance, or None."""
+    def _lookup_segment_info(self, index: int) -> Optional[Dict[str, Any]]:
+        """Return rendered segment info for the car at index as of the last lap data packet, or None.
+        The first lookup after a lap data packet resolves all the cars in one vectorised call."""
         if self.m_session_info.m_track is None:
             return None
-        seg = self.m_track_segments_db.get_segment_info(self.m_session_info.m_track.value, lap_distance)
+        if self.m_car_segments is None:
+            self.m_car_segments = self.m_track_segments_db.get_segments_info(
+                self.m_session_info.m_track.value,
+                [driver.m_packet_copies.m_packet_lap_data.m_lapDistance
+                 if driver and driver.m_packet_copies.m_packet_lap_data else math.nan
+                 for driver in self.m_driver_data])
+        seg = self.m_car_segments[index] if 0 <= index < len(self.m_car_segments) else None
         return seg.to_dict() if seg else None
 
     def _getRaceCtrlHelperDict(self) -> Dict[str, Any]:
@@ -1544,6 +1607,33 @@ class SessionState:
             if driver and driver.is_valid
         }
 
+    def _getStrategyOptions(self) -> Dict[int, List[StrategyOption]]:
+        """Get the ranked strategies of the whole field. The simulator only runs when a driver starts a new lap
+            or changes tyres, every other call is served from the cache
+
+        Returns:
+            Dict[int, List[StrategyOption]]: Driver index -> strategies sorted from fastest to slowest
+        """
+
+        total_laps = self.m_session_info.m_total_laps
+        pit_time_loss = self.m_session_info.m_pit_time_loss
+        if not total_laps or pit_time_loss is None or self.m_race_completed:
+            return {}
+
+        drivers = [driver for driver in self.m_driver_data if driver and driver.is_valid]
+        cache_key = (total_laps, pit_time_loss, tuple(
+            (driver.m_index, driver.m_lap_info.m_current_lap, driver.m_tyre_info.m_tyre_set_history_manager.length)
+            for driver in drivers
+        ))
+        if cache_key != self.m_strategy_cache_key:
+            inputs = [
+                strategy_input for driver in drivers
+                if (strategy_input := driver.getStrategyInput(total_laps, pit_time_loss))
+            ]
+            self.m_strategy_cache = self.m_strategy_simulator.evaluate(inputs)
+            self.m_strategy_cache_key = cache_key
+        return self.m_strategy_cache
+
     def _getObjectByIndex(self, index: int, create: bool = True, reason: str = None) -> DataPerDriver:
         """Looks up and retrieves the object at the specified index.
             If not found and create is True, creates the object, inserts into the list, and returns it.
@@ -25,12 +25,14 @@ SOFTWARE.
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import (Any, Awaitable, Callable, Coroutine, Dict, List, Optional,
                     Tuple)
 
-from apps.backend.state_mgmt_layer import SessionState
+from apps.backend.state_mgmt_layer import SessionJournal, SessionState
 from apps.backend.state_mgmt_layer.intf import ManualSaveRsp
 from lib.button_debouncer import ButtonDebouncer
 from lib.config import CaptureSettings, OverlayId, PngSettings
@@ -49,8 +51,11 @@ from lib.inter_task_communicator import (
     HudPrevPageMfdNotification, HudToggleNotification, ITCMessage,
     TyreDeltaNotificationMessageCollection)
 from lib.logger import PngLogger
+from lib.file_path import resolve_user_file
+from lib.packet_cap import F1PacketRingBuffer
 from lib.packet_forwarder import AsyncUDPForwarder
-from lib.save_to_disk import save_json_to_file
+from lib.save_to_disk import (get_save_file_name, save_blob_to_file,
+                              serialise_session)
 from lib.telemetry_manager import (AsyncF1TelemetryManager,
                                    telemetry_transport_factory)
 from lib.wdt import WatchDogTimerAsync
@@ -100,6 +105,27 @@ class UdpActionCodes:
         attr = self._MAP[key]
         setattr(self, attr, value)
 
+@dataclass
+class FinalSaveStats:
+    """Timings (in ms) of the last session save after the final classification"""
+    build_ms: float = 0.0
+    serialise_ms: float = 0.0
+    loop_blocked_ms: float = 0.0
+    size_bytes: int = 0
+
+    def toJSON(self) -> Dict[str, Any]:
+        """Dump the stats to JSON.
+
+        build-ms is the assembly of the save on the event loop and serialise-ms the serialisation (and compression)
+        in the worker thread. loop-blocked-ms is the total time the event loop spent on the save.
+        """
+        return {
+            "build-ms": round(self.build_ms, 3),
+            "serialise-ms": round(self.serialise_ms, 3),
+            "loop-blocked-ms": round(self.loop_blocked_ms, 3),
+            "size-bytes": self.size_bytes,
+        }
+
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
 
 def setupTelemetryTask(
@@ -185,6 +211,13 @@ class F1TelemetryHandler:
         self.m_button_debouncer: ButtonDebouncer = ButtonDebouncer(
             debounce_time=settings.Network.udp_action_debounce_sec)
         self.m_udp_action_stats: EventCounter = EventCounter()
+        self.m_final_save_stats: FinalSaveStats = FinalSaveStats()
+        self.m_journal: Optional[SessionJournal] = None
+        if self.m_capture_settings.session_journal:
+            self.m_journal = SessionJournal(logger, Path(resolve_user_file("data")) / "journal")
+        self.m_packet_ring: Optional[F1PacketRingBuffer] = None
+        if self.m_capture_settings.packet_ring_buffer_mb:
+            self.m_packet_ring = F1PacketRingBuffer(self.m_capture_settings.packet_ring_buffer_mb * 1024 * 1024)
 
         self.m_should_forward: bool = bool(settings.Forwarding.forwarding_targets)
         self.m_udp_forwarder: Optional[AsyncUDPForwarder] = None
@@ -288,6 +321,8 @@ class F1TelemetryHandler:
             self.m_manager_task.cancel()
         self.m_wdt.stop()
         self.m_menu_wdt.stop()
+        if self.m_journal:
+            await asyncio.to_thread(self.m_journal.close)
         if self.m_save_task:
             self.m_logger.debug("Waiting for save task to complete...")
 
@@ -336,6 +371,8 @@ class F1TelemetryHandler:
             """
             self.m_wdt.kick()
             self.m_session_state_ref.m_pkt_count += 1
+            if self.m_packet_ring:
+                self.m_packet_ring.add(packet, time.time())
             if self.m_should_forward:
                 await AsyncInterTaskCommunicator().send("packet-forward", packet)
 
@@ -358,6 +395,9 @@ class F1TelemetryHandler:
                 self.m_logger.info("Session UID changed. clearing data structures. UID %d",
                                    packet.m_header.m_sessionUID)
                 self.clearAllDataStructures("Session UID changed")
+                if self.m_journal:
+                    # If the app was restarted mid session, pick up where the journal left off
+                    await self.m_journal.recover(packet.m_header.m_sessionUID, self.m_session_state_ref)
 
         @self.m_manager.on_packet(F1PacketType.LAP_DATA)
         async def processLapDataUpdate(packet: PacketLapData) -> None:
@@ -371,6 +411,8 @@ class F1TelemetryHandler:
             if self.m_session_state_ref.m_session_info.m_total_laps is not None:
                 self.m_session_state_ref.processLapDataUpdate(packet)
                 self.m_session_state_ref.setRaceOngoing()
+                if self.m_journal:
+                    self.m_journal.onLapData(self.m_session_state_ref)
 
         @self.m_manager.on_packet(F1PacketType.EVENT)
         async def handleEvent(packet: PacketEventData) -> None:
@@ -452,12 +494,16 @@ class F1TelemetryHandler:
                 self.m_logger.error('Final classification event. Session data not available. Not saving data.')
                 return
             self.m_logger.info('Received Final Classification Packet. UID = %d', packet.m_header.m_sessionUID)
+            start = time.perf_counter()
             final_json = self.m_session_state_ref.processFinalClassificationUpdate(packet)
+            self.m_final_save_stats.build_ms = (time.perf_counter() - start) * 1000
             self.m_final_classification_processed = True
 
             # Perform the auto save stuff only if configured
             if self._shouldSaveData():
                 await self.postGameDumpToFile(final_json, session_uid=packet.m_header.m_sessionUID)
+            if self.m_journal:
+                self.m_journal.discard()
 
             # Notify the frontend about the final classification
             session_type = self.m_session_state_ref.m_session_info.m_session_type
@@ -760,6 +806,7 @@ class F1TelemetryHandler:
             session_uid (int): Session UID for which the final classification was received.
         """
 
+        start = time.perf_counter()
         event_str = self.m_session_state_ref.getEventInfoStr()
         if not event_str:
             return
@@ -768,7 +815,8 @@ class F1TelemetryHandler:
         # Save the JSON data
         # Get timestamp in the format - year_month_day_hour_minute_second
         timestamp_str = now.strftime("%Y_%m_%d_%H_%M_%S")
-        final_json_file_name = event_str + timestamp_str + '.json'
+        file_format = self.m_capture_settings.save_file_format
+        final_json_file_name = get_save_file_name(event_str + timestamp_str, file_format)
 
         # Insert extra debug info
         final_json["debug"] = final_json.get("debug", {})
@@ -781,10 +829,18 @@ class F1TelemetryHandler:
             "packet-count": self.m_session_state_ref.m_pkt_count,
             "file-name": final_json_file_name,
         })
+        self.m_final_save_stats.loop_blocked_ms = \
+            self.m_final_save_stats.build_ms + (time.perf_counter() - start) * 1000
         try:
-            await save_json_to_file(final_json, final_json_file_name)
-            self.m_logger.info("Wrote race info to %s. Num pkts %d. Session UID %d", final_json_file_name,
-                               self.m_session_state_ref.m_pkt_count, session_uid)
+            # Serialise off the event loop. final_json is built from copies, so the state can keep changing meanwhile
+            start = time.perf_counter()
+            blob = await asyncio.to_thread(serialise_session, final_json, file_format)
+            self.m_final_save_stats.serialise_ms = (time.perf_counter() - start) * 1000
+            self.m_final_save_stats.size_bytes = len(blob)
+            await save_blob_to_file(blob, final_json_file_name)
+            self.m_logger.info("Wrote race info to %s. Num pkts %d. Session UID %d. Save stats: %s",
+                               final_json_file_name, self.m_session_state_ref.m_pkt_count, session_uid,
+                               self.m_final_save_stats.toJSON())
         except Exception: # pylint: disable=broad-exception-caught
             # No need to crash the app just because write failed
             self.m_logger.exception("Failed to write race info to %s", final_json_file_name)
@@ -798,6 +854,36 @@ class F1TelemetryHandler:
         return {
             "__UDP_ACTION_BUTTONS__": self.m_udp_action_stats.get_stats(),
             "manager": self.m_manager.getStats(),
+            "final-save": self.m_final_save_stats.toJSON(),
+            "journal": self.m_journal.getStats() if self.m_journal else None,
+        }
+
+    async def dumpPacketRing(self) -> Dict[str, Any]:
+        """Write the rolling packet capture buffer to a capture file.
+
+        The buffer is copied in chunks on the event loop (so that no packets are missed in between) and the file is
+        written from a worker thread.
+
+        Returns:
+            Dict[str, Any]: The status dict
+        """
+        if not self.m_packet_ring:
+            return {"status": "error", "message": "Rolling packet capture is disabled"}
+        if not len(self.m_packet_ring):
+            return {"status": "error", "message": "No packets captured yet"}
+
+        snapshot = await self.m_packet_ring.snapshotAsync(
+            max_age=float(self.m_capture_settings.packet_ring_buffer_dump_sec))
+        dir_path = Path(resolve_user_file("data")) / datetime.now().strftime("%Y_%m_%d") / "captures"
+        dir_path.mkdir(parents=True, exist_ok=True)
+        file_path = dir_path / f"capture_{datetime.now().strftime('%Y_%m_%d_%H_%M_%S')}.f1pcap"
+        file_name, num_packets, num_bytes = await asyncio.to_thread(snapshot.dumpToFile, str(file_path))
+        self.m_logger.info("Dumped %d packets (%d bytes) to %s", num_packets, num_bytes, file_name)
+        return {
+            "status": "success",
+            "message": f"Dumped {num_packets} packets to {file_name}",
+            "file-path": file_name,
+            "num-packets": num_packets,
         }
 
     def _shouldSaveData(self) -> bool:
@@ -950,7 +1036,8 @@ class F1TelemetryHandler:
                 save_rsp = ManualSaveRsp(
                     logger=self.m_logger,
                     session_state=self.m_session_state_ref,
-                    reason="Just_in_case")
+                    reason="Just_in_case",
+                    file_format=self.m_capture_settings.save_file_format)
             except ValueError as e:
                 self.m_logger.warning("Not saving just in case data for session %d: %s", session_uid, e)
                 return
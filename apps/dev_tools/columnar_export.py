@@ -0,0 +1,643 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import os
+import re
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import orjson
+
+from lib.f1_types import (CarDamageData, CarMotionData, CarSetupData,
+                          CarStatusData, CarTelemetryData, F1PacketType,
+                          LapData, PacketHeader)
+from lib.f1_types.common import get_num_cars
+from lib.logger import get_null_logger
+from lib.packet_cap import F1PcapReader
+from lib.telemetry_manager.exceptions import (UnsupportedPacketFormat,
+                                              UnsupportedPacketType)
+from lib.telemetry_manager.factory import PacketParserFactory
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+# Column name -> numpy array (vectorised packet types) or list (everything else)
+Columns = Dict[str, Any]
+
+FILE_FORMATS = ("parquet", "arrow")
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_BATCH_SIZE = 4096
+
+_NUMPY_TYPES = {
+    "b": "i1", "B": "u1", "?": "?",
+    "h": "<i2", "H": "<u2",
+    "i": "<i4", "I": "<u4",
+    "q": "<i8", "Q": "<u8",
+    "f": "<f4", "d": "<f8",
+}
+_STRUCT_TOKEN = re.compile(r"(\d*)([a-zA-Z?])")
+
+# 4 element arrays in the car packets are per wheel, in this order
+_WHEEL_SUFFIXES = ("rl", "rr", "fl", "fr")
+
+_HEADER_COLUMNS = (
+    "packet_format", "game_year", "game_major_version", "game_minor_version", "packet_version", "packet_id",
+    "session_uid", "session_time", "frame_identifier", "overall_frame_identifier", "player_car_index",
+    "secondary_player_car_index",
+)
+# The packet ID is the same for every row of a table
+_HEADER_OUTPUT_COLUMNS = tuple(name for name in _HEADER_COLUMNS if name != "packet_id")
+
+_MOTION_COLUMNS = (
+    "world_position_x", "world_position_y", "world_position_z",
+    "world_velocity_x", "world_velocity_y", "world_velocity_z",
+    "world_forward_dir_x", "world_forward_dir_y", "world_forward_dir_z",
+    "world_right_dir_x", "world_right_dir_y", "world_right_dir_z",
+    "g_force_lateral", "g_force_longitudinal", "g_force_vertical",
+    "yaw", "pitch", "roll",
+)
+_LAP_DATA_COLUMNS = (
+    "last_lap_time_ms", "current_lap_time_ms",
+    "sector1_time_ms_part", "sector1_time_minutes_part", "sector2_time_ms_part", "sector2_time_minutes_part",
+    "delta_to_car_in_front_ms_part", "delta_to_car_in_front_minutes_part",
+    "delta_to_race_leader_ms_part", "delta_to_race_leader_minutes_part",
+    "lap_distance", "total_distance", "safety_car_delta", "car_position", "current_lap_num", "pit_status",
+    "num_pit_stops", "sector", "current_lap_invalid", "penalties", "total_warnings", "corner_cutting_warnings",
+    "num_unserved_drive_through_pens", "num_unserved_stop_go_pens", "grid_position", "driver_status",
+    "result_status", "pit_lane_timer_active", "pit_lane_time_in_lane_ms", "pit_stop_timer_ms",
+    "pit_stop_should_serve_pen", "speed_trap_fastest_speed", "speed_trap_fastest_lap",
+)
+_CAR_TELEMETRY_COLUMNS = (
+    "speed", "throttle", "steer", "brake", "clutch", "gear", "engine_rpm", "drs", "rev_lights_percent",
+    "rev_lights_bit_value", "brakes_temperature", "tyres_surface_temperature", "tyres_inner_temperature",
+    "engine_temperature", "tyres_pressure", "surface_type",
+)
+_CAR_STATUS_COLUMNS = (
+    "traction_control", "anti_lock_brakes", "fuel_mix", "front_brake_bias", "pit_limiter_status", "fuel_in_tank",
+    "fuel_capacity", "fuel_remaining_laps", "max_rpm", "idle_rpm", "max_gears", "drs_allowed",
+    "drs_activation_distance", "actual_tyre_compound", "visual_tyre_compound", "tyres_age_laps",
+    "vehicle_fia_flags", "engine_power_ice", "engine_power_mguk", "ers_store_energy", "ers_deploy_mode",
+    "ers_harvested_this_lap_mguk", "ers_harvested_this_lap_mguh", "ers_deployed_this_lap", "network_paused",
+)
+_CAR_DAMAGE_COLUMNS = (
+    "tyres_wear", "tyres_damage", "brakes_damage", "front_left_wing_damage", "front_right_wing_damage",
+    "rear_wing_damage", "floor_damage", "diffuser_damage", "sidepod_damage", "drs_fault", "ers_fault",
+    "gear_box_damage", "engine_damage", "engine_mguh_wear", "engine_es_wear", "engine_ce_wear", "engine_ice_wear",
+    "engine_mguk_wear", "engine_tc_wear", "engine_blown", "engine_seized",
+)
+# F1 25 added tyre blisters after the brakes damage
+_CAR_DAMAGE_COLUMNS_25 = _CAR_DAMAGE_COLUMNS[:3] + ("tyre_blisters",) + _CAR_DAMAGE_COLUMNS[3:]
+_CAR_SETUP_COLUMNS = (
+    "front_wing", "rear_wing", "on_throttle", "off_throttle", "front_camber", "rear_camber", "front_toe",
+    "rear_toe", "front_suspension", "rear_suspension", "front_anti_roll_bar", "rear_anti_roll_bar",
+    "front_suspension_height", "rear_suspension_height", "brake_pressure", "brake_bias", "engine_braking",
+    "rear_left_tyre_pressure", "rear_right_tyre_pressure", "front_left_tyre_pressure", "front_right_tyre_pressure",
+    "ballast", "fuel_load",
+)
+
+# Per item list in the JSON dump of the packet types that are not decoded vectorised. Each item becomes a row
+_ROW_LISTS: Dict[F1PacketType, Tuple[str, str]] = {
+    F1PacketType.MOTION: ("car-motion-data", "car_index"),
+    F1PacketType.LAP_DATA: ("lap-data", "car_index"),
+    F1PacketType.PARTICIPANTS: ("participants", "car_index"),
+    F1PacketType.CAR_SETUPS: ("car-setups", "car_index"),
+    F1PacketType.CAR_TELEMETRY: ("car-telemetry-data", "car_index"),
+    F1PacketType.CAR_STATUS: ("car-status-data", "car_index"),
+    F1PacketType.FINAL_CLASSIFICATION: ("classification-data", "car_index"),
+    F1PacketType.LOBBY_INFO: ("lobby-players", "car_index"),
+    F1PacketType.CAR_DAMAGE: ("car-damage-data", "car_index"),
+    F1PacketType.SESSION_HISTORY: ("lap-history-data", "lap_index"),
+    F1PacketType.TYRE_SETS: ("tyre-set-data", "tyre_set_index"),
+    F1PacketType.CAR_TELEMETRY_2: ("car-telemetry-2-data", "car_index"),
+}
+
+_PACKET_TYPES = {packet_type.value: packet_type for packet_type in F1PacketType}
+
+# -------------------------------------- FUNCTIONS (LAYOUT) ------------------------------------------------------------
+
+def _structDtype(struct_format: str, columns: Sequence[str]) -> np.dtype:
+    """Packed numpy dtype equivalent of a little endian struct format, with one named field per struct token
+
+    Args:
+        struct_format (str): struct format, e.g. "<HfffB4H"
+        columns (Sequence[str]): Field name for every token. Repeated tokens (4H) are one array field
+
+    Returns:
+        np.dtype: The dtype. Its itemsize matches struct.calcsize(struct_format)
+    """
+    tokens = _STRUCT_TOKEN.findall(struct_format.lstrip("<"))
+    assert len(tokens) == len(columns), f"{struct_format} has {len(tokens)} fields, got {len(columns)} names"
+    fields = []
+    for (count, code), name in zip(tokens, columns):
+        count = int(count or 1)
+        fields.append((name, _NUMPY_TYPES[code], (count,)) if count > 1 else (name, _NUMPY_TYPES[code]))
+    return np.dtype(fields)
+
+_HEADER_DTYPE = _structDtype(PacketHeader.COMPILED_PACKET_STRUCT.format, _HEADER_COLUMNS)
+
+def _packetDtype(packet_format: int,
+                 car_format: str,
+                 car_columns: Sequence[str],
+                 trailer_format: str = "",
+                 trailer_columns: Sequence[str] = ()) -> np.dtype:
+    """Dtype of a whole packet: header, one struct per car and the packet level fields after the car array"""
+    fields = [
+        ("header", _HEADER_DTYPE),
+        ("cars", _structDtype(car_format, car_columns), (get_num_cars(packet_format),)),
+    ]
+    if trailer_format:
+        fields.append(("trailer", _structDtype(trailer_format, trailer_columns)))
+    return np.dtype(fields)
+
+def _buildPacketDtypes() -> Dict[Tuple[F1PacketType, int], np.dtype]:
+    """Packet dtypes of the per car packet types that are decoded vectorised, keyed by (packet type, format)"""
+    dtypes = {}
+    for packet_format in (2024, 2025):
+        dtypes.update({
+            (F1PacketType.MOTION, packet_format): _packetDtype(
+                packet_format, CarMotionData.COMPILED_PACKET_STRUCT.format, _MOTION_COLUMNS),
+            (F1PacketType.LAP_DATA, packet_format): _packetDtype(
+                packet_format, LapData.COMPILED_PACKET_STRUCT_24.format, _LAP_DATA_COLUMNS,
+                "<bb", ("time_trial_pb_car_idx", "time_trial_rival_car_idx")),
+            (F1PacketType.CAR_TELEMETRY, packet_format): _packetDtype(
+                packet_format, CarTelemetryData.COMPILED_PACKET_STRUCT.format, _CAR_TELEMETRY_COLUMNS,
+                "<BBb", ("mfd_panel_index", "mfd_panel_index_secondary_player", "suggested_gear")),
+            (F1PacketType.CAR_STATUS, packet_format): _packetDtype(
+                packet_format, CarStatusData.COMPILED_PACKET_STRUCT.format, _CAR_STATUS_COLUMNS),
+            (F1PacketType.CAR_SETUPS, packet_format): _packetDtype(
+                packet_format, CarSetupData.COMPILED_PACKET_STRUCT_24.format, _CAR_SETUP_COLUMNS,
+                "<f", ("next_front_wing_value",)),
+        })
+    dtypes[(F1PacketType.CAR_DAMAGE, 2024)] = _packetDtype(
+        2024, CarDamageData.COMPILED_PACKET_STRUCT.format, _CAR_DAMAGE_COLUMNS)
+    dtypes[(F1PacketType.CAR_DAMAGE, 2025)] = _packetDtype(
+        2025, CarDamageData.PACKET_FORMAT_25, _CAR_DAMAGE_COLUMNS_25)
+    return dtypes
+
+_PACKET_DTYPES = _buildPacketDtypes()
+
+# -------------------------------------- FUNCTIONS (ROWS) --------------------------------------------------------------
+
+def _columnName(key: str) -> str:
+    return key.replace("-", "_")
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+    """Flatten a JSON dump into columns. Nested objects are joined into the column name, lists of scalars are kept
+    as list columns and lists of objects are stored as a JSON string
+
+    Args:
+        data (Dict[str, Any]): The JSON dump
+        prefix (str): Column name prefix
+
+    Returns:
+        Dict[str, Any]: Column name -> value
+    """
+    flat = {}
+    for key, value in data.items():
+        name = prefix + _columnName(key)
+        if isinstance(value, dict):
+            flat.update(_flatten(value, name + "_"))
+        elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+            flat[name] = orjson.dumps(value).decode()
+        else:
+            flat[name] = value
+    return flat
+
+def _rowsToColumns(rows: List[Dict[str, Any]]) -> Columns:
+    """Transpose rows into columns. Columns missing from a row are None"""
+    names = {}
+    for row in rows:
+        names.update(dict.fromkeys(row))
+    return {name: [row.get(name) for row in rows] for name in names}
+
+def numRows(columns: Columns) -> int:
+    """Number of rows in a column batch"""
+    return len(next(iter(columns.values()))) if columns else 0
+
+def saveLapsTable(save_data: Dict[str, Any]) -> Columns:
+    """One row per driver per lap from a session save: the lap and sector times from the session history, joined
+    with the per lap snapshot (position, top speed, ERS, car status and damage at the end of the lap)
+
+    Args:
+        save_data (Dict[str, Any]): The parsed session save JSON
+
+    Returns:
+        Columns: The laps table
+    """
+    session_info = save_data.get("session-info") or {}
+    session_row = {
+        "game_year": save_data.get("game-year"),
+        "packet_format": save_data.get("packet-format"),
+        "track": session_info.get("track-id"),
+        "session_type": session_info.get("session-type"),
+    }
+
+    rows = []
+    for driver in save_data.get("classification-data") or []:
+        driver_row = dict(session_row,
+                          driver_index=driver.get("index"),
+                          driver_name=driver.get("driver-name"),
+                          team=driver.get("team"),
+                          is_player=driver.get("is-player"),
+                          final_position=driver.get("track-position"))
+        history = driver.get("session-history") or {}
+        laps = history.get("lap-history-data") or []
+        snapshots = {entry.get("lap-number"): entry for entry in driver.get("per-lap-info") or []}
+        for lap_number, lap in enumerate(laps[:history.get("num-laps", len(laps))], start=1):
+            row = dict(driver_row, lap_number=lap_number)
+            # The -str fields are display versions of the ms fields
+            row.update(_flatten({key: value for key, value in lap.items() if not key.endswith("-str")}))
+            snapshot = snapshots.get(lap_number)
+            if snapshot:
+                row.update(_flatten({key: value for key, value in snapshot.items()
+                                     if key not in ("lap-number", "tyre-sets-data")}))
+            rows.append(row)
+    return _rowsToColumns(rows)
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+@dataclass
+class TableBatch:
+    """A batch of rows for one table"""
+    table: str
+    packet_format: int
+    columns: Columns
+
+    @property
+    def num_rows(self) -> int:
+        return numRows(self.columns)
+
+class CaptureTableDecoder:
+    """Turns captured packets into per packet type column batches, one row per car per packet.
+
+    The per car packet types of F1 24/25 (motion, lap data, car telemetry, status, damage and setups) are buffered
+    by type and decoded batch_size packets at a time with a numpy structured dtype. Everything else goes through the
+    regular packet parsers and their JSON dump, and is returned by flush()
+    """
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            batch_size (int): Number of packets per vectorised batch
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.m_batch_size = batch_size
+        self.m_pending: Dict[Tuple[F1PacketType, int], Tuple[List[float], List[bytes]]] = defaultdict(
+            lambda: ([], []))
+        self.m_rows: Dict[Tuple[F1PacketType, int], List[Dict[str, Any]]] = defaultdict(list)
+        self.m_factory = PacketParserFactory(set(F1PacketType), get_null_logger())
+        self.m_num_packets = 0
+        self.m_num_vectorised = 0
+        self.m_num_skipped = 0
+
+    def add(self, timestamp: float, packet: bytes) -> List[TableBatch]:
+        """Add one packet
+
+        Args:
+            timestamp (float): Capture timestamp
+            packet (bytes): The raw packet
+
+        Returns:
+            List[TableBatch]: Batches that are complete
+        """
+        self.m_num_packets += 1
+        if len(packet) < _HEADER_DTYPE.itemsize:
+            self.m_num_skipped += 1
+            return []
+
+        packet_format = packet[0] | (packet[1] << 8)
+        packet_type = _PACKET_TYPES.get(packet[6])
+        dtype = _PACKET_DTYPES.get((packet_type, packet_format))
+        if dtype is None or len(packet) != dtype.itemsize:
+            self._addRows(timestamp, packet)
+            return []
+
+        key = (packet_type, packet_format)
+        timestamps, packets = self.m_pending[key]
+        timestamps.append(timestamp)
+        packets.append(packet)
+        if len(packets) >= self.m_batch_size:
+            return [self._decodePending(key)]
+        return []
+
+    def flush(self) -> List[TableBatch]:
+        """Decode everything still buffered
+
+        Returns:
+            List[TableBatch]: The remaining batches
+        """
+        batches = [self._decodePending(key) for key, (_, packets) in list(self.m_pending.items()) if packets]
+        batches += [TableBatch(packet_type.name.lower(), packet_format, _rowsToColumns(rows))
+                    for (packet_type, packet_format), rows in self.m_rows.items() if rows]
+        self.m_rows.clear()
+        return batches
+
+    def _decodePending(self, key: Tuple[F1PacketType, int]) -> TableBatch:
+        packet_type, packet_format = key
+        timestamps, packets = self.m_pending.pop(key)
+        records = np.frombuffer(b"".join(packets), dtype=_PACKET_DTYPES[key])
+        self.m_num_vectorised += len(records)
+
+        num_cars = records.dtype["cars"].shape[0]
+        columns: Columns = {"timestamp": np.repeat(np.asarray(timestamps, dtype=np.float64), num_cars)}
+        header = records["header"]
+        for name in _HEADER_OUTPUT_COLUMNS:
+            columns[name] = np.repeat(header[name], num_cars)
+        if "trailer" in records.dtype.names:
+            trailer = records["trailer"]
+            for name in trailer.dtype.names:
+                columns[name] = np.repeat(trailer[name], num_cars)
+        columns["car_index"] = np.tile(np.arange(num_cars, dtype=np.uint8), len(records))
+
+        cars = records["cars"].reshape(-1)
+        for name in cars.dtype.names:
+            values = cars[name]
+            if values.ndim == 1:
+                columns[name] = np.ascontiguousarray(values)
+            else:
+                for index, suffix in enumerate(_WHEEL_SUFFIXES):
+                    columns[f"{name}_{suffix}"] = np.ascontiguousarray(values[:, index])
+        return TableBatch(packet_type.name.lower(), packet_format, columns)
+
+    def _addRows(self, timestamp: float, packet: bytes) -> None:
+        try:
+            parsed = self.m_factory.parse(packet)
+        except (UnsupportedPacketFormat, UnsupportedPacketType):
+            parsed = None
+        if parsed is None:
+            self.m_num_skipped += 1
+            return
+
+        packet_type = parsed.m_header.m_packetId
+        header_values = PacketHeader.COMPILED_PACKET_STRUCT.unpack_from(packet)
+        base = {"timestamp": timestamp}
+        base.update((name, value) for name, value in zip(_HEADER_COLUMNS, header_values) if name != "packet_id")
+
+        data = parsed.toJSON()
+        data.pop("header", None)
+        list_key, index_column = _ROW_LISTS.get(packet_type, (None, None))
+        items = data.pop(list_key, None) if list_key else None
+        base.update(_flatten(data))
+
+        rows = self.m_rows[(packet_type, parsed.m_header.m_packetFormat)]
+        if items is None:
+            rows.append(base)
+            return
+        for index, item in enumerate(items):
+            row = dict(base)
+            row[index_column] = index
+            row.update(_flatten(item) if isinstance(item, dict) else {"value": item})
+            rows.append(row)
+
+class _TableWriter:
+    """Appends column batches to one Parquet or Arrow IPC file. The schema is taken from the first batch"""
+
+    def __init__(self, path: str, file_format: str, compression: Optional[str]):
+        self.m_path = path
+        self.m_file_format = file_format
+        self.m_compression = compression
+        self.m_writer = None
+        self.m_schema = None
+
+    def write(self, columns: Columns) -> None:
+        pa = _importPyarrow()
+        table = pa.table(columns)
+        if self.m_writer is None:
+            self.m_schema = table.schema
+            if self.m_file_format == "parquet":
+                self.m_writer = pa.parquet.ParquetWriter(self.m_path, table.schema,
+                                                         compression=self.m_compression or "none")
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=self.m_compression)
+                self.m_writer = pa.ipc.new_file(self.m_path, table.schema, options=options)
+        elif table.schema != self.m_schema:
+            table = table.cast(self.m_schema)
+        self.m_writer.write_table(table)
+
+    def close(self) -> None:
+        if self.m_writer is not None:
+            self.m_writer.close()
+            self.m_writer = None
+
+@dataclass
+class ExportResult:
+    """Outcome of an export"""
+    input_file: str
+    input_size: int
+    file_format: str
+    output_files: Dict[str, str] = field(default_factory=dict)
+    num_rows: Dict[str, int] = field(default_factory=dict)
+    num_packets: int = 0
+    num_vectorised: int = 0
+    num_skipped: int = 0
+    decode_time: float = 0.0
+    total_time: float = 0.0
+
+    @property
+    def output_size(self) -> int:
+        return sum(os.path.getsize(path) for path in self.output_files.values())
+
+    @property
+    def decode_packets_per_sec(self) -> float:
+        return self.num_packets / self.decode_time if self.decode_time else 0.0
+
+    @property
+    def packets_per_sec(self) -> float:
+        return self.num_packets / self.total_time if self.total_time else 0.0
+
+# -------------------------------------- FUNCTIONS (EXPORT) ------------------------------------------------------------
+
+def _importPyarrow():
+    """pyarrow is a dev dependency, only needed to write the files"""
+    # pylint: disable=import-outside-toplevel
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+    return pyarrow
+
+def _outputPath(output_dir: str, table: str, file_format: str) -> str:
+    return os.path.join(output_dir, f"{table}.{file_format}")
+
+def exportCapture(capture_file: str,
+                  output_dir: str,
+                  file_format: str = "parquet",
+                  compression: Optional[str] = DEFAULT_COMPRESSION,
+                  batch_size: int = DEFAULT_BATCH_SIZE) -> ExportResult:
+    """Export a packet capture into one table per packet type
+
+    Args:
+        capture_file (str): The .f1pcap file
+        output_dir (str): Directory for the table files. Created if needed
+        file_format (str): parquet or arrow (Arrow IPC file)
+        compression (Optional[str]): Compression codec, None for uncompressed
+        batch_size (int): Number of packets per vectorised batch
+
+    Returns:
+        ExportResult: Tables written, throughput and sizes
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format {file_format}. Must be one of {FILE_FORMATS}")
+    _importPyarrow()
+    os.makedirs(output_dir, exist_ok=True)
+
+    result = ExportResult(capture_file, os.path.getsize(capture_file), file_format)
+    decoder = CaptureTableDecoder(batch_size)
+    writers: Dict[Tuple[str, int], Tuple[str, _TableWriter]] = {}
+    num_rows = Counter()
+
+    def _write(batches: List[TableBatch]) -> None:
+        for batch in batches:
+            key = (batch.table, batch.packet_format)
+            if key not in writers:
+                # A capture only mixes packet formats if the game was changed while recording
+                name = batch.table if batch.table not in result.output_files else \
+                    f"{batch.table}_{batch.packet_format}"
+                result.output_files[name] = _outputPath(output_dir, name, file_format)
+                writers[key] = (name, _TableWriter(result.output_files[name], file_format, compression))
+            name, writer = writers[key]
+            writer.write(batch.columns)
+            num_rows[name] += batch.num_rows
+
+    start = time.perf_counter()
+    reader = F1PcapReader(capture_file)
+    try:
+        for timestamp, packet in reader.getPackets():
+            decode_start = time.perf_counter()
+            batches = decoder.add(timestamp, packet)
+            result.decode_time += time.perf_counter() - decode_start
+            if batches:
+                _write(batches)
+        decode_start = time.perf_counter()
+        batches = decoder.flush()
+        result.decode_time += time.perf_counter() - decode_start
+        _write(batches)
+    finally:
+        reader.close()
+        for _, writer in writers.values():
+            writer.close()
+
+    result.total_time = time.perf_counter() - start
+    result.num_rows = dict(num_rows)
+    result.num_packets = decoder.m_num_packets
+    result.num_vectorised = decoder.m_num_vectorised
+    result.num_skipped = decoder.m_num_skipped
+    return result
+
+def exportSave(save_file: str,
+               output_dir: str,
+               file_format: str = "parquet",
+               compression: Optional[str] = DEFAULT_COMPRESSION) -> ExportResult:
+    """Export a session save JSON into a laps table (see saveLapsTable)
+
+    Args:
+        save_file (str): The session save JSON
+        output_dir (str): Directory for the table file. Created if needed
+        file_format (str): parquet or arrow (Arrow IPC file)
+        compression (Optional[str]): Compression codec, None for uncompressed
+
+    Returns:
+        ExportResult: Table written and sizes
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format {file_format}. Must be one of {FILE_FORMATS}")
+    _importPyarrow()
+    os.makedirs(output_dir, exist_ok=True)
+
+    result = ExportResult(save_file, os.path.getsize(save_file), file_format)
+    start = time.perf_counter()
+    with open(save_file, "rb") as f:
+        columns = saveLapsTable(orjson.loads(f.read()))
+    result.decode_time = time.perf_counter() - start
+
+    result.output_files["laps"] = _outputPath(output_dir, "laps", file_format)
+    writer = _TableWriter(result.output_files["laps"], file_format, compression)
+    try:
+        if columns:
+            writer.write(columns)
+    finally:
+        writer.close()
+    if not columns:
+        del result.output_files["laps"]
+    result.num_rows["laps"] = numRows(columns)
+    result.total_time = time.perf_counter() - start
+    return result
+
+def formatResult(result: ExportResult) -> str:
+    """Human readable report
+
+    Args:
+        result (ExportResult): The result
+
+    Returns:
+        str: The report
+    """
+    lines = [f"Input            : {result.input_file} ({result.input_size} bytes)"]
+    if result.num_packets:
+        lines += [
+            f"Packets          : {result.num_packets} ({result.num_vectorised} vectorised, "
+            f"{result.num_skipped} skipped)",
+            f"Decode rate      : {result.decode_packets_per_sec:.0f} packets/s",
+            f"Overall rate     : {result.packets_per_sec:.0f} packets/s over {result.total_time:.2f} s "
+            "(read + decode + write)",
+        ]
+    else:
+        lines.append(f"Time             : {result.total_time:.2f} s")
+    ratio = result.output_size / result.input_size if result.input_size else 0.0
+    lines += [
+        f"Output size      : {result.output_size} bytes ({ratio:.2f}x the input)",
+        "",
+        f"{'Table':<28}{'rows':>10}{'bytes':>12}",
+    ]
+    for name, path in result.output_files.items():
+        lines.append(f"{name:<28}{result.num_rows.get(name, 0):>10}{os.path.getsize(path):>12}")
+    return "\n".join(lines)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export a packet capture or a session save into columnar "
+                                                 "Parquet / Arrow IPC tables")
+    parser.add_argument("input", help="Packet capture (.f1pcap) or session save (.json)")
+    parser.add_argument("-o", "--output-dir",
+                        help="Directory for the table files (default: <input>_columnar next to the input)")
+    parser.add_argument("--format", default="parquet", choices=FILE_FORMATS, help="Output format (default parquet)")
+    parser.add_argument("--compression", default=DEFAULT_COMPRESSION,
+                        help=f"Compression codec, or 'none' (default {DEFAULT_COMPRESSION})")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Packets per vectorised batch (default {DEFAULT_BATCH_SIZE})")
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or f"{os.path.splitext(args.input)[0]}_columnar"
+    compression = None if args.compression == "none" else args.compression
+    if args.input.endswith(".json"):
+        result = exportSave(args.input, output_dir, args.format, compression)
+    else:
+        result = exportCapture(args.input, output_dir, args.format, compression, args.batch_size)
+    print(formatResult(result))
+
+if __name__ == "__main__":
+    main()
@@ -23,18 +23,59 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
+import argparse
 import sys
 
 import lib.packet_cap as pcap
 
-if __name__ == '__main__':
-    if len(sys.argv) != 3:
-        print("Usage: python compress_pcap.py <input_file> <output_file>")
-        sys.exit(1)
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def convert(input_file: str,
+            output_file: str,
+            major_version: int = pcap.F1PacketCapture.major_ver,
+            compressed: bool = True,
+            block_size: int = pcap.F1PcapBlockWriter.DEFAULT_BLOCK_SIZE) -> int:
+    """Convert a capture file between formats (v1/v2, compressed/uncompressed).
+    The input file is streamed, so this works for captures larger than memory.
+
+    Args:
+        input_file (str): Source capture (any version)
+        output_file (str): Destination capture
+        major_version (int): Output format version
+        compressed (bool): Whether the output is compressed
+        block_size (int): Uncompressed block size for v2 output
 
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    Returns:
+        int: Number of packets converted
+    """
+    with pcap.F1PcapReader(input_file) as reader:
+        if major_version >= 2:
+            with pcap.F1PcapBlockWriter(output_file, compressed=compressed, block_size=block_size) as writer:
+                for timestamp, data in reader.getPackets():
+                    writer.add(data, timestamp)
+            return writer.m_num_packets
 
-    capture = pcap.F1PacketCapture(file_name=input_file)
-    capture.set_compressed(True)
-    capture.dumpToFile(output_file)
+        capture = pcap.F1PacketCapture(compressed=compressed)
+        for timestamp, data in reader.getPackets():
+            capture.add(data, timestamp)
+        _, num_packets, _ = capture.dumpToFile(output_file, major_version=1)
+        return num_packets
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Convert/compress a .f1pcap capture file")
+    parser.add_argument("input_file", help="Source capture file (v1 or v2)")
+    parser.add_argument("output_file", help="Destination capture file")
+    parser.add_argument("--format-version", type=int, choices=(1, 2), default=pcap.F1PacketCapture.major_ver,
+                        help="Output file format version (default: %(default)s)")
+    parser.add_argument("--uncompressed", action="store_true", help="Write the output without compression")
+    parser.add_argument("--block-size", type=int, default=pcap.F1PcapBlockWriter.DEFAULT_BLOCK_SIZE,
+                        help="Uncompressed block size in bytes for v2 output (default: %(default)s)")
+    args = parser.parse_args()
+
+    try:
+        count = convert(args.input_file, args.output_file, args.format_version, not args.uncompressed,
+                        args.block_size)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Wrote {count} packets to {args.output_file} (format v{args.format_version})")
@@ -0,0 +1,161 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+
+import apps.save_viewer.save_viewer_state as SaveViewerState
+from apps.save_viewer.session_discovery import (_parse_session_metadata,
+                                                check_recompute_json,
+                                                read_session_file)
+from lib.logger import get_null_logger
+from lib.sectioned_save import (SECTIONED_SAVE_SUFFIX, SectionedSave,
+                                encodeSectionedSave)
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def convertSave(input_file: str, output_file: Optional[str] = None) -> str:
+    """Convert a session save between JSON and the sectioned binary format. The direction is taken from the input
+    file's suffix.
+
+    Args:
+        input_file (str): .json or .f1save file
+        output_file (Optional[str]): Destination. Defaults to the input with the other suffix
+
+    Returns:
+        str: The output file
+    """
+    to_json = input_file.endswith(SECTIONED_SAVE_SUFFIX)
+    if output_file is None:
+        output_file = os.path.splitext(input_file)[0] + (".json" if to_json else SECTIONED_SAVE_SUFFIX)
+
+    if to_json:
+        blob = orjson.dumps(SectionedSave(input_file).load())
+    else:
+        with open(input_file, "rb") as f:
+            blob = encodeSectionedSave(orjson.loads(f.read()))
+    with open(output_file, "wb") as f:
+        f.write(blob)
+    return output_file
+
+def convertDirectory(session_dir: str) -> List[str]:
+    """Convert every JSON save under a directory that has not been converted yet. The JSON files are kept, the save
+    viewer shows the .f1save when both exist.
+
+    Args:
+        session_dir (str): Directory, searched recursively
+
+    Returns:
+        List[str]: The files written
+    """
+    written = []
+    for path in sorted(Path(session_dir).rglob("*.json")):
+        if path.name.startswith(".") or path.with_suffix(SECTIONED_SAVE_SUFFIX).exists():
+            continue
+        written.append(convertSave(str(path)))
+    return written
+
+def _bestOf(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmarkLoad(json_file: str, driver_index: int = 0, repeat: int = 5) -> Dict[str, float]:
+    """Time how long the save viewer takes to get at the data of a JSON save, and of the same save converted to the
+    sectioned format.
+
+    Args:
+        json_file (str): The JSON save
+        driver_index (int): Driver for the driver info case
+        repeat (int): Runs per case, the fastest is reported
+
+    Returns:
+        Dict[str, float]: Case name -> seconds
+    """
+    logger = get_null_logger()
+
+    def _driverInfo(path: Path) -> None:
+        data = read_session_file(path)
+        check_recompute_json(data)
+        SaveViewerState.getDriverInfoFrom(data, driver_index)
+
+    def _raceInfo(path: Path) -> None:
+        data = read_session_file(path)
+        check_recompute_json(data)
+        SaveViewerState.getRaceInfoFrom(data)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = Path(json_file)
+        save_path = Path(convertSave(json_file, os.path.join(tmp_dir, json_path.stem + SECTIONED_SAVE_SUFFIX)))
+        return {
+            "json: full load": _bestOf(lambda: read_session_file(json_path), repeat),
+            "json: session list entry": _bestOf(lambda: _parse_session_metadata(json_path, logger), repeat),
+            "json: race info": _bestOf(lambda: _raceInfo(json_path), repeat),
+            "json: driver info": _bestOf(lambda: _driverInfo(json_path), repeat),
+            "f1save: open index": _bestOf(lambda: SectionedSave(str(save_path)), repeat),
+            "f1save: session list entry": _bestOf(lambda: _parse_session_metadata(save_path, logger), repeat),
+            "f1save: race info": _bestOf(lambda: _raceInfo(save_path), repeat),
+            "f1save: driver info": _bestOf(lambda: _driverInfo(save_path), repeat),
+            "f1save: full load": _bestOf(lambda: SectionedSave(str(save_path)).load(), repeat),
+        }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert session saves between JSON and the sectioned binary "
+                                                 "(.f1save) format")
+    parser.add_argument("input", help="Save file (.json or .f1save), or a directory to convert all JSON saves in")
+    parser.add_argument("output", nargs="?", help="Destination file (default: input with the other suffix)")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare the save viewer load times of the JSON input and its converted version")
+    parser.add_argument("--driver-index", type=int, default=0, help="Driver for the driver info benchmark")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            json_size = os.path.getsize(args.input)
+            save_size = len(encodeSectionedSave(read_session_file(Path(args.input))))
+            print(f"Size: JSON {json_size} bytes, f1save {save_size} bytes ({json_size / save_size:.1f}x smaller)")
+            for name, seconds in benchmarkLoad(args.input, args.driver_index).items():
+                print(f"{name:<28}{seconds * 1000:>10.2f} ms")
+        elif os.path.isdir(args.input):
+            written = convertDirectory(args.input)
+            print(f"Converted {len(written)} saves")
+        else:
+            print(f"Wrote {convertSave(args.input, args.output)}")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
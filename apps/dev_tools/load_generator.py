@@ -0,0 +1,389 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import socket
+import struct
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.dev_tools.synthetic_session import (SyntheticSession,
+                                              addSessionArguments,
+                                              sessionFromArguments)
+from lib.f1_types import F1PacketType
+from lib.ipc import IpcPublisherAsync
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+# Session UID in the packet header, after the packet format (uint16), game year, game major version, game minor
+# version, packet version and packet ID (uint8 each)
+_SESSION_UID = struct.Struct("<Q")
+_SESSION_UID_OFFSET = 7
+_PACKET_ID_OFFSET = 6
+
+# Same framing as TcpTransport
+_TCP_LENGTH_PREFIX = struct.Struct("!I")
+
+DEFAULT_IPC_TOPIC = "f1-raw-packets-{rig}"
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class _UdpSink:
+    """One rig's UDP feed, like the game sends it"""
+
+    def __init__(self, ip_addr: str, port: int):
+        self.m_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.m_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self.m_socket.connect((ip_addr, port))
+        self.m_num_errors = 0
+
+    async def sendFrame(self, packets: List[bytes]) -> int:
+        num_bytes = 0
+        send = self.m_socket.send
+        for packet in packets:
+            try:
+                num_bytes += send(packet)
+            except OSError:
+                # Nobody listening (ICMP port unreachable) or socket buffer full
+                self.m_num_errors += 1
+        return num_bytes
+
+    async def close(self) -> None:
+        self.m_socket.close()
+
+class _TcpSink:
+    """One rig's feed over TCP, framed like telemetry_replayer does for TcpTransport"""
+
+    def __init__(self, ip_addr: str, port: int):
+        self.m_ip_addr = ip_addr
+        self.m_port = port
+        self.m_writer: Optional[asyncio.StreamWriter] = None
+        self.m_num_errors = 0
+
+    async def open(self) -> None:
+        try:
+            _, self.m_writer = await asyncio.open_connection(self.m_ip_addr, self.m_port)
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to {self.m_ip_addr}:{self.m_port} — {e}")
+        self.m_writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    async def sendFrame(self, packets: List[bytes]) -> int:
+        prefix = _TCP_LENGTH_PREFIX.pack
+        data = b"".join(prefix(len(packet)) + packet for packet in packets)
+        self.m_writer.write(data)
+        try:
+            # Blocks when the receiver can't keep up, which then shows up as lag
+            await self.m_writer.drain()
+        except ConnectionError as e:
+            raise ConnectionError(f"Lost connection to {self.m_ip_addr}:{self.m_port} — {e}")
+        return len(data)
+
+    async def close(self) -> None:
+        if self.m_writer:
+            self.m_writer.close()
+            try:
+                await self.m_writer.wait_closed()
+            except ConnectionError:
+                pass
+
+class _IpcSink:
+    """One rig's feed published to an IPC pub/sub topic, for IpcTransport"""
+
+    CONNECT_DELAY = 0.2 # Give the publisher time to connect to the broker and the subscribers to subscribe
+
+    def __init__(self, ip_addr: str, port: int, topic: str, sndhwm: int = 10000):
+        self.m_topic = topic
+        self.m_publisher = IpcPublisherAsync(host=ip_addr, port=port, sndhwm=sndhwm)
+
+    @property
+    def m_num_errors(self) -> int:
+        stats = self.m_publisher.get_stats()
+        return sum(stats.get(category, {}).get("__TOTAL__", {}).get("count", 0)
+                   for category in ("__DROP_HWM__", "__DROP_ZMQ_ERROR__")) + \
+            stats.get("__DROP__", {}).get("disconnected", {}).get("count", 0)
+
+    async def open(self) -> None:
+        await self.m_publisher.start()
+        await asyncio.sleep(self.CONNECT_DELAY)
+
+    async def sendFrame(self, packets: List[bytes]) -> int:
+        num_bytes = 0
+        for packet in packets:
+            await self.m_publisher.publish_raw(self.m_topic, packet)
+            num_bytes += len(packet)
+        return num_bytes
+
+    async def close(self) -> None:
+        await self.m_publisher.close()
+
+@dataclass
+class LoadGeneratorResult:
+    """Outcome of a load generator run"""
+    transport: str
+    num_rigs: int
+    duration: float                                         # Seconds of session time per rig
+    speed: Optional[float] = 1.0                            # None if unpaced
+    wall_time: float = 0.0
+    num_packets: int = 0                                    # All rigs
+    num_bytes: int = 0                                      # All rigs, including TCP framing
+    num_errors: int = 0                                     # Packets that couldn't be sent or were dropped
+    max_lag: float = 0.0                                    # Worst delay behind the schedule, in seconds
+    generation_time: float = 0.0
+    packet_types: Dict[str, int] = field(default_factory=dict)    # Packets per rig, by type
+
+    @property
+    def target_packets_per_sec(self) -> Optional[float]:
+        if self.speed is None or not self.duration:
+            return None
+        return self.num_rigs * sum(self.packet_types.values()) / self.duration * self.speed
+
+    @property
+    def packets_per_sec(self) -> float:
+        return self.num_packets / self.wall_time if self.wall_time else 0.0
+
+    @property
+    def megabits_per_sec(self) -> float:
+        return self.num_bytes * 8 / self.wall_time / 1e6 if self.wall_time else 0.0
+
+    def toJSON(self) -> Dict[str, Any]:
+        return {
+            "transport": self.transport,
+            "num-rigs": self.num_rigs,
+            "duration": self.duration,
+            "speed": self.speed,
+            "wall-time": self.wall_time,
+            "generation-time": self.generation_time,
+            "num-packets": self.num_packets,
+            "num-bytes": self.num_bytes,
+            "num-errors": self.num_errors,
+            "target-packets-per-sec": self.target_packets_per_sec,
+            "packets-per-sec": self.packets_per_sec,
+            "megabits-per-sec": self.megabits_per_sec,
+            "max-lag-ms": self.max_lag * 1000,
+            "packet-types-per-rig": dict(self.packet_types),
+        }
+
+class LoadGenerator:
+    """Sends a synthetic session from many independent "rigs" at once, to see how many game feeds a box sustains.
+
+    The session is generated once, up front, so that the generator itself isn't the bottleneck. Every rig sends the
+    same packets with its own session UID (base UID + rig index), to its own destination: port + rig index * port_stride
+    for UDP/TCP and ipc_topic.format(rig=rig index) for IPC. The packets are sent on the session's schedule (all rigs
+    send a frame together), or as fast as possible if speed is None.
+    """
+
+    TRANSPORTS = ("udp", "tcp", "ipc")
+
+    def __init__(self,
+                 session: SyntheticSession,
+                 duration: float,
+                 transport: str = "udp",
+                 num_rigs: int = 1,
+                 ip_addr: str = "127.0.0.1",
+                 port: int = 20777,
+                 port_stride: int = 1,
+                 ipc_topic: str = DEFAULT_IPC_TOPIC,
+                 speed: Optional[float] = 1.0):
+        """
+        Args:
+            session (SyntheticSession): Session to send
+            duration (float): Seconds of session time to send
+            transport (str): "udp", "tcp" (TcpTransport framing) or "ipc" (raw packets published to the IPC broker
+                listening on ip_addr:port)
+            num_rigs (int): Number of independent feeds
+            ip_addr (str): Destination IP address (IPC broker address for ipc)
+            port (int): Destination port of the first rig (IPC broker XSUB port for ipc)
+            port_stride (int): Port increment per rig. 0 sends all rigs to the same port
+            ipc_topic (str): IPC topic, formatted with the rig index
+            speed (Optional[float]): Speed multiplier. None sends as fast as possible
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if transport not in self.TRANSPORTS:
+            raise ValueError(f"transport must be one of {self.TRANSPORTS}")
+        if num_rigs < 1:
+            raise ValueError("num_rigs must be at least 1")
+        if speed is not None and speed <= 0:
+            raise ValueError("Speed must be greater than zero")
+        self.m_session = session
+        self.m_duration = duration
+        self.m_transport = transport
+        self.m_num_rigs = num_rigs
+        self.m_ip_addr = ip_addr
+        self.m_port = port
+        self.m_port_stride = port_stride
+        self.m_ipc_topic = ipc_topic
+        self.m_speed = speed
+
+    def rigDestination(self, rig: int) -> str:
+        """Where the given rig sends its packets"""
+        if self.m_transport == "ipc":
+            return self.m_ipc_topic.format(rig=rig)
+        return f"{self.m_ip_addr}:{self.m_port + rig * self.m_port_stride}"
+
+    async def run(self) -> LoadGeneratorResult:
+        """Generate the session and send it from all the rigs.
+
+        Returns:
+            LoadGeneratorResult: Achieved rate etc.
+
+        Raises:
+            ConnectionError: If a TCP rig can't connect
+        """
+        result = LoadGeneratorResult(self.m_transport, self.m_num_rigs, self.m_duration, self.m_speed)
+        start = time.perf_counter()
+        frames = self._generateFrames(result.packet_types)
+        result.generation_time = time.perf_counter() - start
+
+        sinks = [self._createSink(rig) for rig in range(self.m_num_rigs)]
+        try:
+            for sink in sinks:
+                if hasattr(sink, "open"):
+                    await sink.open()
+            await self._send(frames, sinks, result)
+        finally:
+            result.num_errors = sum(sink.m_num_errors for sink in sinks)
+            for sink in sinks:
+                await sink.close()
+        return result
+
+    def _generateFrames(self, packet_types: Dict[str, int]) -> List[Tuple[float, List[bytes]]]:
+        """Generate the session, grouped into frames of packets with the same timestamp"""
+        frames: List[Tuple[float, List[bytes]]] = []
+        counts = Counter()
+        for timestamp, packet in self.m_session.packets(self.m_duration):
+            if not frames or frames[-1][0] != timestamp:
+                frames.append((timestamp, []))
+            frames[-1][1].append(packet)
+            counts[packet[_PACKET_ID_OFFSET]] += 1
+        packet_types.update({F1PacketType(packet_id).name: count for packet_id, count in sorted(counts.items())})
+        return frames
+
+    def _createSink(self, rig: int):
+        if self.m_transport == "ipc":
+            return _IpcSink(self.m_ip_addr, self.m_port, self.rigDestination(rig))
+        port = self.m_port + rig * self.m_port_stride
+        return _UdpSink(self.m_ip_addr, port) if self.m_transport == "udp" else _TcpSink(self.m_ip_addr, port)
+
+    async def _send(self, frames: List[Tuple[float, List[bytes]]], sinks: list, result: LoadGeneratorResult) -> None:
+        base_uid = self.m_session.m_session_uid
+        rig_uids = [_SESSION_UID.pack((base_uid + rig) & 0xFFFFFFFFFFFFFFFF) for rig in range(self.m_num_rigs)]
+        uid_start = _SESSION_UID_OFFSET
+        uid_end = _SESSION_UID_OFFSET + _SESSION_UID.size
+        first_timestamp = frames[0][0] if frames else 0.0
+        perf_counter = time.perf_counter
+
+        start = perf_counter()
+        for timestamp, packets in frames:
+            if self.m_speed is not None:
+                deadline = start + (timestamp - first_timestamp) / self.m_speed
+                delay = deadline - perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                else:
+                    result.max_lag = max(result.max_lag, -delay)
+            for rig, sink in enumerate(sinks):
+                if rig:
+                    uid = rig_uids[rig]
+                    rig_packets = [packet[:uid_start] + uid + packet[uid_end:] for packet in packets]
+                else:
+                    rig_packets = packets
+                result.num_bytes += await sink.sendFrame(rig_packets)
+                result.num_packets += len(packets)
+        result.wall_time = perf_counter() - start
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def formatResult(result: LoadGeneratorResult, generator: Optional[LoadGenerator] = None) -> str:
+    """Human readable report
+
+    Args:
+        result (LoadGeneratorResult): The result
+        generator (Optional[LoadGenerator]): The generator, to list the rig destinations
+
+    Returns:
+        str: The report
+    """
+    lines = [f"Transport        : {result.transport}, {result.num_rigs} rig(s)"]
+    if generator:
+        destinations = [generator.rigDestination(rig) for rig in range(result.num_rigs)]
+        lines.append(f"Destinations     : {', '.join(destinations[:4])}{' ...' if len(destinations) > 4 else ''}")
+    lines += [
+        f"Generated        : {sum(result.packet_types.values())} packets per rig in {result.generation_time:.2f} s",
+        f"Target rate      : {result.target_packets_per_sec:.0f} packets/s" if result.target_packets_per_sec
+        else "Target rate      : max (unpaced)",
+        f"Achieved rate    : {result.packets_per_sec:.0f} packets/s, {result.megabits_per_sec:.2f} Mbit/s "
+        f"over {result.wall_time:.2f} s",
+        f"Max lag          : {result.max_lag * 1000:.1f} ms",
+        f"Send errors      : {result.num_errors}",
+        "",
+        f"{'Packet type':<24}{'per rig':>10}{'per rig/s':>12}",
+    ]
+    for name, count in result.packet_types.items():
+        lines.append(f"{name:<24}{count:>10}{count / result.duration if result.duration else 0.0:>12.1f}")
+    return "\n".join(lines)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Send synthetic telemetry from many simultaneous rigs and report "
+                                                 "the achieved output rate")
+    parser.add_argument("--transport", default="udp", choices=LoadGenerator.TRANSPORTS,
+                        help="udp (default), tcp (replay server framing) or ipc (raw packets via the IPC broker)")
+    parser.add_argument("--rigs", type=int, default=1, help="Number of simultaneous rigs (default 1)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of session time (default 30)")
+    parser.add_argument("--ip", default="127.0.0.1", help="Destination IP address / IPC broker address")
+    parser.add_argument("--port", type=int, default=20777,
+                        help="Destination port of the first rig / IPC broker XSUB port (default 20777)")
+    parser.add_argument("--port-stride", type=int, default=1,
+                        help="Port increment per rig (default 1). 0 sends every rig to the same port")
+    parser.add_argument("--ipc-topic", default=DEFAULT_IPC_TOPIC,
+                        help=f"IPC topic, {{rig}} is replaced with the rig index (default {DEFAULT_IPC_TOPIC})")
+    parser.add_argument("--speed", default="1",
+                        help="Speed multiplier, or 'max' to send as fast as possible (default 1)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    addSessionArguments(parser)
+    args = parser.parse_args()
+
+    generator = LoadGenerator(
+        session=sessionFromArguments(args),
+        duration=args.duration,
+        transport=args.transport,
+        num_rigs=args.rigs,
+        ip_addr=args.ip,
+        port=args.port,
+        port_stride=args.port_stride,
+        ipc_topic=args.ipc_topic,
+        speed=None if args.speed == "max" else float(args.speed))
+    result = asyncio.run(generator.run())
+    print(formatResult(result, generator))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result.toJSON(), f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -27,7 +27,7 @@ sys.path.insert(0, str(_PROJECT_ROOT))
 from lib.f1_types.header import F1PacketType, PacketHeader
 from lib.f1_types.packet_0_car_motion_data import PacketMotionData
 from lib.f1_types.packet_2_lap_data import PacketLapData
-from lib.packet_cap import F1PacketCapture
+from lib.packet_cap import F1PcapReader
 # pylint: enable=wrong-import-position
 
 
@@ -43,17 +43,17 @@ def extract_game_year(pcap_path: str) -> int:
     Returns:
         Full game year (e.g. 2025), or 0 if unreadable.
     """
-    pcap = F1PacketCapture(file_name=pcap_path)
     header_len = PacketHeader.PACKET_LEN
-    for _, raw in pcap.getPackets():
-        if len(raw) < header_len:
-            continue
-        try:
-            header = PacketHeader(raw[:header_len])
-            year = header.m_gameYear
-            return 2000 + year if year < 100 else year
-        except Exception:  # pylint: disable=broad-exception-caught
-            continue
+    with F1PcapReader(pcap_path) as pcap:
+        for _, raw in pcap.getPackets():
+            if len(raw) < header_len:
+                continue
+            try:
+                header = PacketHeader(raw[:header_len])
+                year = header.m_gameYear
+                return 2000 + year if year < 100 else year
+            except Exception:  # pylint: disable=broad-exception-caught
+                continue
     return 0
 
 
@@ -67,7 +67,7 @@ def extract_track_points(pcap_path: str, min_lap: int = 2) -> List[TrackPoint]:
     Returns:
         List of TrackPoint with on-track positions sorted by lap_distance.
     """
-    pcap = F1PacketCapture(file_name=pcap_path)
+    pcap = F1PcapReader(pcap_path)
     header_len = PacketHeader.PACKET_LEN
     total = pcap.getNumPackets()
 
@@ -106,6 +106,7 @@ def extract_track_points(pcap_path: str, min_lap: int = 2) -> List[TrackPoint]:
             except Exception:  # pylint: disable=broad-exception-caught
                 continue
             lap_frames[fid] = pkt
+    pcap.close()
 
     print(f"\r  Parsed {total} packets: {len(motion_frames)} motion frames, "
           f"{len(lap_frames)} lap-data frames.")
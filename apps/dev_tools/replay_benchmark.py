@@ -0,0 +1,419 @@
+
+# MIT License
+#
+# Copyright (c) [2025] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import asyncio
+import json
+import socket
+import time
+import tracemalloc
+from array import array
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import (Any, Awaitable, Callable, Dict, Iterable, List, Optional,
+                    Tuple)
+
+import msgpack
+import orjson
+import psutil
+
+from apps.backend.intf_layer.telemetry_ui_tasks import (highFreqLocalUpdateTask,
+                                                        lowFreqLocalUpdateTask,
+                                                        webClientUpdateTask)
+from apps.backend.state_mgmt_layer import SessionState
+from apps.backend.telemetry_layer import F1TelemetryHandler
+from lib.config import PngSettings
+from lib.f1_types import F1PacketBase
+from lib.inter_task_communicator import AsyncInterTaskCommunicator
+from lib.logger import PngLogger, get_null_logger
+from lib.packet_cap import F1PcapReader
+from lib.telemetry_manager.factory import PacketParserFactory
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class _IpcPublisherSink:
+    """Stands in for IpcPublisherAsync. Serialises like the real one, but doesn't send anything"""
+
+    def __init__(self):
+        self.m_num_messages = 0
+        self.m_num_bytes = 0
+
+    async def publish(self, topic: str, data: dict) -> None: # pylint: disable=unused-argument
+        self.m_num_messages += 1
+        self.m_num_bytes += len(orjson.dumps(data))
+
+class _WebServerSink:
+    """Stands in for TelemetryWebServer, with one client subscribed to every event"""
+
+    def __init__(self):
+        self.m_num_messages = 0
+        self.m_num_bytes = 0
+
+    def is_any_client_interested_in_event(self, event: str) -> bool: # pylint: disable=unused-argument
+        return True
+
+    async def send_to_clients_interested_in_event(self, event: str, data: Dict[str, Any], # pylint: disable=unused-argument
+                                                  projector: Any = None, packed: Optional[bytes] = None) -> None:
+        self.m_num_messages += 1
+        self.m_num_bytes += len(packed if packed is not None else msgpack.packb(data, use_bin_type=True))
+
+@dataclass
+class _PeriodicTask:
+    """A UI periodic task driven by the virtual clock"""
+    name: str
+    interval: float
+    coro: Callable[..., Awaitable[Any]]
+    args: Tuple[Any, ...]
+    next_tick: float = 0.0
+    calls: int = 0
+    total_time: float = 0.0
+
+@dataclass
+class _PacketTypeStats:
+    count: int = 0
+    num_bytes: int = 0
+    parse_time: float = 0.0
+    handler_time: float = 0.0
+
+    def toJSON(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "bytes": self.num_bytes,
+            "parse-us-mean": self.parse_time / self.count * 1e6 if self.count else 0.0,
+            "handler-us-mean": self.handler_time / self.count * 1e6 if self.count else 0.0,
+            "total-ms": (self.parse_time + self.handler_time) * 1e3,
+        }
+
+@dataclass
+class ReplayBenchmarkResult:
+    """Result of a ReplayBenchmark run"""
+    num_packets: int
+    wall_time: float
+    virtual_time: float
+    packet_latencies: array
+    packet_types: Dict[str, _PacketTypeStats]
+    periodic_tasks: List[_PeriodicTask]
+    num_dropped: int
+    start_rss: int
+    peak_rss: int
+    traced_peak: Optional[int] = None
+    egress: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @property
+    def packets_per_sec(self) -> float:
+        return self.num_packets / self.wall_time if self.wall_time else 0.0
+
+    def latencyPercentile(self, percentile: float) -> float:
+        """Get a percentile of the per packet processing time (seconds)
+
+        Args:
+            percentile (float): 0-100
+
+        Returns:
+            float: The percentile
+        """
+        if not self.packet_latencies:
+            return 0.0
+        ordered = sorted(self.packet_latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+    def toJSON(self) -> Dict[str, Any]:
+        return {
+            "num-packets": self.num_packets,
+            "num-dropped": self.num_dropped,
+            "wall-time-sec": self.wall_time,
+            "virtual-time-sec": self.virtual_time,
+            "packets-per-sec": self.packets_per_sec,
+            "packet-latency-us": {
+                "p50": self.latencyPercentile(50) * 1e6,
+                "p99": self.latencyPercentile(99) * 1e6,
+                "max": max(self.packet_latencies, default=0.0) * 1e6,
+            },
+            "packet-types": {name: stats.toJSON() for name, stats in self.packet_types.items()},
+            "periodic-tasks": {
+                task.name: {
+                    "calls": task.calls,
+                    "ms-mean": task.total_time / task.calls * 1e3 if task.calls else 0.0,
+                } for task in self.periodic_tasks
+            },
+            "memory": {
+                "start-rss-mb": self.start_rss / (1024 * 1024),
+                "peak-rss-mb": self.peak_rss / (1024 * 1024),
+                "traced-peak-mb": None if self.traced_peak is None else self.traced_peak / (1024 * 1024),
+            },
+            "egress": self.egress,
+        }
+
+class ReplayBenchmark:
+    """Drives the backend pipeline (F1TelemetryHandler, SessionState and the UI update tasks) in-process from a
+    packet source, without sockets.
+
+    Packets go straight into AsyncF1TelemetryManager._processPacket. The UI update tasks are not run by the event loop,
+    they are called from the replay loop whenever the virtual clock (the capture timestamps, relative to the first
+    packet) crosses their next deadline, so the ratio of packets to UI updates matches a live session at any replay
+    speed. IPC and Socket.IO egress is serialised but not sent.
+    """
+
+    RSS_SAMPLE_INTERVAL = 1000 # packets
+
+    def __init__(self,
+                 settings: Optional[PngSettings] = None,
+                 speed: Optional[float] = None,
+                 trace_memory: bool = False,
+                 logger: Optional[PngLogger] = None):
+        """
+        Args:
+            settings (Optional[PngSettings]): App settings. Defaults are used if not specified. Autosaves are always
+                disabled and the telemetry port is replaced with a free one.
+            speed (Optional[float]): Replay speed multiplier. None replays as fast as possible
+            trace_memory (bool): Track the peak Python heap usage with tracemalloc (slows down the replay a lot)
+            logger (Optional[PngLogger]): Logger. Logs are discarded if not specified
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be greater than zero")
+        self.m_speed = speed
+        self.m_trace_memory = trace_memory
+        self.m_logger = logger or get_null_logger()
+        self.m_settings = self._benchmarkSettings(settings or PngSettings())
+
+    async def run(self, packets: Iterable[Tuple[float, bytes]]) -> ReplayBenchmarkResult:
+        """Replay the packets through a fresh backend pipeline.
+
+        Args:
+            packets (Iterable[Tuple[float, bytes]]): Timestamps and raw packets, e.g. F1PcapReader.getPackets()
+
+        Returns:
+            ReplayBenchmarkResult: The measurements
+        """
+        session_state = SessionState(self.m_logger, self.m_settings, "dev")
+        handler = F1TelemetryHandler(self.m_settings, self.m_logger, session_state)
+        await handler.m_manager.m_transport.close() # Packets are injected directly
+        manager = handler.m_manager
+        pkt_factory = PacketParserFactory(set(manager.m_callbacks.keys()), self.m_logger)
+
+        packet_types: Dict[str, _PacketTypeStats] = defaultdict(_PacketTypeStats)
+        self._instrument(manager, pkt_factory, packet_types)
+
+        ipc_pub = _IpcPublisherSink()
+        web_server = _WebServerSink()
+        display = self.m_settings.Display
+        periodic_tasks = [
+            _PeriodicTask("Low Frequency Local Update Task", display.local_telemetry_interval_ms / 1000.0,
+                          lowFreqLocalUpdateTask, (session_state, ipc_pub)),
+            _PeriodicTask("Web Client Update Task", display.refresh_interval / 1000.0,
+                          webClientUpdateTask,
+                          (web_server, session_state, self.m_settings.StreamOverlay.show_sample_data_at_start)),
+            _PeriodicTask("High Frequency Local Update Task", display.hud_refresh_interval / 1000.0,
+                          highFreqLocalUpdateTask, (session_state, ipc_pub)),
+        ]
+        itc = AsyncInterTaskCommunicator()
+        frontend_updates = _WebServerSink()
+
+        process = psutil.Process()
+        start_rss = peak_rss = process.memory_info().rss
+        if self.m_trace_memory:
+            tracemalloc.start()
+        latencies = array('d')
+        first_timestamp = None
+        virtual_now = 0.0
+        perf_counter = time.perf_counter
+        wall_start = perf_counter()
+        try:
+            for index, (timestamp, raw_packet) in enumerate(packets):
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                virtual_now = timestamp - first_timestamp
+                if self.m_speed is not None:
+                    delay = wall_start + virtual_now / self.m_speed - perf_counter()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                await self._runDueTasks(periodic_tasks, virtual_now)
+
+                start = perf_counter()
+                await manager._processPacket(pkt_factory, raw_packet) # pylint: disable=protected-access
+                latencies.append(perf_counter() - start)
+
+                self._drainQueues(itc, frontend_updates)
+                if index % self.RSS_SAMPLE_INTERVAL == 0:
+                    peak_rss = max(peak_rss, process.memory_info().rss)
+            wall_time = perf_counter() - wall_start
+        finally:
+            traced_peak = tracemalloc.get_traced_memory()[1] if self.m_trace_memory else None
+            if self.m_trace_memory:
+                tracemalloc.stop()
+
+        peak_rss = max(peak_rss, process.memory_info().rss)
+        manager_stats = manager.getStats()["packets"]
+        num_dropped = sum(sum(bucket["count"] for bucket in stats.values())
+                          for key, stats in manager_stats.items() if key.startswith("__DROPPED"))
+        return ReplayBenchmarkResult(
+            num_packets=len(latencies),
+            wall_time=wall_time,
+            virtual_time=virtual_now,
+            packet_latencies=latencies,
+            packet_types=dict(packet_types),
+            periodic_tasks=periodic_tasks,
+            num_dropped=num_dropped,
+            start_rss=start_rss,
+            peak_rss=peak_rss,
+            traced_peak=traced_peak,
+            egress={
+                "ipc": {"messages": ipc_pub.m_num_messages, "bytes": ipc_pub.m_num_bytes},
+                "socketio": {"messages": web_server.m_num_messages, "bytes": web_server.m_num_bytes},
+                "frontend-update": {"messages": frontend_updates.m_num_messages,
+                                    "bytes": frontend_updates.m_num_bytes},
+            },
+        )
+
+    def runFile(self, file_name: str) -> ReplayBenchmarkResult:
+        """Replay a capture file in a new event loop.
+
+        Args:
+            file_name (str): Capture file (any version)
+
+        Returns:
+            ReplayBenchmarkResult: The measurements
+        """
+        with F1PcapReader(file_name) as reader:
+            return asyncio.run(self.run(reader.getPackets()))
+
+    @staticmethod
+    def _benchmarkSettings(settings: PngSettings) -> PngSettings:
+        """Copy of the settings that doesn't touch the disk or the real telemetry port"""
+        settings = settings.model_copy(deep=True)
+        settings.Capture.post_race_data_autosave = False
+        settings.Capture.post_quali_data_autosave = False
+        settings.Capture.post_fp_data_autosave = False
+        settings.Capture.post_tt_data_autosave = False
+        settings.Capture.just_in_case_autosave = False
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.bind(("127.0.0.1", 0))
+            settings.Network.telemetry_port = s.getsockname()[1]
+        return settings
+
+    @staticmethod
+    def _instrument(manager, pkt_factory: PacketParserFactory, packet_types: Dict[str, _PacketTypeStats]) -> None:
+        """Wrap the parser and the packet callbacks to record the per packet type costs"""
+        perf_counter = time.perf_counter
+        parse = pkt_factory.parse
+
+        def _timedParse(raw_packet: bytes) -> Optional[F1PacketBase]:
+            start = perf_counter()
+            packet = parse(raw_packet)
+            if packet is not None:
+                stats = packet_types[str(packet.m_header.m_packetId)]
+                stats.count += 1
+                stats.num_bytes += len(raw_packet)
+                stats.parse_time += perf_counter() - start
+            return packet
+        pkt_factory.parse = _timedParse
+
+        def _timedCallback(name: str, callback: Callable[[F1PacketBase], Awaitable[None]]):
+            async def _wrapper(packet: F1PacketBase) -> None:
+                start = perf_counter()
+                try:
+                    await callback(packet)
+                finally:
+                    packet_types[name].handler_time += perf_counter() - start
+            return _wrapper
+        for packet_type, callback in list(manager.m_callbacks.items()):
+            manager.m_callbacks[packet_type] = _timedCallback(str(packet_type), callback)
+
+    @staticmethod
+    async def _runDueTasks(periodic_tasks: List[_PeriodicTask], virtual_now: float) -> None:
+        """Run the periodic tasks whose deadline has passed on the virtual clock"""
+        for task in periodic_tasks:
+            # Every tick that would have fired in a live session, even if several fall between two packets
+            while task.next_tick <= virtual_now:
+                start = time.perf_counter()
+                await task.coro(*task.args)
+                task.total_time += time.perf_counter() - start
+                task.calls += 1
+                task.next_tick += task.interval
+
+    @staticmethod
+    def _drainQueues(itc: AsyncInterTaskCommunicator, frontend_updates: _WebServerSink) -> None:
+        """Consume the messages the handlers queue up for the other tasks"""
+        for queue_name, queue in itc.queues.items():
+            while not queue.empty():
+                message = queue.get_nowait()
+                if queue_name == "frontend-update":
+                    frontend_updates.m_num_messages += 1
+                    frontend_updates.m_num_bytes += len(msgpack.packb(message.toJSON(), use_bin_type=True))
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def formatResult(result: ReplayBenchmarkResult) -> str:
+    """Human readable report
+
+    Args:
+        result (ReplayBenchmarkResult): The result
+
+    Returns:
+        str: The report
+    """
+    summary = result.toJSON()
+    lines = [
+        f"Packets          : {result.num_packets} ({result.num_dropped} dropped)",
+        f"Virtual time     : {result.virtual_time:.1f} s",
+        f"Wall time        : {result.wall_time:.2f} s ({result.virtual_time / result.wall_time:.1f}x real time)"
+        if result.wall_time else "Wall time        : 0",
+        f"Throughput       : {result.packets_per_sec:.0f} packets/s",
+        f"Packet latency   : p50 {summary['packet-latency-us']['p50']:.1f} us, "
+        f"p99 {summary['packet-latency-us']['p99']:.1f} us, max {summary['packet-latency-us']['max']:.1f} us",
+        f"RSS              : {summary['memory']['start-rss-mb']:.1f} MB -> peak {summary['memory']['peak-rss-mb']:.1f} MB",
+    ]
+    if result.traced_peak is not None:
+        lines.append(f"Traced heap peak : {summary['memory']['traced-peak-mb']:.1f} MB")
+    lines.append("")
+    lines.append(f"{'Packet type':<24}{'count':>8}{'parse us':>12}{'handler us':>12}{'total ms':>12}")
+    for name, stats in sorted(summary["packet-types"].items(), key=lambda item: -item[1]["total-ms"]):
+        lines.append(f"{name:<24}{stats['count']:>8}{stats['parse-us-mean']:>12.1f}"
+                     f"{stats['handler-us-mean']:>12.1f}{stats['total-ms']:>12.1f}")
+    lines.append("")
+    lines.append(f"{'Periodic task':<36}{'calls':>8}{'ms mean':>12}")
+    for name, stats in summary["periodic-tasks"].items():
+        lines.append(f"{name:<36}{stats['calls']:>8}{stats['ms-mean']:>12.3f}")
+    return "\n".join(lines)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a capture through the backend pipeline in-process and "
+                                                 "report throughput, per packet type costs and memory")
+    parser.add_argument("file_name", help="Capture file (.f1pcap)")
+    parser.add_argument("--speed", default="max",
+                        help="Replay speed multiplier, or 'max' to replay as fast as possible (default)")
+    parser.add_argument("--trace-memory", action="store_true", help="Report the peak Python heap (slow)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    speed = None if args.speed == "max" else float(args.speed)
+    result = ReplayBenchmark(speed=speed, trace_memory=args.trace_memory).runFile(args.file_name)
+    print(formatResult(result))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result.toJSON(), f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,698 @@
+
+# MIT License
+#
+# Copyright (c) [2025] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import math
+import random
+import struct
+from dataclasses import dataclass
+from typing import FrozenSet, Generator, Iterable, List, Optional, Tuple
+
+import lib.packet_cap as pcap
+from lib.f1_types import (ActualTyreCompound, CarDamageData, CarMotionData,
+                          CarSetupData, CarStatusData, CarTelemetryData,
+                          F1PacketType, FinalClassificationData, LapData,
+                          LapHistoryData, LiveryColour, LobbyInfoData,
+                          Nationality, PacketCarDamageData, PacketCarSetupData,
+                          PacketCarStatusData, PacketCarTelemetryData,
+                          PacketEventData,
+                          PacketHeader, PacketLapData, PacketLapPositionsData,
+                          PacketMotionData,
+                          PacketMotionExData, PacketParticipantsData,
+                          PacketSessionData, PacketSessionHistoryData,
+                          PacketTimeTrialData, PacketTyreSetsData,
+                          ParticipantData, Platform, ResultReason,
+                          ResultStatus, SessionType24, TeamID24, TeamID25,
+                          TelemetrySetting, TimeTrialDataSet, TrackID,
+                          TractionControlAssistMode, TyreSetData,
+                          TyreStintHistoryData, VisualTyreCompound)
+from lib.f1_types.packet_1_session_data import WeatherForecastSample
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+@dataclass
+class _SyntheticCar:
+    """Kinematic state of one synthetic car"""
+    speed: float                # m/s
+    total_distance: float       # m, negative on the grid
+    lap_start_time: float = 0.0
+    last_lap_time_ms: int = 0
+    position: int = 0
+
+class SyntheticSession:
+    """Deterministic generator of a plausible F1 25/24 session, as raw UDP packets.
+
+    The cars drive round an oval-ish track at slightly different constant speeds, so positions, gaps, lap times, fuel
+    and tyre wear evolve like in a real session. By default only the packets the backend needs for the live race table
+    are generated: motion, lap data, car telemetry and car status every frame, session and car damage every
+    slow_divisor frames, participants every participants_divisor frames and a SESSION_STARTED event at the start.
+
+    The other packet types can be enabled with packet_types. They follow the game's schedule: motion ex with motion,
+    car setups with session, one car's session history and tyre sets per frame, lap positions and time trial (time
+    trial sessions only) once a second, lobby info at the start and final classification once the leader finishes.
+    """
+
+    DEFAULT_PACKET_TYPES: FrozenSet[F1PacketType] = frozenset({
+        F1PacketType.EVENT,
+        F1PacketType.PARTICIPANTS,
+        F1PacketType.SESSION,
+        F1PacketType.MOTION,
+        F1PacketType.LAP_DATA,
+        F1PacketType.CAR_TELEMETRY,
+        F1PacketType.CAR_STATUS,
+        F1PacketType.CAR_DAMAGE,
+    })
+    ALL_PACKET_TYPES: FrozenSet[F1PacketType] = frozenset(F1PacketType(i) for i in range(16))
+    SUPPORTED_PACKET_FORMATS = (2024, 2025)
+    MAX_CARS = 22
+    TRACK = TrackID.Silverstone
+    TRACK_LENGTH = 5891
+
+    def __init__(self,
+                 num_cars: int = 20,
+                 total_laps: int = 5,
+                 rate_hz: int = 20,
+                 slow_divisor: int = 10,
+                 participants_divisor: int = 100,
+                 seed: int = 0,
+                 session_uid: Optional[int] = None,
+                 packet_format: int = 2025,
+                 session_type: SessionType24 = SessionType24.RACE,
+                 motion_rate_hz: Optional[int] = None,
+                 packet_types: Optional[Iterable[F1PacketType]] = None):
+        """
+        Args:
+            num_cars (int): Number of active cars (max 22)
+            total_laps (int): Race distance
+            rate_hz (int): Frame rate, i.e. the rate of the high frequency packets
+            slow_divisor (int): Session and damage packets are sent every slow_divisor frames
+            participants_divisor (int): Participants packets are sent every participants_divisor frames
+            seed (int): Seed for the per car variations
+            session_uid (Optional[int]): Session UID. Derived from the seed if not specified
+            packet_format (int): 2025 (F1 25) or 2024 (F1 24)
+            session_type (SessionType24): Session type reported in the session packet
+            motion_rate_hz (Optional[int]): Rate of the motion and motion ex packets. Must be a multiple of rate_hz.
+                Defaults to rate_hz
+            packet_types (Optional[Iterable[F1PacketType]]): Packet types to generate. Defaults to
+                DEFAULT_PACKET_TYPES. Types that the game doesn't send for this format are ignored
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        if not 1 <= num_cars <= self.MAX_CARS:
+            raise ValueError(f"num_cars must be between 1 and {self.MAX_CARS}")
+        if packet_format not in self.SUPPORTED_PACKET_FORMATS:
+            raise ValueError(f"packet_format must be one of {self.SUPPORTED_PACKET_FORMATS}")
+        motion_rate_hz = motion_rate_hz or rate_hz
+        if motion_rate_hz % rate_hz:
+            raise ValueError("motion_rate_hz must be a multiple of rate_hz")
+        self.m_num_cars = num_cars
+        self.m_total_laps = total_laps
+        self.m_rate_hz = rate_hz
+        self.m_motion_rate_hz = motion_rate_hz
+        self.m_motion_divisor = motion_rate_hz // rate_hz
+        self.m_slow_divisor = slow_divisor
+        self.m_participants_divisor = participants_divisor
+        self.m_packet_format = packet_format
+        self.m_game_year = packet_format % 100
+        self.m_session_type = session_type
+        self.m_packet_types = set(self.DEFAULT_PACKET_TYPES if packet_types is None else packet_types)
+        if packet_format < 2025:
+            self.m_packet_types.discard(F1PacketType.LAP_POSITIONS)
+        if session_type != SessionType24.TIME_TRIAL:
+            self.m_packet_types.discard(F1PacketType.TIME_TRIAL)
+        rng = random.Random(seed)
+        self.m_session_uid = session_uid if session_uid is not None else rng.getrandbits(63)
+        self.m_cars = [
+            _SyntheticCar(speed=62.0 + rng.uniform(-1.5, 1.5), total_distance=-8.0 * i, position=i + 1)
+            for i in range(num_cars)
+        ]
+        self.m_frame = 0
+        self.m_finished = False
+        self.m_classification_sent = False
+        self.m_lap_positions: List[List[int]] = []
+        if F1PacketType.LAP_POSITIONS in self.m_packet_types:
+            self._recordLapPositions()
+
+    def packets(self, duration: float, start_timestamp: float = 0.0) -> Generator[Tuple[float, bytes], None, None]:
+        """Generate the packets of the next duration seconds of the session.
+
+        Args:
+            duration (float): Seconds of session time to generate
+            start_timestamp (float): Capture timestamp of session time 0
+
+        Yields:
+            Tuple[float, bytes]: Capture timestamp and raw packet
+        """
+        num_frames = int(duration * self.m_motion_rate_hz)
+        for _ in range(num_frames):
+            session_time = self.m_frame / self.m_motion_rate_hz
+            self._advance(session_time)
+            timestamp = start_timestamp + session_time
+            for packet in self.framePackets(session_time):
+                yield timestamp, packet
+            self.m_frame += 1
+
+    def framePackets(self, session_time: float) -> List[bytes]:
+        """Build the packets for the current frame (a motion frame, if motion_rate_hz is higher than rate_hz).
+
+        Args:
+            session_time (float): Session time of the frame
+
+        Returns:
+            List[bytes]: Raw packets
+        """
+        types = self.m_packet_types
+        packets = []
+        if self.m_frame % self.m_motion_divisor:
+            # Motion only frame
+            if F1PacketType.MOTION in types:
+                packets.append(self._motionPacket(session_time))
+            if F1PacketType.MOTION_EX in types:
+                packets.append(self._motionExPacket(session_time))
+            return packets
+
+        frame = self.m_frame // self.m_motion_divisor
+        slow_frame = frame % self.m_slow_divisor == 0
+        if frame == 0:
+            if F1PacketType.LOBBY_INFO in types:
+                packets.append(self._lobbyInfoPacket(session_time))
+            if F1PacketType.EVENT in types:
+                packets.append(self._eventPacket(session_time, PacketEventData.EventPacketType.SESSION_STARTED))
+        if frame % self.m_participants_divisor == 0 and F1PacketType.PARTICIPANTS in types:
+            packets.append(self._participantsPacket(session_time))
+        if slow_frame:
+            if F1PacketType.SESSION in types:
+                packets.append(self._sessionPacket(session_time))
+            if F1PacketType.CAR_SETUPS in types:
+                packets.append(self._carSetupsPacket(session_time))
+        if F1PacketType.MOTION in types:
+            packets.append(self._motionPacket(session_time))
+        if F1PacketType.MOTION_EX in types:
+            packets.append(self._motionExPacket(session_time))
+        if F1PacketType.LAP_DATA in types:
+            packets.append(self._lapDataPacket(session_time))
+        if F1PacketType.CAR_TELEMETRY in types:
+            packets.append(self._telemetryPacket(session_time))
+        if F1PacketType.CAR_STATUS in types:
+            packets.append(self._statusPacket(session_time))
+        if slow_frame and F1PacketType.CAR_DAMAGE in types:
+            packets.append(self._damagePacket(session_time))
+
+        # One car per frame, like the game
+        car_index = frame % self.m_num_cars
+        if F1PacketType.SESSION_HISTORY in types:
+            packets.append(self._sessionHistoryPacket(car_index, session_time))
+        if F1PacketType.TYRE_SETS in types:
+            packets.append(self._tyreSetsPacket(car_index, session_time))
+
+        if frame % self.m_rate_hz == 0:
+            if F1PacketType.LAP_POSITIONS in types:
+                packets.append(self._lapPositionsPacket(session_time))
+            if F1PacketType.TIME_TRIAL in types:
+                packets.append(self._timeTrialPacket(session_time))
+        if self.m_finished and not self.m_classification_sent and F1PacketType.FINAL_CLASSIFICATION in types:
+            packets.append(self._finalClassificationPacket(session_time))
+            self.m_classification_sent = True
+        return packets
+
+    # ---------------------------------- SIMULATION --------------------------------------------------------------------
+
+    def _advance(self, session_time: float) -> None:
+        """Move the cars to session_time"""
+        dt = 1.0 / self.m_motion_rate_hz if self.m_frame else 0.0
+        lap_completed = False
+        for car in self.m_cars:
+            prev_laps = self._completedLaps(car)
+            car.total_distance += car.speed * dt
+            if self._completedLaps(car) > prev_laps and car.total_distance > 0:
+                car.last_lap_time_ms = int((session_time - car.lap_start_time) * 1000)
+                car.lap_start_time = session_time
+                lap_completed = True
+        for position, car in enumerate(sorted(self.m_cars, key=lambda c: -c.total_distance), start=1):
+            car.position = position
+        if lap_completed and F1PacketType.LAP_POSITIONS in self.m_packet_types:
+            self._recordLapPositions()
+        if not self.m_finished and self._completedLaps(self._leader()) >= self.m_total_laps:
+            self.m_finished = True
+
+    def _recordLapPositions(self) -> None:
+        """Update the lap positions history with the current order"""
+        max_laps = PacketLapPositionsData.MAX_LAPS
+        lap = min(max(self._completedLaps(car) for car in self.m_cars), max_laps - 1)
+        while len(self.m_lap_positions) <= lap:
+            self.m_lap_positions.append([0] * self.MAX_CARS)
+        for index, car in enumerate(self.m_cars):
+            self.m_lap_positions[lap][index] = car.position
+
+    def _leader(self) -> _SyntheticCar:
+        return next(c for c in self.m_cars if c.position == 1)
+
+    def _completedLaps(self, car: _SyntheticCar) -> int:
+        return max(0, int(car.total_distance // self.TRACK_LENGTH))
+
+    def _lapDistance(self, car: _SyntheticCar) -> float:
+        return car.total_distance % self.TRACK_LENGTH
+
+    def _carInFront(self, car: _SyntheticCar) -> Optional[_SyntheticCar]:
+        if car.position == 1:
+            return None
+        return next(c for c in self.m_cars if c.position == car.position - 1)
+
+    def _gapMs(self, car: _SyntheticCar, other: Optional[_SyntheticCar]) -> int:
+        if other is None:
+            return 0
+        return int((other.total_distance - car.total_distance) / car.speed * 1000)
+
+    # ---------------------------------- PACKET BUILDERS ---------------------------------------------------------------
+
+    def _header(self, packet_type: F1PacketType, session_time: float) -> PacketHeader:
+        return PacketHeader.from_values(
+            packet_format=self.m_packet_format,
+            game_year=self.m_game_year,
+            game_major_version=1,
+            game_minor_version=0,
+            packet_version=1,
+            packet_type=packet_type,
+            session_uid=self.m_session_uid,
+            session_time=session_time,
+            frame_identifier=self.m_frame,
+            overall_frame_identifier=self.m_frame,
+            player_car_index=0,
+            secondary_player_car_index=255,
+        )
+
+    def _padCars(self, items: list, empty) -> list:
+        return items + [empty] * (self.MAX_CARS - len(items))
+
+    def _eventPacket(self, session_time: float, event_type: PacketEventData.EventPacketType) -> bytes:
+        return PacketEventData.from_values(
+            header=self._header(F1PacketType.EVENT, session_time),
+            event_type=event_type,
+            event_details=None,
+        ).to_bytes(include_header=True)
+
+    def _participantsPacket(self, session_time: float) -> bytes:
+        header = self._header(F1PacketType.PARTICIPANTS, session_time)
+        teams = self._teams()
+        participants = [
+            ParticipantData.from_values(
+                header=header,
+                ai_controlled=(i != 0),
+                driver_id=255 if i == 0 else i,
+                network_id=i,
+                team_id=teams[i // 2 % len(teams)],
+                my_team=False,
+                race_number=i + 1,
+                nationality=Nationality.British,
+                name=f"Driver {i + 1:02d}",
+                your_telemetry=TelemetrySetting.PUBLIC,
+                show_online_names=True,
+                platform=Platform.STEAM,
+                liveries=[LiveryColour.from_values(30 * (i % 8), 0, 255 - 30 * (i % 8))] * 4,
+            )
+            for i in range(self.MAX_CARS)
+        ]
+        return PacketParticipantsData.from_values(header, self.m_num_cars, participants).to_bytes()
+
+    def _sessionPacket(self, session_time: float) -> bytes:
+        # No serialiser for the session packet, so pack the sections by hand (marshal zones and unused forecast
+        # samples are zeroed)
+        weather_sample = WeatherForecastSample.COMPILED_PACKET_STRUCT.pack(
+            self.m_session_type.value, 0, WeatherForecastSample.WeatherCondition.LIGHT_CLOUD.value, 31,
+            WeatherForecastSample.TrackTemperatureChange.NO_CHANGE.value, 22,
+            WeatherForecastSample.AirTemperatureChange.NO_CHANGE.value, 5)
+        payload = PacketSessionData.COMPILED_PACKET_STRUCT_SECTION_0.pack(
+            1, 31, 22, self.m_total_laps, self.TRACK_LENGTH, self.m_session_type.value, self.TRACK.value, 0,
+            max(0, 7200 - int(session_time)), 7200, 80, 0, 0, 255, 0, 0)
+        payload += bytes(PacketSessionData.F1_23_MAX_NUM_MARSHAL_ZONES * 5)
+        payload += PacketSessionData.COMPILED_PACKET_STRUCT_SECTION_2.pack(0, 0, 1)
+        payload += weather_sample
+        payload += bytes((PacketSessionData.F1_24_MAX_NUM_WEATHER_FORECAST_SAMPLES - 1) * len(weather_sample))
+        payload += PacketSessionData.COMPILED_PACKET_STRUCT_SECTION_4.pack(
+            0, 90, 1, 1, 1, 2, 3, 10, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 840, 3, 1, 0, 1, 0, 0, 0, 0)
+        payload += PacketSessionData.COMPILED_PACKET_STRUCT_SECTION_5.pack(
+            0, 0, 3, 1, 0, 0, 1, 0, 2, 1, 2, 0, 0, 0, 0, 0, 0, 2, 0, 0, 0, 2, 0, 0, 1,
+            self.m_session_type.value, *([0] * 11), self.TRACK_LENGTH / 3, 2 * self.TRACK_LENGTH / 3)
+        return self._header(F1PacketType.SESSION, session_time).to_bytes() + payload
+
+    def _motionPacket(self, session_time: float) -> bytes:
+        radius = self.TRACK_LENGTH / (2 * math.pi)
+        cars = []
+        for car in self.m_cars:
+            angle = 2 * math.pi * self._lapDistance(car) / self.TRACK_LENGTH
+            cars.append(CarMotionData.from_values(
+                radius * math.cos(angle), 0.0, radius * math.sin(angle),
+                -car.speed * math.sin(angle), 0.0, car.speed * math.cos(angle),
+                0, 0, 32767, 32767, 0, 0,
+                car.speed * car.speed / radius / 9.81, 0.0, 1.0,
+                angle, 0.0, 0.0,
+                packet_format=self.m_packet_format))
+        empty = CarMotionData.from_values(*([0] * 18), packet_format=self.m_packet_format)
+        return PacketMotionData.from_values(
+            self._header(F1PacketType.MOTION, session_time), self._padCars(cars, empty)).to_bytes()
+
+    def _lapData(self, car: Optional[_SyntheticCar], session_time: float) -> LapData:
+        if car is None:
+            return LapData.from_values(*([0] * 33), packet_format=self.m_packet_format)
+        lap_distance = self._lapDistance(car)
+        leader = self._leader()
+        in_front = self._carInFront(car)
+        sector_len = self.TRACK_LENGTH / 3
+        curr_lap_ms = int((session_time - car.lap_start_time) * 1000)
+        return LapData.from_values(
+            last_lap_time_ms=car.last_lap_time_ms,
+            current_lap_time_ms=curr_lap_ms,
+            sector1_time_ms=int(sector_len / car.speed * 1000) if lap_distance > sector_len else 0,
+            sector1_time_minutes=0,
+            sector2_time_ms=int(sector_len / car.speed * 1000) if lap_distance > 2 * sector_len else 0,
+            sector2_time_minutes=0,
+            delta_to_front_ms=self._gapMs(car, in_front) % 60000,
+            delta_to_front_minutes=self._gapMs(car, in_front) // 60000,
+            delta_to_leader_ms=self._gapMs(car, leader) % 60000,
+            delta_to_leader_minutes=self._gapMs(car, leader) // 60000,
+            lap_distance=lap_distance if car.total_distance >= 0 else car.total_distance,
+            total_distance=car.total_distance,
+            safety_car_delta=0.0,
+            car_position=car.position,
+            current_lap_num=min(self._completedLaps(car) + 1, self.m_total_laps),
+            pit_status=0,
+            num_pit_stops=0,
+            sector=min(2, int(lap_distance // sector_len)),
+            current_lap_invalid=0,
+            penalties=0,
+            total_warnings=0,
+            corner_cutting_warnings=0,
+            num_unserved_drive_through_pens=0,
+            num_unserved_stop_go_pens=0,
+            grid_position=self.m_cars.index(car) + 1,
+            driver_status=4, # On track
+            result_status=2, # Active
+            pit_lane_timer_active=0,
+            pit_lane_time_ms=0,
+            pit_stop_timer_ms=0,
+            pit_stop_should_serve_pen=0,
+            speed_trap_fastest_speed=car.speed * 3.6 + 20.0,
+            speed_trap_fastest_lap=1,
+            packet_format=self.m_packet_format)
+
+    def _lapDataPacket(self, session_time: float) -> bytes:
+        laps = [self._lapData(car, session_time) for car in self.m_cars]
+        return PacketLapData.from_values(
+            self._header(F1PacketType.LAP_DATA, session_time),
+            self._padCars(laps, self._lapData(None, session_time))).to_bytes()
+
+    def _telemetryPacket(self, session_time: float) -> bytes:
+        cars = []
+        for index, car in enumerate(self.m_cars):
+            wave = math.sin(session_time + index)
+            speed_kmph = int(car.speed * 3.6 + 40 * wave)
+            cars.append(CarTelemetryData.from_values(
+                speed_kmph, 1.0 if wave > -0.5 else 0.0, 0.1 * wave, 0.0 if wave > -0.5 else 0.8, 0,
+                max(1, min(8, speed_kmph // 40)), 10500 + int(1000 * wave), speed_kmph > 280, 60, 0,
+                500, 500, 480, 480, 95, 95, 92, 92, 100, 100, 98, 98, 105,
+                23.5, 23.5, 22.0, 22.0, 0, 0, 0, 0,
+                packet_format=self.m_packet_format))
+        empty = CarTelemetryData.from_values(*([0] * 31), packet_format=self.m_packet_format)
+        return PacketCarTelemetryData.from_values(
+            self._header(F1PacketType.CAR_TELEMETRY, session_time), self._padCars(cars, empty),
+            255, 255, 0).to_bytes()
+
+    def _carStatus(self, car: Optional[_SyntheticCar]) -> CarStatusData:
+        laps_done = car.total_distance / self.TRACK_LENGTH if car else 0.0
+        fuel = max(0.0, 100.0 - 1.6 * laps_done) if car else 0.0
+        return CarStatusData.from_values(
+            traction_control=TractionControlAssistMode.OFF,
+            anti_lock_brakes=False,
+            fuel_mix=CarStatusData.FuelMix.STANDARD,
+            front_brake_bias=56,
+            pit_limiter_status=False,
+            fuel_in_tank=fuel,
+            fuel_capacity=110.0,
+            fuel_remaining_laps=fuel / 1.6 - (self.m_total_laps - laps_done),
+            max_rpm=13000,
+            idle_rpm=4000,
+            max_gears=8,
+            drs_allowed=0,
+            drs_activation_distance=0,
+            actual_tyre_compound=ActualTyreCompound.C3,
+            visual_tyre_compound=VisualTyreCompound.MEDIUM,
+            tyres_age_laps=max(0, int(laps_done)),
+            m_vehicle_fia_flags=CarStatusData.VehicleFIAFlags.NONE,
+            engine_power_ice=600000.0,
+            engine_power_mguk=120000.0,
+            ers_store_energy=2000000.0,
+            ers_deploy_mode=CarStatusData.ERSDeployMode.MEDIUM,
+            ers_harvested_this_lap_mguk=0.0,
+            ers_harvested_this_lap_mguh=0.0,
+            ers_deployed_this_lap=0.0,
+            network_paused=0,
+            packet_format=self.m_packet_format)
+
+    def _statusPacket(self, session_time: float) -> bytes:
+        statuses = [self._carStatus(car) for car in self.m_cars]
+        return PacketCarStatusData.from_values(
+            self._header(F1PacketType.CAR_STATUS, session_time),
+            self._padCars(statuses, self._carStatus(None))).to_bytes()
+
+    def _carDamage(self, car: Optional[_SyntheticCar]) -> CarDamageData:
+        wear = max(0.0, car.total_distance / self.TRACK_LENGTH * 1.8) if car else 0.0
+        return CarDamageData.from_values(
+            self.m_packet_format, [wear, wear, wear * 1.1, wear * 1.1], [int(wear)] * 4, [0] * 4, [0] * 4,
+            0, 0, 0, 0, 0, 0, False, False, 0, 0, 0, 0, 0, 0, 0, 0, False, False)
+
+    def _damagePacket(self, session_time: float) -> bytes:
+        damages = [self._carDamage(car) for car in self.m_cars]
+        return PacketCarDamageData.from_values(
+            self._header(F1PacketType.CAR_DAMAGE, session_time),
+            self._padCars(damages, self._carDamage(None))).to_bytes()
+
+    def _teams(self) -> list:
+        return list(TeamID25 if self.m_packet_format >= 2025 else TeamID24)[:10]
+
+    def _lapTimeMs(self, car: _SyntheticCar) -> int:
+        return int(self.TRACK_LENGTH / car.speed * 1000)
+
+    def _lobbyInfoPacket(self, session_time: float) -> bytes:
+        header = self._header(F1PacketType.LOBBY_INFO, session_time)
+        teams = self._teams()
+        players = [
+            LobbyInfoData.from_values(
+                header=header,
+                ai_controlled=(i != 0),
+                team_id=teams[i // 2 % len(teams)],
+                nationality=Nationality.British,
+                platform=Platform.STEAM,
+                name=f"Driver {i + 1:02d}",
+                car_number=i + 1,
+            )
+            for i in range(self.MAX_CARS)
+        ]
+        # The packet's to_bytes() only serialises the active players, but the game always sends all the slots
+        return header.to_bytes() + struct.pack("<B", self.m_num_cars) + b"".join(p.to_bytes() for p in players)
+
+    def _carSetupsPacket(self, session_time: float) -> bytes:
+        setup = CarSetupData.from_values(
+            self.m_packet_format, 20, 25, 60, 55, -3.0, -1.5, 0.05, 0.2, 20, 10, 8, 5, 30, 60, 100, 56,
+            22.5, 22.5, 24.0, 24.0, 6, 100.0, 50)
+        return PacketCarSetupData.from_values(
+            self._header(F1PacketType.CAR_SETUPS, session_time), [setup] * self.MAX_CARS).to_bytes()
+
+    def _motionExPacket(self, session_time: float) -> bytes:
+        # No serialiser for motion ex, so pack it by hand. Player car only
+        car = self.m_cars[0]
+        radius = self.TRACK_LENGTH / (2 * math.pi)
+        lat_accel = car.speed * car.speed / radius
+        payload = PacketMotionExData.COMPILED_PACKET_STRUCT_23.pack(
+            *([0.0] * 4), *([0.0] * 4), *([0.0] * 4),     # Suspension position, velocity, acceleration
+            *([car.speed] * 4),                             # Wheel speed
+            *([0.01] * 4), *([0.02] * 4),                   # Slip ratio, slip angle
+            *([lat_accel * 200] * 4), *([1000.0] * 4),      # Lateral, longitudinal force
+            0.3, 0.0, 0.0, car.speed,                       # COG height, local velocity
+            0.0, car.speed / radius, 0.0, 0.0, 0.0, 0.0,    # Angular velocity, angular acceleration
+            0.05, *([4000.0] * 4))                          # Front wheels angle, vertical force
+        payload += PacketMotionExData.COMPILED_PACKET_STRUCT_24_EXTRA.pack(0.03, 0.06, 0.0, 0.0, 0.0)
+        if self.m_packet_format >= 2025:
+            payload += PacketMotionExData.COMPILED_PACKET_STRUCT_25_EXTRA.pack(0.0, *([-0.05] * 4), *([0.0] * 4))
+        return self._header(F1PacketType.MOTION_EX, session_time).to_bytes() + payload
+
+    def _sessionHistoryPacket(self, car_index: int, session_time: float) -> bytes:
+        # No serialiser for session history, so pack it by hand
+        car = self.m_cars[car_index]
+        max_laps = PacketSessionHistoryData.MAX_LAPS
+        completed_laps = min(self._completedLaps(car), max_laps - 1)
+        lap_ms = self._lapTimeMs(car)
+        sector_ms = lap_ms // 3
+        best_lap = 1 if completed_laps else 0
+        payload = PacketSessionHistoryData.COMPILED_PACKET_STRUCT.pack(
+            car_index, completed_laps + 1, 1, best_lap, best_lap, best_lap, best_lap)
+        completed = LapHistoryData.COMPILED_PACKET_STRUCT.pack(
+            lap_ms, sector_ms, 0, sector_ms, 0, lap_ms - 2 * sector_ms, 0, 0x0F)
+        payload += completed * completed_laps
+        payload += bytes(LapHistoryData.PACKET_LEN * (max_laps - completed_laps))
+        payload += TyreStintHistoryData.COMPILED_PACKET_STRUCT.pack(
+            255, ActualTyreCompound.C3.value, VisualTyreCompound.MEDIUM.value)
+        payload += bytes(TyreStintHistoryData.PACKET_LEN * (PacketSessionHistoryData.MAX_TYRE_STINT_COUNT - 1))
+        return self._header(F1PacketType.SESSION_HISTORY, session_time).to_bytes() + payload
+
+    def _tyreSetsPacket(self, car_index: int, session_time: float) -> bytes:
+        car = self.m_cars[car_index]
+        compounds = [
+            (ActualTyreCompound.C4, VisualTyreCompound.SOFT),
+            (ActualTyreCompound.C3, VisualTyreCompound.MEDIUM),
+            (ActualTyreCompound.C2, VisualTyreCompound.HARD),
+        ]
+        wear = max(0, int(car.total_distance / self.TRACK_LENGTH * 1.8))
+        tyre_sets = [
+            TyreSetData.from_values(
+                self.m_packet_format, *compounds[i % len(compounds)],
+                wear=wear if i == 1 else 0,
+                available=True,
+                recommended_session=self.m_session_type,
+                life_span=20,
+                usable_life=25,
+                lap_delta_time=500 * (i % len(compounds)),
+                fitted=(i == 1))
+            for i in range(PacketTyreSetsData.MAX_TYRE_SETS)
+        ]
+        return PacketTyreSetsData.from_values(
+            self._header(F1PacketType.TYRE_SETS, session_time), car_index, tyre_sets, 1).to_bytes()
+
+    def _lapPositionsPacket(self, session_time: float) -> bytes:
+        rows = self.m_lap_positions[:PacketLapPositionsData.MAX_LAPS]
+        return PacketLapPositionsData.from_values(
+            self._header(F1PacketType.LAP_POSITIONS, session_time), len(rows), 0, rows).to_bytes()
+
+    def _timeTrialPacket(self, session_time: float) -> bytes:
+        car = self.m_cars[0]
+        lap_ms = self._lapTimeMs(car)
+        data_set = TimeTrialDataSet.from_values(
+            self.m_packet_format, 0, self._teams()[0], lap_ms, lap_ms // 3, lap_ms // 3, lap_ms - 2 * (lap_ms // 3),
+            0, 0, False, True, False, True)
+        return PacketTimeTrialData.from_values(
+            self._header(F1PacketType.TIME_TRIAL, session_time), data_set, data_set, data_set).to_bytes()
+
+    def _classification(self, car: Optional[_SyntheticCar], session_time: float) -> FinalClassificationData:
+        points = (25, 18, 15, 12, 10, 8, 6, 4, 2, 1)
+        position = car.position if car else 0
+        return FinalClassificationData.from_values(
+            self.m_packet_format,
+            position,
+            self.m_total_laps if car else 0,
+            self.m_cars.index(car) + 1 if car else 0,
+            points[position - 1] if 0 < position <= len(points) else 0,
+            0,
+            ResultStatus.FINISHED if car else ResultStatus.INVALID,
+            ResultReason.FINISHED if car else ResultReason.INVALID,
+            self._lapTimeMs(car) if car else 0,
+            session_time if car else 0.0,
+            0,
+            0,
+            1 if car else 0,
+            *([ActualTyreCompound.C3] * 8),
+            *([VisualTyreCompound.MEDIUM] * 8),
+            *([self.m_total_laps if car else 0] + [0] * 7))
+
+    def _finalClassificationPacket(self, session_time: float) -> bytes:
+        # The packet's to_bytes() only serialises the active cars, but the game always sends all the slots
+        classification = [self._classification(car, session_time) for car in self.m_cars]
+        classification = self._padCars(classification, self._classification(None, session_time))
+        return (self._header(F1PacketType.FINAL_CLASSIFICATION, session_time).to_bytes() +
+                struct.pack("<B", self.m_num_cars) + b"".join(data.to_bytes() for data in classification))
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+SESSION_TYPES = {
+    "race": SessionType24.RACE,
+    "qualifying": SessionType24.QUALIFYING_1,
+    "practice": SessionType24.PRACTICE_1,
+    "time-trial": SessionType24.TIME_TRIAL,
+}
+
+def addSessionArguments(parser: argparse.ArgumentParser) -> None:
+    """Add the SyntheticSession options to a dev tool's command line parser"""
+    parser.add_argument("--cars", type=int, default=20, help="Number of cars (default 20)")
+    parser.add_argument("--rate", type=int, default=20, help="Frame rate in Hz (default 20)")
+    parser.add_argument("--motion-rate", type=int, default=None,
+                        help="Motion packet rate in Hz, a multiple of --rate (default: same as --rate)")
+    parser.add_argument("--format", type=int, default=2025, choices=SyntheticSession.SUPPORTED_PACKET_FORMATS,
+                        help="Packet format (default 2025)")
+    parser.add_argument("--session-type", default="race", choices=SESSION_TYPES.keys(),
+                        help="Session type (default race)")
+    parser.add_argument("--laps", type=int, default=5, help="Race distance (default 5)")
+    parser.add_argument("--all-packet-types", action="store_true",
+                        help="Generate every packet type, not just the ones the race table needs")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default 0)")
+
+def sessionFromArguments(args: argparse.Namespace) -> SyntheticSession:
+    """Create a SyntheticSession from the options added by addSessionArguments()"""
+    return SyntheticSession(
+        num_cars=args.cars,
+        total_laps=args.laps,
+        rate_hz=args.rate,
+        seed=args.seed,
+        packet_format=args.format,
+        session_type=SESSION_TYPES[args.session_type],
+        motion_rate_hz=args.motion_rate,
+        packet_types=SyntheticSession.ALL_PACKET_TYPES if args.all_packet_types else None)
+
+def writeCapture(output_file: str,
+                 duration: float,
+                 num_cars: int = 20,
+                 rate_hz: int = 20,
+                 seed: int = 0,
+                 block_size: int = pcap.F1PcapBlockWriter.DEFAULT_BLOCK_SIZE,
+                 session: Optional[SyntheticSession] = None) -> int:
+    """Write a synthetic session to a (v2, compressed) capture file.
+
+    Args:
+        output_file (str): Destination capture
+        duration (float): Seconds of session time
+        num_cars (int): Number of cars
+        rate_hz (int): Frame rate
+        seed (int): Seed for the per car variations
+        block_size (int): Uncompressed block size
+        session (Optional[SyntheticSession]): Session to write. Overrides num_cars, rate_hz and seed
+
+    Returns:
+        int: Number of packets written
+    """
+    session = session or SyntheticSession(num_cars=num_cars, rate_hz=rate_hz, seed=seed)
+    with pcap.F1PcapBlockWriter(output_file, block_size=block_size) as writer:
+        for timestamp, data in session.packets(duration):
+            writer.add(data, timestamp)
+    return writer.m_num_packets
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a deterministic synthetic session to a capture file")
+    parser.add_argument("output", help="Output .f1pcap file")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of session time (default 30)")
+    addSessionArguments(parser)
+    args = parser.parse_args()
+
+    num_packets = writeCapture(args.output, args.duration, session=sessionFromArguments(args))
+    print(f"Wrote {num_packets} packets to {args.output}")
+
+if __name__ == "__main__":
+    main()
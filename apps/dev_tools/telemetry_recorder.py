@@ -23,7 +23,9 @@
 
 import asyncio
 import os
+import shutil
 import sys
+import tempfile
 import time
 import tkinter as tk
 from threading import Condition, Lock, Thread
@@ -33,55 +35,60 @@ from typing import Tuple
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lib.packet_cap import F1PacketCapture
+from lib.packet_cap import F1PcapStreamWriter
 from lib.socket_receiver import UdpTransport
 
 g_start_condition = Condition()
 g_port_num = None
 
 class PacketCaptureTable:
-    """Thread safe container for F1PacketCapture instance.
+    """Thread safe container for the capture being recorded.
+
+    Packets are streamed to a spool file in the temp directory (so memory usage stays flat and a crash doesn't lose
+    the recording). Saving moves the spool file to the chosen path and starts a new one.
     """
 
     def __init__(self) -> None:
         """
-        Initialize the object by creating a new F1PacketCapture instance and a Lock instance.
+        Initialize the object by creating a new spool file writer and a Lock instance.
         """
-        self.m_packet_capture = F1PacketCapture(compressed=True)
         self.m_lock = Lock()
+        self._startSpool()
 
     def add(self, packet: bytes) -> None:
         """
-        Add a packet to the packet list while acquiring a lock to ensure thread safety.
+        Add a packet to the capture while acquiring a lock to ensure thread safety.
 
         Parameters:
             packet (bytes): The raw packet to be added to the table.
         """
         with self.m_lock:
-            self.m_packet_capture.add(packet)
+            self.m_writer.add(packet)
 
     def clear(self) -> int:
         """
-        Clear the packet history table and reset the number of packets.
+        Discard the recorded packets and start a new spool file.
 
         Returns:
             int: The number of packets cleared.
         """
         with self.m_lock:
-            ret = self.m_packet_capture.getNumPackets()
-            self.m_packet_capture.clear()
+            ret = self.m_writer.getNumPackets()
+            self.m_writer.close()
+            os.remove(self.m_spool_path)
+            self._startSpool()
             return ret
 
     def getNumPackets(self) -> int:
         """
-        Returns the number of packets captured by the packet capture object.
+        Returns the number of packets captured so far.
         """
         with self.m_lock:
-            return self.m_packet_capture.getNumPackets()
+            return self.m_writer.getNumPackets()
 
     def dumpToFile(self, path: str) -> Tuple[str, int, int]:
         """
-        Dumps the packet history to a file while acquiring a lock to ensure thread safety.
+        Finalise the spool file and move it to the given path while acquiring a lock to ensure thread safety.
 
         Parameters:
             path (str): The path to the file to be written to.
@@ -90,7 +97,24 @@ class PacketCaptureTable:
             Tuple[str, int, int]: A tuple containing the filename, number of packets, and number of bytes written.
         """
         with self.m_lock:
-            return self.m_packet_capture.dumpToFile(path)
+            num_packets, num_bytes = self.m_writer.close()
+            if num_packets:
+                shutil.move(self.m_spool_path, path)
+                ret = (path, num_packets, num_bytes)
+            else:
+                os.remove(self.m_spool_path)
+                ret = (None, 0, 0)
+            if self.m_writer.num_dropped:
+                print(f"[WARN]: {self.m_writer.num_dropped} packets were dropped (disk too slow)")
+            self._startSpool()
+            return ret
+
+    def _startSpool(self) -> None:
+        """Start streaming to a new spool file"""
+        fd, self.m_spool_path = tempfile.mkstemp(prefix="png_recorder_", suffix=".f1pcap")
+        os.close(fd)
+        self.m_writer = F1PcapStreamWriter(self.m_spool_path, compressed=True)
+        print(f"Recording to {self.m_spool_path}")
 
 g_capture_table = PacketCaptureTable()
 
@@ -23,19 +23,21 @@
 
 import socket
 import argparse
+from array import array
 from tqdm import tqdm
+import math
 import struct
 import time
 import sys
 import os
 import random
-from typing import Callable, Optional, Tuple, Iterator
+from typing import Callable, List, Optional, Tuple
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Now perform the import
-from lib.packet_cap import F1PacketCapture
+from lib.packet_cap import F1PcapReader
 
 def should_drop(probability_percentage: int) -> bool:
     """
@@ -51,21 +53,6 @@ def should_drop(probability_percentage: int) -> bool:
         raise ValueError("Probability percentage must be between 0 and 100.")
     return random.uniform(0, 100) < probability_percentage
 
-def send_bytes_udp(data: bytes, udp_ip: str, udp_port: int) -> int:
-    """Send the given list of bytes to the specified destination over UDP
-
-    Args:
-        data (bytes): List of raw bytes to be sent
-        udp_ip (str): The destination IP address
-        udp_port (int): The destination UDP port
-
-    Returns:
-        int: Number of bytes sent
-    """
-    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
-        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        return udp_socket.sendto(data, (udp_ip, udp_port))
-
 def format_file_size(num_bytes: int) -> str:
     """Get human readable string containing file size
 
@@ -86,6 +73,141 @@ def format_file_size(num_bytes: int) -> str:
 
     return f"{round(num_bytes, 2)} {sizes[i]}"
 
+class ReplayPacer:
+    """Paces the replay against absolute deadlines derived from the capture timestamps.
+
+    Each packet's deadline is start + capture offset / speed_multiplier, so timing errors don't accumulate like
+    they do with a sleep per packet. The capture offset advances by the timestamp delta (packets of a frame often
+    share a timestamp and go out back to back), or by FALLBACK_INTERVAL for packets without a usable timestamp
+    (v1 files only store float32 timestamps, which are equal for minutes at a time). Waits longer than
+    spin_threshold sleep until spin_threshold before the deadline and then busy-wait the rest, since sleep()
+    overshoots by up to a scheduler tick.
+    """
+
+    FALLBACK_INTERVAL = 0.01667 # 16.67ms is time interval on 60 Hz telemetry rate.
+
+    def __init__(self, speed_multiplier: float = 1.0, spin_threshold: float = 0.001):
+        """
+        Args:
+            speed_multiplier (float): Replay speed. math.inf replays as fast as possible
+            spin_threshold (float): Seconds before a deadline at which to stop sleeping and start spinning.
+                0 never spins
+
+        Raises:
+            ValueError: If speed_multiplier is not positive
+        """
+        if not speed_multiplier > 0:
+            raise ValueError("Speed multiplier must be greater than zero")
+        self.m_speed_multiplier = speed_multiplier
+        self.m_spin_threshold = spin_threshold
+        self.m_last_timestamp: Optional[float] = None
+        self.m_start: Optional[float] = None
+        self.m_offset: float = 0.0 # Capture time of the current packet, relative to the first one
+
+    @property
+    def is_unpaced(self) -> bool:
+        return math.isinf(self.m_speed_multiplier)
+
+    def wait(self, timestamp: Optional[float]) -> float:
+        """Block until the packet with the given capture timestamp is due.
+
+        Args:
+            timestamp (Optional[float]): Capture timestamp of the next packet. None if the capture has no usable
+                timestamps
+
+        Returns:
+            float: The packet's deadline (time.perf_counter() clock)
+        """
+        now = time.perf_counter()
+        if self.m_start is None:
+            self.m_start = now
+        elif timestamp is None:
+            self.m_offset += self.FALLBACK_INTERVAL
+        elif self.m_last_timestamp is not None and timestamp > self.m_last_timestamp:
+            self.m_offset += timestamp - self.m_last_timestamp
+        self.m_last_timestamp = timestamp
+        if self.is_unpaced:
+            return now
+
+        deadline = self.m_start + self.m_offset / self.m_speed_multiplier
+        remaining = deadline - now
+        if remaining > self.m_spin_threshold:
+            time.sleep(remaining - self.m_spin_threshold)
+        while time.perf_counter() < deadline:
+            pass
+        return deadline
+
+class ReplayStats:
+    """Achieved rate and timing accuracy of a replay"""
+
+    def __init__(self, speed_multiplier: float = 1.0):
+        """
+        Args:
+            speed_multiplier (float): Replay speed, used to scale the recorded inter-packet intervals
+        """
+        self.m_speed_multiplier = speed_multiplier
+        self.m_num_packets = 0
+        self.m_num_bytes = 0
+        self.m_first_send: Optional[float] = None
+        self.m_last_send: Optional[float] = None
+        self.m_last_timestamp: Optional[float] = None
+        self.m_lateness = array('d')        # Send time - deadline
+        self.m_interval_errors = array('d') # Actual inter-packet interval - recorded (scaled) interval
+
+    def record(self, timestamp: float, deadline: float, sent_at: float, num_bytes: int) -> None:
+        """Record one sent packet.
+
+        Args:
+            timestamp (float): Capture time of the packet (any fixed epoch, e.g. relative to the first packet)
+            deadline (float): When the packet was due (time.perf_counter() clock)
+            sent_at (float): When the packet was sent (time.perf_counter() clock)
+            num_bytes (int): Bytes sent
+        """
+        if self.m_first_send is None:
+            self.m_first_send = sent_at
+        elif not math.isinf(self.m_speed_multiplier):
+            recorded = (timestamp - self.m_last_timestamp) / self.m_speed_multiplier
+            self.m_interval_errors.append((sent_at - self.m_last_send) - recorded)
+        if not math.isinf(self.m_speed_multiplier):
+            self.m_lateness.append(sent_at - deadline)
+        self.m_last_send = sent_at
+        self.m_last_timestamp = timestamp
+        self.m_num_packets += 1
+        self.m_num_bytes += num_bytes
+
+    @property
+    def duration(self) -> float:
+        if self.m_first_send is None:
+            return 0.0
+        return self.m_last_send - self.m_first_send
+
+    @property
+    def packets_per_sec(self) -> float:
+        return self.m_num_packets / self.duration if self.duration else 0.0
+
+    @staticmethod
+    def _percentile(ordered: List[float], percentile: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percentile / 100))]
+
+    def summary(self) -> List[str]:
+        """Human readable summary lines"""
+        lines = [
+            f"Achieved rate: {self.packets_per_sec:.1f} packets/s, "
+            f"{self.m_num_bytes * 8 / self.duration / 1e6 if self.duration else 0.0:.2f} Mbit/s "
+            f"over {self.duration:.3f} s"
+        ]
+        if self.m_lateness:
+            lateness = sorted(self.m_lateness)
+            errors = sorted(abs(err) for err in self.m_interval_errors)
+            lines.append(f"Send lateness vs capture timestamps: p50 {self._percentile(lateness, 50) * 1e6:.1f} us, "
+                         f"p99 {self._percentile(lateness, 99) * 1e6:.1f} us, max {lateness[-1] * 1e6:.1f} us")
+            lines.append(f"Inter-packet jitter: p50 {self._percentile(errors, 50) * 1e6:.1f} us, "
+                         f"p99 {self._percentile(errors, 99) * 1e6:.1f} us, "
+                         f"max {(errors[-1] if errors else 0.0) * 1e6:.1f} us")
+        return lines
+
 def send_telemetry_data(
     file_name: str,
     ip_addr: str = "127.0.0.1",
@@ -95,7 +217,8 @@ def send_telemetry_data(
     packet_loss: Optional[int] = None,
     no_nagle: bool = False,
     printer: Optional[Callable[[str], None]] = None,
-    show_progress: bool = True
+    show_progress: bool = True,
+    spin_threshold: float = 0.001
 ) -> Tuple[int, int, int]:
     """
     Send captured F1 telemetry packets to a specified destination.
@@ -105,11 +228,13 @@ def send_telemetry_data(
         ip_addr (str): Destination IP address (default: "127.0.0.1")
         port (int): Destination port number (default: 20777)
         udp_mode (bool): Send telemetry over UDP with timestamps (default: False, uses TCP)
-        speed_multiplier (float): Speed multiplier for replay (UDP mode only, default: 1.0)
+        speed_multiplier (float): Speed multiplier for replay (UDP mode only, default: 1.0). math.inf sends as
+            fast as possible
         packet_loss (Optional[int]): Packet loss percentage to simulate (0-100)
         no_nagle (bool): Disable Nagle's Algorithm in TCP mode (default: False)
         printer (Optional[Callable[[str], None]]): Custom print function (default: print)
         show_progress (bool): Show progress bar (default: True)
+        spin_threshold (float): Busy-wait the last spin_threshold seconds before each send (UDP mode only)
 
     Returns:
         Tuple[int, int, int]: (total_packets_sent, total_bytes_sent, dropped_packets)
@@ -126,7 +251,7 @@ def send_telemetry_data(
         raise ValueError("--no-nagle and --udp-mode are mutually exclusive")
 
     # Read and parse the file
-    captured_packets = F1PacketCapture(file_name=file_name)
+    captured_packets = F1PcapReader(file_name)
     printer(f'Loaded {file_name} with {captured_packets.getNumPackets()} packets.')
     printer(f'File format ver: {captured_packets.m_header._major_version}.{captured_packets.m_header._minor_version}')
     printer(f'Compressed: {captured_packets.m_header.is_compressed}')
@@ -135,6 +260,7 @@ def send_telemetry_data(
     total_bytes = 0
     dropped_packets = 0
     client_socket = None
+    stats = ReplayStats(speed_multiplier if udp_mode else math.inf)
 
     try:
         if udp_mode:
@@ -143,7 +269,8 @@ def send_telemetry_data(
                 total_packets=total_packets,
                 ip_addr=ip_addr,
                 port=port,
-                speed_multiplier=speed_multiplier,
+                pacer=ReplayPacer(speed_multiplier, spin_threshold),
+                stats=stats,
                 packet_loss=packet_loss,
                 show_progress=show_progress
             )
@@ -154,6 +281,7 @@ def send_telemetry_data(
                 ip_addr=ip_addr,
                 port=port,
                 no_nagle=no_nagle,
+                stats=stats,
                 packet_loss=packet_loss,
                 show_progress=show_progress
             )
@@ -164,27 +292,30 @@ def send_telemetry_data(
         if packet_loss:
             dropped_rate = (dropped_packets / total_packets) * 100.0
             printer(f'Dropped {dropped_packets} packets ({dropped_rate:.3f}% loss).')
+        for line in stats.summary():
+            printer(line)
 
         return packets_sent, total_bytes, dropped_packets
 
     finally:
         if client_socket:
             client_socket.close()
+        captured_packets.close()
 
 
 def _send_udp_mode(
-    captured_packets: F1PacketCapture,
+    captured_packets: F1PcapReader,
     total_packets: int,
     ip_addr: str,
     port: int,
-    speed_multiplier: float,
+    pacer: ReplayPacer,
+    stats: ReplayStats,
     packet_loss: Optional[int],
     show_progress: bool
 ) -> Tuple[int, int]:
-    """Send packets in UDP mode with timing."""
+    """Send packets in UDP mode, paced by the capture timestamps. One socket is used for the whole replay."""
     total_bytes = 0
     dropped_packets = 0
-    prev_timestamp = None
 
     progress_bar = tqdm(
         total=total_packets,
@@ -194,38 +325,49 @@ def _send_udp_mode(
         disable=not show_progress
     )
 
-    for timestamp, packet in captured_packets.getPackets():
-        progress_bar.update(1)
-
-        if prev_timestamp is not None:
-            sleep_duration = timestamp - prev_timestamp
-            if sleep_duration == 0:
-                sleep_duration = 0.01667  # 16.67ms is time interval on 60 Hz telemetry rate.
-            time.sleep(sleep_duration / speed_multiplier)
-
-        if packet_loss and should_drop(packet_loss):
-            dropped_packets += 1
-            prev_timestamp = timestamp
-            continue
-
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+        udp_socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
         try:
-            total_bytes += send_bytes_udp(packet, ip_addr, port)
+            # Connected UDP socket, so that the destination isn't resolved again for every packet
+            udp_socket.connect((ip_addr, port))
         except (OSError, ConnectionError) as e:
             progress_bar.close()
             raise ConnectionError(f"Failed to send to {ip_addr}:{port} — {e}")
-
-        prev_timestamp = timestamp
+        send = udp_socket.send
+        perf_counter = time.perf_counter
+        # v1 timestamps are float32 epoch seconds (~2 min resolution), too coarse to pace from
+        has_timestamps = captured_packets.m_header.major_version > 1
+
+        for timestamp, packet in captured_packets.getPackets():
+            progress_bar.update(1)
+            deadline = pacer.wait(timestamp if has_timestamps else None)
+
+            if packet_loss and should_drop(packet_loss):
+                dropped_packets += 1
+                continue
+
+            try:
+                num_bytes = send(packet)
+            except ConnectionRefusedError:
+                # ICMP port unreachable from a previous datagram (nobody listening yet). Same as fire-and-forget UDP
+                num_bytes = len(packet)
+            except (OSError, ConnectionError) as e:
+                progress_bar.close()
+                raise ConnectionError(f"Failed to send to {ip_addr}:{port} — {e}")
+            stats.record(pacer.m_offset, deadline, perf_counter(), num_bytes)
+            total_bytes += num_bytes
 
     progress_bar.close()
     return total_bytes, dropped_packets
 
 
 def _send_tcp_mode(
-    captured_packets: F1PacketCapture,
+    captured_packets: F1PcapReader,
     total_packets: int,
     ip_addr: str,
     port: int,
     no_nagle: bool,
+    stats: ReplayStats,
     packet_loss: Optional[int],
     show_progress: bool
 ) -> Tuple[socket.socket, int, int]:
@@ -252,7 +394,8 @@ def _send_tcp_mode(
     )
 
     # Send each packet one by one and update the progress bar
-    for _, packet in captured_packets.getPackets():
+    perf_counter = time.perf_counter
+    for timestamp, packet in captured_packets.getPackets():
         progress_bar.update(1)
 
         if packet_loss and should_drop(packet_loss):
@@ -271,11 +414,22 @@ def _send_tcp_mode(
             raise ConnectionError(f"Failed to send to {ip_addr}:{port} — {e}")
 
         total_bytes += message_length
+        now = perf_counter()
+        stats.record(timestamp, now, now, message_length)
 
     progress_bar.close()
     return client_socket, total_bytes, dropped_packets
 
 
+def _parse_speed_multiplier(value: str) -> float:
+    """Parse the --speed-multiplier arg. 'max' means unpaced"""
+    if value.lower() == "max":
+        return math.inf
+    speed = float(value)
+    if speed <= 0:
+        raise argparse.ArgumentTypeError("Speed multiplier must be greater than zero")
+    return speed
+
 def main():
     """Main entry point for command-line execution."""
     # Parse the command line args
@@ -287,8 +441,12 @@ def main():
     parser.add_argument('--no-nagle', action='store_true', help="Disable Nagle's Algorithm in TCP mode")
     parser.add_argument('--udp-mode', action='store_true',
                         help="Send telemetry over UDP considering timestamps as well")
-    parser.add_argument('--speed-multiplier', type=float, default=1.0,
-                        help="Speed multiplier for the replay speed (UDP mode only)")
+    parser.add_argument('--speed-multiplier', type=_parse_speed_multiplier, default=1.0,
+                        help="Speed multiplier for the replay speed, or 'max' to send as fast as possible "
+                             "(UDP mode only)")
+    parser.add_argument('--spin-us', type=int, default=1000,
+                        help="Busy-wait this many microseconds before each send instead of sleeping, for precise "
+                             "inter-packet timing (UDP mode only, default: 1000, 0 to disable)")
 
     args = parser.parse_args()
 
@@ -300,7 +458,8 @@ def main():
             udp_mode=args.udp_mode,
             speed_multiplier=args.speed_multiplier,
             packet_loss=args.packet_loss,
-            no_nagle=args.no_nagle
+            no_nagle=args.no_nagle,
+            spin_threshold=args.spin_us / 1e6
         )
     except KeyboardInterrupt:
         print("\nClient terminated by user.")
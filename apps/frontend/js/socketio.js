@@ -1,4 +1,5 @@
-function initializeSocketIO(clientType, clientId) {
+// projection (optional): the part of the periodic updates this client needs, see race_table_projection.py
+function initializeSocketIO(clientType, clientId, projection = null) {
     const connectStart = Date.now();
 
     const socketio = io(`${location.protocol}//${location.hostname}:${location.port}`, {
@@ -17,10 +18,26 @@ function initializeSocketIO(clientType, clientId) {
 
     // Connection successful
     socketio.on('connect', () => {
-        socketio.emit('register-client', { type: clientType, id: clientId });
+        // batch: take the events of a server tick in one frame, see the 'batch' handler below
+        const registration = { type: clientType, id: clientId, batch: true };
+        if (projection) {
+            registration.projection = projection;
+        }
+        socketio.emit('register-client', registration);
         console.log(`⏱️ Socket connected in ${Date.now() - connectStart}ms`);
     });
 
+    // Batched events: [[event, packed payload], ...]. Hand each payload to the handlers of its event,
+    // as if it had arrived on its own
+    socketio.on('batch', (binaryData) => {
+        const batch = window.msgpack.decode(new Uint8Array(binaryData));
+        for (const [event, payload] of batch) {
+            for (const handler of socketio.listeners(event)) {
+                handler(payload);
+            }
+        }
+    });
+
     // Connection error
     socketio.on('connect_error', (err) => {
         console.warn('❌ Socket connection error:', err.message);
@@ -31,6 +31,7 @@ from apps.hud.ui.infra.hf_types import HudOverlayData
 from apps.hud.ui.overlays.base import BaseOverlay
 from lib.config import OverlayId, OverlayPosition
 from lib.f1_types import F1Utils
+from lib.file_path import resolve_fixed_file
 from lib.track_segment_info import (ComplexCornerSegmentInfo,
                                     CornerSegmentInfo, TrackSegmentsDatabase)
 
@@ -77,7 +78,8 @@ class CircuitInfoOverlay(BaseOverlay):
             refresh_interval_ms=refresh_interval_ms,
         )
 
-        self.tracks_db = TrackSegmentsDatabase(Path(__file__).parents[5] / "assets/track-segments")
+        self.tracks_db = TrackSegmentsDatabase(Path(__file__).parents[5] / "assets/track-segments",
+                                               cache_path=resolve_fixed_file("track_segments.cache"))
 
         # For high frequency/high refresh rate overlays, subscribe to HF types here and render in render_frame.
         self.subscribe_hf(HudOverlayData)
@@ -28,9 +28,10 @@ from typing import Any, Dict, List, Optional, Tuple, final
 from apps.hud.common import get_ers_mode_color, get_ref_row_index
 from apps.hud.ui.overlays.mfd.pages.base_page import MfdPageBase
 from lib.config import MfdPageId, OverlayId
+from lib.file_path import resolve_fixed_file
 from lib.track_segment_info import TrackSegmentsDatabase
 
-from .utils import get_traffic_window, resolve_location, sort_by_rel_distance
+from .utils import get_traffic_window, resolve_locations, sort_by_rel_distance
 
 # -------------------------------------- CONSTANTS ---------------------------------------------------------------------
 
@@ -52,7 +53,8 @@ class TrafficMonitorPage(MfdPageBase):
 
     @final
     def setup_page(self):
-        self.tracks_db = TrackSegmentsDatabase(Path(__file__).parents[7] / "assets/track-segments")
+        self.tracks_db = TrackSegmentsDatabase(Path(__file__).parents[7] / "assets/track-segments",
+                                               cache_path=resolve_fixed_file("track_segments.cache"))
 
         @self.on_event("race_table_update")
         def _handle_race_table_update(data: Dict[str, Any]) -> None:
@@ -121,19 +123,21 @@ class TrafficMonitorPage(MfdPageBase):
         ref_index: int,
         circuit_num: Optional[int],
     ) -> List[Dict[str, Any]]:
-        return [self._build_row(rel_dist_m, row, ref_index, circuit_num) for rel_dist_m, row in window]
+        locations = resolve_locations(self.tracks_db, circuit_num, [row for _, row in window])
+        return [
+            self._build_row(rel_dist_m, row, ref_index, location)
+            for (rel_dist_m, row), location in zip(window, locations)
+        ]
 
     def _build_row(
         self,
         rel_dist_m: float,
         row: Dict[str, Any],
         ref_index: int,
-        circuit_num: Optional[int],
+        location: str,
     ) -> Dict[str, Any]:
         driver_info: Dict[str, Any] = row.get("driver-info", {})
         ers_info: Dict[str, Any] = row.get("ers-info", {})
-        lap_info: Dict[str, Any] = row.get("lap-info", {})
-        curr_lap_info: Dict[str, Any] = lap_info.get("curr-lap", {})
 
         is_ref = (driver_info.get("index", -1) == ref_index)
         ers_mode: str = ers_info.get("ers-mode") or "None"
@@ -147,9 +151,5 @@ class TrafficMonitorPage(MfdPageBase):
             "relDist":      f"+{rel_dist_m:.0f}m",
             "relDistColor": "#44FF44",
             "isRef":        is_ref,
-            "location":     resolve_location(
-                                self.tracks_db, circuit_num,
-                                lap_info.get("lap-distance"),
-                                curr_lap_info.get("sector"),
-                            ),
+            "location":     location,
         }
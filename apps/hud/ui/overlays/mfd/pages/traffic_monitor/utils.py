@@ -25,6 +25,7 @@
 from typing import Any, Dict, List, Optional, Tuple
 
 from lib.track_segment_info import TrackSegmentsDatabase
+from lib.track_segment_info.types import BaseSegmentInfo
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
 
@@ -61,20 +62,34 @@ def get_traffic_window(
     return sorted_entries[start : start + num_behind]
 
 
-def resolve_location(
+def resolve_locations(
     tracks_db: TrackSegmentsDatabase,
     circuit_num: Optional[int],
-    lap_dist: Optional[float],
-    sector: Optional[Any] = None,
-) -> str:
-    """Resolve a lap distance to a human-readable track location label (e.g. 'T3', 'T8-10').
+    rows: List[Dict[str, Any]],
+) -> List[str]:
+    """Resolve the lap distance of each row to a human-readable track location label (e.g. 'T3', 'T8-10').
 
-    Falls back to sector if no segment is found.
+    All rows are looked up in one vectorised call. Falls back to the row's sector if no segment is found.
     """
-    fallback = str(sector) if sector is not None else "---"
-    if circuit_num is None or lap_dist is None:
-        return fallback
-    segment = tracks_db.get_segment_info(circuit_num, lap_dist)
+    fallbacks = []
+    lap_dists = []
+    for row in rows:
+        lap_info: Dict[str, Any] = row.get("lap-info", {})
+        sector = lap_info.get("curr-lap", {}).get("sector")
+        fallbacks.append(str(sector) if sector is not None else "---")
+        lap_dist = lap_info.get("lap-distance")
+        lap_dists.append(float("nan") if lap_dist is None else lap_dist) # NaN never matches a segment
+
+    if circuit_num is None:
+        return fallbacks
+    return [
+        _segment_label(segment, fallback)
+        for segment, fallback in zip(tracks_db.get_segments_info(circuit_num, lap_dists), fallbacks)
+    ]
+
+
+def _segment_label(segment: Optional[BaseSegmentInfo], fallback: str) -> str:
+    """Return the location label for segment, or fallback if it is not a corner."""
     if segment is None:
         return fallback
     match segment.TYPE:
@@ -85,4 +100,3 @@ def resolve_location(
             return f"T{first}-{last}"
         case _:
             return fallback
-
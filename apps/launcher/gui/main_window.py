@@ -41,7 +41,8 @@ from PySide6.QtWidgets import (QApplication, QDialog, QFileDialog, QGridLayout,
 from apps.launcher.logger import get_rotating_logger
 from apps.launcher.subsystems import (BackendAppMgr, BrokerAppMgr, HudAppMgr,
                                       McpAppMgr, PngAppMgrBase,
-                                      PngAppMgrConfig, SaveViewerAppMgr)
+                                      PngAppMgrConfig, SaveViewerAppMgr,
+                                      WebFanoutAppMgr)
 from lib.assets_loader import load_fonts, load_icon
 from lib.config import (PngSettings, load_config_migrated,
                         maybe_migrate_legacy_hud_layout, save_config_to_json)
@@ -233,7 +234,8 @@ class PngLauncherWindow(QMainWindow):
             SaveViewerAppMgr(common_cfg),
             HudAppMgr(common_cfg),
             BrokerAppMgr(common_cfg),
-            McpAppMgr(common_cfg)
+            McpAppMgr(common_cfg),
+            WebFanoutAppMgr(common_cfg)
         ]
         for subsystem in self.subsystems:
             assert subsystem.SHORT_NAME
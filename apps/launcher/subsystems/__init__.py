@@ -28,6 +28,7 @@ from .broker_mgr import BrokerAppMgr
 from .hud_mgr import HudAppMgr
 from .mcp_mgr import McpAppMgr
 from .save_viewer_mgr import SaveViewerAppMgr
+from .web_fanout_mgr import WebFanoutAppMgr
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
 
@@ -39,4 +40,5 @@ __all__ = [
     "PngAppMgrConfig",
     "McpAppMgr",
     "SaveViewerAppMgr",
+    "WebFanoutAppMgr",
 ]
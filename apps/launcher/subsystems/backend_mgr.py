@@ -174,6 +174,7 @@ class BackendAppMgr(PngAppMgrBase):
                 "broker_xsub_port",
                 "broker_router_port",
                 "enable_pkt_ordering",
+                "web_fanout_processes",
             ],
             "Capture" : [],
             "Display" : [
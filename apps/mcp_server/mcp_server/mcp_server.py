@@ -28,7 +28,7 @@ import inspect
 import logging
 import socket
 import time
-from typing import Annotated, Any, Callable, Dict, Literal
+from typing import Annotated, Any, Callable, Dict, Literal, Optional
 
 import uvicorn
 from fastmcp import FastMCP
@@ -60,6 +60,8 @@ from .tools.get_session_events_for_driver import (
     DRIVER_SESSION_EVENTS_OUTPUT_SCHEMA, get_session_events_for_driver)
 from .tools.get_session_info import (SESSION_INFO_OUTPUT_SCHEMA,
                                      get_session_info)
+from .tools.get_strategy_options import (STRATEGY_OPTIONS_OUTPUT_SCHEMA,
+                                         get_strategy_options)
 from .tools.get_tyre_wear import TYRE_WEAR_OUTPUT_SCHEMA, get_tyre_wear
 
 TransportType = Literal["http", "stdio"]
@@ -281,6 +283,36 @@ TYRE WEAR THRESHOLDS:
                 driver_index=driver_index,
             )
 
+        @self._tool(
+            name="get_strategy_options",
+            description=(
+                "Get the fastest pit strategies for the rest of the race for a driver identified by index. "
+                "Every zero, one and two stop plan using the driver's available tyre sets is simulated "
+                "from their observed pace and tyre wear, and the best ones are returned fastest first. "
+                "Each strategy lists the pit laps and compounds, predicted remaining race time, "
+                "time lost relative to the fastest strategy, the first stop pit window and the predicted "
+                "tyre wear at the flag. data_sufficient is false until enough clean laps are complete. "
+                "Use get_drivers_list to look up a driver's index."
+            ),
+            title="Driver Pit Strategy Options",
+            tags={"driver", "strategy", "pit", "tyre", "prediction"},
+            output_schema=STRATEGY_OPTIONS_OUTPUT_SCHEMA,
+            annotations=ToolAnnotations(
+                title="Driver Pit Strategy Options",
+                readOnlyHint=True,
+                openWorldHint=False,
+            ),
+        )
+        async def handle_get_strategy_options(
+            driver_index: Annotated[int, Field(ge=0, le=21, description="Driver index. Use get_drivers_list to resolve a name to an index.")],
+        ) -> Dict[str, Any]:
+            self.logger.debug("get_strategy_options called: driver_index=%s", driver_index)
+            return await get_strategy_options(
+                dealer=self.dealer,
+                logger=self.logger,
+                driver_index=driver_index,
+            )
+
         @self._tool(
             name="get_session_events_for_driver",
             description=(
@@ -289,6 +321,7 @@ TYRE WEAR THRESHOLDS:
                 "pit stops, tyre changes, wing changes, car damage events, retirements, safety car, "
                 "DRS enable/disable, red flags, and more. "
                 "Each message includes lap number, timestamp, and a plain-English description. "
+                "Pass the returned last_id as since_id to only get messages logged after a previous call. "
                 "Use get_drivers_list to look up a driver's index."
             ),
             title="Driver Race Control Messages (History)",
@@ -309,12 +342,14 @@ TYRE WEAR THRESHOLDS:
         )
         async def handle_get_session_events_for_driver(
             driver_index: Annotated[int, Field(ge=0, le=21, description="Driver index. Use get_drivers_list to resolve a name to an index.")],
+            since_id: Annotated[Optional[int], Field(ge=0, description="Only return messages newer than this ID (last_id from a previous call). Omit for all messages.")] = None,
         ) -> Dict[str, Any]:
-            self.logger.debug("get_session_events_for_driver called: driver_index=%s", driver_index)
+            self.logger.debug("get_session_events_for_driver called: driver_index=%s since_id=%s", driver_index, since_id)
             return await get_session_events_for_driver(
                 dealer=self.dealer,
                 logger=self.logger,
                 driver_index=driver_index,
+                since_id=since_id,
             )
 
         @self._tool(
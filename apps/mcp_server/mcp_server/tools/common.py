@@ -96,23 +96,66 @@ async def fetch_driver_info(
     Centralizes all transport and backend errors.
     """
 
+    return await _fetch_per_driver(dealer, logger, "driver-info-request", driver_index)
+
+async def fetch_strategy(
+        dealer: IpcDealerAsync,
+        logger: logging.Logger,
+        driver_index: int,
+) -> Dict[str, Any]:
+    """
+    Fetch the ranked pit strategies of a driver from the backend via ZMQ DEALER request-response.
+
+    Never raises.
+    Centralizes all transport and backend errors.
+    """
+
+    return await _fetch_per_driver(dealer, logger, "strategy-request", driver_index)
+
+async def fetch_race_control(
+        dealer: IpcDealerAsync,
+        logger: logging.Logger,
+        driver_index: int,
+        since_id: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch the race control messages of a driver newer than since_id from the backend via ZMQ DEALER
+    request-response. The reply data contains "messages" and the "last-id" cursor.
+
+    Never raises.
+    Centralizes all transport and backend errors.
+    """
+
+    return await _fetch_per_driver(dealer, logger, "race-control-request", driver_index, {"since-id": since_id})
+
+async def _fetch_per_driver(
+        dealer: IpcDealerAsync,
+        logger: logging.Logger,
+        request_type: str,
+        driver_index: int,
+        extra_args: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Send a per driver request to the backend and normalise the reply into the status/data format.
+    """
+
     reply = await dealer.request(
         str(PngAppId.BACKEND),
-        "driver-info-request",
-        {"index": driver_index},
+        request_type,
+        {"index": driver_index, **(extra_args or {})},
     )
 
     if reply.get("status") == "error":
         reason = reply.get("reason", "unknown")
         error_key = "core_server_timeout" if "timeout" in reason else "core_server_unreachable"
-        logger.error("[fetch_driver_info] dealer error: %s", reason)
+        logger.error("[%s] dealer error: %s", request_type, reason)
         return {
             "status": {"ok": False, "error": error_key, "status": None, "details": reason},
             "data": None,
         }
 
     if not reply.get("ok"):
-        logger.error("[fetch_driver_info] backend returned not-ok: %s", reply)
+        logger.error("[%s] backend returned not-ok: %s", request_type, reply)
         return {
             "status": {"ok": False, "error": "backend_error", "status": None, "details": str(reply)},
             "data": None,
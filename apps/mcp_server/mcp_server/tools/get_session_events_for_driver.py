@@ -23,13 +23,13 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from lib.f1_types import F1Utils
 
 from lib.ipc import IpcDealerAsync
 
-from .common import _DRIVER_INFO_REQ_STATUS_SCHEMA, fetch_driver_info
+from .common import _DRIVER_INFO_REQ_STATUS_SCHEMA, fetch_race_control
 
 # -------------------------------------- CONSTANTS ---------------------------------------------------------------------
 
@@ -71,6 +71,10 @@ DRIVER_SESSION_EVENTS_OUTPUT_SCHEMA = {
             "description": "List of race control messages relevant to the driver",
             "items": _RACE_CONTROL_MESSAGE_SCHEMA,
         },
+        "last_id": {
+            "type": ["integer", "null"],
+            "description": "ID of the latest message. Pass it as since_id to only get newer messages next time",
+        },
     },
 
     # status must always exist (even on error)
@@ -85,35 +89,38 @@ DRIVER_SESSION_EVENTS_OUTPUT_SCHEMA = {
 async def get_session_events_for_driver(
         dealer: IpcDealerAsync,
         logger: logging.Logger,
-        driver_index: int) -> Dict[str, Any]:
-    """Get race table from state data.
+        driver_index: int,
+        since_id: Optional[int] = None) -> Dict[str, Any]:
+    """Get the race control messages of a driver from the backend.
 
     Arguments:
         dealer (IpcDealerAsync): ZMQ DEALER client for backend requests.
         logger (logging.Logger): Logger instance.
         driver_index (int): Driver index.
+        since_id (Optional[int]): Only get the messages newer than this ID (last_id of a previous call).
 
     Returns:
         Dict[str, Any]: Session info dictionary.
     """
 
-    rsp = await fetch_driver_info(
+    rsp = await fetch_race_control(
         dealer=dealer,
         logger=logger,
         driver_index=driver_index,
+        since_id=since_id,
     )
 
     status = rsp["status"]
     if not status["ok"]:
         return rsp  # pass-through error
 
-
-
+    data = rsp.get("data") or {}
     return {
         "race_ctrl_msgs" : [
             _get_race_ctrl_msg(msg)
-            for msg in rsp.get("data", {}).get("race-control", [])
+            for msg in data.get("messages", [])
         ],
+        "last_id": data.get("last-id"),
         "status": status,
     }
 
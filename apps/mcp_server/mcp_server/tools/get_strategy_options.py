@@ -0,0 +1,161 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import logging
+from typing import Any, Dict
+
+from lib.ipc import IpcDealerAsync
+
+from .common import _DRIVER_INFO_REQ_STATUS_SCHEMA, fetch_strategy
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+STRATEGY_OPTIONS_OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+
+        # ---- status (always present) ----
+        **_DRIVER_INFO_REQ_STATUS_SCHEMA,
+
+        # ---- resolved driver ----
+        "driver_index": {"type": ["integer", "null"]},
+        "driver_name": {"type": ["string", "null"]},
+        "current_lap": {"type": ["integer", "null"]},
+        "total_laps": {"type": ["integer", "null"]},
+        "pit_time_loss_s": {
+            "type": ["number", "null"],
+            "description": "Time lost by a pit stop at this track (seconds)",
+        },
+
+        # ---- strategies ----
+        "data_sufficient": {
+            "type": "boolean",
+            "description": (
+                "False until enough clean laps and tyre data exist to model the driver's pace and wear. "
+                "strategies is empty until then."
+            ),
+        },
+        "strategies": {
+            "type": "array",
+            "description": "Strategies sorted from fastest to slowest",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "start_compound": {"type": "string"},
+                    "num_stops": {"type": "integer"},
+                    "stops": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "lap": {
+                                    "type": "integer",
+                                    "description": "The driver pits at the end of this lap",
+                                },
+                                "compound": {"type": "string"},
+                            },
+                            "required": ["lap", "compound"],
+                            "additionalProperties": False,
+                        },
+                    },
+                    "race_time_ms": {
+                        "type": "integer",
+                        "description": "Predicted time to complete the remaining laps (ms)",
+                    },
+                    "delta_ms": {
+                        "type": "integer",
+                        "description": "Time lost relative to the fastest strategy (ms)",
+                    },
+                    "pit_window": {
+                        "type": ["array", "null"],
+                        "items": {"type": "integer"},
+                        "description": "First and last lap of the first stop window",
+                    },
+                    "final_wear_pct": {
+                        "type": "number",
+                        "description": "Predicted wear of the most worn tyre at the flag (%)",
+                    },
+                },
+                "required": ["start_compound", "num_stops", "stops", "race_time_ms", "delta_ms"],
+                "additionalProperties": False,
+            },
+        },
+    },
+
+    # status must always exist
+    "required": ["status"],
+
+    # allow future additions
+    "additionalProperties": True,
+}
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+async def get_strategy_options(
+        dealer: IpcDealerAsync,
+        logger: logging.Logger,
+        driver_index: int) -> Dict[str, Any]:
+    """Get the ranked pit strategies for a driver from the backend.
+
+    Arguments:
+        dealer (IpcDealerAsync): ZMQ DEALER client for backend requests.
+        logger (logging.Logger): Logger instance.
+        driver_index (int): Driver index.
+
+    Returns:
+        Dict[str, Any]: Strategy options dictionary.
+    """
+
+    rsp = await fetch_strategy(
+        dealer=dealer,
+        logger=logger,
+        driver_index=driver_index,
+    )
+
+    status = rsp["status"]
+    if not status["ok"]:
+        return rsp  # pass-through error
+
+    data: Dict[str, Any] = rsp.get("data") or {}
+    return {
+        "status": status,
+        "driver_index": data.get("index"),
+        "driver_name": data.get("driver-name"),
+        "current_lap": data.get("current-lap"),
+        "total_laps": data.get("total-laps"),
+        "pit_time_loss_s": data.get("pit-time-loss"),
+        "data_sufficient": bool(data.get("status")),
+        "strategies": [_strategy_entry(entry) for entry in data.get("strategies", [])],
+    }
+
+def _strategy_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "start_compound": entry.get("start-compound"),
+        "num_stops": entry.get("num-stops"),
+        "stops": entry.get("stops", []),
+        "race_time_ms": entry.get("race-time-ms"),
+        "delta_ms": entry.get("delta-ms"),
+        "pit_window": entry.get("pit-window"),
+        "final_wear_pct": entry.get("final-wear"),
+    }
@@ -28,20 +28,21 @@ from http import HTTPStatus
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import orjson
 from quart import send_file
 from watchfiles import awatch
 
-import apps.save_viewer.save_viewer_state as SaveViewerState
-from apps.save_viewer.session_discovery import CACHE_FILE, build_session_list, formula_group_key, load_session_json
+from apps.save_viewer.session_catalog import SessionCatalog, SessionFilter
+from apps.save_viewer.session_discovery import (load_session_json,
+                                                resolve_session_path)
+from apps.save_viewer.session_view_cache import (VIEW_DRIVER, VIEW_RACE,
+                                                 VIEW_TELEMETRY,
+                                                 SessionViewCache)
+from lib.sectioned_save import SECTIONED_SAVE_SUFFIX, SectionedSave
 from lib.child_proc_mgmt import notify_parent_init_complete
 from lib.logger import PngLogger
 from lib.web_server import BaseWebServer, ClientType
-
-# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
-
-def _best(sessions: List[Dict[str, Any]], key: str) -> float:
-    vals = [s[key] for s in sessions if s.get(key, 0) > 0]
-    return min(vals) if vals else 0
+from lib.web_server.http_cache import file_etag
 
 # -------------------------------------- CLASSES ----------------------------------------------------------------
 
@@ -79,8 +80,8 @@ class SaveViewerWebServer(BaseWebServer):
         """
         self.m_session_dir: Path = session_dir
         self.m_viewer_dir: Path = viewer_dir
-        self.m_sessions_cache: List[Dict[str, Any]] = []
-        self.m_slug_map: Dict[str, str] = {}
+        self.m_catalog: SessionCatalog = SessionCatalog(session_dir, logger)
+        self.m_view_cache: SessionViewCache = SessionViewCache(logger)
         self._m_cache_ready = asyncio.Event()
         self._m_watch_stop = asyncio.Event()
         super().__init__(port, ver_str, logger,
@@ -136,13 +137,10 @@ class SaveViewerWebServer(BaseWebServer):
 
         @self.http_route('/legacy/<slug>')
         async def legacyView(slug: str):
-            if not self.m_slug_map:
-                async for sessions, slug_map in build_session_list(self.m_session_dir, self.m_logger):
-                    self.m_sessions_cache = sessions
-                    self.m_slug_map = slug_map
-            if not self.m_slug_map.get(slug):
+            await self._m_cache_ready.wait()
+            if not self.m_catalog.m_slug_map.get(slug):
                 return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
-            return await self.render_template(
+            return await self.render_page(
                 'driver-view.html', live_data_mode=False, version=self.m_ver_str, session_slug=slug
             )
 
@@ -155,15 +153,24 @@ class SaveViewerWebServer(BaseWebServer):
         """
         @self.http_route('/api/sessions')
         async def apiSessions():
-            self.m_logger.debug("Received request for session list")
+            # Optional filters and pagination. The total number of matching sessions is in X-Total-Count
+            args = self.request.args
+            limit = args.get('limit', '')
+            offset = args.get('offset', '0')
+            if (limit and not limit.isdigit()) or not offset.isdigit():
+                return {'error': 'Invalid parameter value',
+                        'message': '"limit" and "offset" must be numeric'}, HTTPStatus.BAD_REQUEST
             await self._m_cache_ready.wait()
-            self.m_logger.debug("GET /api/sessions → %d sessions", len(self.m_sessions_cache))
-            return self.jsonify(self.m_sessions_cache), HTTPStatus.OK
+            body, total = self.m_catalog.list_sessions(self._session_filter(),
+                                                       limit=int(limit) if limit else None,
+                                                       offset=int(offset))
+            self.m_logger.debug("GET /api/sessions → %d sessions", total)
+            return body, HTTPStatus.OK, {'Content-Type': 'application/json', 'X-Total-Count': str(total)}
 
-        @self.http_route('/api/sessions/<slug>')
+        @self.http_route('/api/sessions/<slug>', conditional=True)
         async def apiSession(slug: str):
             await self._m_cache_ready.wait()
-            relative = self.m_slug_map.get(slug)
+            relative = self.m_catalog.m_slug_map.get(slug)
             if not relative:
                 return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
             root = self.m_session_dir.resolve()
@@ -173,6 +180,13 @@ class SaveViewerWebServer(BaseWebServer):
             if not full.exists():
                 return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
             self.m_logger.debug("GET /api/sessions/%s → %s", slug, full)
+            if full.suffix == SECTIONED_SAVE_SUFFIX:
+                # Saves are immutable until rewritten, skip decoding if the client has this version or it's compressed
+                etag = file_etag(full.stat())
+                if cached := self.cached_response(etag, 'application/json'):
+                    return cached
+                body = await asyncio.to_thread(lambda: orjson.dumps(SectionedSave(str(full)).load()))
+                return body, HTTPStatus.OK, {'Content-Type': 'application/json', 'ETag': f'"{etag}"'}
             return await send_file(full, mimetype='application/json')
 
         @self.http_route('/api/track-pbs')
@@ -183,44 +197,59 @@ class SaveViewerWebServer(BaseWebServer):
             if not track:
                 return {'error': 'Missing "track" parameter'}, HTTPStatus.BAD_REQUEST
             await self._m_cache_ready.wait()
-            target_formula = formula_group_key(formula_param)
-            track_sessions = [
-                s for s in self.m_sessions_cache
-                if s.get('track') == track
-                and formula_group_key(s.get('formula', '')) == target_formula
-                and s.get('slug') != exclude_slug
-            ]
-            return self.jsonify({
-                'bestQualiLapMs': _best(track_sessions, 'bestLapTimeMs'),
-                'bestS1Ms': _best(track_sessions, 'bestS1Ms'),
-                'bestS2Ms': _best(track_sessions, 'bestS2Ms'),
-                'bestS3Ms': _best(track_sessions, 'bestS3Ms'),
-                'bestRaceLapMs': _best(track_sessions, 'bestRaceLapMs'),
-                'bestRacePaceMs': _best(track_sessions, 'bestRacePaceMs'),
-                'sessionCount': len(track_sessions),
-            }), HTTPStatus.OK
-
-        @self.http_route('/telemetry-info')
+            return self.jsonify(self.m_catalog.track_pbs(track, formula_param, exclude_slug)), HTTPStatus.OK
+
+        @self.http_route('/api/analytics/laps')
+        async def apiAnalyticsLaps():
+            # The reference driver's lap times per session/day/week/month, e.g. the progression at a track
+            await self._m_cache_ready.wait()
+            try:
+                return self.jsonify(self.m_catalog.lap_progression(
+                    self._session_filter(),
+                    bucket=self.request.args.get('bucket', 'session'),
+                    laps=self.request.args.get('laps', 'valid'),
+                    compound=self.request.args.get('compound'),
+                )), HTTPStatus.OK
+            except ValueError as e:
+                return {'error': 'Invalid parameter value', 'message': str(e)}, HTTPStatus.BAD_REQUEST
+
+        @self.http_route('/api/analytics/stints')
+        async def apiAnalyticsStints():
+            # Tyre stint stats per compound, e.g. the degradation across all races at a track
+            await self._m_cache_ready.wait()
+            try:
+                return self.jsonify(self.m_catalog.stint_summary(
+                    self._session_filter(),
+                    group_by=self.request.args.get('groupBy', 'compound'),
+                    player_only=self.request.args.get('playerOnly', '').lower() in ('1', 'true'),
+                )), HTTPStatus.OK
+            except ValueError as e:
+                return {'error': 'Invalid parameter value', 'message': str(e)}, HTTPStatus.BAD_REQUEST
+
+        @self.http_route('/api/analytics/tyre-age')
+        async def apiAnalyticsTyreAge():
+            # The reference driver's clean lap time by tyre age, per compound
+            await self._m_cache_ready.wait()
+            return self.jsonify(self.m_catalog.tyre_age_curve(
+                self._session_filter(),
+                compound=self.request.args.get('compound'),
+            )), HTTPStatus.OK
+
+        @self.http_route('/telemetry-info', conditional=True)
         async def telemetryInfoHTTP():
             slug = self.request.args.get('slug')
             if not slug:
                 return {'error': 'Missing "slug" parameter'}, HTTPStatus.BAD_REQUEST
-            data = await load_session_json(self.m_session_dir, self.m_slug_map, slug)
-            if data is None:
-                return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
-            return SaveViewerState.getTelemetryInfoFrom(data), HTTPStatus.OK
+            return await self._sessionViewResponse(slug, VIEW_TELEMETRY)
 
-        @self.http_route('/race-info')
+        @self.http_route('/race-info', conditional=True)
         async def raceInfoHTTP():
             slug = self.request.args.get('slug')
             if not slug:
                 return {'error': 'Missing "slug" parameter'}, HTTPStatus.BAD_REQUEST
-            data = await load_session_json(self.m_session_dir, self.m_slug_map, slug)
-            if data is None:
-                return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
-            return SaveViewerState.getRaceInfoFrom(data), HTTPStatus.OK
+            return await self._sessionViewResponse(slug, VIEW_RACE)
 
-        @self.http_route('/driver-info')
+        @self.http_route('/driver-info', conditional=True)
         async def driverInfoHTTP():
             index: str = self.request.args.get('index')
             slug: str = self.request.args.get('slug')
@@ -232,46 +261,74 @@ class SaveViewerWebServer(BaseWebServer):
             if not index.isdigit():
                 return {'error': 'Invalid parameter value', 'message': '"index" parameter must be numeric'}, HTTPStatus.BAD_REQUEST
 
-            index_int = int(index)
-            data = await load_session_json(self.m_session_dir, self.m_slug_map, slug)
-            if data is None:
-                return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
-            if driver_info := SaveViewerState.getDriverInfoFrom(data, index_int):
-                return driver_info, HTTPStatus.OK
-            return {'error': 'Invalid parameter value', 'message': 'Invalid index'}, HTTPStatus.NOT_FOUND
+            return await self._sessionViewResponse(slug, VIEW_DRIVER, int(index))
+
+    async def _sessionViewResponse(self, slug: str, view: str, index: Optional[int] = None) -> Any:
+        """Serve a telemetry/race/driver view of a saved session from the view cache.
+
+        Args:
+            slug (str): Session slug
+            view (str): One of the session view cache's VIEW_* names
+            index (Optional[int]): Driver index for the driver view
 
-    async def _rebuild_cache(self) -> None:
-        """Rebuild session cache from disk, publishing partial results after each batch."""
+        Returns:
+            A Quart-compatible (body, status[, headers]) tuple.
+        """
+        full = resolve_session_path(self.m_session_dir, self.m_catalog.m_slug_map, slug)
+        try:
+            mtime_ns = full.stat().st_mtime_ns if full else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
+            return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
+
+        body = await self.m_view_cache.get(
+            slug, mtime_ns, view, index,
+            lambda: load_session_json(self.m_session_dir, self.m_catalog.m_slug_map, slug, mtime_ns))
+        if body is not None:
+            return body, HTTPStatus.OK, {'Content-Type': 'application/json'}
+        if view == VIEW_DRIVER and self.m_view_cache.has_session(slug, mtime_ns):
+            return {'error': 'Invalid parameter value', 'message': 'Invalid index'}, HTTPStatus.NOT_FOUND
+        return {'error': 'Session not found'}, HTTPStatus.NOT_FOUND
+
+    def _session_filter(self) -> SessionFilter:
+        """Build the session filter from the current request's query parameters."""
+        args = self.request.args
+        return SessionFilter(
+            track=args.get('track'),
+            formula=args.get('formula'),
+            session_type=args.get('sessionType'),
+            driver=args.get('driver'),
+            since=args.get('since'),
+            until=args.get('until'),
+        )
+
+    async def _sync_catalog(self) -> None:
+        """Bring the session catalog in line with the save directory, unblocking requests once the first batch is catalogued."""
         try:
-            self.m_logger.debug("Session cache: scanning %s", self.m_session_dir)
             if not self.m_session_dir.exists():
                 self.m_logger.warning("Session directory does not exist: %s", self.m_session_dir)
-                return
-            t0 = time.perf_counter()
-            async for sessions, slug_map in build_session_list(self.m_session_dir, self.m_logger):
-                self.m_sessions_cache = sessions
-                self.m_slug_map = slug_map
+            async for _ in self.m_catalog.sync():
                 self._m_cache_ready.set()  # unblocks waiting requests after the first batch
-            self.m_logger.info(
-                "Session cache: loaded %d sessions in %.2fs",
-                len(self.m_sessions_cache), time.perf_counter() - t0,
-            )
         except Exception:  # pylint: disable=broad-exception-caught
-            self.m_logger.exception("Session cache: error building cache")
+            self.m_logger.exception("Session catalog: error syncing")
         finally:
             self._m_cache_ready.set()  # always unblock even if the directory was empty
 
     async def _sessions_watch_loop(self) -> None:
-        """Background task: rebuild session cache whenever watchfiles detects a change."""
+        """Background task: update the session catalog for the files that watchfiles reports as changed."""
         if not self.m_session_dir.exists():
             self.m_logger.warning("Session directory %s does not exist — file watcher not started", self.m_session_dir)
             return
-        async for _ in awatch(self.m_session_dir, stop_event=self._m_watch_stop,
-                              watch_filter=lambda _, p: not p.endswith(CACHE_FILE)):
+        async for changes in awatch(self.m_session_dir, stop_event=self._m_watch_stop,
+                                    watch_filter=lambda _, p: not Path(p).name.startswith('.')):
             try:
-                await self._rebuild_cache()
+                start = time.perf_counter()
+                if await self.m_catalog.apply_changes(Path(path) for _, path in changes):
+                    self.m_logger.debug("Session catalog: applied %d file changes in %.1f ms",
+                                        len(changes), (time.perf_counter() - start) * 1000)
             except Exception:  # pylint: disable=broad-exception-caught
-                self.m_logger.exception("Error refreshing session cache")
+                self.m_logger.exception("Error refreshing session catalog")
 
     async def _post_start(self) -> None:
         """Notify the parent process that the web server is initialized and start session watcher."""
@@ -281,8 +338,9 @@ class SaveViewerWebServer(BaseWebServer):
         async def _stop_watch_loop() -> None:
             self._m_watch_stop.set()
             self.m_logger.info("Session watch loop stop signal sent")
+            self.m_catalog.close()
 
-        asyncio.create_task(self._rebuild_cache(), name="Session Initial Scan")
+        asyncio.create_task(self._sync_catalog(), name="Session Initial Scan")
         asyncio.create_task(self._sessions_watch_loop(), name="Session Watch Loop")
 
     async def send_to_clients_of_type(self, event: str, data: Dict[str, Any], client_type: ClientType) -> None:
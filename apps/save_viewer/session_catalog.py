@@ -0,0 +1,652 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from apps.save_viewer.session_discovery import (_SESSION_FILE_SUFFIXES,
+                                                CACHE_FILE,
+                                                _make_session_entry,
+                                                _parse_session_metadata,
+                                                find_json_files,
+                                                formula_group_key,
+                                                parse_filename)
+from lib.logger import PngLogger
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+CATALOG_FILE = '.png_session_catalog.sqlite3'
+
+# Bump when the schema or the stored entry format changes. The catalog is rebuilt from the save files
+_SCHEMA_VERSION = 2
+_PARSE_CONCURRENCY = 50
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id                INTEGER PRIMARY KEY,
+        rel_path          TEXT    NOT NULL UNIQUE,
+        stem              TEXT    NOT NULL,
+        slug              TEXT    NOT NULL,
+        mtime             REAL    NOT NULL,
+        size              INTEGER NOT NULL,
+        date              TEXT    NOT NULL,
+        session_type      TEXT    NOT NULL,
+        track             TEXT    NOT NULL,
+        formula_group     TEXT    NOT NULL,
+        best_lap_ms       REAL,
+        best_s1_ms        REAL,
+        best_s2_ms        REAL,
+        best_s3_ms        REAL,
+        best_race_lap_ms  REAL,
+        best_race_pace_ms REAL,
+        entry             BLOB    NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS sessions_by_date  ON sessions (date DESC, rel_path);
+    CREATE INDEX IF NOT EXISTS sessions_by_track ON sessions (track, formula_group);
+    CREATE INDEX IF NOT EXISTS sessions_by_stem  ON sessions (stem);
+    CREATE TABLE IF NOT EXISTS session_drivers (
+        session_id INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+        name       TEXT    NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS session_drivers_by_name    ON session_drivers (name);
+    CREATE INDEX IF NOT EXISTS session_drivers_by_session ON session_drivers (session_id);
+
+    -- Laps of the reference driver (the player, or the driver with the most laps when spectating). The per-lap and
+    -- per-stint tables are clustered by session, so the aggregates read them sequentially
+    CREATE TABLE IF NOT EXISTS laps (
+        session_id  INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+        lap_number  INTEGER NOT NULL,
+        lap_time_ms INTEGER NOT NULL,
+        s1_ms       INTEGER,
+        s2_ms       INTEGER,
+        s3_ms       INTEGER,
+        valid       INTEGER NOT NULL,
+        clean       INTEGER NOT NULL,
+        safety_car  TEXT,
+        compound    TEXT,
+        tyre_age    INTEGER,
+        PRIMARY KEY (session_id, lap_number)
+    ) WITHOUT ROWID;
+
+    -- Tyre stints of every driver
+    CREATE TABLE IF NOT EXISTS stints (
+        session_id      INTEGER NOT NULL REFERENCES sessions (id) ON DELETE CASCADE,
+        driver_index    INTEGER NOT NULL,
+        driver_name     TEXT,
+        is_player       INTEGER NOT NULL,
+        stint_number    INTEGER NOT NULL,
+        start_lap       INTEGER NOT NULL,
+        end_lap         INTEGER NOT NULL,
+        length          INTEGER NOT NULL,
+        compound        TEXT,
+        actual_compound TEXT,
+        start_wear      REAL,
+        end_wear        REAL,
+        wear_per_lap    REAL,
+        pace_laps       INTEGER NOT NULL,
+        avg_lap_ms      REAL,
+        PRIMARY KEY (session_id, driver_index, stint_number)
+    ) WITHOUT ROWID;
+"""
+
+# Session list entry key -> catalog column, for the personal best queries
+_PB_COLUMNS = {
+    'bestQualiLapMs': 'best_lap_ms',
+    'bestS1Ms': 'best_s1_ms',
+    'bestS2Ms': 'best_s2_ms',
+    'bestS3Ms': 'best_s3_ms',
+    'bestRaceLapMs': 'best_race_lap_ms',
+    'bestRacePaceMs': 'best_race_pace_ms',
+}
+_ENTRY_PB_KEYS = {
+    'best_lap_ms': 'bestLapTimeMs',
+    'best_s1_ms': 'bestS1Ms',
+    'best_s2_ms': 'bestS2Ms',
+    'best_s3_ms': 'bestS3Ms',
+    'best_race_lap_ms': 'bestRaceLapMs',
+    'best_race_pace_ms': 'bestRacePaceMs',
+}
+
+_PROGRESSION_BUCKETS = {
+    'session': "s.slug",
+    'day': "substr(s.date, 1, 10)",
+    'week': "strftime('%Y-W%W', s.date)",
+    'month': "substr(s.date, 1, 7)",
+}
+_LAP_SELECTIONS = {
+    'all': "1",
+    'valid': "l.valid",
+    'clean': "l.clean",
+}
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SessionFilter:
+    """
+    Which sessions a catalog query covers. Unset fields don't filter.
+
+    Attributes:
+        track (Optional[str]): Only sessions at this track
+        formula (Optional[str]): Only sessions of this formula group (all F1 variants are one group)
+        session_type (Optional[str]): Only sessions of this type
+        driver (Optional[str]): Only sessions with a driver of this name
+        since (Optional[str]): Only sessions on or after this date (ISO 8601, e.g. 2026-01-31)
+        until (Optional[str]): Only sessions on or before this date (ISO 8601, inclusive)
+    """
+    track: Optional[str] = None
+    formula: Optional[str] = None
+    session_type: Optional[str] = None
+    driver: Optional[str] = None
+    since: Optional[str] = None
+    until: Optional[str] = None
+
+    def where(self) -> Tuple[str, Dict[str, Any]]:
+        """Build the WHERE clause, for a query over the sessions table aliased as s
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The clause (empty if nothing is filtered) and its named parameters
+        """
+        clauses = []
+        params: Dict[str, Any] = {}
+        if self.track:
+            clauses.append("s.track = :track")
+            params['track'] = self.track
+        if self.formula:
+            clauses.append("s.formula_group = :formula_group")
+            params['formula_group'] = formula_group_key(self.formula)
+        if self.session_type:
+            clauses.append("s.session_type = :session_type")
+            params['session_type'] = self.session_type
+        if self.driver:
+            clauses.append("s.id IN (SELECT session_id FROM session_drivers WHERE name = :driver)")
+            params['driver'] = self.driver
+        if self.since:
+            clauses.append("s.date >= :since")
+            params['since'] = self.since
+        if self.until:
+            # Dates are stored as YYYY-MM-DDTHH:MM:SS, so this also takes in the whole of a date-only bound
+            clauses.append("s.date <= :until")
+            params['until'] = self.until + '~'
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def session_ids_in(self, column: str) -> Tuple[str, Dict[str, Any]]:
+        """Build a condition that restricts a session id column of another table to the filtered sessions
+
+        Args:
+            column (str): The session id column, e.g. l.session_id
+
+        Returns:
+            Tuple[str, Dict[str, Any]]: The condition (always true if nothing is filtered) and its named parameters
+        """
+        where, params = self.where()
+        if not where:
+            return "1", params
+        return f"{column} IN (SELECT s.id FROM sessions s {where})", params
+
+class SessionCatalog:
+    """
+    Persistent SQLite catalog of the session metadata in a save directory, backing the session list and the
+    track personal best queries.
+
+    Each row is keyed by the file's path (relative to the save directory) and remembers the file's mtime and size,
+    so a full sync only parses new or modified files, and a file change event only touches that file's row. The
+    session list entry is stored pre-serialised, so listing sessions is a single indexed query.
+
+    Per-lap (reference driver) and per-stint (every driver) tables are filled in at the same time, so the cross
+    session analytics are aggregate queries over the catalog instead of loading the saves.
+
+    Database calls are made on the event loop (they take well under a millisecond with the indexes); parsing the
+    save files happens in worker threads.
+    """
+
+    def __init__(self, session_dir: Path, logger: PngLogger, db_path: Optional[Path] = None):
+        """
+        Open (or create) the catalog.
+
+        Args:
+            session_dir (Path): Directory holding the save files
+            logger (PngLogger): Logger
+            db_path (Optional[Path]): Database file. Defaults to CATALOG_FILE in the session directory, or an in-memory
+                database if that can't be created.
+        """
+        self.m_session_dir: Path = session_dir
+        self.m_logger: PngLogger = logger
+        self.m_slug_map: Dict[str, str] = {}
+        self.m_conn: sqlite3.Connection = self._connect(db_path or session_dir / CATALOG_FILE)
+        self._refresh_slug_map()
+
+    def close(self) -> None:
+        """Close the database"""
+        self.m_conn.close()
+
+    # ---------------------------------------------------------------------
+    # Updates
+    # ---------------------------------------------------------------------
+
+    async def sync(self) -> AsyncIterator[int]:
+        """Bring the catalog in line with the save directory. New or modified files are parsed newest-first, in
+        batches of _PARSE_CONCURRENCY, and rows of deleted files are dropped.
+
+        Yields:
+            int: Number of files still to be parsed after every batch, or 0 once if nothing needed parsing
+        """
+        start = time.perf_counter()
+        files = await asyncio.to_thread(self._scan) if self.m_session_dir.exists() else {}
+        known = {row[0]: (row[1], row[2]) for row in self.m_conn.execute("SELECT rel_path, mtime, size FROM sessions")}
+
+        removed = [rel for rel in known if rel not in files]
+        changed = [(rel, stat) for rel, stat in files.items() if known.get(rel) != stat]
+        changed.sort(key=lambda item: _date_key(item[0]), reverse=True)
+        with self.m_conn:
+            self.m_conn.executemany("DELETE FROM sessions WHERE rel_path = ?", [(rel,) for rel in removed])
+        if removed:
+            self._refresh_slug_map()
+        if changed:
+            self.m_logger.info("Session catalog: %d new/modified files to parse (%d already catalogued)",
+                               len(changed), len(files) - len(changed))
+        else:
+            yield 0
+
+        for batch_start in range(0, len(changed), _PARSE_CONCURRENCY):
+            await self._update(changed[batch_start:batch_start + _PARSE_CONCURRENCY])
+            yield max(len(changed) - batch_start - _PARSE_CONCURRENCY, 0)
+
+        self.m_logger.info("Session catalog: %d sessions in sync in %.2fs (%d parsed, %d removed)",
+                           len(files), time.perf_counter() - start, len(changed), len(removed))
+
+    async def apply_changes(self, paths: Iterable[Path]) -> bool:
+        """Update the catalog for a set of changed paths (as reported by the file watcher). Anything other than a
+        session file, e.g. a renamed directory, falls back to a full sync.
+
+        Args:
+            paths (Iterable[Path]): Absolute paths that were added, modified or deleted
+
+        Returns:
+            bool: True if the catalog changed
+        """
+        stems = set()
+        for path in paths:
+            if path.name.startswith('.'):
+                continue
+            if path.suffix not in _SESSION_FILE_SUFFIXES:
+                if path.is_dir() or (not path.suffix and not path.exists()):
+                    # Directory added/removed/renamed. Rare enough that a full (stat only) sync is fine
+                    async for _ in self.sync():
+                        pass
+                    return True
+                continue
+            try:
+                stems.add(path.relative_to(self.m_session_dir).with_suffix(''))
+            except ValueError:
+                continue
+
+        changed: List[Tuple[str, Tuple[float, int]]] = []
+        stale: List[str] = []
+        for stem in stems:
+            chosen, others = self._resolve_stem(stem)
+            stale.extend(others)
+            if chosen:
+                rel, stat = chosen
+                row = self.m_conn.execute("SELECT mtime, size FROM sessions WHERE rel_path = ?", (rel,)).fetchone()
+                if row is None or tuple(row) != stat:
+                    changed.append(chosen)
+
+        if stale:
+            with self.m_conn:
+                self.m_conn.executemany("DELETE FROM sessions WHERE rel_path = ?", [(rel,) for rel in stale])
+        if changed:
+            await self._update(changed)
+        elif stale:
+            self._refresh_slug_map()
+        return bool(changed or stale)
+
+    # ---------------------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------------------
+
+    def list_sessions(self,
+                      session_filter: Optional[SessionFilter] = None,
+                      limit: Optional[int] = None,
+                      offset: int = 0) -> Tuple[bytes, int]:
+        """Get the session list, newest first, optionally filtered and paginated.
+
+        Args:
+            session_filter (Optional[SessionFilter]): Which sessions. Defaults to all
+            limit (Optional[int]): Max number of sessions. Defaults to all
+            offset (int): Number of sessions to skip
+
+        Returns:
+            Tuple[bytes, int]: The JSON array of session list entries and the total number of matching sessions
+        """
+        where, params = (session_filter or SessionFilter()).where()
+        total = self.m_conn.execute(f"SELECT COUNT(*) FROM sessions s {where}", params).fetchone()[0]
+        params.update(limit=-1 if limit is None else limit, offset=offset)
+        rows = self.m_conn.execute(f"""
+            SELECT entry FROM sessions s {where}
+            ORDER BY date DESC, rel_path
+            LIMIT :limit OFFSET :offset
+        """, params)
+        return b'[' + b','.join(row[0] for row in rows) + b']', total
+
+    def track_pbs(self, track: str, formula: str, exclude_slug: str = '') -> Dict[str, Any]:
+        """Get the best times across all sessions at a track.
+
+        Args:
+            track (str): Track
+            formula (str): Formula. All F1 variants are compared with each other
+            exclude_slug (str): Session to leave out, typically the one being viewed
+
+        Returns:
+            Dict[str, Any]: The best times (0 if none) and the number of sessions considered
+        """
+        # MIN ignores NULLs, and NULLIF drops the 0s that mean "no time"
+        columns = ', '.join(f"MIN(NULLIF({column}, 0))" for column in _PB_COLUMNS.values())
+        row = self.m_conn.execute(f"""
+            SELECT {columns}, COUNT(*) FROM sessions
+            WHERE track = :track AND formula_group = :formula_group AND slug != :exclude
+        """, {'track': track, 'formula_group': formula_group_key(formula), 'exclude': exclude_slug}).fetchone()
+        result: Dict[str, Any] = {key: value or 0 for key, value in zip(_PB_COLUMNS, row)}
+        result['sessionCount'] = row[-1]
+        return result
+
+    def lap_progression(self,
+                        session_filter: Optional[SessionFilter] = None,
+                        bucket: str = 'session',
+                        laps: str = 'valid',
+                        compound: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the reference driver's lap times over time, e.g. the progression at a track over the last months.
+
+        Args:
+            session_filter (Optional[SessionFilter]): Which sessions. Defaults to all
+            bucket (str): Group the laps by 'session', 'day', 'week' or 'month'
+            laps (str): Which laps count: 'all', 'valid' or 'clean' (valid, and in races no lap 1, SC or pit laps)
+            compound (Optional[str]): Only laps on this (visual) compound
+
+        Raises:
+            ValueError: Unknown bucket or laps value
+
+        Returns:
+            List[Dict[str, Any]]: Per bucket, oldest first: lap count, best and average lap and best sectors
+        """
+        if bucket not in _PROGRESSION_BUCKETS:
+            raise ValueError(f'Unknown bucket "{bucket}". Expected one of {list(_PROGRESSION_BUCKETS)}')
+        if laps not in _LAP_SELECTIONS:
+            raise ValueError(f'Unknown laps "{laps}". Expected one of {list(_LAP_SELECTIONS)}')
+        condition, params = (session_filter or SessionFilter()).session_ids_in("l.session_id")
+        condition += f" AND {_LAP_SELECTIONS[laps]}"
+        if compound:
+            condition += " AND l.compound = :compound"
+            params['compound'] = compound
+        # Aggregated per session first, so that the bucket expression is evaluated per session rather than per lap
+        rows = self.m_conn.execute(f"""
+            SELECT {_PROGRESSION_BUCKETS[bucket]} AS bucket, MIN(s.date), COUNT(*), SUM(a.num_laps),
+                   MIN(a.best_ms), CAST(SUM(a.total_ms) AS REAL) / SUM(a.num_laps),
+                   MIN(a.s1_ms), MIN(a.s2_ms), MIN(a.s3_ms)
+            FROM (
+                SELECT l.session_id, COUNT(*) AS num_laps, MIN(l.lap_time_ms) AS best_ms, SUM(l.lap_time_ms) AS total_ms,
+                       MIN(l.s1_ms) AS s1_ms, MIN(l.s2_ms) AS s2_ms, MIN(l.s3_ms) AS s3_ms
+                FROM laps l
+                WHERE {condition}
+                GROUP BY l.session_id
+            ) a JOIN sessions s ON s.id = a.session_id
+            GROUP BY bucket
+            ORDER BY MIN(s.date)
+        """, params)
+        return [
+            {
+                'bucket': row[0],
+                'date': row[1],
+                'sessionCount': row[2],
+                'lapCount': row[3],
+                'bestLapMs': row[4],
+                'avgLapMs': row[5],
+                'bestS1Ms': row[6],
+                'bestS2Ms': row[7],
+                'bestS3Ms': row[8],
+            }
+            for row in rows
+        ]
+
+    def stint_summary(self,
+                      session_filter: Optional[SessionFilter] = None,
+                      group_by: str = 'compound',
+                      player_only: bool = False) -> List[Dict[str, Any]]:
+        """Get tyre stint stats per compound, e.g. the tyre degradation across all races at a track.
+
+        Args:
+            session_filter (Optional[SessionFilter]): Which sessions. Defaults to all
+            group_by (str): Group by the 'compound' (visual, e.g. Soft) or the 'actual_compound' (e.g. C3)
+            player_only (bool): Only the player's stints, else every driver's
+
+        Raises:
+            ValueError: Unknown group_by value
+
+        Returns:
+            List[Dict[str, Any]]: Per compound, most used first: stint count, stint lengths, average tyre wear per
+                lap and average lap time (lap 1 and in/out laps left out)
+        """
+        if group_by not in ('compound', 'actual_compound'):
+            raise ValueError(f'Unknown group_by "{group_by}". Expected compound or actual_compound')
+        condition, params = (session_filter or SessionFilter()).session_ids_in("st.session_id")
+        if player_only:
+            condition += " AND st.is_player"
+        rows = self.m_conn.execute(f"""
+            SELECT st.{group_by}, COUNT(*), COUNT(DISTINCT st.session_id), SUM(st.length), AVG(st.length),
+                   MAX(st.length), AVG(st.wear_per_lap), MAX(st.wear_per_lap),
+                   SUM(st.avg_lap_ms * st.pace_laps) / SUM(CASE WHEN st.avg_lap_ms IS NULL THEN 0 ELSE st.pace_laps END)
+            FROM stints st
+            WHERE {condition}
+            GROUP BY st.{group_by}
+            ORDER BY COUNT(*) DESC
+        """, params)
+        return [
+            {
+                'compound': row[0],
+                'stintCount': row[1],
+                'sessionCount': row[2],
+                'lapCount': row[3],
+                'avgStintLength': row[4],
+                'maxStintLength': row[5],
+                'avgWearPerLap': row[6],
+                'maxWearPerLap': row[7],
+                'avgLapMs': row[8],
+            }
+            for row in rows
+        ]
+
+    def tyre_age_curve(self,
+                       session_filter: Optional[SessionFilter] = None,
+                       compound: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """Get the reference driver's average clean lap time by tyre age, per compound (lap time degradation).
+
+        Args:
+            session_filter (Optional[SessionFilter]): Which sessions. Defaults to all
+            compound (Optional[str]): Only this (visual) compound
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: Compound -> points by increasing tyre age
+        """
+        condition, params = (session_filter or SessionFilter()).session_ids_in("l.session_id")
+        condition += " AND l.clean AND l.compound IS NOT NULL AND l.tyre_age IS NOT NULL"
+        if compound:
+            condition += " AND l.compound = :compound"
+            params['compound'] = compound
+        curves: Dict[str, List[Dict[str, Any]]] = {}
+        for row in self.m_conn.execute(f"""
+            SELECT l.compound, l.tyre_age, COUNT(*), AVG(l.lap_time_ms), MIN(l.lap_time_ms)
+            FROM laps l
+            WHERE {condition}
+            GROUP BY l.compound, l.tyre_age
+            ORDER BY l.compound, l.tyre_age
+        """, params):
+            curves.setdefault(row[0], []).append(
+                {'tyreAge': row[1], 'lapCount': row[2], 'avgLapMs': row[3], 'bestLapMs': row[4]})
+        return curves
+
+    def __len__(self) -> int:
+        return self.m_conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    # ---------------------------------------------------------------------
+    # Internals
+    # ---------------------------------------------------------------------
+
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """Open the database, (re)creating the schema if it is missing or out of date"""
+        try:
+            conn = sqlite3.connect(db_path)
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        except sqlite3.DatabaseError as exc:
+            self.m_logger.warning("Session catalog: unable to open %s (%s). Using an in-memory catalog", db_path, exc)
+            conn = sqlite3.connect(':memory:')
+            version = 0
+
+        if version != _SCHEMA_VERSION:
+            if version:
+                self.m_logger.info("Session catalog: schema v%d is out of date, rebuilding", version)
+            conn.executescript("""
+                DROP TABLE IF EXISTS stints;
+                DROP TABLE IF EXISTS laps;
+                DROP TABLE IF EXISTS session_drivers;
+                DROP TABLE IF EXISTS sessions;
+            """)
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            conn.commit()
+        conn.execute("PRAGMA foreign_keys = ON")
+        # The catalog can always be rebuilt from the save files, so durability is traded for cheaper commits
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    def _scan(self) -> Dict[str, Tuple[float, int]]:
+        """Stat every session file in the directory (runs in a thread)"""
+        # Superseded by the catalog
+        (self.m_session_dir / CACHE_FILE).unlink(missing_ok=True)
+        files: Dict[str, Tuple[float, int]] = {}
+        for rel in find_json_files(self.m_session_dir):
+            try:
+                stat = (self.m_session_dir / rel).stat()
+            except OSError:
+                continue
+            files[str(rel)] = (stat.st_mtime, stat.st_size)
+        return files
+
+    def _resolve_stem(self, stem: Path) -> Tuple[Optional[Tuple[str, Tuple[float, int]]], List[str]]:
+        """Find the file that represents a session (the .f1save if both it and the .json exist).
+
+        Returns:
+            Tuple: (relative path, (mtime, size)) of the file or None if neither exists, and the catalogued relative
+                paths of the session that are no longer the right ones
+        """
+        chosen = None
+        for suffix in reversed(_SESSION_FILE_SUFFIXES):
+            try:
+                stat = (self.m_session_dir / stem.with_suffix(suffix)).stat()
+            except OSError:
+                continue
+            chosen = (str(stem.with_suffix(suffix)), (stat.st_mtime, stat.st_size))
+            break
+        stale = [row[0] for row in self.m_conn.execute("SELECT rel_path FROM sessions WHERE stem = ?", (str(stem),))
+                 if not chosen or row[0] != chosen[0]]
+        return chosen, stale
+
+    async def _update(self, files: List[Tuple[str, Tuple[float, int]]]) -> None:
+        """Parse a batch of files in worker threads and upsert their rows"""
+        outcomes = await asyncio.gather(*[
+            asyncio.to_thread(self._parse, Path(rel)) for rel, _ in files
+        ])
+        with self.m_conn:
+            for (rel, (mtime, size)), outcome in zip(files, outcomes):
+                self._upsert(Path(rel), mtime, size, outcome)
+        self._refresh_slug_map()
+
+    def _parse(self, rel_path: Path) -> Any:
+        """Parse a file's metadata (runs in a thread). Returns the exception if the file can't be parsed"""
+        try:
+            return _parse_session_metadata(self.m_session_dir / rel_path, self.m_logger)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            self.m_logger.silent("Session catalog: failed to parse %s: %s", rel_path, exc)
+            return exc
+
+    def _upsert(self, rel_path: Path, mtime: float, size: int, outcome: Any) -> None:
+        """Insert or replace the row of a parsed file (within a transaction)"""
+        entry = _make_session_entry(rel_path, self.m_session_dir / rel_path, outcome)
+        del entry['_rel_path']
+        del entry['fileSize']
+        row = {
+            'rel_path': str(rel_path),
+            'stem': str(rel_path.with_suffix('')),
+            'slug': entry['slug'],
+            'mtime': mtime,
+            'size': size,
+            'date': entry['date'],
+            'session_type': entry['sessionType'],
+            'track': entry['track'],
+            'formula_group': formula_group_key(entry.get('formula', '')),
+            'entry': orjson.dumps(entry),
+        }
+        row.update({column: entry.get(key) for column, key in _ENTRY_PB_KEYS.items()})
+        self.m_conn.execute("DELETE FROM sessions WHERE rel_path = :rel_path", row)
+        session_id = _insert(self.m_conn, 'sessions', [row])
+        if isinstance(outcome, Exception):
+            return
+        _insert(self.m_conn, 'session_drivers',
+                [{'session_id': session_id, 'name': name} for name in set(outcome.get('drivers', []))])
+        _insert(self.m_conn, 'laps', [dict(lap, session_id=session_id) for lap in outcome.get('laps', [])])
+        _insert(self.m_conn, 'stints', [dict(stint, session_id=session_id) for stint in outcome.get('stints', [])])
+
+    def _refresh_slug_map(self) -> None:
+        """Rebuild the slug -> relative path map. Where two files share a slug, the older one wins (as it always has)"""
+        self.m_slug_map = dict(self.m_conn.execute("SELECT slug, rel_path FROM sessions ORDER BY date DESC, rel_path"))
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def _insert(conn: sqlite3.Connection, table: str, rows: List[Dict[str, Any]]) -> Optional[int]:
+    """Insert rows (all with the same keys) into a table, replacing duplicates of the primary key.
+
+    Returns:
+        Optional[int]: The rowid of a single inserted row, else None
+    """
+    if not rows:
+        return None
+    columns = list(rows[0])
+    sql = f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({', '.join(':' + column for column in columns)})"
+    if len(rows) == 1:
+        return conn.execute(sql, rows[0]).lastrowid
+    conn.executemany(sql, rows)
+    return None
+
+def _date_key(rel_path: str) -> str:
+    """Date embedded in a save file's name, for newest-first parsing (no disk I/O)"""
+    try:
+        return parse_filename(Path(rel_path))['date']
+    except Exception:  # pylint: disable=broad-exception-caught
+        return ''
@@ -22,10 +22,8 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-import asyncio
-import time
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiofiles
 import orjson
@@ -36,10 +34,11 @@ import lib.race_analyzer as RaceAnalyzer
 from lib.f1_types import (F1Utils, PacketSessionData, SessionType23,
                           SessionType24)
 from lib.logger import PngLogger
+from lib.sectioned_save import SECTIONED_SAVE_SUFFIX, SectionedSave
 
 # -------------------------------------- CONSTANTS ---------------------------------------------------------------------
 
-CACHE_FILE = '.png_session_cache.json'
+CACHE_FILE = '.png_session_cache.json' # Legacy mtime cache, superseded by the session catalog
 _JSON_CACHE_SIZE = 25
 
 # Known session type strings derived from the authoritative enums, sorted longest-first
@@ -59,30 +58,30 @@ _RACE_SESSION_TYPES: frozenset = frozenset(
 _F1_FORMULA_STRINGS: frozenset = frozenset(
     str(f) for f in PacketSessionData.FormulaType if f.is_f1()
 )
-_PARSE_CONCURRENCY = 50
+_SESSION_FILE_SUFFIXES = ('.json', SECTIONED_SAVE_SUFFIX)
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
 
 def find_json_files(session_dir: Path) -> List[Path]:
-    """Recursively find all .json files under session_dir; paths relative to session_dir."""
-    return [
-        p.relative_to(session_dir)
-        for p in session_dir.rglob('*.json')
-        if not p.name.startswith('.')
-    ]
-
-
-def _load_cache(cache_path: Path) -> Dict[str, Any]:
-    try:
-        with open(cache_path, 'rb') as f:
-            return orjson.loads(f.read())
-    except (FileNotFoundError, orjson.JSONDecodeError):
-        return {}
+    """Recursively find all session files (.json and .f1save) under session_dir; paths relative to session_dir.
+    If a session was converted and both files exist, only the .f1save is returned."""
+    files: Dict[Path, Path] = {}
+    for p in session_dir.rglob('*'):
+        if p.suffix not in _SESSION_FILE_SUFFIXES or p.name.startswith('.'):
+            continue
+        stem = p.with_suffix('')
+        if stem not in files or p.suffix == SECTIONED_SAVE_SUFFIX:
+            files[stem] = p
+    return [p.relative_to(session_dir) for p in files.values()]
 
 
-def _save_cache(cache_path: Path, cache: Dict[str, Any]) -> None:
-    with open(cache_path, 'wb') as f:
-        f.write(orjson.dumps(cache))
+def read_session_file(path: Path) -> Dict[str, Any]:
+    """Load a session save. Sectioned (.f1save) saves are opened lazily: only the index is read here and every
+    section is read the first time it is accessed."""
+    if path.suffix == SECTIONED_SAVE_SUFFIX:
+        return SectionedSave(str(path)).lazy()
+    with open(path, 'rb') as fh:
+        return orjson.loads(fh.read())
 
 
 def to_slug(relative_path: Path) -> str:
@@ -90,7 +89,8 @@ def to_slug(relative_path: Path) -> str:
 
 
 def parse_filename(relative_path: Path) -> Dict[str, Any]:
-    """Parse session metadata from filename. Pattern: [SessionType]_[Track]_[YYYY]_[MM]_[DD]_[HH]_[mm]_[ss].json"""
+    """Parse session metadata from filename. Pattern: [SessionType]_[Track]_[YYYY]_[MM]_[DD]_[HH]_[mm]_[ss].json
+    (or .f1save)"""
     stem = relative_path.stem
     parts = stem.split('_')
     date_parts = parts[-6:]
@@ -184,11 +184,82 @@ def _get_clean_race_laps(player: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [l for l in clean if l['lap-time-in-ms'] <= median * 1.2]
 
 
+def _extract_lap_rows(player: Dict[str, Any], session_type: str) -> List[Dict[str, Any]]:
+    """Per-lap rows of the reference driver for the analytics tables. 'clean' marks the laps that count towards race
+    pace (every valid lap outside races)."""
+    laps = player.get('session-history', {}).get('lap-history-data', [])
+    sc_by_lap = {p['lap-number']: p.get('max-safety-car-status') for p in player.get('per-lap-info', [])}
+    compound_by_lap = {}
+    for stint in player.get('tyre-set-history', []):
+        compound = (stint.get('tyre-set-data') or {}).get('visual-tyre-compound')
+        for lap_num in range(stint.get('start-lap', 0), stint.get('end-lap', -1) + 1):
+            compound_by_lap[lap_num] = (compound, lap_num - stint['start-lap'] + 1)
+    if _is_race_session(session_type):
+        clean_ids = {id(l) for l in _get_clean_race_laps(player)}
+    else:
+        clean_ids = {id(l) for l in laps if l.get('lap-valid-bit-flags') == 15}
+
+    rows = []
+    for lap_num, lap in enumerate(laps, start=1):
+        if lap.get('lap-time-in-ms', 0) <= 0:
+            continue
+        compound, tyre_age = compound_by_lap.get(lap_num, (None, None))
+        rows.append({
+            'lap_number': lap_num,
+            'lap_time_ms': lap['lap-time-in-ms'],
+            's1_ms': lap.get('sector-1-time-in-ms') or None,
+            's2_ms': lap.get('sector-2-time-in-ms') or None,
+            's3_ms': lap.get('sector-3-time-in-ms') or None,
+            'valid': lap.get('lap-valid-bit-flags') == 15,
+            'clean': id(lap) in clean_ids,
+            'safety_car': sc_by_lap.get(lap_num),
+            'compound': compound,
+            'tyre_age': tyre_age,
+        })
+    return rows
+
+
+def _extract_stint_rows(driver: Dict[str, Any], position: int) -> List[Dict[str, Any]]:
+    """Per-stint rows of a driver for the analytics tables. The pace of a stint leaves out lap 1 and the in/out laps.
+    position (the driver's place in classification-data) stands in for the car index in saves without one."""
+    laps = driver.get('session-history', {}).get('lap-history-data', [])
+    history = driver.get('tyre-set-history', [])
+    rows = []
+    for idx, stint in enumerate(history):
+        tyre_set = stint.get('tyre-set-data') or {}
+        start_lap, end_lap = stint.get('start-lap', 0), stint.get('end-lap', 0)
+        wear = stint.get('tyre-wear-history') or []
+        wear_laps = (wear[-1]['lap-number'] - wear[0]['lap-number']) if len(wear) > 1 else 0
+
+        first = max(start_lap + (1 if idx > 0 else 0), 2)
+        last = end_lap - (1 if idx < len(history) - 1 else 0)
+        pace = [
+            l['lap-time-in-ms'] for l in laps[first - 1:last]
+            if l.get('lap-valid-bit-flags') == 15 and l.get('lap-time-in-ms', 0) > 0
+        ]
+        rows.append({
+            'driver_index': driver.get('index', position),
+            'driver_name': driver.get('driver-name'),
+            'is_player': bool(driver.get('is-player')),
+            'stint_number': idx + 1,
+            'start_lap': start_lap,
+            'end_lap': end_lap,
+            'length': stint.get('stint-length', end_lap - start_lap + 1),
+            'compound': tyre_set.get('visual-tyre-compound'),
+            'actual_compound': tyre_set.get('actual-tyre-compound'),
+            'start_wear': wear[0].get('average') if wear else None,
+            'end_wear': wear[-1].get('average') if wear else None,
+            'wear_per_lap': (wear[-1]['average'] - wear[0]['average']) / wear_laps if wear_laps > 0 else None,
+            'pace_laps': len(pace),
+            'avg_lap_ms': sum(pace) / len(pace) if pace else None,
+        })
+    return rows
+
+
 def _parse_session_metadata(path: Path, logger: PngLogger) -> Dict[str, Any]:
     """Load a session JSON and extract session-info plus player lap stats."""
     logger.debug("_parse_session_metadata: reading %s (%.1f MB)", path.name, path.stat().st_size / 1_048_576)
-    with open(path, 'rb') as fh:
-        data = orjson.loads(fh.read())
+    data = read_session_file(path)
 
     session_info = data.get('session-info', {})
     classification = data.get('classification-data', [])
@@ -205,7 +276,13 @@ def _parse_session_metadata(path: Path, logger: PngLogger) -> Dict[str, Any]:
             default=None,
         )
 
-    result: Dict[str, Any] = {'session_info': session_info, 'is_spectator': is_spectator}
+    result: Dict[str, Any] = {
+        'session_info': session_info,
+        'is_spectator': is_spectator,
+        'drivers': [name for d in classification if (name := d.get('driver-name'))],
+        'stints': [row for i, d in enumerate(classification) for row in _extract_stint_rows(d, i)],
+        'laps': [],
+    }
 
     if player:
         sh = player.get('session-history', {})
@@ -214,6 +291,7 @@ def _parse_session_metadata(path: Path, logger: PngLogger) -> Dict[str, Any]:
         result['valid_lap_count'] = len(driven)
 
         session_type = session_info.get('session-type', '')
+        result['laps'] = _extract_lap_rows(player, session_type)
         if _is_qualifying_session(session_type):
             best_lap_num = sh.get('best-lap-time-lap-num', -1)
             result['lap_indicators'] = [
@@ -245,46 +323,6 @@ def _parse_session_metadata(path: Path, logger: PngLogger) -> Dict[str, Any]:
 
     return result
 
-async def _parse_one(
-    file_idx: int,
-    total: int,
-    rel_path: Path,
-    full_path: Path,
-    logger: PngLogger,
-    cache: Dict[str, Any],
-) -> Tuple[Path, Any]:
-    """Return (rel_path, session_info | Exception), using the mtime cache to skip unchanged files."""
-    cache_key = str(rel_path)
-    try:
-        mtime = full_path.stat().st_mtime
-    except OSError:
-        mtime = 0.0
-
-    cached = cache.get(cache_key)
-    if cached and cached.get('mtime') == mtime and 'data' in cached:
-        return rel_path, cached['data']
-
-    try:
-        start = time.perf_counter()
-        parsed = await asyncio.to_thread(_parse_session_metadata, full_path, logger)
-        logger.debug("[%d/%d] done in %.2fs — %s", file_idx, total, time.perf_counter() - start, rel_path)
-        cache[cache_key] = {'mtime': mtime, 'data': parsed}
-        return rel_path, parsed
-    except Exception as exc:  # pylint: disable=broad-exception-caught
-        logger.silent("[%d/%d] failed — %s: %s", file_idx, total, rel_path, exc)
-        return rel_path, exc
-
-
-def _sort_files_newest_first(json_files: List[Path]) -> List[Path]:
-    """Sort file paths newest-first using the date embedded in each filename (no disk I/O)."""
-    def _date_key(p: Path) -> str:
-        try:
-            return parse_filename(p)['date']
-        except Exception:  # pylint: disable=broad-exception-caught
-            return ''
-    return sorted(json_files, key=_date_key, reverse=True)
-
-
 def _make_session_entry(
     rel_path: Path,
     full_path: Path,
@@ -337,95 +375,24 @@ def _make_session_entry(
     return entry
 
 
-def _snapshot(all_raw: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, str]]:
-    """Sort + build slug_map from the running raw list. Non-destructive."""
-    candidates = [dict(e) for e in all_raw]
-    candidates.sort(key=lambda s: s['date'], reverse=True)
-    slug_map = {s['slug']: s.pop('_rel_path') for s in candidates}
-    for s in candidates:
-        s.pop('fileSize', None)
-    return candidates, slug_map
-
-
-async def build_session_list(
-    session_dir: Path,
-    logger: PngLogger,
-) -> AsyncIterator[Tuple[List[Dict[str, Any]], Dict[str, str]]]:
-    """Async generator: yields (sessions, slug_map) after each batch of _PARSE_CONCURRENCY files.
-
-    Files are processed newest-first so the most recent sessions are available
-    after the very first yield. Metadata is cached on disk keyed by file mtime,
-    so only new or modified files are parsed on subsequent runs.
-    """
-    if not session_dir.exists():
-        return
-
-    json_files = find_json_files(session_dir)
-    logger.debug("build_session_list: found %d JSON files in %s", len(json_files), session_dir)
-
-    json_files = _sort_files_newest_first(json_files)
-    total = len(json_files)
-
-    cache_path = session_dir / CACHE_FILE
-    cache_file_existed = cache_path.exists()
-    cache: Dict[str, Any] = await asyncio.to_thread(_load_cache, cache_path)
-    cache_hits = sum(1 for r in json_files if str(r) in cache)
-
-    if not cache_file_existed:
-        logger.info("Session cache: no cache file found, parsing all %d files from scratch", total)
-    elif not cache:
-        logger.warning("Session cache: cache file invalid or empty, parsing all %d files from scratch", total)
-    elif cache_hits < total:
-        logger.info("Session cache: %d new/modified files to parse (%d/%d already cached)",
-                    total - cache_hits, cache_hits, total)
-    else:
-        logger.debug("Session cache: all %d files already cached", total)
-
-    all_raw: List[Dict[str, Any]] = []
-
-    for batch_start in range(0, total, _PARSE_CONCURRENCY):
-        batch = json_files[batch_start:batch_start + _PARSE_CONCURRENCY]
-        results = await asyncio.gather(
-            *[
-                _parse_one(batch_start + i + 1, total, rel, session_dir / rel, logger, cache)
-                for i, rel in enumerate(batch)
-            ]
-        )
-
-        for rel_path, outcome in results:
-            all_raw.append(_make_session_entry(rel_path, session_dir / rel_path, outcome))
-
-        sessions, slug_map = _snapshot(all_raw)
-        batch_end = min(batch_start + _PARSE_CONCURRENCY, total)
-        logger.debug(
-            "build_session_list: files %d-%d/%d done — %d sessions so far",
-            batch_start + 1, batch_end, total, len(sessions),
-        )
-        yield sessions, slug_map
-
-    # Prune deleted files and persist the updated cache
-    live_keys = {str(r) for r in json_files}
-    pruned_cache = {k: v for k, v in cache.items() if k in live_keys}
-    await asyncio.to_thread(_save_cache, cache_path, pruned_cache)
-    # logger.info("build_session_list: cache saved (%d entries)", len(pruned_cache))
-
-
-
 @alru_cache(maxsize=_JSON_CACHE_SIZE)
-async def _cached_load(full_path_str: str) -> Dict[str, Any]:
-    """Read, parse, and recompute a session JSON file. Results are LRU-cached by path."""
-    async with aiofiles.open(full_path_str, 'rb') as f:
-        data = orjson.loads(await f.read())
+async def _cached_load(full_path_str: str, _mtime_ns: int) -> Dict[str, Any]:
+    """Read, parse, and recompute a session JSON file. Results are LRU-cached by path and mtime."""
+    if full_path_str.endswith(SECTIONED_SAVE_SUFFIX):
+        data = read_session_file(Path(full_path_str))
+    else:
+        async with aiofiles.open(full_path_str, 'rb') as f:
+            data = orjson.loads(await f.read())
     check_recompute_json(data)
     return data
 
 
-async def load_session_json(
+def resolve_session_path(
     session_dir: Path,
     slug_map: Dict[str, str],
     slug: str
-) -> Optional[Dict[str, Any]]:
-    """Resolve slug to file, validate path, load and cache JSON. Returns None on any error."""
+) -> Optional[Path]:
+    """Resolve slug to a file inside the session directory. Returns None if unknown or outside the directory."""
     relative_str = slug_map.get(slug)
     if relative_str is None:
         return None
@@ -434,9 +401,26 @@ async def load_session_json(
     full = (root / relative_str).resolve()
     if not full.is_relative_to(root):
         return None
+    return full
+
+
+async def load_session_json(
+    session_dir: Path,
+    slug_map: Dict[str, str],
+    slug: str,
+    mtime_ns: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
+    """Resolve slug to file, validate path, load and cache JSON. Returns None on any error.
+
+    mtime_ns is the file's modification time if the caller already has it, otherwise it is read here."""
+    full = resolve_session_path(session_dir, slug_map, slug)
+    if full is None:
+        return None
 
     try:
-        return await _cached_load(str(full))
+        if mtime_ns is None:
+            mtime_ns = full.stat().st_mtime_ns
+        return await _cached_load(str(full), mtime_ns)
     except Exception:  # pylint: disable=broad-exception-caught
         return None
 
@@ -0,0 +1,246 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+from collections import OrderedDict
+from typing import (Any, Awaitable, Callable, Dict, Iterable, Optional,
+                    Tuple)
+
+import orjson
+
+import apps.save_viewer.save_viewer_state as SaveViewerState
+from lib.logger import PngLogger
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+VIEW_TELEMETRY = 'telemetry-info'
+VIEW_RACE = 'race-info'
+VIEW_DRIVER = 'driver-info'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_MAX_SESSIONS = 256
+
+# (slug, mtime_ns, view, driver index or None)
+ViewKey = Tuple[str, int, str, Optional[int]]
+SessionKey = Tuple[str, int]
+# (view, driver index or None) pairs to build, in insertion order. The last one ends up most recently used
+WantedViews = Tuple[Tuple[str, Optional[int]], ...]
+SessionLoader = Callable[[], Awaitable[Optional[Dict[str, Any]]]]
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class SessionViewCache:
+    """Pre-serialised telemetry/race/driver view responses of saved sessions, in a byte-budgeted LRU.
+
+    The first request for a session computes every view of it in one worker thread, so clicking through the drivers
+    serves stored bytes. Views evicted under the budget are rebuilt on demand, and a driver view hit prefetches its
+    neighbours in classification order. The file's mtime is part of the key, so a rewritten save is never served stale.
+    """
+
+    def __init__(self, logger: PngLogger, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.m_logger: PngLogger = logger
+        self.m_max_bytes: int = max_bytes
+        self.m_bytes: int = 0
+        self.m_views: "OrderedDict[ViewKey, bytes]" = OrderedDict()
+        # Driver indices of every session seen, in classification order. Tells an evicted view from an invalid index
+        self.m_drivers: "OrderedDict[SessionKey, Tuple[int, ...]]" = OrderedDict()
+        self.m_pending: Dict[SessionKey, asyncio.Task] = {}
+        self.m_hits: int = 0
+        self.m_misses: int = 0
+
+    async def get(self,
+                  slug: str,
+                  mtime_ns: int,
+                  view: str,
+                  index: Optional[int],
+                  load: SessionLoader) -> Optional[bytes]:
+        """Get the serialised view, computing it from the session data returned by load on a miss.
+
+        Args:
+            slug (str): Session slug
+            mtime_ns (int): Modification time of the session file
+            view (str): One of VIEW_TELEMETRY, VIEW_RACE, VIEW_DRIVER
+            index (Optional[int]): Driver index for VIEW_DRIVER, None otherwise
+            load (SessionLoader): Loads the session data. Returns None if the session can't be read
+
+        Returns:
+            Optional[bytes]: JSON body, or None if the session can't be read or has no driver with this index
+        """
+        key = (slug, mtime_ns, view, index)
+        session = (slug, mtime_ns)
+        if (body := self._lookup(key)) is not None:
+            self.m_hits += 1
+            if view == VIEW_DRIVER:
+                self._prefetch_neighbours(session, index, load)
+            return body
+
+        self.m_misses += 1
+        while (pending := self.m_pending.get(session)) is not None:
+            await asyncio.shield(pending)
+            if (body := self._lookup(key)) is not None:
+                return body
+
+        drivers = self.m_drivers.get(session)
+        if drivers is None:
+            wanted = None  # First access, build every view
+        elif view != VIEW_DRIVER:
+            wanted = ((view, None),)
+        elif index in drivers:
+            # The requested view goes in last, so the budget evicts a neighbour rather than it
+            wanted = tuple((VIEW_DRIVER, i) for i in self._neighbours(drivers, index)) + ((view, index),)
+        else:
+            return None
+
+        views = await self._build(session, wanted, load)
+        return None if views is None else views.get((view, index))
+
+    def has_session(self, slug: str, mtime_ns: int) -> bool:
+        """Whether the views of this version of the session have been built."""
+        return (slug, mtime_ns) in self.m_drivers
+
+    def get_stats(self) -> Dict[str, int]:
+        """Cache occupancy and hit counts."""
+        return {
+            'views': len(self.m_views),
+            'sessions': len(self.m_drivers),
+            'bytes': self.m_bytes,
+            'max-bytes': self.m_max_bytes,
+            'hits': self.m_hits,
+            'misses': self.m_misses,
+        }
+
+    def _lookup(self, key: ViewKey) -> Optional[bytes]:
+        """Get a stored view and mark it as most recently used."""
+        body = self.m_views.get(key)
+        if body is not None:
+            self.m_views.move_to_end(key)
+            self.m_drivers.move_to_end(key[:2])
+        return body
+
+    @staticmethod
+    def _neighbours(drivers: Tuple[int, ...], index: int) -> Tuple[int, ...]:
+        """Driver indices next to the given one in classification order."""
+        pos = drivers.index(index)
+        return drivers[max(pos - 1, 0):pos] + drivers[pos + 1:pos + 2]
+
+    def _prefetch_neighbours(self, session: SessionKey, index: int, load: SessionLoader) -> None:
+        """Rebuild the views of the neighbouring drivers in the background if they were evicted."""
+        drivers = self.m_drivers.get(session)
+        if drivers is None or index not in drivers or session in self.m_pending:
+            return
+        missing = tuple((VIEW_DRIVER, i) for i in self._neighbours(drivers, index)
+                        if (session + (VIEW_DRIVER, i)) not in self.m_views)
+        if missing:
+            self._start_build(session, missing, load)
+
+    async def _build(self,
+                     session: SessionKey,
+                     wanted: Optional[WantedViews],
+                     load: SessionLoader) -> Optional[Dict[Tuple[str, Optional[int]], bytes]]:
+        """Build the wanted views (all of them if None) and wait for the result."""
+        return await asyncio.shield(self._start_build(session, wanted, load))
+
+    def _start_build(self,
+                     session: SessionKey,
+                     wanted: Optional[WantedViews],
+                     load: SessionLoader) -> asyncio.Task:
+        """Start building views of a session. One build per session runs at a time, since the view getters fill
+        missing fields into the shared session data."""
+        async def build() -> Optional[Dict[Tuple[str, Optional[int]], bytes]]:
+            try:
+                data = await load()
+                if data is None:
+                    return None
+                drivers, views = await asyncio.to_thread(_build_views, data, wanted)
+                self._store(session, drivers, views)
+                return views
+            except Exception: # pylint: disable=broad-exception-caught
+                self.m_logger.exception("Session view cache: failed to build views of %s", session[0])
+                return None
+            finally:
+                self.m_pending.pop(session, None)
+
+        task = asyncio.create_task(build(), name=f"Session views {session[0]}")
+        self.m_pending[session] = task
+        return task
+
+    def _store(self,
+               session: SessionKey,
+               drivers: Tuple[int, ...],
+               views: Dict[Tuple[str, Optional[int]], bytes]) -> None:
+        """Insert built views and evict least recently used ones beyond the budget."""
+        slug, mtime_ns = session
+        if session not in self.m_drivers:
+            # Drop the views of older versions of this file
+            for stale in [s for s in self.m_drivers if s[0] == slug]:
+                self._evict_session(stale)
+        self.m_drivers[session] = drivers
+        self.m_drivers.move_to_end(session)
+        for (view, index), body in views.items():
+            key = (slug, mtime_ns, view, index)
+            if (old := self.m_views.pop(key, None)) is not None:
+                self.m_bytes -= len(old)
+            self.m_views[key] = body
+            self.m_bytes += len(body)
+
+        while self.m_bytes > self.m_max_bytes and self.m_views:
+            _, body = self.m_views.popitem(last=False)
+            self.m_bytes -= len(body)
+        while len(self.m_drivers) > _MAX_SESSIONS:
+            self._evict_session(next(iter(self.m_drivers)))
+
+    def _evict_session(self, session: SessionKey) -> None:
+        """Forget a session and all of its stored views."""
+        self.m_drivers.pop(session, None)
+        for key in [k for k in self.m_views if k[:2] == session]:
+            self.m_bytes -= len(self.m_views.pop(key))
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def _build_views(data: Dict[str, Any],
+                 wanted: Optional[Iterable[Tuple[str, Optional[int]]]]
+                 ) -> Tuple[Tuple[int, ...], Dict[Tuple[str, Optional[int]], bytes]]:
+    """Compute and serialise views of a session. Runs in a worker thread.
+
+    Args:
+        data (Dict[str, Any]): Session JSON
+        wanted (Optional[Iterable[Tuple[str, Optional[int]]]]): (view, index) pairs to build, or None for all
+
+    Returns:
+        Tuple[Tuple[int, ...], Dict[Tuple[str, Optional[int]], bytes]]: Driver indices in classification order,
+            and the JSON body of every built view. Driver indices without info are left out
+    """
+    drivers = tuple(driver["index"] for driver in data.get("classification-data", []) if "index" in driver)
+    if wanted is None:
+        wanted = [(VIEW_TELEMETRY, None), (VIEW_RACE, None)] + [(VIEW_DRIVER, index) for index in drivers]
+
+    views = {}
+    for view, index in wanted:
+        if view == VIEW_TELEMETRY:
+            views[(view, index)] = orjson.dumps(SaveViewerState.getTelemetryInfoFrom(data))
+        elif view == VIEW_RACE:
+            views[(view, index)] = orjson.dumps(SaveViewerState.getRaceInfoFrom(data))
+        elif driver_info := SaveViewerState.getDriverInfoFrom(data, index):
+            views[(view, index)] = orjson.dumps(driver_info)
+    return drivers, views
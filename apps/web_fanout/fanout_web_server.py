@@ -0,0 +1,199 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import logging
+from http import HTTPStatus
+from typing import Any, Dict, Tuple
+
+from apps.backend.intf_layer.race_table_projection import projectRaceTable
+from apps.backend.intf_layer.request_handlers import (DriverInfoResult,
+                                                      RequestError)
+from apps.backend.intf_layer.telemetry_web_server import (TelemetryWebServer,
+                                                          _toHttpResponse)
+from lib.child_proc_mgmt import notify_parent_init_complete
+from lib.config import PngSettings
+from lib.ipc import IpcDealerAsync, PngAppId
+from lib.web_server import ClientType
+
+# -------------------------------------- CLASS DEFINITIONS -------------------------------------------------------------
+
+class FanoutWebServer(TelemetryWebServer):
+    """
+    Serves the pages, data routes and Socket.IO events of the telemetry web server from a separate process.
+
+    The Socket.IO updates arrive from the core over IPC already packed and are sent on as they are. The polled
+    routes serve the latest update published for the HUD and MCP server, and the request routes are forwarded to
+    the core over the router.
+
+    Attributes:
+        m_dealer (IpcDealerAsync): Dealer for requests to the core.
+        m_latest (Dict[str, Dict[str, Any]]): Latest payload of each polled route.
+    """
+
+    # Polled route -> IPC topic whose payload it serves
+    POLLED_ROUTE_TOPICS = {
+        '/telemetry-info': 'race-table-update',
+        '/stream-overlay-info': 'stream-overlay-update',
+    }
+
+    def __init__(self,
+                 settings: PngSettings,
+                 ver_str: str,
+                 logger: logging.Logger,
+                 dealer: IpcDealerAsync,
+                 debug_mode: bool = False,
+                 reuse_port: bool = False,
+                 notify_parent: bool = False):
+        """
+        Initialize the FanoutWebServer.
+
+        Args:
+            settings (PngSettings): App settings.
+            ver_str (str): The version string.
+            logger (logging.Logger): The logger instance.
+            dealer (IpcDealerAsync): Dealer for requests to the core.
+            debug_mode (bool, optional): Enable or disable debug mode. Defaults to False.
+            reuse_port (bool, optional): Share the port with the other fan-out processes. Defaults to False.
+            notify_parent (bool, optional): Tell the launcher once serving. Defaults to False.
+        """
+        self.m_dealer: IpcDealerAsync = dealer
+        self.m_latest: Dict[str, Dict[str, Any]] = {}
+        self.m_notify_parent: bool = notify_parent
+        super().__init__(
+            settings=settings,
+            ver_str=ver_str,
+            logger=logger,
+            session_state=None,
+            debug_mode=debug_mode,
+            port=settings.Network.web_fanout_port,
+            reuse_port=reuse_port)
+
+    def setLatest(self, topic: str, data: Dict[str, Any]) -> None:
+        """Store the latest payload of an IPC topic served by a polled route.
+
+        Args:
+            topic (str): IPC topic
+            data (Dict[str, Any]): Payload
+        """
+        self.m_latest[topic] = data
+
+    async def forwardUpdate(self, event: str, packed: bytes) -> None:
+        """Send on a packed Socket.IO update from the core.
+
+        Args:
+            event (str): Socket.IO event
+            packed (bytes): msgpack payload
+        """
+        if event == 'frontend-update':
+            await self.send_to_clients_of_type(event, None, ClientType.RACE_TABLE, packed=packed)
+        elif self.is_any_client_interested_in_event(event):
+            await self.send_to_clients_interested_in_event(
+                event, None, projector=projectRaceTable if event == 'race-table-update' else None, packed=packed)
+
+    def _defineDataRoutes(self) -> None:
+        """
+        Define the data routes of the telemetry web server, served from the latest published updates or forwarded
+        to the core.
+        """
+        for path, topic in self.POLLED_ROUTE_TOPICS.items():
+            self._definePolledRoute(path, topic)
+
+        @self.http_route('/race-info', conditional=True)
+        async def raceInfoHTTP() -> Tuple[Dict[str, Any], int]:
+            """
+            Provide overall race statistics via HTTP.
+
+            Returns:
+                Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+            """
+            return await self._forwardRequest('race-info-request', {})
+
+        @self.http_route('/driver-info', conditional=True)
+        async def driverInfoHTTP() -> Tuple[Dict[str, Any], int]:
+            """
+            Provide driver information based on the index parameter.
+
+            Returns:
+                Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+            """
+            return await self._forwardRequest('driver-info-request', {'index': self.request.args.get('index')})
+
+        @self.http_route('/strategy-info')
+        async def strategyInfoHTTP() -> Tuple[Dict[str, Any], int]:
+            """
+            Provide the ranked pit strategies of the driver based on the index parameter.
+
+            Returns:
+                Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+            """
+            return await self._forwardRequest('strategy-request', {'index': self.request.args.get('index')})
+
+        @self.http_route('/race-control')
+        async def raceControlHTTP() -> Tuple[Dict[str, Any], int]:
+            """
+            Provide the race control messages newer than the since-id parameter (all optional: since-id, index, limit).
+
+            Returns:
+                Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+            """
+            args = self.request.args
+            return await self._forwardRequest('race-control-request', {
+                'since-id': args.get('since-id'),
+                'index': args.get('index'),
+                'limit': args.get('limit'),
+            })
+
+    def _definePolledRoute(self, path: str, topic: str) -> None:
+        """Serve the latest payload of an IPC topic on a route."""
+        @self.http_route(path, conditional=True, endpoint=path)
+        async def polledHTTP() -> Tuple[Dict[str, Any], int]:
+            if (data := self.m_latest.get(topic)) is None:
+                return {'error': 'No data from the telemetry core yet'}, HTTPStatus.SERVICE_UNAVAILABLE
+            return data, HTTPStatus.OK
+
+    async def _forwardRequest(self, topic: str, data: Dict[str, Any]) -> Tuple[Dict[str, Any], int]:
+        """Forward a request to the core and map its reply to a JSON response and HTTP status code.
+
+        Args:
+            topic (str): Router topic of the request
+            data (Dict[str, Any]): Request arguments
+
+        Returns:
+            Tuple[Dict[str, Any], int]: JSON response and HTTP status code.
+        """
+        reply = await self.m_dealer.request(str(PngAppId.BACKEND), topic, data)
+        if 'ok' not in reply:
+            # Timeout or send failure, see IpcDealerAsync.request
+            return {'error': f"Telemetry core unavailable: {reply.get('reason')}"}, HTTPStatus.SERVICE_UNAVAILABLE
+        if reply['ok']:
+            return _toHttpResponse(DriverInfoResult.success(reply['data']))
+        error_type = reply.get('error-type')
+        error = RequestError[error_type] if error_type in RequestError.__members__ else RequestError.INVALID_PARAM
+        return _toHttpResponse(DriverInfoResult.failure(error, reply.get('error')))
+
+    async def _post_start(self) -> None:
+        """Function to be called after the server starts serving."""
+        if self.m_notify_parent:
+            notify_parent_init_complete()
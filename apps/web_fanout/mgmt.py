@@ -0,0 +1,132 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+import logging
+import os
+import subprocess
+from typing import Any, Dict, List
+
+from lib.child_proc_mgmt import report_ipc_port_from_child
+from lib.error_status import PNG_LOST_CONN_TO_PARENT
+from lib.ipc import IpcDealerAsync, IpcServerAsync
+
+from .fanout_web_server import FanoutWebServer
+from .subscriber import FanoutSubscriber
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class WebFanoutIpc:
+    def __init__(self,
+                 logger: logging.Logger,
+                 server: FanoutWebServer,
+                 ipc_sub: FanoutSubscriber,
+                 ipc_dealer: IpcDealerAsync,
+                 workers: List[subprocess.Popen]) -> None:
+        """Initialize the IPC server the launcher manages the fan-out through.
+
+        Args:
+            logger (logging.Logger): Logger
+            server (FanoutWebServer): Web server of this process
+            ipc_sub (FanoutSubscriber): Subscriber of this process
+            ipc_dealer (IpcDealerAsync): Dealer of this process
+            workers (List[subprocess.Popen]): The other fan-out processes
+        """
+        self.m_logger = logger
+        self.m_ipc_server = IpcServerAsync(name="Web Fan-out IPC Server")
+        self.m_server = server
+        self.m_ipc_sub = ipc_sub
+        self.m_ipc_dealer = ipc_dealer
+        self.m_workers = workers
+        self._register_handlers()
+        report_ipc_port_from_child(self.m_ipc_server.port)
+
+    async def run(self) -> None:
+        """Starts the IPC server."""
+        await self.m_ipc_server.run()
+
+    def _register_handlers(self):
+        """Registers handlers for IPC commands."""
+
+        @self.m_ipc_server.on_shutdown
+        async def _shutdown_handler(args: dict) -> Dict[str, Any]:
+            """Shutdown handler function.
+
+            Args:
+                args (dict): IPC command arguments
+
+            Returns:
+                Dict[str, Any]: Shutdown response
+            """
+            self.m_logger.info("Shutting down. Reason: %s", args["reason"])
+            asyncio.create_task(self._handle_shutdown_task())
+            return {"status": "success"}
+
+        @self.m_ipc_server.on_heartbeat_missed
+        async def _heartbeat_missed_handler(count: int) -> None:
+            self.m_logger.warning("Missed heartbeat %s times. This process has probably been orphaned. Terminating...",
+                                  count)
+            # The workers watch this process and exit with it
+            os._exit(PNG_LOST_CONN_TO_PARENT)
+
+        @self.m_ipc_server.on_get_stats
+        async def _get_stats(_args: dict) -> dict:
+            return {
+                "status": "success",
+                "stats": {
+                    "INGRESS": self.m_ipc_sub.get_stats(),
+                    "WEB": self.m_server.get_stats(),
+                    "DEALER": self.m_ipc_dealer.get_stats(),
+                    "WORKERS": len([worker for worker in self.m_workers if worker.poll() is None]),
+                }
+            }
+
+    async def _handle_shutdown_task(self) -> None:
+        """Handles shutdown signal."""
+        await self.m_server.stop()
+        await self.m_ipc_sub.close()
+        await self.m_ipc_dealer.close()
+        self.m_logger.debug("Web fan-out shutdown task completed")
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def init_ipc_task(logger: logging.Logger,
+                  tasks: List[asyncio.Task],
+                  server: FanoutWebServer,
+                  ipc_sub: FanoutSubscriber,
+                  ipc_dealer: IpcDealerAsync,
+                  workers: List[subprocess.Popen]) -> None:
+    """Initialize the IPC task.
+
+    Args:
+        logger (logging.Logger): Logger
+        tasks (List[asyncio.Task]): List of tasks
+        server (FanoutWebServer): Web server of this process
+        ipc_sub (FanoutSubscriber): Subscriber of this process
+        ipc_dealer (IpcDealerAsync): Dealer of this process
+        workers (List[subprocess.Popen]): The other fan-out processes
+    """
+    ipc_server = WebFanoutIpc(logger, server, ipc_sub, ipc_dealer, workers)
+    tasks.append(asyncio.create_task(ipc_server.run(), name="IPC Server Task"))
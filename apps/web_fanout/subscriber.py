@@ -0,0 +1,115 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from lib.ipc import IpcSubscriberAsync
+from lib.logger import PngLogger
+from lib.web_server import WEB_FANOUT_EVENTS, fanout_topic
+
+from .fanout_web_server import FanoutWebServer
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class FanoutSubscriber:
+    def __init__(self, logger: PngLogger, port: int, server: FanoutWebServer) -> None:
+        """Subscribe the fan-out web server to the updates published by the core.
+
+        Args:
+            logger (PngLogger): Logger
+            port (int): Broker XPUB port
+            server (FanoutWebServer): Web server to feed
+        """
+        self.m_ipc_sub = IpcSubscriberAsync(port=port, logger=logger)
+        self.m_server = server
+        self._init_routes()
+        self._init_callbacks()
+
+    def _init_callbacks(self) -> None:
+        """Initialize connection callbacks."""
+        @self.m_ipc_sub.on_connect
+        async def _on_connect() -> None:
+            self.m_ipc_sub.logger.info("Connected to the telemetry core's data stream")
+
+        @self.m_ipc_sub.on_disconnect
+        async def _on_disconnect(_exc: Optional[Exception]) -> None:
+            self.m_ipc_sub.logger.warning("Disconnected from the telemetry core's data stream")
+
+    def _init_routes(self) -> None:
+        """Initialize the IPC routes."""
+        for event in WEB_FANOUT_EVENTS:
+            self._route_update(event)
+        for topic in FanoutWebServer.POLLED_ROUTE_TOPICS.values():
+            self._route_polled(topic)
+
+    def _route_update(self, event: str) -> None:
+        """Send on the packed updates of a Socket.IO event."""
+        @self.m_ipc_sub.route_raw(fanout_topic(event))
+        async def _handle_update(packed: bytes) -> None:
+            await self.m_server.forwardUpdate(event, packed)
+
+    def _route_polled(self, topic: str) -> None:
+        """Keep the latest payload of a topic served by a polled route."""
+        @self.m_ipc_sub.route(topic)
+        async def _handle_polled(msg: Dict[str, Any]) -> None:
+            self.m_server.setLatest(topic, msg)
+
+    async def run(self) -> None:
+        """Starts the IPC subscriber."""
+        await self.m_ipc_sub.run()
+
+    async def close(self) -> None:
+        """Closes the IPC subscriber."""
+        self.m_ipc_sub.close()
+
+    def get_stats(self) -> dict:
+        """Get stats for the subscriber.
+
+        Returns:
+            dict: Stats dictionary
+        """
+        return self.m_ipc_sub.get_stats()
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def init_subscriber_task(port: int,
+                         logger: PngLogger,
+                         server: FanoutWebServer,
+                         tasks: List[asyncio.Task]) -> FanoutSubscriber:
+    """Initialize the IPC subscriber task.
+
+    Args:
+        port (int): Broker XPUB port
+        logger (PngLogger): Logger
+        server (FanoutWebServer): Web server to feed
+        tasks (List[asyncio.Task]): List of tasks
+
+    Returns:
+        FanoutSubscriber: The subscriber instance
+    """
+    ipc_sub = FanoutSubscriber(logger, port, server)
+    tasks.append(asyncio.create_task(ipc_sub.run(), name="IPC Subscriber Task"))
+    return ipc_sub
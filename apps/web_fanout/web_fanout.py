@@ -0,0 +1,221 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import argparse
+import asyncio
+import logging
+import os
+import subprocess
+import sys
+from typing import List
+
+from lib.child_proc_mgmt import report_pid_from_child
+from lib.config import PngSettings, load_config_from_json
+from lib.error_status import PNG_LOST_CONN_TO_PARENT, PngError
+from lib.ipc import IpcDealerAsync, PngAppId
+from lib.logger import get_logger
+from lib.version import get_version
+from lib.web_server import supports_reuse_port
+from meta.meta import APP_NAME
+
+from .fanout_web_server import FanoutWebServer
+from .mgmt import init_ipc_task
+from .subscriber import init_subscriber_task
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+MODULE_PATH = "apps.web_fanout"
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def parseArgs() -> argparse.Namespace:
+    """Parse the command line args
+
+    Returns:
+        argparse.Namespace: The parsed args namespace
+    """
+
+    # Initialize the ArgumentParser
+    parser = argparse.ArgumentParser(description=f"{APP_NAME} Web Fan-out Server")
+
+    # Add command-line arguments with default values
+    parser.add_argument("--config-file", nargs="?", default="png_config.json", help="Configuration file name (optional)")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--managed", action="store_true", help="Indicates if process is managed by parent")
+    parser.add_argument("--worker", type=int, default=0,
+                        help="Index of this process. Process 0 starts the others (internal)")
+
+    # Parse the command-line arguments
+    return parser.parse_args()
+
+def getNumProcesses(settings: PngSettings, logger: logging.Logger) -> int:
+    """Number of fan-out processes to run. Several processes need to share the port, which Windows can't do
+
+    Args:
+        settings (PngSettings): Settings
+        logger (logging.Logger): Logger
+
+    Returns:
+        int: Number of processes, at least 1
+    """
+    num_processes = max(settings.Network.web_fanout_processes, 1)
+    if num_processes > 1 and not supports_reuse_port():
+        logger.warning("Running 1 web fan-out process instead of %d, this platform can't share the port",
+                       num_processes)
+        return 1
+    return num_processes
+
+def startWorkers(args: argparse.Namespace, num_processes: int, logger: logging.Logger) -> List[subprocess.Popen]:
+    """Start the fan-out processes other than this one
+
+    Args:
+        args (argparse.Namespace): Args of this process
+        num_processes (int): Total number of processes
+        logger (logging.Logger): Logger
+
+    Returns:
+        List[subprocess.Popen]: The started processes
+    """
+    if getattr(sys, "frozen", False):
+        cmd = [sys.executable, "--module", MODULE_PATH]
+    else:
+        cmd = [sys.executable, "-m", MODULE_PATH]
+    cmd += ["--config-file", args.config_file]
+    if args.debug:
+        cmd.append("--debug")
+
+    workers = []
+    for index in range(1, num_processes):
+        # stdout is how managed children talk to the launcher, keep the workers off it
+        workers.append(subprocess.Popen(cmd + ["--worker", str(index)], stdout=subprocess.DEVNULL))
+        logger.debug("Started web fan-out process %d (PID %d)", index, workers[-1].pid)
+    return workers
+
+def stopWorkers(workers: List[subprocess.Popen], logger: logging.Logger) -> None:
+    """Stop the fan-out processes started by this one
+
+    Args:
+        workers (List[subprocess.Popen]): The started processes
+        logger (logging.Logger): Logger
+    """
+    for worker in workers:
+        worker.terminate()
+    for worker in workers:
+        try:
+            worker.wait(timeout=3.0)
+        except subprocess.TimeoutExpired:
+            logger.warning("Web fan-out process %d did not exit, killing it", worker.pid)
+            worker.kill()
+
+async def watchParent(logger: logging.Logger, interval: float = 1.0) -> None:
+    """Exit if the process that started this one goes away, so that no fan-out process is left holding the port
+
+    Args:
+        logger (logging.Logger): Logger
+        interval (float): Polling interval in seconds
+    """
+    parent_pid = os.getppid()
+    while True:
+        await asyncio.sleep(interval)
+        if os.getppid() != parent_pid:
+            logger.warning("Web fan-out process 0 is gone. Terminating...")
+            # os._exit required: the parent is gone, there is nobody to report to
+            os._exit(PNG_LOST_CONN_TO_PARENT)
+
+async def main(logger: logging.Logger, settings: PngSettings, version: str, args: argparse.Namespace) -> None:
+    """Main function
+
+    Args:
+        logger (logging.Logger): Logger
+        settings (PngSettings): Settings
+        version (str): Version string
+        args (argparse.Namespace): Parsed command-line arguments
+    """
+    tasks: List[asyncio.Task] = []
+    num_processes = getNumProcesses(settings, logger)
+    dealer = IpcDealerAsync(
+        host="127.0.0.1",
+        port=settings.Network.broker_router_port,
+        identity=f"{PngAppId.WEB_FANOUT}-{args.worker}",
+        logger=logger,
+    )
+    tasks.append(asyncio.create_task(dealer.start(), name="Web Fan-out Dealer Recv"))
+    server = FanoutWebServer(
+        settings=settings,
+        ver_str=version,
+        logger=logger,
+        dealer=dealer,
+        debug_mode=args.debug,
+        reuse_port=num_processes > 1,
+        notify_parent=args.managed and args.worker == 0,
+    )
+    tasks.append(asyncio.create_task(server.run(), name="Web Server Task"))
+    ipc_sub = init_subscriber_task(settings.Network.broker_xpub_port, logger, server, tasks)
+
+    workers: List[subprocess.Popen] = []
+    if args.worker == 0:
+        workers = startWorkers(args, num_processes, logger)
+        if args.managed:
+            init_ipc_task(logger, tasks, server, ipc_sub, dealer, workers)
+    else:
+        tasks.append(asyncio.create_task(watchParent(logger), name="Parent Watch Task"))
+
+    try:
+        logger.debug("Registered %d Tasks: %s", len(tasks), [task.get_name() for task in tasks])
+        await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        logger.debug("Main task was cancelled.")
+        for task in tasks:
+            task.cancel()
+        raise  # Ensure proper cancellation behavior
+    finally:
+        stopWorkers(workers, logger)
+
+# -------------------------------------- ENTRY POINT -------------------------------------------------------------------
+
+def entry_point():
+    """Entry point"""
+    args = parseArgs()
+    if args.managed:
+        report_pid_from_child()
+    png_logger = get_logger(f"web_fanout_{args.worker}", args.debug, jsonl=args.managed)
+    configs = load_config_from_json(args.config_file, png_logger)
+    version = get_version()
+    png_logger.info("Starting %s web fan-out process %d, version %s...", APP_NAME, args.worker, version)
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+    try:
+        asyncio.run(main(
+            logger=png_logger,
+            settings=configs,
+            version=version,
+            args=args))
+    except KeyboardInterrupt:
+        png_logger.info("Program interrupted by user.")
+    except asyncio.CancelledError:
+        png_logger.info("Program shutdown gracefully.")
+    except PngError as e:
+        png_logger.exception("Terminating due to Error: %s with code %d", e, e.exit_code)
+        sys.exit(e.exit_code)
@@ -27,6 +27,8 @@ from enum import Enum
 from io import StringIO
 import json
 
+from lib.leaderboard_counter import LeaderboardCounter
+
 class CollisionRecord:
     """
     Represents an overtake record in an F1 race.
@@ -314,7 +316,7 @@ class CollisionAnalyzer:
         for record in collision_records:
             if self.m_input_mode == CollisionAnalyzerMode.INPUT_MODE_LIST_COLLISION_RECORDS_JSON:
                 record = CollisionRecord.fromJSON(record)
-            self.__processCollisionRecord(record)
+            self._processCollisionRecord(record)
 
     def __analyzeCsvFile(self, file_name) -> None:
         """
@@ -347,7 +349,7 @@ class CollisionAnalyzer:
         csv_data_file = StringIO(csv_data_string)
         self.__analyze(csv_data_file)
 
-    def __processCollisionRecord(self, record: CollisionRecord) -> None:
+    def _processCollisionRecord(self, record: CollisionRecord) -> None:
         """
         Process the given CollisionRecord object.
 
@@ -387,7 +389,7 @@ class CollisionAnalyzer:
                 continue
             driver_1_name, driver_1_index, driver_1_lap, driver_2_name, driver_2_index, driver_2_lap = \
                 [col.strip() for col in row]
-            self.__processCollisionRecord(CollisionRecord(
+            self._processCollisionRecord(CollisionRecord(
                 driver_1_name=driver_1_name,
                 driver_1_lap=int(driver_1_lap),
                 driver_1_index=int(driver_1_index),
@@ -484,3 +486,102 @@ class CollisionAnalyzer:
             ],
             "records" : [record.toJSON() for record in self.m_collision_records],
         }
+
+class StreamingCollisionAnalyzer(CollisionAnalyzer):
+    """
+    CollisionAnalyzer variant for live sessions. Collisions are fed in one at a time as they happen and the
+    aggregates (most collisions, most collided pairs) are maintained incrementally, so querying them does not
+    rescan the whole session. The batch CollisionAnalyzer remains the choice for CSV/offline input.
+
+    Attributes:
+        m_collisions_board (LeaderboardCounter[Tuple[int,str]]): Collisions count per driver (index, name)
+        m_pair_board (LeaderboardCounter[CollisionPairKey]): Collisions count per pair of drivers
+    """
+
+    def __init__(self, collision_records: Optional[List[CollisionRecord]] = None):
+        """
+        Initialize StreamingCollisionAnalyzer.
+
+        Args:
+            collision_records (Optional[List[CollisionRecord]]): Records to seed the analyzer with. Defaults to None
+        """
+
+        self.m_collisions_board: LeaderboardCounter[Tuple[int,str]] = LeaderboardCounter()
+        self.m_pair_board: LeaderboardCounter[CollisionPairKey] = LeaderboardCounter()
+        super().__init__(CollisionAnalyzerMode.INPUT_MODE_LIST_COLLISION_RECORDS, collision_records or [])
+
+    def processCollisionRecord(self, record: CollisionRecord) -> None:
+        """
+        Add a collision to the aggregates
+
+        Args:
+            record (CollisionRecord): The CollisionRecord object to process.
+        """
+        self._processCollisionRecord(record)
+
+    def clear(self) -> None:
+        """
+        Drop all collisions processed so far
+        """
+        self.m_collision_counts.clear()
+        self.m_collision_pair_records.clear()
+        self.m_collision_records.clear()
+        self.m_collisions_board.clear()
+        self.m_pair_board.clear()
+
+    def _processCollisionRecord(self, record: CollisionRecord) -> None:
+        """
+        Process the given CollisionRecord object, updating the running aggregates
+
+        Args:
+            record (CollisionRecord): The CollisionRecord object to process.
+        """
+        super()._processCollisionRecord(record)
+        self.m_collisions_board.increment((record.m_driver_1_index, record.m_driver_1_name))
+        self.m_collisions_board.increment((record.m_driver_2_index, record.m_driver_2_name))
+        self.m_pair_board.increment(CollisionPairKey(
+            driver_1_index=record.m_driver_1_index,
+            driver_1_name=record.m_driver_1_name,
+            driver_2_index=record.m_driver_2_index,
+            driver_2_name=record.m_driver_2_name))
+
+    def getMostCollisions(self) -> Tuple[List[Tuple[int,str]], int]:
+        """
+        Get the driver names and number of collisions for the driver with the most collisions.
+
+        Returns:
+            Tuple[List[Tuple[int,str]], int]: Tuple containing the driver ID tuple and the number of collisions
+                The driver ID tuple is a pair of driver index (int) and driver name (str)
+        """
+        return self.m_collisions_board.leaders()
+
+    def getNumCollisions(self) -> int:
+        """
+        Get the total number of collisions.
+
+        Returns:
+            int: The total number of collisions
+        """
+        return self.m_collisions_board.total
+
+    def getMostCollidedPairsJSON(self) -> Dict[str, Any]:
+        """
+        Get the most collided pair of drivers in JSON format.
+
+        Returns:
+            Dict[str, Any]: The JSON dictionary containing the most collided pair of drivers.
+                Same format as CollisionAnalyzer.getMostCollidedPairsJSON
+        """
+        collision_pairs, max_collisions_count = self.m_pair_board.leaders()
+        return {
+            "count": max_collisions_count,
+            "collision-pairs": [
+                {
+                    "driver-1-index": collision_pair.m_driver_1_index,
+                    "driver-1-name": collision_pair.m_driver_1_name,
+                    "driver-2-index": collision_pair.m_driver_2_index,
+                    "driver-2-name": collision_pair.m_driver_2_name
+                }
+                for collision_pair in collision_pairs
+            ]
+        }
@@ -32,6 +32,7 @@ from .schema import (CaptureSettings, DisplaySettings, ForwardingSettings,
                      NetworkSettings, OverlayId, OverlayPosition,
                      PitTimeLossF1, PitTimeLossF2, PngSettings,
                      PredictionSettings, HarvestPowerSmoothing, PrivacySettings,
+                     SaveFileFormat,
                      StreamOverlaySettings, SubSysCtrl, TimingTowerColId,
                      TimingTowerColOptions, TimingTowerColSettings,
                      WeatherMFDUIType)
@@ -41,6 +42,7 @@ from .types import FilePathStr
 
 __all__ = [
     'CaptureSettings',
+    'SaveFileFormat',
     'DisplaySettings',
     'ForwardingSettings',
     'NetworkSettings',
@@ -22,7 +22,7 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-from .capture import CaptureSettings
+from .capture import CaptureSettings, SaveFileFormat
 from .display import DisplaySettings
 from .forwarding import ForwardingSettings
 from .https import HttpsSettings
@@ -45,6 +45,7 @@ from .subsys_ctrl import SubSysCtrl
 
 __all__ = [
     'CaptureSettings',
+    'SaveFileFormat',
     'DisplaySettings',
     'ForwardingSettings',
     'HttpsSettings',
@@ -22,6 +22,7 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
+from enum import Enum
 from pathlib import Path
 from typing import Any, ClassVar, Dict
 
@@ -31,6 +32,10 @@ from .diff import ConfigDiffMixin
 
 # -------------------------------------- CLASS  DEFINITIONS ------------------------------------------------------------
 
+class SaveFileFormat(str, Enum):
+    """File format of the session saves."""
+    JSON = "JSON"
+    BINARY = "Binary"
 
 class CaptureSettings(ConfigDiffMixin, BaseModel):
 
@@ -109,6 +114,67 @@ class CaptureSettings(ConfigDiffMixin, BaseModel):
             }
         }
     )
+    save_file_format: SaveFileFormat = Field(
+        default=SaveFileFormat.JSON,
+        description="Session save file format",
+        json_schema_extra={
+            "ui": {
+                "type": "radio_buttons",
+                "options": [e.value for e in SaveFileFormat],
+                "visible": True,
+                "ext_info": [
+                    "Binary saves (.f1save) are smaller and the save viewer opens them much faster, \n"
+                    "since it only reads the parts it displays. Use JSON if other tools read the saves. \n"
+                    "Existing JSON saves can be converted with the convert_save dev tool."
+                ]
+            }
+        }
+    )
+    session_journal: bool = Field(
+        default=False,
+        description="Crash recovery journal of live sessions",
+        json_schema_extra={
+            "ui": {
+                "type" : "check_box",
+                "visible": True,
+                "ext_info": [
+                    "Writes the session data to a journal as the laps complete, with a full checkpoint every "
+                    "10 laps. \n"
+                    "If the app is restarted during a session (e.g. after a crash), the data collected so far is "
+                    "restored as soon as the game sends data for the same session again. \n"
+                    "The journal is deleted once the session has ended."
+                ]
+            }
+        }
+    )
+    packet_ring_buffer_mb: int = Field(
+        default=0,
+        ge=0,
+        le=1024,
+        description="Rolling packet capture buffer size in MB (0 to disable)",
+        json_schema_extra={
+            "ui": {
+                "type" : "text_box",
+                "visible": True,
+                "ext_info": [
+                    "Keeps the most recent raw UDP packets in memory so that they can be dumped to a capture "
+                    "file on demand, e.g. right after something odd happened. ~40 MB holds about 5 minutes of a race."
+                ]
+            }
+        }
+    )
+    packet_ring_buffer_dump_sec: int = Field(
+        default=300,
+        ge=1,
+        le=3600,
+        description="Max age (in seconds) of the packets written when the rolling capture buffer is dumped",
+        json_schema_extra={
+            "ui": {
+                "type" : "text_box",
+                "visible": True,
+            }
+        }
+    )
     session_dir: str = Field(
         default="data",
         description="Directory where saved session JSON files are stored",
@@ -86,6 +86,35 @@ class NetworkSettings(ConfigDiffMixin, BaseModel):
         ],
     )
 
+    web_fanout_port: int = port_field(
+        "Web Fan-out HTTP Port",
+        default=4771,
+        port_type=PortType.TCP,
+        ext_info=[
+            "Port of the web fan-out processes, when enabled.",
+            "Serves the same pages and live updates as the main HTTP server, for viewers beyond the driver's own "
+            "screens.",
+        ],
+    )
+
+    web_fanout_processes: int = Field(
+        default=0,
+        ge=0,
+        le=16,
+        description="Web Fan-out Processes",
+        json_schema_extra={
+            "ui": {
+                "type" : "text_box",
+                "ext_info": [
+                    "Number of processes serving web clients on the Web Fan-out HTTP Port. 0 disables the fan-out.",
+                    "The core publishes each update once and the fan-out processes send it to every viewer, "
+                    "so many viewers don't slow down telemetry processing.",
+                    "More than one process is only supported on Linux and macOS.",
+                ]
+            }
+        }
+    )
+
     bind_address: str = Field(
         default="0.0.0.0",
         description="Server Bind Address",
@@ -43,6 +43,8 @@ class LapDeltaManager:
       - set_best_lap(lap_num: int)
       - get_delta() -> Optional[DeltaResult]
       - handle_flashback(lap_num: int, curr_distance: float)
+      - get_lap_points(lap_num: int) / restore_lap(lap_num: int, points: List[LapPoint])
+      - without_laps() -> LapDeltaManager
     """
 
     def __init__(self) -> None:
@@ -109,6 +111,34 @@ class LapDeltaManager:
         """
         self._best_lap_num = lap_num
 
+    @property
+    def best_lap_num(self) -> Optional[int]:
+        """The lap number used as the 'best lap' reference, None if not set."""
+        return self._best_lap_num
+
+    def get_lap_points(self, lap_num: int) -> List[LapPoint]:
+        """
+        Get a copy of the recorded points of a lap. Empty if the lap has no data.
+        """
+        return list(self._laps.get(lap_num, ()))
+
+    def restore_lap(self, lap_num: int, points: List[LapPoint]) -> None:
+        """
+        Replace the recorded points of a lap, e.g. with ones saved by get_lap_points().
+        The points must already follow the HOLY PRINCIPLE.
+        """
+        self._laps[lap_num] = list(points)
+        self._lap_distances[lap_num] = [p.distance_m for p in points]
+
+    def without_laps(self) -> "LapDeltaManager":
+        """
+        Get a copy with the same best lap and last point, but without any recorded lap data.
+        """
+        ret = LapDeltaManager()
+        ret._best_lap_num = self._best_lap_num
+        ret._last_recorded_point = self._last_recorded_point
+        return ret
+
     def get_delta(self) -> Optional[DeltaResult]:
         """
         Compute delta (current_time_ms - best_time_ms_at_same_distance) for the latest recorded point.
@@ -31,6 +31,7 @@ class PngAppId(Enum):
     BACKEND = "backend"
     HUD = "hud"
     MCP = "mcp"
+    WEB_FANOUT = "web-fanout" # One per process, suffixed with the process index
 
     def __str__(self):
         return self.value
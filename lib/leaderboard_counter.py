@@ -0,0 +1,120 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+from typing import Dict, Generic, Hashable, List, Tuple, TypeVar
+
+# -------------------------------------- TYPES -------------------------------------------------------------------------
+
+K = TypeVar("K", bound=Hashable)
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class LeaderboardCounter(Generic[K]):
+    """
+    Counter that keeps track of its leaders (the keys sharing the highest count) as it is updated.
+
+    Counts can only go up, so the leaders are maintained on every increment and
+    fetching them costs O(k) in the number of leaders instead of a scan over all keys.
+    Leaders are reported in the order their keys were first counted, matching a
+    scan over an insertion ordered dict. As with a dict, the first key object counted is the
+    one kept (and reported) for all keys equal to it.
+
+    This class is intentionally simple:
+    - No decrements
+    - No internal locking (caller manages concurrency)
+    """
+
+    def __init__(self) -> None:
+        """Create an empty counter."""
+        self._counts: Dict[K, int] = {}
+        self._first_seen: Dict[K, Tuple[int, K]] = {} # key -> (order of first count, key object stored)
+        self._leaders: Dict[K, None] = {} # used as an ordered set
+        self._max_count: int = 0
+        self._total: int = 0
+
+    def increment(self, key: K) -> int:
+        """
+        Increment the count of the given key by one.
+
+        Args:
+            key: The key to count.
+
+        Returns:
+            The updated count of the key.
+        """
+        if (first_seen := self._first_seen.get(key)) is None:
+            first_seen = self._first_seen[key] = (len(self._first_seen), key)
+        key = first_seen[1]
+        count = self._counts.get(key, 0) + 1
+        self._counts[key] = count
+        self._total += 1
+
+        if count > self._max_count:
+            self._max_count = count
+            self._leaders = {key: None}
+        elif count == self._max_count:
+            self._leaders[key] = None
+        return count
+
+    def get(self, key: K) -> int:
+        """
+        Return the count of the given key.
+
+        Args:
+            key: The key.
+
+        Returns:
+            The count, 0 if the key was never counted.
+        """
+        return self._counts.get(key, 0)
+
+    def leaders(self) -> Tuple[List[K], int]:
+        """
+        Return the keys with the highest count.
+
+        Returns:
+            The leading keys in first counted order, and their count. ([], 0) if empty.
+        """
+        return sorted(self._leaders, key=lambda key: self._first_seen[key][0]), self._max_count
+
+    @property
+    def total(self) -> int:
+        """Return the sum of all counts."""
+        return self._total
+
+    def clear(self) -> None:
+        """Remove all counts."""
+        self._counts.clear()
+        self._first_seen.clear()
+        self._leaders = {}
+        self._max_count = 0
+        self._total = 0
+
+    def __len__(self) -> int:
+        """Return the number of counted keys."""
+        return len(self._counts)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the given key was counted at least once."""
+        return key in self._counts
@@ -27,6 +27,8 @@ from enum import Enum
 from io import StringIO
 import json
 
+from lib.leaderboard_counter import LeaderboardCounter
+
 class OvertakeRecord:
     """
     Represents an overtake record in an F1 race.
@@ -313,7 +315,7 @@ class OvertakeAnalyzer:
         for record in overtake_records:
             if self.m_input_mode == OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS_JSON:
                 record = OvertakeRecord.fromJSON(record)
-            self.__processOvertakeRecord(record)
+            self._processOvertakeRecord(record)
 
     def __analyzeCsvFile(self, file_name) -> None:
         """
@@ -363,7 +365,7 @@ class OvertakeAnalyzer:
                 continue
             lap_overtaking, driver_overtaking, lap_being_overtaken, driver_being_overtaken = \
                 [col.strip() for col in row]
-            self.__processOvertakeRecord(OvertakeRecord(
+            self._processOvertakeRecord(OvertakeRecord(
                 overtaking_driver_name=driver_overtaking,
                 overtaking_driver_lap=int(lap_overtaking),
                 overtaken_driver_name=driver_being_overtaken,
@@ -371,7 +373,7 @@ class OvertakeAnalyzer:
                 row_id=row_id))
             row_id += 1
 
-    def __processOvertakeRecord(self, overtake_record : OvertakeRecord) -> None:
+    def _processOvertakeRecord(self, overtake_record : OvertakeRecord) -> None:
         """
         Process an OvertakeRecord
 
@@ -562,9 +564,9 @@ class OvertakeAnalyzer:
             ],
         }
         final_dict["player-name"] = driver_name
-        final_dict["number-of-times-player-overtaken"] = self.m_being_overtaken_counts[driver_name]
-        final_dict["number-of-times-player-overtakes"] = self.m_overtaking_counts[driver_name]
-        if self.m_overtaking_counts[driver_name] == 0 or self.m_being_overtaken_counts[driver_name] == 0:
+        final_dict["number-of-times-player-overtaken"] = self.m_being_overtaken_counts.get(driver_name, 0)
+        final_dict["number-of-times-player-overtakes"] = self.m_overtaking_counts.get(driver_name, 0)
+        if final_dict["number-of-times-player-overtakes"] == 0 or final_dict["number-of-times-player-overtaken"] == 0:
             player_most_heated_rivalries = None
         elif self.m_overtaking_counts:
             player_most_heated_rivalries = self.getMostHeatedRivalries(
@@ -713,6 +715,129 @@ class OvertakeAnalyzer:
 
         return False, final_str
 
+class StreamingOvertakeAnalyzer(OvertakeAnalyzer):
+    """
+    OvertakeAnalyzer variant for live sessions. Overtakes are fed in one at a time as they happen and the
+    aggregates (most overtakes, most overtaken, most heated rivalries) are maintained incrementally, so querying
+    them does not rescan the whole race. The batch OvertakeAnalyzer remains the choice for CSV/offline input.
+
+    Attributes:
+        m_overtakes_board (LeaderboardCounter[str]): Overtakes count per driver
+        m_overtaken_board (LeaderboardCounter[str]): Overtaken count per driver
+        m_rivalry_board (LeaderboardCounter[OvertakeRivalryKey]): Overtakes count per rivalry
+        m_driver_rivalry_boards (Dict[str, LeaderboardCounter[OvertakeRivalryKey]]): Overtakes count per rivalry,
+            for every driver involved
+    """
+
+    def __init__(self, overtake_records: Optional[List[OvertakeRecord]] = None):
+        """
+        Initialize StreamingOvertakeAnalyzer.
+
+        Args:
+            overtake_records (Optional[List[OvertakeRecord]]): Records to seed the analyzer with. Defaults to None
+        """
+
+        self.m_overtakes_board: LeaderboardCounter[str] = LeaderboardCounter()
+        self.m_overtaken_board: LeaderboardCounter[str] = LeaderboardCounter()
+        self.m_rivalry_board: LeaderboardCounter[OvertakeRivalryKey] = LeaderboardCounter()
+        self.m_driver_rivalry_boards: Dict[str, LeaderboardCounter[OvertakeRivalryKey]] = defaultdict(
+            LeaderboardCounter)
+        super().__init__(OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS, overtake_records or [])
+
+    def processOvertakeRecord(self, overtake_record: OvertakeRecord) -> None:
+        """
+        Add an overtake to the aggregates
+
+        Args:
+            overtake_record (OvertakeRecord): The OvertakeRecord to process
+        """
+        self._processOvertakeRecord(overtake_record)
+
+    def clear(self) -> None:
+        """
+        Drop all overtakes processed so far
+        """
+        self.m_overtaking_counts.clear()
+        self.m_being_overtaken_counts.clear()
+        self.m_rivalry_records.clear()
+        self.m_overtakes_board.clear()
+        self.m_overtaken_board.clear()
+        self.m_rivalry_board.clear()
+        self.m_driver_rivalry_boards.clear()
+
+    def _processOvertakeRecord(self, overtake_record: OvertakeRecord) -> None:
+        """
+        Process an OvertakeRecord, updating the running aggregates
+
+        Args:
+            overtake_record (OvertakeRecord): The OvertakeRecord to process
+        """
+        super()._processOvertakeRecord(overtake_record)
+        overtaking_driver = overtake_record.m_overtaking_driver_name
+        overtaken_driver = overtake_record.m_overtaken_driver_name
+        rivalry_key = OvertakeRivalryKey(driver_1_name=overtaking_driver, driver_2_name=overtaken_driver)
+
+        self.m_overtakes_board.increment(overtaking_driver)
+        self.m_overtaken_board.increment(overtaken_driver)
+        self.m_rivalry_board.increment(rivalry_key)
+        self.m_driver_rivalry_boards[overtaking_driver].increment(rivalry_key)
+        if overtaken_driver != overtaking_driver:
+            self.m_driver_rivalry_boards[overtaken_driver].increment(rivalry_key)
+
+    def getMostOvertakes(self) -> Tuple[List[str], int]:
+        """
+        Get the driver(s) with the most overtakes and their count.
+
+        Returns:
+            List[str]: List of driver names with the most overtakes.
+            int: The number of overtakes
+        """
+        return self.m_overtakes_board.leaders()
+
+    def getMostOvertaken(self) -> Tuple[List[str], int]:
+        """
+        Get the driver(s) who has been overtaken the most and their count.
+
+        Returns:
+            List[str]: List of driver names who have been overtaken the most.
+            int: The number of overtakes
+        """
+        return self.m_overtaken_board.leaders()
+
+    def getTotalNumberOfOvertakes(self) -> int:
+        """Get the total number of overtakes occured in this race
+
+        Returns:
+            int: The overtakes count
+        """
+        return self.m_overtakes_board.total
+
+    def getMostHeatedRivalries(self,
+                        driver_name: Optional[str] = None,
+                        is_case_sensitive: Optional[bool] = True) -> Dict[OvertakeRivalryKey, List[OvertakeRecord]]:
+        """
+        Get the most heated overtaking rivalries and details of each overtake involved.
+
+        Args:
+            driver_name (str, optional): The driver's name to check involvement in most heated rivalries.
+            is_case_sensitive (bool, optional): Whether the player name search must be case sensitive
+
+        Returns:
+            Dict[OvertakeRivalryPair, List[OvertakeRecord]]:
+                A dictionary containing rivalries as keys and details of each overtake involved as values.
+                Returns empty dictionary if the specified driver_name is invalid.
+        """
+        if driver_name is None:
+            board = self.m_rivalry_board
+        elif not is_case_sensitive:
+            # Names are only indexed as is, fall back to the full scan
+            return super().getMostHeatedRivalries(driver_name, is_case_sensitive)
+        elif (board := self.m_driver_rivalry_boards.get(driver_name)) is None:
+            return {}
+
+        rivalry_keys, _ = board.leaders()
+        return {key: self.m_rivalry_records[key] for key in rivalry_keys}
+
 if __name__ == "__main__":
     import argparse
 
@@ -20,12 +20,20 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import asyncio
+import bisect
+import mmap
+import os
+import queue
 import struct
 import sys
+import threading
 import time
 import zlib
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Generator, List, Optional, Tuple
+from array import array
+from typing import (Any, BinaryIO, Callable, Generator, List, Optional,
+                    Tuple)
 
 
 class CompressionHelper(ABC):
@@ -79,6 +87,9 @@ class F1PktCapFileHeader:
            |      |   bits 3-0: Minor version (4 bits, max 15)
      8     | 4    | Number of packets (uint32)
      12    | Total header length
+
+    In major version 1, the header is followed by the packets (see F1PktCapMessage). In major version 2, it is
+    followed by compressed blocks of packets and a block index (see F1PcapBlockWriter).
     """
 
     # Class attribute for the magic number
@@ -300,11 +311,809 @@ class F1PktCapMessage:
             raise ValueError(f"Data length mismatch. Header length: {length}, Actual length: {len(payload)}")
         return F1PktCapMessage(payload, timestamp)
 
+class F1PcapBlockIndexEntry:
+    """Index entry of one block in a v2 capture file.
+
+    Offset | Size | Description
+    -------+------+----------------------------------------
+     0     | 8    | File offset of the block header (uint64)
+     8     | 8    | Index of the first packet in the block (uint64)
+     16    | 4    | Number of packets in the block (uint32)
+     20    | 8    | Timestamp of the first packet (double)
+     28    | 4    | Frame identifier of the first packet (uint32, 0xFFFFFFFF if unknown)
+     32    | 64   | Packet ID histogram (16 x uint32, IDs above 15 are counted in the last bucket)
+     96    | Total entry length
+    """
+
+    ENTRY_STRUCT = struct.Struct('<QQIdI16I')
+    UNKNOWN_FRAME_ID = 0xFFFFFFFF
+    NUM_PACKET_ID_BUCKETS = 16
+
+    __slots__ = ("offset", "first_packet", "num_packets", "first_timestamp", "first_frame_id", "packet_id_histogram")
+
+    def __init__(self,
+                 offset: int,
+                 first_packet: int,
+                 num_packets: int,
+                 first_timestamp: float,
+                 first_frame_id: int,
+                 packet_id_histogram: Tuple[int, ...]):
+        self.offset = offset
+        self.first_packet = first_packet
+        self.num_packets = num_packets
+        self.first_timestamp = first_timestamp
+        self.first_frame_id = first_frame_id
+        self.packet_id_histogram = packet_id_histogram
+
+    def to_bytes(self) -> bytes:
+        """Serialise this entry"""
+        return self.ENTRY_STRUCT.pack(self.offset, self.first_packet, self.num_packets, self.first_timestamp,
+                                      self.first_frame_id, *self.packet_id_histogram)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int = 0) -> 'F1PcapBlockIndexEntry':
+        """Deserialise an entry from data at the given offset"""
+        fields = cls.ENTRY_STRUCT.unpack_from(data, offset)
+        return cls(*fields[:5], fields[5:])
+
+class F1PcapBlockWriter:
+    """Writes a v2 capture file, where packets are grouped into (optionally zlib compressed) blocks.
+
+    File layout:
+    - File header (F1PktCapFileHeader, major version 2). num_packets is patched on close.
+    - Blocks. Each block is a header (magic "F1BK", payload length, raw length, number of packets, payload CRC32,
+      all uint32 apart from the magic) followed by the payload. The uncompressed payload is a sequence of packet
+      records (timestamp as double, data length as uint32, data).
+    - Block index: magic "F1IX", number of blocks (uint32) and one F1PcapBlockIndexEntry per block.
+    - Trailer: file offset of the block index (uint64) and magic "F1IE".
+
+    Blocks are self describing, so a file without a valid index (writer killed before close) can still be read.
+    """
+
+    BLOCK_HEADER_STRUCT = struct.Struct('<4sIIII')
+    BLOCK_MAGIC = b'F1BK'
+    RECORD_HEADER_STRUCT = struct.Struct('<dI')
+    INDEX_HEADER_STRUCT = struct.Struct('<4sI')
+    INDEX_MAGIC = b'F1IX'
+    TRAILER_STRUCT = struct.Struct('<Q4s')
+    TRAILER_MAGIC = b'F1IE'
+    MAJOR_VERSION = 2
+    MINOR_VERSION = 0
+    DEFAULT_BLOCK_SIZE = 256 * 1024
+
+    def __init__(self, file_name: str, compressed: bool = True, block_size: int = DEFAULT_BLOCK_SIZE):
+        """
+        Create the file and write the file header.
+
+        Parameters:
+        - file_name (str): Path of the file. Overwritten if it exists.
+        - compressed (bool): Whether the blocks are zlib compressed.
+        - block_size (int): Uncompressed size after which a block is closed and written.
+        """
+        self.m_file_name = file_name
+        self.m_compressed = compressed
+        self.m_block_size = block_size
+        self.m_index: List[F1PcapBlockIndexEntry] = []
+        self.m_num_packets = 0
+        self.m_bytes_written = 0
+
+        self._m_block_records: List[bytes] = []
+        self._m_block_raw_len = 0
+        self._m_block_first_timestamp = 0.0
+        self._m_block_first_frame_id = F1PcapBlockIndexEntry.UNKNOWN_FRAME_ID
+        self._m_block_histogram = [0] * F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS
+
+        self._m_file: Optional[BinaryIO] = open(file_name, "wb")
+        self._m_file.write(self._header(0).to_bytes())
+
+    def __enter__(self) -> 'F1PcapBlockWriter':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the file has been finalised"""
+        return self._m_file is None
+
+    def add(self, data: bytes, timestamp: Optional[float] = None) -> None:
+        """
+        Append a packet. The current block is written out once it exceeds the block size.
+
+        Parameters:
+        - data (bytes): Raw packet.
+        - timestamp (float): The timestamp to be written, will be initialised with current time if not provided
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if not self._m_block_records:
+            self._m_block_first_timestamp = timestamp
+            self._m_block_first_frame_id = _peekFrameId(data)
+        self._m_block_histogram[min(_peekPacketId(data), F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS - 1)] += 1
+
+        self._m_block_records.append(self.RECORD_HEADER_STRUCT.pack(timestamp, len(data)))
+        self._m_block_records.append(data)
+        self._m_block_raw_len += self.RECORD_HEADER_STRUCT.size + len(data)
+        self.m_num_packets += 1
+        if self._m_block_raw_len >= self.m_block_size:
+            self.flushBlock()
+
+    def flushBlock(self) -> None:
+        """Write out the current block, if it has any packets"""
+        if not self._m_block_records:
+            return
+        raw = b''.join(self._m_block_records)
+        payload = zlib.compress(raw) if self.m_compressed else raw
+        num_packets = len(self._m_block_records) // 2
+
+        self.m_index.append(F1PcapBlockIndexEntry(
+            offset=self._m_file.tell(),
+            first_packet=self.m_num_packets - num_packets,
+            num_packets=num_packets,
+            first_timestamp=self._m_block_first_timestamp,
+            first_frame_id=self._m_block_first_frame_id,
+            packet_id_histogram=tuple(self._m_block_histogram)))
+        block = self.BLOCK_HEADER_STRUCT.pack(self.BLOCK_MAGIC, len(payload), len(raw), num_packets,
+                                              zlib.crc32(payload)) + payload
+        self._m_file.write(block)
+        self.m_bytes_written += len(block)
+
+        self._m_block_records.clear()
+        self._m_block_raw_len = 0
+        self._m_block_histogram = [0] * F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS
+
+    def sync(self) -> None:
+        """Write out the current block, patch the packet count in the file header and fsync, so that everything added
+        so far survives a crash (F1PcapReader recovers files without an index)"""
+        self.flushBlock()
+        end = self._m_file.tell()
+        self._m_file.seek(0)
+        self._m_file.write(self._header(self.m_num_packets).to_bytes())
+        self._m_file.seek(end)
+        self._m_file.flush()
+        os.fsync(self._m_file.fileno())
+
+    def close(self) -> Tuple[int, int]:
+        """
+        Write the last block, the index and the trailer and patch the packet count in the file header.
+
+        Returns:
+            - int: The number of packets written
+            - int: The number of bytes written after the file header
+        """
+        if self._m_file is None:
+            return self.m_num_packets, self.m_bytes_written
+
+        self.flushBlock()
+        index_offset = self._m_file.tell()
+        index = [self.INDEX_HEADER_STRUCT.pack(self.INDEX_MAGIC, len(self.m_index))]
+        index.extend(entry.to_bytes() for entry in self.m_index)
+        index.append(self.TRAILER_STRUCT.pack(index_offset, self.TRAILER_MAGIC))
+        index_bytes = b''.join(index)
+        self._m_file.write(index_bytes)
+        self.m_bytes_written += len(index_bytes)
+
+        self._m_file.seek(0)
+        self._m_file.write(self._header(self.m_num_packets).to_bytes())
+        self._m_file.close()
+        self._m_file = None
+        return self.m_num_packets, self.m_bytes_written
+
+    def abort(self) -> None:
+        """Close the file without finalising it. Everything up to the last written block is still readable"""
+        if self._m_file is not None:
+            self._m_file.close()
+            self._m_file = None
+
+    def _header(self, num_packets: int) -> F1PktCapFileHeader:
+        return F1PktCapFileHeader(
+            major_version=self.MAJOR_VERSION,
+            minor_version=self.MINOR_VERSION,
+            num_packets=num_packets,
+            is_little_endian=True,
+            is_compressed=self.m_compressed)
+
+class F1PcapStreamWriter:
+    """Appends packets to a v2 capture file from a background thread, so that captures don't have to be held in
+    memory and survive a crash.
+
+    add() only queues the packet and never blocks: if the bounded queue is full (disk can't keep up), the packet is
+    dropped and counted in num_dropped. The writer thread syncs the file (see F1PcapBlockWriter.sync) every
+    sync_interval seconds, so at most that much data is lost on a crash.
+    """
+
+    DEFAULT_QUEUE_SIZE = 16384 # ~20 MB, ~45 s of F1 telemetry
+    DEFAULT_SYNC_INTERVAL = 5.0
+
+    def __init__(self,
+                 file_name: str,
+                 compressed: bool = True,
+                 block_size: int = F1PcapBlockWriter.DEFAULT_BLOCK_SIZE,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 sync_interval: float = DEFAULT_SYNC_INTERVAL):
+        """
+        Create the file and start the writer thread.
+
+        Parameters:
+        - file_name (str): Path of the file. Overwritten if it exists.
+        - compressed (bool): Whether the blocks are zlib compressed.
+        - block_size (int): Uncompressed size after which a block is written.
+        - queue_size (int): Maximum number of packets waiting to be written.
+        - sync_interval (float): Seconds between syncs to disk.
+        """
+        self.m_file_name = file_name
+        self.m_sync_interval = sync_interval
+        self.num_dropped = 0
+        self._m_num_queued = 0
+        self._m_writer = F1PcapBlockWriter(file_name, compressed=compressed, block_size=block_size)
+        self._m_queue: "queue.Queue[Optional[Tuple[float, bytes]]]" = queue.Queue(maxsize=queue_size)
+        self._m_error: Optional[BaseException] = None
+        self._m_closed = False
+        self._m_thread = threading.Thread(target=self._run, name="F1PcapStreamWriter", daemon=True)
+        self._m_thread.start()
+
+    def __enter__(self) -> 'F1PcapStreamWriter':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def add(self, data: bytes, timestamp: Optional[float] = None) -> bool:
+        """
+        Queue a packet to be written.
+
+        Parameters:
+        - data (bytes): Raw packet.
+        - timestamp (float): The timestamp to be written, will be initialised with current time if not provided
+
+        Returns:
+        - bool: False if the packet was dropped (queue full, or the writer has failed/closed)
+        """
+        if self._m_closed or self._m_error:
+            self.num_dropped += 1
+            return False
+        try:
+            self._m_queue.put_nowait((time.time() if timestamp is None else timestamp, data))
+        except queue.Full:
+            self.num_dropped += 1
+            return False
+        self._m_num_queued += 1
+        return True
+
+    def getNumPackets(self) -> int:
+        """Get the number of packets accepted so far (written or waiting to be written)"""
+        return self._m_num_queued
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """The exception that stopped the writer thread, if any"""
+        return self._m_error
+
+    def close(self) -> Tuple[int, int]:
+        """
+        Write the queued packets and finalise the file (block index, header).
+
+        Returns:
+            - int: The number of packets written
+            - int: The number of bytes written after the file header
+
+        Raises:
+            - OSError: If the writer thread failed
+        """
+        if not self._m_closed:
+            self._m_closed = True
+            # A dead writer thread would never make room in a full queue
+            while self._m_thread.is_alive():
+                try:
+                    self._m_queue.put(None, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            self._m_thread.join()
+        if self._m_error:
+            raise OSError(f"Failed to write {self.m_file_name}: {self._m_error}") from self._m_error
+        return self._m_writer.m_num_packets, self._m_writer.m_bytes_written
+
+    def _run(self) -> None:
+        """Writer thread"""
+        writer = self._m_writer
+        next_sync = time.monotonic() + self.m_sync_interval
+        synced_packets = 0
+        stopping = False
+        try:
+            while True:
+                try:
+                    item = self._m_queue.get(timeout=max(0.0, next_sync - time.monotonic()))
+                except queue.Empty:
+                    item = ()
+                if item is None:
+                    stopping = True
+                    break
+                if item:
+                    writer.add(item[1], item[0])
+                if time.monotonic() >= next_sync:
+                    if writer.m_num_packets != synced_packets:
+                        writer.sync()
+                        synced_packets = writer.m_num_packets
+                    next_sync = time.monotonic() + self.m_sync_interval
+            writer.close()
+        except (OSError, ValueError) as e:
+            self._m_error = e
+            try:
+                writer.abort()
+            except OSError:
+                pass
+            # Keep draining until close() so that producers don't see a full queue
+            while not stopping:
+                stopping = self._m_queue.get() is None
+        except BaseException as e:
+            self._m_error = e # Reported by close()
+            try:
+                writer.abort()
+            except OSError:
+                pass
+            raise
+
+class F1PcapReader:
+    """Random access, memory mapped reader for capture files.
+
+    Unlike F1PacketCapture.readFromFile, nothing is decoded up front. v2 files are decoded one block at a time as
+    packets are requested. v1 files are supported too (only the packet offsets are indexed on open).
+
+    A v2 file without a valid index (e.g. writer killed before close) is recovered by scanning the blocks, stopping
+    at the first truncated or corrupt one. is_recovered is set in that case.
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Open and index the file.
+
+        Parameters:
+        - file_name (str): The capture file.
+
+        Raises:
+        - ValueError: If the file is not a capture file.
+        """
+        self.m_file_name = file_name
+        self.is_recovered = False
+        self._m_mm: Optional[mmap.mmap] = None
+        self._m_file: Optional[BinaryIO] = open(file_name, "rb")
+        try:
+            size = os.fstat(self._m_file.fileno()).st_size
+            if size < F1PktCapFileHeader.HEADER_LEN:
+                raise ValueError(f"{file_name} is too small to be a capture file")
+            self._m_mm = mmap.mmap(self._m_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._m_file.close()
+            raise
+
+        header_bytes = self._m_mm[:F1PktCapFileHeader.HEADER_LEN]
+        if not header_bytes.startswith(F1PktCapFileHeader.MAGIC_NUMBER):
+            self.close()
+            raise ValueError(f"{file_name} is not a capture file")
+        self.m_header = F1PktCapFileHeader.from_bytes(header_bytes)
+        self.m_blocks: List[F1PcapBlockIndexEntry] = []
+        self._m_block_starts: List[int] = []
+        self._m_v1_offsets: Optional[array] = None
+        self._m_cached_block: Optional[Tuple[int, List[Tuple[float, bytes]]]] = None
+
+        if self.m_header.major_version >= 2:
+            self._loadBlockIndex()
+            num_packets = sum(block.num_packets for block in self.m_blocks)
+        else:
+            self._loadV1Offsets()
+            num_packets = len(self._m_v1_offsets) - 1
+        if num_packets != self.m_header.num_packets:
+            self.m_header.num_packets = num_packets
+
+    def __enter__(self) -> 'F1PcapReader':
+        return self
+
+    def __exit__(self, *_args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.m_header.num_packets
+
+    def getNumPackets(self) -> int:
+        """Get the number of packets in the file"""
+        return self.m_header.num_packets
+
+    def getFirstTimestamp(self) -> Optional[float]:
+        """Returns the timestamp of the first packet in the capture, None if the capture is empty"""
+        return self.getPacket(0)[0] if len(self) else None
+
+    def getPacket(self, index: int) -> Tuple[float, bytes]:
+        """
+        Get a packet by index.
+
+        Parameters:
+        - index (int): The packet index.
+
+        Returns:
+        - Tuple[float, bytes]: The timestamp and data
+
+        Raises:
+        - IndexError: If the index is out of range
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("packet index out of range")
+        if self._m_v1_offsets is not None:
+            return self._readV1Packet(index)
+        block_index = bisect.bisect_right(self._m_block_starts, index) - 1
+        return self._decodeBlock(block_index)[index - self.m_blocks[block_index].first_packet]
+
+    def getPackets(self, start_timestamp: Optional[float] = None) -> Generator[Tuple[float, bytes], None, None]:
+        """
+        Generate the packets in file order.
+
+        Parameters:
+        - start_timestamp (float): If specified, skip straight to the block containing this timestamp (v2 files)
+            and skip the packets before it. Timestamps are assumed to be non decreasing.
+
+        Yields:
+        - Tuple[float, bytes]: A tuple containing timestamp (float) and data (bytes) for each packet.
+        """
+        if self._m_v1_offsets is not None:
+            for index in range(len(self)):
+                packet = self._readV1Packet(index)
+                if start_timestamp is None or packet[0] >= start_timestamp:
+                    yield packet
+            return
+
+        first_block = 0
+        if start_timestamp is not None:
+            first_block = max(0, bisect.bisect_right(
+                [block.first_timestamp for block in self.m_blocks], start_timestamp) - 1)
+        for block_index in range(first_block, len(self.m_blocks)):
+            # Don't go through the single block cache, sequential reads would just thrash it
+            packets = self._decodeBlock(block_index, use_cache=False)
+            if start_timestamp is None or block_index != first_block:
+                yield from packets
+            else:
+                yield from (packet for packet in packets if packet[0] >= start_timestamp)
+
+    def close(self) -> None:
+        """Unmap and close the file"""
+        self._m_cached_block = None
+        if self._m_mm is not None:
+            self._m_mm.close()
+            self._m_mm = None
+        if self._m_file is not None:
+            self._m_file.close()
+            self._m_file = None
+
+    def _loadBlockIndex(self) -> None:
+        """Load the block index from the end of the file, or rebuild it by scanning the blocks"""
+        mm = self._m_mm
+        trailer_len = F1PcapBlockWriter.TRAILER_STRUCT.size
+        index_header_len = F1PcapBlockWriter.INDEX_HEADER_STRUCT.size
+        entry_len = F1PcapBlockIndexEntry.ENTRY_STRUCT.size
+        if len(mm) >= F1PktCapFileHeader.HEADER_LEN + trailer_len:
+            index_offset, magic = F1PcapBlockWriter.TRAILER_STRUCT.unpack_from(mm, len(mm) - trailer_len)
+            if magic == F1PcapBlockWriter.TRAILER_MAGIC and index_offset + index_header_len <= len(mm):
+                magic, num_blocks = F1PcapBlockWriter.INDEX_HEADER_STRUCT.unpack_from(mm, index_offset)
+                if magic == F1PcapBlockWriter.INDEX_MAGIC and \
+                        index_offset + index_header_len + num_blocks * entry_len + trailer_len == len(mm):
+                    self.m_blocks = [
+                        F1PcapBlockIndexEntry.from_bytes(mm, index_offset + index_header_len + i * entry_len)
+                        for i in range(num_blocks)
+                    ]
+                    self._m_block_starts = [block.first_packet for block in self.m_blocks]
+                    return
+
+        # No usable index. Walk the blocks until the data runs out or stops making sense
+        self.is_recovered = True
+        offset = F1PktCapFileHeader.HEADER_LEN
+        block_header = F1PcapBlockWriter.BLOCK_HEADER_STRUCT
+        first_packet = 0
+        while offset + block_header.size <= len(mm):
+            magic, payload_len, _raw_len, num_packets, crc = block_header.unpack_from(mm, offset)
+            payload_start = offset + block_header.size
+            if magic != F1PcapBlockWriter.BLOCK_MAGIC or payload_start + payload_len > len(mm) or \
+                    zlib.crc32(mm[payload_start:payload_start + payload_len]) != crc:
+                break
+            entry = F1PcapBlockIndexEntry(offset, first_packet, num_packets, 0.0,
+                                          F1PcapBlockIndexEntry.UNKNOWN_FRAME_ID,
+                                          (0,) * F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS)
+            self.m_blocks.append(entry)
+            self._m_block_starts.append(first_packet)
+            packets = self._decodeBlock(len(self.m_blocks) - 1, use_cache=False)
+            histogram = [0] * F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS
+            for _, data in packets:
+                histogram[min(_peekPacketId(data), F1PcapBlockIndexEntry.NUM_PACKET_ID_BUCKETS - 1)] += 1
+            entry.first_timestamp = packets[0][0] if packets else 0.0
+            entry.first_frame_id = _peekFrameId(packets[0][1]) if packets else entry.first_frame_id
+            entry.packet_id_histogram = tuple(histogram)
+            first_packet += num_packets
+            offset = payload_start + payload_len
+
+    def _decodeBlock(self, block_index: int, use_cache: bool = True) -> List[Tuple[float, bytes]]:
+        """Decode all packets of a block"""
+        if use_cache and self._m_cached_block and self._m_cached_block[0] == block_index:
+            return self._m_cached_block[1]
+
+        block_header = F1PcapBlockWriter.BLOCK_HEADER_STRUCT
+        offset = self.m_blocks[block_index].offset
+        magic, payload_len, raw_len, num_packets, _crc = block_header.unpack_from(self._m_mm, offset)
+        if magic != F1PcapBlockWriter.BLOCK_MAGIC:
+            raise ValueError(f"Corrupt block {block_index} at offset {offset} in {self.m_file_name}")
+        payload = self._m_mm[offset + block_header.size:offset + block_header.size + payload_len]
+        if self.m_header.is_compressed:
+            try:
+                payload = zlib.decompress(payload)
+            except zlib.error as e:
+                raise ValueError(f"Block {block_index} decompression failed: {e}") from e
+        if len(payload) != raw_len:
+            raise ValueError(f"Block {block_index} length mismatch. Header length: {raw_len}, "
+                             f"Actual length: {len(payload)}")
+
+        record_header = F1PcapBlockWriter.RECORD_HEADER_STRUCT
+        packets: List[Tuple[float, bytes]] = []
+        pos = 0
+        for _ in range(num_packets):
+            timestamp, length = record_header.unpack_from(payload, pos)
+            pos += record_header.size
+            packets.append((timestamp, payload[pos:pos + length]))
+            pos += length
+
+        if use_cache:
+            self._m_cached_block = (block_index, packets)
+        return packets
+
+    def _loadV1Offsets(self) -> None:
+        """Index the packet offsets of a v1 file (the packet headers are read, the payloads are not)"""
+        mm = self._m_mm
+        length_struct = struct.Struct(f'{self.m_header.getEndiannessStr()}I')
+        offsets = array('Q', [F1PktCapFileHeader.HEADER_LEN])
+        offset = F1PktCapFileHeader.HEADER_LEN
+        while offset + F1PktCapMessage.HEADER_LEN <= len(mm):
+            (data_length,) = length_struct.unpack_from(mm, offset + 4)
+            if offset + F1PktCapMessage.HEADER_LEN + data_length > len(mm):
+                break # Truncated tail
+            offset += F1PktCapMessage.HEADER_LEN + data_length
+            offsets.append(offset)
+        self._m_v1_offsets = offsets
+        self._m_v1_helper: CompressionHelper = ZlibCompressionHelper() if self.m_header.is_compressed \
+            else NoCompressionHelper()
+
+    def _readV1Packet(self, index: int) -> Tuple[float, bytes]:
+        start, end = self._m_v1_offsets[index], self._m_v1_offsets[index + 1]
+        entry = F1PktCapMessage.from_bytes(self._m_mm[start:end], self.m_header.is_little_endian, self._m_v1_helper)
+        return entry.m_timestamp, entry.m_data
+
+class F1PacketRingBuffer:
+    """Fixed size, preallocated ring of the most recent raw packets, for on-demand capture of what just happened.
+
+    Packets are copied into one preallocated byte buffer of byte_budget bytes, with their offset, length and timestamp
+    in preallocated arrays, so add() doesn't allocate. The oldest packets are overwritten when the buffer is full.
+    Not thread safe, add() and snapshot() must be called from the same thread (event loop).
+    """
+
+    MIN_AVG_PACKET_LEN = 64 # Sizes the metadata arrays. F1 packets are much larger on average
+    SNAPSHOT_CHUNK_SIZE = 4 * 1024 * 1024
+
+    def __init__(self, byte_budget: int):
+        """
+        Allocate the ring.
+
+        Parameters:
+        - byte_budget (int): Size of the packet data buffer in bytes.
+
+        Raises:
+        - ValueError: If byte_budget is not positive.
+        """
+        if byte_budget <= 0:
+            raise ValueError("byte_budget must be greater than zero")
+        self.m_byte_budget = byte_budget
+        self.m_max_packets = max(1, byte_budget // self.MIN_AVG_PACKET_LEN)
+        self.num_oversized = 0
+        self._m_buffer = bytearray(byte_budget)
+        self._m_view = memoryview(self._m_buffer)
+        self._m_offsets = array('Q', bytes(8 * self.m_max_packets))
+        self._m_lengths = array('I', bytes(4 * self.m_max_packets))
+        self._m_timestamps = array('d', bytes(8 * self.m_max_packets))
+        self._m_head = 0 # Slot of the oldest packet
+        self._m_count = 0
+        self._m_write_pos = 0
+        self._m_bytes_consumed = 0 # Monotonic count of buffer bytes written (or skipped on wrap around)
+
+    def __len__(self) -> int:
+        return self._m_count
+
+    def add(self, data: bytes, timestamp: float) -> None:
+        """
+        Copy a packet into the ring, overwriting the oldest packets if required.
+
+        Parameters:
+        - data (bytes): Raw packet.
+        - timestamp (float): Receive timestamp.
+        """
+        length = len(data)
+        budget = self.m_byte_budget
+        if length > budget:
+            self.num_oversized += 1
+            return
+
+        offsets = self._m_offsets
+        lengths = self._m_lengths
+        max_packets = self.m_max_packets
+        head = self._m_head
+        count = self._m_count
+        pos = self._m_write_pos
+        if pos + length > budget:
+            # Wrap around. Everything between pos and the end of the buffer is older than what's at the start
+            self._m_bytes_consumed += budget - pos
+            while count and offsets[head] >= pos:
+                head += 1
+                count -= 1
+                if head == max_packets:
+                    head = 0
+            pos = 0
+        end = pos + length
+
+        # Evict the oldest packets that overlap the region being written
+        while count:
+            offset = offsets[head]
+            if offset >= end or offset + lengths[head] <= pos:
+                break
+            head += 1
+            count -= 1
+            if head == max_packets:
+                head = 0
+        if count == max_packets:
+            head += 1
+            count -= 1
+            if head == max_packets:
+                head = 0
+
+        self._m_view[pos:end] = data
+        slot = head + count
+        if slot >= max_packets:
+            slot -= max_packets
+        offsets[slot] = pos
+        lengths[slot] = length
+        self._m_timestamps[slot] = timestamp
+        self._m_head = head
+        self._m_count = count + 1
+        self._m_write_pos = end
+        self._m_bytes_consumed += length
+
+    def clear(self) -> None:
+        """Drop all packets (the memory stays allocated)"""
+        self._m_head = 0
+        self._m_count = 0
+        self._m_write_pos = 0
+
+    def snapshot(self, max_age: Optional[float] = None) -> 'F1PacketRingSnapshot':
+        """
+        Copy the ring contents in one go.
+
+        Parameters:
+        - max_age (float): If specified, only packets whose timestamp is within max_age seconds of the newest one.
+
+        Returns:
+        - F1PacketRingSnapshot: The snapshot
+        """
+        offsets, lengths, timestamps = self._copyRecords(max_age)
+        return F1PacketRingSnapshot(bytes(self._m_buffer), offsets, lengths, timestamps)
+
+    async def snapshotAsync(self,
+                            max_age: Optional[float] = None,
+                            chunk_size: int = SNAPSHOT_CHUNK_SIZE) -> 'F1PacketRingSnapshot':
+        """
+        Copy the ring contents in chunks, yielding to the event loop between chunks so that packet processing isn't
+        held up. The chunks are copied oldest first, i.e. in the order add() overwrites them, so a packet is only lost
+        if add() laps the copy (in which case it is left out of the snapshot).
+
+        Parameters:
+        - max_age (float): If specified, only packets whose timestamp is within max_age seconds of the newest one.
+        - chunk_size (int): Bytes copied per event loop iteration.
+
+        Returns:
+        - F1PacketRingSnapshot: The snapshot
+        """
+        offsets, lengths, timestamps = self._copyRecords(max_age)
+        budget = self.m_byte_budget
+        start_pos = self._m_write_pos
+        start_consumed = self._m_bytes_consumed
+        buffer = bytearray(budget)
+        dest = memoryview(buffer)
+
+        # Distance is measured in ring order from start_pos, i.e. from the oldest data
+        copied_upto = 0
+        lost_upto = 0
+        while copied_upto < budget:
+            overwritten = self._m_bytes_consumed - start_consumed
+            if overwritten > copied_upto:
+                lost_upto = min(budget, overwritten)
+                copied_upto = max(copied_upto, lost_upto)
+                if copied_upto >= budget:
+                    break
+            chunk_end = min(budget, copied_upto + chunk_size)
+            src_start = (start_pos + copied_upto) % budget
+            src_end = src_start + (chunk_end - copied_upto)
+            if src_end > budget: # Split at the end of the buffer
+                src_end = budget
+                chunk_end = copied_upto + (budget - src_start)
+            dest[src_start:src_end] = self._m_view[src_start:src_end]
+            copied_upto = chunk_end
+            await asyncio.sleep(0)
+
+        if lost_upto:
+            keep = [i for i in range(len(offsets)) if (offsets[i] - start_pos) % budget >= lost_upto]
+            offsets = array('Q', (offsets[i] for i in keep))
+            lengths = array('I', (lengths[i] for i in keep))
+            timestamps = array('d', (timestamps[i] for i in keep))
+        return F1PacketRingSnapshot(bytes(buffer), offsets, lengths, timestamps)
+
+    def _copyRecords(self, max_age: Optional[float]) -> Tuple[array, array, array]:
+        """Copy the metadata of the packets in the ring, oldest first"""
+        head, count = self._m_head, self._m_count
+        end = head + count
+        def _slice(arr: array) -> array:
+            if end <= self.m_max_packets:
+                return arr[head:end]
+            return arr[head:] + arr[:end - self.m_max_packets]
+        offsets, lengths, timestamps = _slice(self._m_offsets), _slice(self._m_lengths), _slice(self._m_timestamps)
+        if max_age is not None and count:
+            first = bisect.bisect_left(timestamps, timestamps[-1] - max_age)
+            offsets, lengths, timestamps = offsets[first:], lengths[first:], timestamps[first:]
+        return offsets, lengths, timestamps
+
+class F1PacketRingSnapshot:
+    """Point in time copy of an F1PacketRingBuffer"""
+
+    def __init__(self, buffer: bytes, offsets: array, lengths: array, timestamps: array):
+        """
+        Parameters:
+        - buffer (bytes): Copy of the ring's data buffer.
+        - offsets (array): Offsets of the packets in the buffer, oldest first.
+        - lengths (array): Lengths of the packets.
+        - timestamps (array): Timestamps of the packets.
+        """
+        self._m_buffer = buffer
+        self._m_offsets = offsets
+        self._m_lengths = lengths
+        self._m_timestamps = timestamps
+
+    def __len__(self) -> int:
+        return len(self._m_offsets)
+
+    def getPackets(self) -> Generator[Tuple[float, bytes], None, None]:
+        """
+        Generate the packets, oldest first.
+
+        Yields:
+        - Tuple[float, bytes]: A tuple containing timestamp (float) and data (bytes) for each packet.
+        """
+        buffer = self._m_buffer
+        for timestamp, offset, length in zip(self._m_timestamps, self._m_offsets, self._m_lengths):
+            yield timestamp, buffer[offset:offset + length]
+
+    def dumpToFile(self, file_name: str) -> Tuple[str, int, int]:
+        """
+        Write the packets to a (v2) capture file. Blocking, run it in a worker thread from async code.
+
+        Parameters:
+        - file_name (str): Path of the file.
+
+        Returns:
+            - str: The filename
+            - int: The number of packets written
+            - int: The number of bytes written after the file header
+        """
+        with F1PcapBlockWriter(file_name) as writer:
+            for timestamp, data in self.getPackets():
+                writer.add(data, timestamp)
+        return file_name, writer.m_num_packets, writer.m_bytes_written
+
 class F1PacketCapture:
     """Represents a collection of F1PktCapMessage objects."""
 
-    major_ver = 1
-    minor_ver = 1
+    major_ver = F1PcapBlockWriter.MAJOR_VERSION
+    minor_ver = F1PcapBlockWriter.MINOR_VERSION
     is_little_endian = (sys.byteorder == "little")
     file_extension = "f1pcap"
 
@@ -369,7 +1178,8 @@ class F1PacketCapture:
     def dumpToFile(self,
         file_name: Optional[str] = None,
         progress_update_callback: Optional[Callable] = None,
-        progress_update_callback_arg: Optional[Any] = None) -> Tuple[str, int, int]:
+        progress_update_callback_arg: Optional[Any] = None,
+        major_version: Optional[int] = None) -> Tuple[str, int, int]:
         """
         Dump the packet history to a binary file.
 
@@ -380,6 +1190,8 @@ class F1PacketCapture:
                     - The total number of packets
                     - The optional argument passed in
             - progress_update_callback_arg (Any): Optional argument passed to the progress_update_callback
+            - major_version (int, optional): File format version, 1 (per packet compression) or
+                    2 (block compression with an index, default).
 
         Returns:
             - str: The filename where the data is saved. None if nothing is written
@@ -397,11 +1209,25 @@ class F1PacketCapture:
         byte_count = 0
         packets_snapshot = list(self.m_packet_history)
         total_packet_count = len(packets_snapshot)
+        if major_version is None:
+            major_version = self.major_ver
+
+        if major_version >= 2:
+            with F1PcapBlockWriter(file_name, compressed=bool(self.is_compressed)) as writer:
+                for curr_packet_count, entry in enumerate(packets_snapshot):
+                    writer.add(entry.m_data, entry.m_timestamp)
+                    if progress_update_callback:
+                        if progress_update_callback_arg:
+                            progress_update_callback(curr_packet_count, total_packet_count,
+                                                     progress_update_callback_arg)
+                        else:
+                            progress_update_callback(curr_packet_count, total_packet_count)
+            return file_name, total_packet_count, writer.m_bytes_written
 
         # Construct the header
         header = F1PktCapFileHeader(
-            major_version=self.major_ver,
-            minor_version=self.minor_ver,
+            major_version=1,
+            minor_version=1,
             num_packets=total_packet_count,
             is_little_endian=self.is_little_endian,
             is_compressed=self.is_compressed)
@@ -439,10 +1265,10 @@ class F1PacketCapture:
             # First, fetch the file header
             self.m_header = F1PktCapFileHeader.from_bytes(file.read(F1PktCapFileHeader.HEADER_LEN))
             endianness_str = self.m_header.getEndiannessStr()
-            if self.m_header.is_compressed:
-                self.m_compression_helper = ZlibCompressionHelper()
-            else:
-                self.m_compression_helper = NoCompressionHelper()
+            self.set_compressed(self.m_header.is_compressed)
+            if self.m_header.major_version >= 2:
+                self._readBlocksFromFile(file_name)
+                return
 
             # Next process all the packets
             while True:
@@ -471,6 +1297,17 @@ class F1PacketCapture:
             print(f"[WARN]: Number of packets in the file {self.m_header.num_packets} does not match the header "
                              f"{len(self.m_packet_history)}. Possibly corrupt file", file=sys.stderr)
 
+    def _readBlocksFromFile(self, file_name: str) -> None:
+        """Populate the packet history from a v2 (block) file"""
+        with F1PcapReader(file_name) as reader:
+            if reader.is_recovered:
+                print(f"[WARN]: {file_name} has no valid block index. Recovered {reader.getNumPackets()} packets",
+                      file=sys.stderr)
+            self.m_packet_history.extend(
+                F1PktCapMessage(data, timestamp, self.m_header.is_little_endian)
+                for timestamp, data in reader.getPackets())
+            self.m_header.num_packets = len(self.m_packet_history)
+
     def getPackets(self) -> Generator[Tuple[float, bytes], None, None]:
         """
         Generate packets from the packet history.
@@ -495,3 +1332,13 @@ class F1PacketCapture:
 
         self.m_packet_history.clear()
         self.m_header.num_packets = 0
+
+def _peekPacketId(data: bytes) -> int:
+    """Get the packet ID from a raw packet header without parsing it (0 if the packet is too short)"""
+    return data[6] if len(data) > 6 else 0
+
+def _peekFrameId(data: bytes) -> int:
+    """Get the frame identifier from a raw packet header without parsing it"""
+    if len(data) < 23:
+        return F1PcapBlockIndexEntry.UNKNOWN_FRAME_ID
+    return struct.unpack_from('<I', data, 19)[0]
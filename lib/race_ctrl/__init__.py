@@ -28,6 +28,7 @@ from .messages import (CarDamageRaceControlMessage, DriverAiStatusChange,
                        DriverPittingRaceCtrlMsg, MessageType, RaceCtrlMsgBase,
                        TyreChangeRaceControlMessage, WingChangeRaceCtrlMsg)
 from .session_mgr import SessionRaceControlManager
+from .store import RaceCtrlMsgStore, RaceCtrlMsgView
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
 
@@ -36,6 +37,8 @@ __all__ = [
     "RaceCtrlMsgBase",
     "DriverRaceControlManager",
     "SessionRaceControlManager",
+    "RaceCtrlMsgStore",
+    "RaceCtrlMsgView",
     "race_ctrl_event_msg_factory",
 
     # Status messages
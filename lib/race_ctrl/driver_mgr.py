@@ -22,7 +22,7 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from .messages import RaceCtrlMsgBase
 
@@ -35,14 +35,17 @@ class DriverRaceControlManager:
     """
     Manager for race control messages specific to a single driver.
 
+    Once registered with a session manager, the messages live in the session's store and this manager only holds a
+    view of the ones filed under this driver.
+
     Attributes:
         driver_index (int): Unique identifier of the driver.
-        messages (List[RaceControlMessage]): References to messages involving this driver.
+        messages (Sequence[RaceControlMessage]): Messages involving this driver.
     """
 
     def __init__(self, driver_index: int) -> None:
         self.driver_index: int = driver_index
-        self.messages: List[RaceCtrlMsgBase] = []
+        self.messages: Sequence[RaceCtrlMsgBase] = []
         self.session_mgr: Optional["SessionRaceControlManager"] = None
 
     def add_message(self, message: RaceCtrlMsgBase, propagate: bool = True) -> None:
@@ -53,19 +56,23 @@ class DriverRaceControlManager:
             propagate (bool): Whether to propagate the message to the session manager.
                             If true, the message will be added to the session manager as well.
         """
-        self.messages.append(message)
         if propagate:
             assert self.session_mgr
-            self.session_mgr.add_message(message, is_propagated=True)
+            self.session_mgr.add_message(message, is_propagated=True, source_driver=self.driver_index)
+        elif isinstance(self.messages, list):
+            self.messages.append(message)
+        # else: the session manager has already filed this message under this driver
 
     def clear(self) -> None:
         """Clear all stored messages for this driver."""
-        self.messages.clear()
+        if isinstance(self.messages, list):
+            self.messages.clear()
 
     def register_session_manager(self, manager: "SessionRaceControlManager") -> None:
         """Register a session manager with this driver manager."""
         self.session_mgr = manager
+        self.messages = manager.driver_messages(self.driver_index)
 
-    def toJSON(self, driver_info: Optional[dict] = None) -> Dict[str, Any]:
+    def toJSON(self, driver_info: Optional[dict] = None) -> List[Dict[str, Any]]:
         """Export all driver messages as JSON-ready dicts with implicit IDs."""
         return [msg.toJSON(driver_info) for msg in self.messages]
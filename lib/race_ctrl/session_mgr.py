@@ -25,7 +25,8 @@
 from typing import Dict, List, Optional
 
 from .driver_mgr import DriverRaceControlManager
-from .messages import RaceCtrlMsgBase
+from .messages import MessageType, RaceCtrlMsgBase
+from .store import RaceCtrlMsgStore
 
 # -------------------------------------- CLASSES -----------------------------------------------------------------------
 
@@ -34,55 +35,95 @@ class SessionRaceControlManager:
     Manager for all race control messages in a session.
 
     Attributes:
-        messages (List[RaceControlMessage]): All messages in this session.
+        store (RaceCtrlMsgStore): Indexed store of all messages in this session.
         drivers (Dict[int, DriverRaceControlManager]): Per-driver managers.
     """
 
-    def __init__(self) -> None:
-        self.messages: List[RaceCtrlMsgBase] = []
+    def __init__(self,
+                 max_in_memory: Optional[int] = None,
+                 spill_to_disk: bool = True,
+                 spill_dir: Optional[str] = None) -> None:
+        """Create an empty session manager. The arguments are passed on to RaceCtrlMsgStore.
+
+        Args:
+            max_in_memory (Optional[int]): Number of messages kept in memory. None (default) for unbounded.
+            spill_to_disk (bool): Whether messages evicted from memory are written to disk. Defaults to True.
+            spill_dir (Optional[str]): Directory for the spill file. None for the platform temp dir.
+        """
+        self.store: RaceCtrlMsgStore = RaceCtrlMsgStore(max_in_memory, spill_to_disk, spill_dir)
         self.drivers: Dict[int, DriverRaceControlManager] = {}
 
+    @property
+    def messages(self) -> RaceCtrlMsgStore:
+        """All messages in this session, indexable by message ID."""
+        return self.store
+
+    @property
+    def last_id(self) -> Optional[int]:
+        """ID of the latest message, None if there are no messages."""
+        return self.store.last_id
+
     def register_driver(self, driver_index: int, driver_mgr: DriverRaceControlManager) -> None:
         """Register a driver manager with this session."""
         self.drivers[driver_index] = driver_mgr
         driver_mgr.register_session_manager(self)
 
-    def add_message(self, message: RaceCtrlMsgBase, is_propagated: bool = False) -> int:
+    def add_message(self,
+                    message: RaceCtrlMsgBase,
+                    is_propagated: bool = False,
+                    source_driver: Optional[int] = None) -> int:
         """
         Add a race control message to the session and relevant drivers.
 
         Args:
             message (RaceCtrlMsgBase): The message to add.
             is_propagated (bool): Whether the message is propagated from the driver to the session. If true, the message
-                                  will not be added to the driver manager (given that the message came from the driver).
+                                  will only be filed under the driver it came from (source_driver).
+            source_driver (Optional[int]): Index of the driver a propagated message came from.
 
         Returns:
             int: The message ID (its index in the session list).
         """
-        message._id = len(self.messages)
-        self.messages.append(message)
         if is_propagated:
-            return message._id
-
-        for driver_idx in message.involved_drivers:
-            if driver_mgr := self.drivers.get(driver_idx):
-                driver_mgr.add_message(message, propagate=False)
-
-        return message._id
+            driver_indices = [] if source_driver is None else [source_driver]
+        else:
+            driver_indices = [idx for idx in message.involved_drivers if idx in self.drivers]
+        return self.store.append(message, driver_indices)
+
+    def driver_messages(self, driver_index: int):
+        """Live view of the messages filed under a driver."""
+        return self.store.view(driver_index)
+
+    def query(self,
+              since_id: Optional[int] = None,
+              driver_index: Optional[int] = None,
+              lap_number: Optional[int] = None,
+              message_type: Optional[MessageType] = None,
+              limit: Optional[int] = None) -> List[RaceCtrlMsgBase]:
+        """Get the messages matching the given filters, in ID order. See RaceCtrlMsgStore.query"""
+        return self.store.query(since_id=since_id, driver_index=driver_index, lap_number=lap_number,
+                                message_type=message_type, limit=limit)
 
     def clear(self) -> None:
         """Clear all session and driver messages. All registered drivers are automatically un-registered"""
-        self.messages.clear()
+        self.store.clear()
         for driver_mgr in self.drivers.values():
             driver_mgr.clear()
         self.drivers.clear()
 
-    def toJSON(self, driver_info_dict: Optional[Dict[int, dict]] = None) -> List[dict]:
-        """Export all session messages as JSON-ready dicts with implicit IDs.
+    def toJSON(self,
+               driver_info_dict: Optional[Dict[int, dict]] = None,
+               since_id: Optional[int] = None,
+               limit: Optional[int] = None,
+               **filters) -> List[dict]:
+        """Export session messages as JSON-ready dicts with implicit IDs.
 
         Args:
             driver_info_dict (Optional[Dict[int, dict]]): Optional driver info dict.
             If specified, the driver info will be added to the message JSON. The dict must be a mapping of index against
             driver info JSON, which contains the following keys: `name`, `team`, `driver-number`.
+            since_id (Optional[int]): Only export messages with an ID greater than this.
+            limit (Optional[int]): Maximum number of messages.
+            **filters: Other RaceCtrlMsgStore.query filters (driver_index, lap_number, message_type, ...)
         """
-        return [msg.toJSON(driver_info_dict) for msg in self.messages]
+        return self.store.toJSON(driver_info_dict, since_id=since_id, limit=limit, **filters)
@@ -0,0 +1,369 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import bisect
+import pickle
+import tempfile
+from array import array
+from collections import defaultdict, deque
+from typing import (
+    IO, Any, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, overload)
+
+from .messages import MessageType, RaceCtrlMsgBase
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class RaceCtrlMsgStore(Sequence[RaceCtrlMsgBase]):
+    """
+    Indexed store of race control messages.
+
+    Message IDs are assigned sequentially from 0, so the store can be used as a list indexed by ID. Messages are
+    indexed by driver, lap number and message type, and can be queried incrementally ("everything after ID N"),
+    which is what clients polling for updates need.
+
+    Memory can optionally be bounded: only the latest `max_in_memory` messages are kept as objects. Older messages
+    are spilled to a temporary file (and loaded back on access, as new objects) or discarded if spilling is disabled.
+    The indexes of discarded messages are trimmed every `max_in_memory` discards.
+
+    Attributes:
+        max_in_memory (Optional[int]): Number of messages kept in memory. None for unbounded.
+        spill_to_disk (bool): Whether messages evicted from memory are written to disk (else they are discarded).
+        spill_dir (Optional[str]): Directory for the spill file. None for the platform temp dir.
+    """
+
+    def __init__(self,
+                 max_in_memory: Optional[int] = None,
+                 spill_to_disk: bool = True,
+                 spill_dir: Optional[str] = None) -> None:
+        """Create an empty store.
+
+        Args:
+            max_in_memory (Optional[int]): Number of messages kept in memory. None for unbounded.
+            spill_to_disk (bool): Whether messages evicted from memory are written to disk. Defaults to True.
+            spill_dir (Optional[str]): Directory for the spill file. None for the platform temp dir.
+
+        Raises:
+            ValueError: If max_in_memory is not greater than zero.
+        """
+        if max_in_memory is not None and max_in_memory <= 0:
+            raise ValueError("max_in_memory must be greater than zero")
+
+        self.max_in_memory: Optional[int] = max_in_memory
+        self.spill_to_disk: bool = spill_to_disk
+        self.spill_dir: Optional[str] = spill_dir
+
+        self._recent: Deque[RaceCtrlMsgBase] = deque()
+        self._num_messages: int = 0 # Also the next message ID
+        self._by_driver: Dict[int, List[int]] = defaultdict(list)
+        self._by_lap: Dict[Optional[int], List[int]] = defaultdict(list)
+        self._by_type: Dict[MessageType, List[int]] = defaultdict(list)
+        self._by_time: List[Tuple[float, int]] = []
+        self._indexed_from_id: int = 0 # Indexes hold no IDs below this (discarded messages are trimmed in batches)
+
+        self._spill_file: Optional[IO[bytes]] = None
+        self._spill_offsets: array = array("Q", [0]) # Message ID i is stored at [offsets[i], offsets[i + 1])
+
+    # ---------------------------------- Updates ----------------------------------
+
+    def append(self, message: RaceCtrlMsgBase, driver_indices: Optional[Sequence[int]] = None) -> int:
+        """Add a message, assigning it the next ID.
+
+        Args:
+            message (RaceCtrlMsgBase): The message.
+            driver_indices (Optional[Sequence[int]]): Drivers this message is filed under.
+                Defaults to the message's involved drivers.
+
+        Returns:
+            int: The message ID.
+        """
+        msg_id = self._num_messages
+        message._id = msg_id
+        self._num_messages += 1
+        self._recent.append(message)
+
+        for driver_index in (message.involved_drivers if driver_indices is None else driver_indices):
+            ids = self._by_driver[driver_index]
+            if not ids or ids[-1] != msg_id:
+                ids.append(msg_id)
+        self._by_lap[message.lap_number].append(msg_id)
+        self._by_type[message.message_type].append(msg_id)
+        if self._by_time and message.timestamp < self._by_time[-1][0]:
+            # Session time can go backwards (e.g. flashbacks)
+            bisect.insort(self._by_time, (message.timestamp, msg_id))
+        else:
+            self._by_time.append((message.timestamp, msg_id))
+
+        if self.max_in_memory is not None and len(self._recent) > self.max_in_memory:
+            self._evict(self._recent.popleft())
+        return msg_id
+
+    def clear(self) -> None:
+        """Remove all messages and reset the IDs. Views returned by this store remain valid."""
+        self._recent.clear()
+        self._num_messages = 0
+        for index in (self._by_driver, self._by_lap, self._by_type):
+            for ids in index.values():
+                ids.clear()
+        self._by_time.clear()
+        self._indexed_from_id = 0
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_offsets = array("Q", [0])
+
+    def close(self) -> None:
+        """Release the spill file. Spilled messages are lost"""
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+
+    # ---------------------------------- Access ----------------------------------
+
+    @property
+    def last_id(self) -> Optional[int]:
+        """ID of the latest message, None if the store is empty."""
+        return self._num_messages - 1 if self._num_messages else None
+
+    @property
+    def first_available_id(self) -> int:
+        """ID of the oldest message that can still be read."""
+        if self.spill_to_disk:
+            return 0
+        return self._num_messages - len(self._recent)
+
+    def get(self, msg_id: int) -> Optional[RaceCtrlMsgBase]:
+        """Get a message by ID.
+
+        Args:
+            msg_id (int): The message ID.
+
+        Returns:
+            Optional[RaceCtrlMsgBase]: The message. Spilled messages are loaded as new objects.
+                None if the ID is unknown or the message was discarded.
+        """
+        if not 0 <= msg_id < self._num_messages:
+            return None
+        recent_base = self._num_messages - len(self._recent)
+        if msg_id >= recent_base:
+            return self._recent[msg_id - recent_base]
+        if self._spill_file is None or msg_id + 1 >= len(self._spill_offsets):
+            return None
+        start, end = self._spill_offsets[msg_id], self._spill_offsets[msg_id + 1]
+        self._spill_file.seek(start)
+        return pickle.loads(self._spill_file.read(end - start))
+
+    def view(self, driver_index: int) -> "RaceCtrlMsgView":
+        """Get a live, read only sequence of the messages filed under a driver.
+
+        Args:
+            driver_index (int): The driver index.
+
+        Returns:
+            RaceCtrlMsgView: The view
+        """
+        return RaceCtrlMsgView(self, self._by_driver[driver_index])
+
+    def query(self,
+              since_id: Optional[int] = None,
+              driver_index: Optional[int] = None,
+              lap_number: Optional[int] = None,
+              message_type: Optional[MessageType] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              limit: Optional[int] = None) -> List[RaceCtrlMsgBase]:
+        """Get the messages matching all the given filters, in ID order.
+
+        Args:
+            since_id (Optional[int]): Only messages with an ID greater than this (cursor from a previous query).
+            driver_index (Optional[int]): Only messages filed under this driver.
+            lap_number (Optional[int]): Only messages from this lap.
+            message_type (Optional[MessageType]): Only messages of this type.
+            start_time (Optional[float]): Only messages with timestamp >= this.
+            end_time (Optional[float]): Only messages with timestamp < this.
+            limit (Optional[int]): Maximum number of messages returned (the oldest ones).
+
+        Returns:
+            List[RaceCtrlMsgBase]: The messages. Discarded messages are skipped.
+        """
+        return [msg for msg_id in self.queryIds(since_id, driver_index, lap_number, message_type,
+                                                 start_time, end_time, limit)
+                if (msg := self.get(msg_id)) is not None]
+
+    def queryIds(self,
+                 since_id: Optional[int] = None,
+                 driver_index: Optional[int] = None,
+                 lap_number: Optional[int] = None,
+                 message_type: Optional[MessageType] = None,
+                 start_time: Optional[float] = None,
+                 end_time: Optional[float] = None,
+                 limit: Optional[int] = None) -> List[int]:
+        """Same as query(), returning the message IDs only (no disk access)."""
+
+        if limit is not None and limit <= 0:
+            return []
+
+        candidates: List[Sequence[int]] = []
+        if driver_index is not None:
+            candidates.append(self._by_driver.get(driver_index, []))
+        if lap_number is not None:
+            candidates.append(self._by_lap.get(lap_number, []))
+        if message_type is not None:
+            candidates.append(self._by_type.get(message_type, []))
+        if start_time is not None or end_time is not None:
+            lo = 0 if start_time is None else bisect.bisect_left(self._by_time, (start_time, -1))
+            hi = len(self._by_time) if end_time is None else bisect.bisect_left(self._by_time, (end_time, -1))
+            candidates.append(sorted(msg_id for _, msg_id in self._by_time[lo:hi]))
+        if not candidates:
+            candidates.append(range(self._num_messages))
+
+        # Walk the smallest index and probe the others
+        candidates.sort(key=len)
+        base, others = candidates[0], candidates[1:]
+        first_id = max(self.first_available_id, -1 if since_id is None else since_id + 1)
+        ret: List[int] = []
+        for pos in range(bisect.bisect_left(base, first_id), len(base)):
+            msg_id = base[pos]
+            if all(_contains(ids, msg_id) for ids in others):
+                ret.append(msg_id)
+                if limit is not None and len(ret) >= limit:
+                    break
+        return ret
+
+    def toJSON(self,
+               driver_info_dict: Optional[Dict[int, dict]] = None,
+               since_id: Optional[int] = None,
+               limit: Optional[int] = None,
+               **filters: Any) -> List[Dict[str, Any]]:
+        """Export the matching messages as JSON-ready dicts.
+
+        Args:
+            driver_info_dict (Optional[Dict[int, dict]]): Optional driver info dict, see RaceCtrlMsgBase.toJSON
+            since_id (Optional[int]): Only messages with an ID greater than this.
+            limit (Optional[int]): Maximum number of messages.
+            **filters: Other query() filters.
+
+        Returns:
+            List[Dict[str, Any]]: The messages JSON
+        """
+        return [msg.toJSON(driver_info_dict) for msg in self.query(since_id=since_id, limit=limit, **filters)]
+
+    # ---------------------------------- Sequence ----------------------------------
+
+    def __len__(self) -> int:
+        return self._num_messages
+
+    @overload
+    def __getitem__(self, index: int) -> RaceCtrlMsgBase: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[RaceCtrlMsgBase]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_messages))]
+        if index < 0:
+            index += self._num_messages
+        if not 0 <= index < self._num_messages:
+            raise IndexError("race control message ID out of range")
+        return self.get(index)
+
+    def __iter__(self) -> Iterator[RaceCtrlMsgBase]:
+        for msg_id in range(self.first_available_id, self._num_messages):
+            yield self.get(msg_id)
+
+    def __contains__(self, message: object) -> bool:
+        if not isinstance(message, RaceCtrlMsgBase) or message._id is None:
+            return False
+        return self.get(message._id) == message
+
+    # ---------------------------------- Internals ----------------------------------
+
+    def _evict(self, message: RaceCtrlMsgBase) -> None:
+        """Move the oldest in-memory message out of memory"""
+        if not self.spill_to_disk:
+            if self.first_available_id - self._indexed_from_id >= self.max_in_memory:
+                self._trimIndexes()
+            return
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile(prefix="png_race_ctrl_", dir=self.spill_dir)
+        blob = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spill_file.seek(0, 2)
+        self._spill_file.write(blob)
+        self._spill_offsets.append(self._spill_offsets[-1] + len(blob))
+
+    def _trimIndexes(self) -> None:
+        """Drop the IDs of discarded messages from the indexes. Driver ID lists are trimmed in place (views share
+        them), empty lap and type lists are removed."""
+        first_id = self.first_available_id
+        for driver_ids in self._by_driver.values():
+            del driver_ids[:bisect.bisect_left(driver_ids, first_id)]
+        for index in (self._by_lap, self._by_type):
+            for key in list(index):
+                ids = index[key]
+                del ids[:bisect.bisect_left(ids, first_id)]
+                if not ids:
+                    del index[key]
+        self._by_time = [entry for entry in self._by_time if entry[1] >= first_id]
+        self._indexed_from_id = first_id
+
+class RaceCtrlMsgView(Sequence[RaceCtrlMsgBase]):
+    """
+    Live, read only sequence of the messages filed under one driver in a RaceCtrlMsgStore. Discarded messages
+    are not part of the view.
+    """
+
+    def __init__(self, store: RaceCtrlMsgStore, ids: List[int]) -> None:
+        self._store = store
+        self._ids = ids
+
+    def _available(self) -> List[int]:
+        """The IDs that can still be read"""
+        return self._ids[bisect.bisect_left(self._ids, self._store.first_available_id):]
+
+    def __len__(self) -> int:
+        return len(self._ids) - bisect.bisect_left(self._ids, self._store.first_available_id)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.get(msg_id) for msg_id in self._available()[index]]
+        start = bisect.bisect_left(self._ids, self._store.first_available_id)
+        if index < 0:
+            index += len(self._ids) - start
+        if not 0 <= index < len(self._ids) - start:
+            raise IndexError("race control message view index out of range")
+        return self._store.get(self._ids[start + index])
+
+    def __iter__(self) -> Iterator[RaceCtrlMsgBase]:
+        for msg_id in self._available():
+            yield self._store.get(msg_id)
+
+    def __contains__(self, message: object) -> bool:
+        if not isinstance(message, RaceCtrlMsgBase) or message._id is None:
+            return False
+        return _contains(self._ids, message._id) and self._store.get(message._id) == message
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def _contains(sorted_ids: Sequence[int], msg_id: int) -> bool:
+    """Binary search for an ID in an ascending sequence"""
+    pos = bisect.bisect_left(sorted_ids, msg_id)
+    return pos < len(sorted_ids) and sorted_ids[pos] == msg_id
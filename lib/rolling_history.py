@@ -73,6 +73,13 @@ class RollingHistory(Generic[T]):
         """
         self._data.append(value)
 
+    @property
+    def maxlen(self) -> int:
+        """
+        Return the maximum number of values retained.
+        """
+        return self._data.maxlen
+
     @property
     def latest(self) -> Optional[T]:
         """
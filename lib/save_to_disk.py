@@ -23,14 +23,24 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
-import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 import aiofiles
+import orjson
 
+from lib.config import SaveFileFormat
 from lib.file_path import resolve_user_file
+from lib.sectioned_save import SECTIONED_SAVE_SUFFIX, encodeSectionedSave
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+_SAVE_FILE_SUFFIXES = {
+    SaveFileFormat.JSON: ".json",
+    SaveFileFormat.BINARY: SECTIONED_SAVE_SUFFIX,
+}
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
 
@@ -51,6 +61,91 @@ async def save_json_to_file(
     Returns:
         Path: The full path to the saved JSON file.
     """
+    return await save_session_to_file(data, filename, SaveFileFormat.JSON, base_dir)
+
+async def save_sectioned_to_file(
+    data: dict,
+    filename: str,
+    base_dir: Optional[Path] = None
+) -> Path:
+    """
+    Saves the given dictionary in the sectioned binary format (see lib.sectioned_save) in data/<date>/race-info/.
+
+    Args:
+        data (dict): The data to save.
+        filename (str): Name of the file (e.g., "race.f1save").
+        base_dir (Path, optional): Custom base directory for saving.
+                                   If not provided, uses current date (YYYY_MM_DD) under 'data'.
+
+    Returns:
+        Path: The full path to the saved file.
+    """
+    return await save_session_to_file(data, filename, SaveFileFormat.BINARY, base_dir)
+
+async def save_session_to_file(
+    data: dict,
+    filename: str,
+    file_format: SaveFileFormat = SaveFileFormat.JSON,
+    base_dir: Optional[Path] = None
+) -> Path:
+    """
+    Saves a session in the given format. The data is serialised in a worker thread, so it must not be modified
+    until this returns.
+
+    Args:
+        data (dict): The data to save.
+        filename (str): Name of the file. See get_save_file_name
+        file_format (SaveFileFormat): JSON or sectioned binary.
+        base_dir (Path, optional): Custom base directory for saving.
+
+    Returns:
+        Path: The full path to the saved file.
+    """
+    blob = await asyncio.to_thread(serialise_session, data, file_format)
+    return await save_blob_to_file(blob, filename, base_dir)
+
+async def save_blob_to_file(
+    blob: bytes,
+    filename: str,
+    base_dir: Optional[Path] = None
+) -> Path:
+    """
+    Writes an already serialised session (see serialise_session) in data/<date>/race-info/.
+
+    Args:
+        blob (bytes): The serialised session.
+        filename (str): Name of the file. See get_save_file_name
+        base_dir (Path, optional): Custom base directory for saving.
+
+    Returns:
+        Path: The full path to the saved file.
+    """
+    file_path = _get_save_dir(base_dir) / filename
+    async with aiofiles.open(file_path, mode='wb') as save_file:
+        await save_file.write(blob)
+
+    return file_path
+
+def serialise_session(data: dict, file_format: SaveFileFormat = SaveFileFormat.JSON) -> bytes:
+    """Serialise a session save. Does not touch the event loop, meant to be run in a worker thread.
+
+    Args:
+        data (dict): The data to save.
+        file_format (SaveFileFormat): JSON or sectioned binary (compressed).
+
+    Returns:
+        bytes: The file contents
+    """
+    if file_format == SaveFileFormat.BINARY:
+        return encodeSectionedSave(data)
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+def get_save_file_name(file_stem: str, file_format: SaveFileFormat) -> str:
+    """Add the suffix of the given save format to the file name"""
+    return file_stem + _SAVE_FILE_SUFFIXES[file_format]
+
+def _get_save_dir(base_dir: Optional[Path]) -> Path:
+    """Resolve and create the race-info directory"""
     if base_dir is None:
         date_str = datetime.now().strftime("%Y_%m_%d")
         base_dir = Path(resolve_user_file("data")) / date_str
@@ -59,10 +154,4 @@ async def save_json_to_file(
 
     dir_path = base_dir / "race-info"
     dir_path.mkdir(parents=True, exist_ok=True)
-
-    file_path = dir_path / filename
-    json_str = json.dumps(data, separators=(",", ":"))
-    async with aiofiles.open(file_path, mode='w', encoding='utf-8') as json_file:
-        await json_file.write(json_str)
-
-    return file_path
+    return dir_path
@@ -0,0 +1,274 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import struct
+import zlib
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import msgpack
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+SECTIONED_SAVE_SUFFIX = ".f1save"
+
+# Header: magic, version, flags, length of the (compressed) index that follows it. The sections follow the index
+_HEADER = struct.Struct("<8sHHI")
+_MAGIC = b"PNGSAVE\x00"
+_VERSION = 1
+_FLAG_COMPRESSED = 0x1
+
+# How a key's value is stored. Scalars are grouped into the parent's own section, containers get a section each and
+# the classification data gets one group of sections per driver
+_INLINE = 0
+_SECTION = 1
+_DRIVERS = 2
+
+_DRIVERS_KEY = "classification-data"
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def _sectionName(prefix: str, key: str) -> str:
+    return f"{prefix}/{key}" if prefix else key
+
+def _driverPrefix(index: int) -> str:
+    return f"{_DRIVERS_KEY}/{index}"
+
+def _pack(value: Any, compress: bool) -> bytes:
+    blob = msgpack.packb(value, use_bin_type=True)
+    return zlib.compress(blob, 6) if compress else blob
+
+def _unpack(blob: bytes, compressed: bool) -> Any:
+    if compressed:
+        blob = zlib.decompress(blob)
+    return msgpack.unpackb(blob, raw=False, strict_map_key=False)
+
+def _split(data: Dict[str, Any],
+           prefix: str,
+           sections: List[Tuple[str, Any]],
+           allow_drivers: bool = False) -> List[List[Any]]:
+    """Split a dict into sections and return its layout ([key, storage] per key, in order)"""
+    layout = []
+    inline = {}
+    for key, value in data.items():
+        if allow_drivers and key == _DRIVERS_KEY and isinstance(value, list) and \
+                all(isinstance(driver, dict) for driver in value):
+            layout.append([key, _DRIVERS])
+        elif isinstance(value, (dict, list)):
+            layout.append([key, _SECTION])
+            sections.append((_sectionName(prefix, key), value))
+        else:
+            layout.append([key, _INLINE])
+            inline[key] = value
+    sections.append((prefix, inline))
+    return layout
+
+def encodeSectionedSave(data: Dict[str, Any], compress: bool = True) -> bytes:
+    """Encode a session save (the post race JSON) into the sectioned binary format.
+
+    Every top level container (session info, records, position history, ...) is a msgpack section. The
+    classification data is split per driver, again one section per container (session history, per lap info, tyre
+    sets, race control, ...) plus one for the driver's scalars. The index in front maps section names to their
+    location, so readers only decode the sections they use.
+
+    Args:
+        data (Dict[str, Any]): The save. Must be JSON compatible
+        compress (bool): zlib compress every section
+
+    Returns:
+        bytes: The encoded file
+    """
+    sections: List[Tuple[str, Any]] = []
+    layout = _split(data, "", sections, allow_drivers=True)
+    drivers = []
+    if [_DRIVERS_KEY, _DRIVERS] in layout:
+        drivers = [_split(driver, _driverPrefix(index), sections) for index, driver in enumerate(data[_DRIVERS_KEY])]
+
+    offsets = {}
+    blobs = []
+    offset = 0
+    for name, value in sections:
+        blob = _pack(value, compress)
+        offsets[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    index = _pack({"layout": layout, "drivers": drivers, "sections": offsets}, compress)
+    header = _HEADER.pack(_MAGIC, _VERSION, _FLAG_COMPRESSED if compress else 0, len(index))
+    return b"".join([header, index] + blobs)
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class SectionedSave:
+    """Reader for sectioned saves. Opening only reads the header and the index. Sections are read from the file and
+    decoded when requested, so the file handle isn't kept open.
+    """
+
+    def __init__(self, file_name: str):
+        """
+        Args:
+            file_name (str): The .f1save file
+
+        Raises:
+            ValueError: If the file is not a sectioned save
+        """
+        self.m_file_name = file_name
+        with open(file_name, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size or not header.startswith(_MAGIC):
+                raise ValueError(f"{file_name} is not a sectioned save file")
+            _, version, flags, index_len = _HEADER.unpack(header)
+            if version > _VERSION:
+                raise ValueError(f"{file_name} has unsupported version {version}")
+            self.m_compressed = bool(flags & _FLAG_COMPRESSED)
+            index_blob = f.read(index_len)
+        if len(index_blob) != index_len:
+            raise ValueError(f"{file_name} is truncated")
+
+        index = _unpack(index_blob, self.m_compressed)
+        self.m_layout: List[List[Any]] = index["layout"]
+        self.m_drivers: List[List[List[Any]]] = index["drivers"]
+        self.m_sections: Dict[str, List[int]] = index["sections"]
+        self._m_data_offset = _HEADER.size + index_len
+
+    def sectionNames(self) -> List[str]:
+        """Names of all sections, in file order"""
+        return list(self.m_sections)
+
+    def readSection(self, name: str) -> Any:
+        """Read and decode one section
+
+        Args:
+            name (str): Section name, e.g. "session-info" or "classification-data/3/per-lap-info"
+
+        Returns:
+            Any: The decoded value
+
+        Raises:
+            KeyError: If there is no such section
+        """
+        offset, length = self.m_sections[name]
+        with open(self.m_file_name, "rb") as f:
+            f.seek(self._m_data_offset + offset)
+            blob = f.read(length)
+        return _unpack(blob, self.m_compressed)
+
+    def load(self) -> Dict[str, Any]:
+        """Decode the whole save, in one read. The result is equal to the JSON it was created from"""
+        with open(self.m_file_name, "rb") as f:
+            f.seek(self._m_data_offset)
+            blob = f.read()
+
+        def _section(name: str) -> Any:
+            offset, length = self.m_sections[name]
+            return _unpack(blob[offset:offset + length], self.m_compressed)
+
+        def _join(prefix: str, layout: List[List[Any]]) -> Dict[str, Any]:
+            inline = _section(prefix)
+            result = {}
+            for key, storage in layout:
+                if storage == _INLINE:
+                    result[key] = inline[key]
+                elif storage == _SECTION:
+                    result[key] = _section(_sectionName(prefix, key))
+                else:
+                    result[key] = [_join(_driverPrefix(index), driver) for index, driver in enumerate(self.m_drivers)]
+            return result
+
+        return _join("", self.m_layout)
+
+    def lazy(self) -> 'LazySaveDict':
+        """A dict-like view of the save that reads sections on first access"""
+        return LazySaveDict(self, "", self.m_layout)
+
+class LazySaveDict(MutableMapping):
+    """Dict-like view of (a part of) a sectioned save. A key's section is read on first access and cached, so code
+    written for the JSON dict (save viewer, race analyzer) only pays for what it touches. Assignments are kept in
+    memory, the file is never modified.
+    """
+
+    def __init__(self, save: SectionedSave, prefix: str, layout: List[List[Any]]):
+        """
+        Args:
+            save (SectionedSave): The reader
+            prefix (str): Section name prefix ("" for the top level, "classification-data/<index>" for a driver)
+            layout (List[List[Any]]): [key, storage] per key
+        """
+        self.m_save = save
+        self.m_prefix = prefix
+        self.m_storage: Dict[str, Optional[int]] = {key: storage for key, storage in layout}
+        self._m_values: Dict[str, Any] = {}
+        self._m_inline: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._m_values:
+            return self._m_values[key]
+        storage = self.m_storage.get(key)
+        if storage is None:
+            raise KeyError(key)
+        if storage == _INLINE:
+            if self._m_inline is None:
+                self._m_inline = self.m_save.readSection(self.m_prefix)
+            value = self._m_inline[key]
+        elif storage == _SECTION:
+            value = self.m_save.readSection(_sectionName(self.m_prefix, key))
+        else:
+            value = [LazySaveDict(self.m_save, _driverPrefix(index), driver)
+                     for index, driver in enumerate(self.m_save.m_drivers)]
+        self._m_values[key] = value
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.m_storage.setdefault(key, None)
+        self._m_values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self.m_storage:
+            raise KeyError(key)
+        del self.m_storage[key]
+        self._m_values.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.m_storage))
+
+    def __len__(self) -> int:
+        return len(self.m_storage)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.m_storage
+
+    def __repr__(self) -> str:
+        return f"LazySaveDict({self.m_save.m_file_name!r}, {self.m_prefix!r}, loaded={list(self._m_values)})"
+
+    def toDict(self) -> Dict[str, Any]:
+        """Materialise into a plain dict, reading all remaining sections"""
+        result = {}
+        for key in self:
+            value = self[key]
+            if isinstance(value, LazySaveDict):
+                value = value.toDict()
+            elif isinstance(value, list):
+                value = [item.toDict() if isinstance(item, LazySaveDict) else item for item in value]
+            result[key] = value
+        return result
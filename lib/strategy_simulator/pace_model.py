@@ -0,0 +1,158 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ------------------------- IMPORTS ------------------------------------------------------------------------------------
+
+from statistics import median
+from typing import Dict, Iterable, List, Optional
+
+from .types import LapSample
+
+# ------------------------- CONSTANTS ----------------------------------------------------------------------------------
+
+# Lap time lost per kg of fuel carried. Used to normalise lap times from different fuel loads
+FUEL_EFFECT_S_PER_KG = 0.03
+
+# Lap time lost per percent of wear on the most worn corner
+WEAR_EFFECT_S_PER_PCT = 0.03
+
+# Slick compounds ordered from softest to hardest. Used to derive the pace/wear of compounds the driver
+# has not run yet from the ones that have been observed
+_DRY_COMPOUND_ORDER = ["Super Soft", "Soft", "Medium", "Hard"]
+_PACE_DELTA_PER_STEP_S = 0.5
+_WEAR_FACTOR_PER_STEP = 0.75
+
+# Laps slower than this fraction of the compound median are treated as traffic/mistakes and dropped
+_OUTLIER_THRESHOLD = 1.07
+
+# ------------------------- FUNCTIONS ----------------------------------------------------------------------------------
+
+def correctedLapTime(sample: LapSample,
+                     fuel_effect_s_per_kg: float = FUEL_EFFECT_S_PER_KG,
+                     wear_effect_s_per_pct: float = WEAR_EFFECT_S_PER_PCT) -> float:
+    """Strip the fuel load and tyre wear contributions from a lap time
+
+    Args:
+        sample (LapSample): The lap sample
+        fuel_effect_s_per_kg (float): Lap time lost per kg of fuel
+        wear_effect_s_per_pct (float): Lap time lost per percent of tyre wear
+
+    Returns:
+        float: The corrected lap time in seconds
+    """
+    fuel = sample.fuel_kg or 0.0
+    return sample.lap_time_s - (fuel_effect_s_per_kg * fuel) - (wear_effect_s_per_pct * sample.wear)
+
+def estimateCompoundPace(samples: Iterable[LapSample],
+                         fuel_effect_s_per_kg: float = FUEL_EFFECT_S_PER_KG,
+                         wear_effect_s_per_pct: float = WEAR_EFFECT_S_PER_PCT) -> Dict[str, float]:
+    """Estimate the corrected base lap time of every compound present in the lap samples
+
+    Args:
+        samples (Iterable[LapSample]): Completed laps. Unclean laps are ignored
+        fuel_effect_s_per_kg (float): Lap time lost per kg of fuel
+        wear_effect_s_per_pct (float): Lap time lost per percent of tyre wear
+
+    Returns:
+        Dict[str, float]: Compound name -> median corrected lap time in seconds
+    """
+    per_compound: Dict[str, List[LapSample]] = {}
+    for sample in samples:
+        if sample.is_clean and sample.lap_time_s > 0:
+            per_compound.setdefault(sample.compound, []).append(sample)
+
+    ret: Dict[str, float] = {}
+    for compound, laps in per_compound.items():
+        cutoff = median(lap.lap_time_s for lap in laps) * _OUTLIER_THRESHOLD
+        corrected = [
+            correctedLapTime(lap, fuel_effect_s_per_kg, wear_effect_s_per_pct)
+            for lap in laps if lap.lap_time_s <= cutoff
+        ]
+        ret[compound] = median(corrected)
+    return ret
+
+def extrapolateCompoundPace(known: Dict[str, float], compound: str) -> Optional[float]:
+    """Get the base lap time of a compound, deriving it from the nearest observed slick compound if required
+
+    Args:
+        known (Dict[str, float]): Compound name -> observed base lap time in seconds
+        compound (str): The compound of interest
+
+    Returns:
+        Optional[float]: The base lap time in seconds. None if it cannot be derived
+    """
+    if compound in known:
+        return known[compound]
+    if (steps := _nearestDryCompoundSteps(known, compound)) is None:
+        return None
+    ref_compound, num_steps = steps
+    return known[ref_compound] + (num_steps * _PACE_DELTA_PER_STEP_S)
+
+def extrapolateWearRate(known: Dict[str, float], compound: str) -> Optional[float]:
+    """Get the wear rate of a compound, deriving it from the nearest observed slick compound if required
+
+    Args:
+        known (Dict[str, float]): Compound name -> observed wear rate in percent per lap
+        compound (str): The compound of interest
+
+    Returns:
+        Optional[float]: The wear rate in percent per lap. None if it cannot be derived
+    """
+    if compound in known:
+        return known[compound]
+    if (steps := _nearestDryCompoundSteps(known, compound)) is None:
+        return None
+    ref_compound, num_steps = steps
+    return known[ref_compound] * (_WEAR_FACTOR_PER_STEP ** num_steps)
+
+def isDryCompound(compound: str) -> bool:
+    """Check if the given compound name is a slick compound
+
+    Args:
+        compound (str): Compound name
+
+    Returns:
+        bool: True if slick
+    """
+    return compound in _DRY_COMPOUND_ORDER
+
+def _nearestDryCompoundSteps(known: Dict[str, float], compound: str) -> Optional[tuple]:
+    """Find the closest observed slick compound and the number of steps (positive = harder) to the target
+
+    Args:
+        known (Dict[str, float]): Observed compounds
+        compound (str): Target compound
+
+    Returns:
+        Optional[tuple]: (reference compound, signed steps). None if no slick reference exists
+    """
+    if compound not in _DRY_COMPOUND_ORDER:
+        return None
+    target = _DRY_COMPOUND_ORDER.index(compound)
+    candidates = [
+        (abs(_DRY_COMPOUND_ORDER.index(name) - target), name)
+        for name in known if name in _DRY_COMPOUND_ORDER
+    ]
+    if not candidates:
+        return None
+    _, ref_compound = min(candidates)
+    return ref_compound, target - _DRY_COMPOUND_ORDER.index(ref_compound)
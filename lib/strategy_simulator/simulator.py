@@ -0,0 +1,391 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ------------------------- IMPORTS ------------------------------------------------------------------------------------
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .pace_model import FUEL_EFFECT_S_PER_KG, WEAR_EFFECT_S_PER_PCT
+from .types import PitStop, StrategyInput, StrategyOption
+
+# ------------------------- CONSTANTS ----------------------------------------------------------------------------------
+
+# Strategies that run any corner beyond this wear are discarded (puncture risk)
+DEFAULT_MAX_WEAR = 75.0
+
+# First stop laps within this many seconds of the optimum are reported as the pit window
+DEFAULT_WINDOW_TOLERANCE_S = 1.0
+
+# ------------------------- CLASS DEFINITIONS --------------------------------------------------------------------------
+
+class StrategySimulator:
+    """Evaluates every zero, one and two stop strategy for a whole field in one vectorised pass.
+
+    Every stint is modelled as (base_lap_time + wear_effect * wear) per lap, with wear growing linearly from the
+    set's initial wear. That makes the cost of a stint a closed-form function of its length, so the cost tables
+    for every compound and stint length are built once per driver and every pit lap / compound combination is
+    a sum of three table lookups. The fuel load is the same for every strategy, so it only shifts the absolute
+    race time and is added at the end.
+
+    Drivers are padded to the longest remaining race and the widest compound list so that all of them are
+    evaluated with the same array operations.
+    """
+
+    def __init__(self,
+                 wear_effect_s_per_pct: float = WEAR_EFFECT_S_PER_PCT,
+                 fuel_effect_s_per_kg: float = FUEL_EFFECT_S_PER_KG,
+                 max_wear: float = DEFAULT_MAX_WEAR,
+                 window_tolerance_s: float = DEFAULT_WINDOW_TOLERANCE_S):
+        """Init the simulator
+
+        Args:
+            wear_effect_s_per_pct (float): Lap time lost per percent of tyre wear
+            fuel_effect_s_per_kg (float): Lap time lost per kg of fuel
+            max_wear (float): Maximum allowed wear on any corner, in percent
+            window_tolerance_s (float): Tolerance used to compute the pit window, in seconds
+        """
+        self.m_wear_effect: float = wear_effect_s_per_pct
+        self.m_fuel_effect: float = fuel_effect_s_per_kg
+        self.m_max_wear: float = max_wear
+        self.m_window_tolerance: float = window_tolerance_s
+
+    def evaluate(self, inputs: Sequence[StrategyInput], top_n: int = 5) -> Dict[int, List[StrategyOption]]:
+        """Rank the strategies of all the given drivers
+
+        Args:
+            inputs (Sequence[StrategyInput]): One entry per driver
+            top_n (int): Maximum number of strategies returned per driver
+
+        Returns:
+            Dict[int, List[StrategyOption]]: Driver index -> strategies sorted from fastest to slowest.
+                Drivers with no remaining laps map to an empty list
+        """
+        inputs = [entry for entry in inputs if entry.remaining_laps >= 1]
+        if not inputs:
+            return {}
+
+        num_drivers = len(inputs)
+        remaining = np.array([entry.remaining_laps for entry in inputs], dtype=np.int64)
+        max_laps = int(remaining.max())
+        num_compounds = max(1, max(len(entry.candidate_compounds) for entry in inputs))
+        laps = np.arange(max_laps + 1, dtype=np.float64)
+
+        # Stint cost tables - [driver, laps] for the fitted set and [driver, compound, laps] for new sets
+        cur_cost = self._stintCost(
+            base=np.array([entry.current_compound.base_lap_time_s for entry in inputs]),
+            rate=np.array([entry.current_compound.wear_rate for entry in inputs]),
+            initial_wear=np.array([entry.current_compound.initial_wear for entry in inputs]),
+            laps=laps,
+        )
+        cur_cost[:, 1] = np.where(np.isinf(cur_cost[:, 1]), self._lapCost(inputs), cur_cost[:, 1])
+
+        base, rate, initial_wear = self._candidateArrays(inputs, num_compounds)
+        new_cost = self._stintCost(base, rate, initial_wear, laps)
+        pit_loss = np.array([entry.pit_time_loss_s for entry in inputs])
+
+        one_stop_ok, two_stop_ok, zero_stop_ok = self._ruleMasks(inputs, num_compounds)
+        driver_idx = np.arange(num_drivers)
+
+        # Zero stop - [driver]
+        zero_stop = np.where(zero_stop_ok, cur_cost[driver_idx, remaining], np.inf)
+
+        # One stop - [driver, compound, n1], n1 = laps left on current set (1 .. max_laps - 1)
+        first = np.arange(1, max(max_laps, 2))
+        second = remaining[:, None] - first[None, :]
+        second_valid = second >= 1
+        second_cost = new_cost[driver_idx[:, None, None],
+                               np.arange(num_compounds)[None, :, None],
+                               np.clip(second, 0, max_laps)[:, None, :]]
+        one_stop = cur_cost[:, first][:, None, :] + second_cost + pit_loss[:, None, None]
+        one_stop = np.where(second_valid[:, None, :] & one_stop_ok[:, :, None], one_stop, np.inf)
+
+        # Two stop - [driver, compound 2, compound 3, n1]. The best split of the laps after the first stop only
+        # depends on how many laps are left, so it is solved once per remaining lap count
+        split_cost, split_len = self._bestSplit(base, rate, initial_wear, max_laps)
+        after_first = np.clip(remaining[:, None] - first[None, :], 0, max_laps)
+        two_stop = (cur_cost[:, first][:, None, None, :] +
+                    np.take_along_axis(split_cost, after_first[:, None, None, :], axis=-1) +
+                    (2 * pit_loss)[:, None, None, None])
+        two_stop_second = np.take_along_axis(split_len, after_first[:, None, None, :], axis=-1)
+        two_stop = np.where(two_stop_ok[..., None], two_stop, np.inf)
+
+        # Best lap(s) per compound sequence and the first stop pit window
+        one_stop_best = one_stop.argmin(axis=-1)
+        one_stop_time = np.take_along_axis(one_stop, one_stop_best[..., None], axis=-1)[..., 0]
+        one_stop_window = self._window(one_stop, one_stop_time)
+
+        two_stop_best = two_stop.argmin(axis=-1)
+        two_stop_time = np.take_along_axis(two_stop, two_stop_best[..., None], axis=-1)[..., 0]
+        two_stop_window = self._window(two_stop, two_stop_time)
+        two_stop_second_best = np.take_along_axis(two_stop_second, two_stop_best[..., None], axis=-1)[..., 0]
+
+        # Flatten every compound sequence into one axis so that ranking is a single argsort:
+        # [zero stop, one stop (c2), two stop (c2, c3)]
+        times = np.concatenate([zero_stop[:, None], one_stop_time,
+                                two_stop_time.reshape(num_drivers, -1)], axis=1)
+        first_stint = np.concatenate([remaining[:, None], first[one_stop_best],
+                                      first[two_stop_best].reshape(num_drivers, -1)], axis=1)
+        second_stint = np.concatenate([np.zeros((num_drivers, 1 + num_compounds), dtype=np.int64),
+                                       two_stop_second_best.reshape(num_drivers, -1)], axis=1)
+        window_low, window_high = (
+            np.concatenate([np.zeros((num_drivers, 1), dtype=np.int64), one_stop_bound,
+                            two_stop_bound.reshape(num_drivers, -1)], axis=1)
+            for one_stop_bound, two_stop_bound in zip(one_stop_window, two_stop_window)
+        )
+        order = np.argsort(times, axis=1, kind="stable")[:, :top_n]
+
+        ret: Dict[int, List[StrategyOption]] = {}
+        for i, entry in enumerate(inputs):
+            options: List[StrategyOption] = []
+            fuel_time = self._fuelTime(entry)
+            best = float(times[i, order[i, 0]])
+            for shape in order[i]:
+                if not np.isfinite(times[i, shape]):
+                    break
+                if shape == 0:
+                    stint_lengths, compound_indices = [], []
+                elif shape <= num_compounds:
+                    stint_lengths, compound_indices = [int(first_stint[i, shape])], [int(shape) - 1]
+                else:
+                    stint_lengths = [int(first_stint[i, shape]), int(second_stint[i, shape])]
+                    compound_indices = list(divmod(int(shape) - 1 - num_compounds, num_compounds))
+                pit_window = None
+                if shape and window_high[i, shape]:
+                    pit_window = (entry.current_lap + int(window_low[i, shape]) - 1,
+                                  entry.current_lap + int(window_high[i, shape]) - 1)
+                race_time = float(times[i, shape])
+                option = self._makeOption(entry, stint_lengths, compound_indices, race_time + fuel_time, pit_window)
+                option.delta_s = race_time - best
+                options.append(option)
+            ret[entry.index] = options
+        return ret
+
+    def _stintCost(self, base: np.ndarray, rate: np.ndarray, initial_wear: np.ndarray,
+                   laps: np.ndarray) -> np.ndarray:
+        """Build the cost of a stint for every possible length. Infeasible lengths are set to +inf
+
+        Args:
+            base (np.ndarray): Base lap time in seconds. Any shape
+            rate (np.ndarray): Wear rate per lap, same shape as base
+            initial_wear (np.ndarray): Initial wear, same shape as base
+            laps (np.ndarray): Stint lengths (0 .. N)
+
+        Returns:
+            np.ndarray: Cost table with an extra trailing axis for the stint length
+        """
+        base = base[..., None]
+        rate = rate[..., None]
+        initial_wear = initial_wear[..., None]
+
+        # Wear at the end of lap k is initial + k * rate. Summing over k = 1..n gives the closed form below
+        cost = laps * base + self.m_wear_effect * (initial_wear * laps + rate * laps * (laps + 1) / 2)
+        end_wear = initial_wear + rate * laps
+        return np.where((end_wear <= self.m_max_wear) | (laps == 0), cost, np.inf)
+
+    def _lapCost(self, inputs: Sequence[StrategyInput]) -> np.ndarray:
+        """Cost of finishing the current lap on the fitted set, ignoring the wear limit.
+        The current lap has to be completed before pitting, no matter how worn the tyres are.
+
+        Args:
+            inputs (Sequence[StrategyInput]): Driver inputs
+
+        Returns:
+            np.ndarray: [driver] cost in seconds
+        """
+        return np.array([
+            entry.current_compound.base_lap_time_s + self.m_wear_effect *
+            (entry.current_compound.initial_wear + entry.current_compound.wear_rate)
+            for entry in inputs
+        ])
+
+    def _bestSplit(self, base: np.ndarray, rate: np.ndarray, initial_wear: np.ndarray,
+                   max_laps: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the best way to split m laps into two stints, for every compound pair and every m.
+
+        A stint of n laps costs a*n + b*n^2 with b >= 0, so the total of both stints is convex in the split
+        point. The real valued optimum is found analytically and only its two integer neighbours, clamped to
+        the bounds imposed by the wear limit, have to be checked.
+
+        Args:
+            base (np.ndarray): [driver, compound] base lap time
+            rate (np.ndarray): [driver, compound] wear rate per lap
+            initial_wear (np.ndarray): [driver, compound] initial wear
+            max_laps (int): Largest m to solve for
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: [driver, c2, c3, m] best cost (+inf if infeasible) and length of
+                the first of the two stints
+        """
+        lin = base + self.m_wear_effect * (initial_wear + rate / 2)
+        quad = self.m_wear_effect * rate / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            longest = np.where(rate > 0, np.floor((self.m_max_wear - initial_wear) / rate), max_laps)
+        longest = np.clip(longest, 0, max_laps)
+
+        lin2, quad2, longest2 = lin[:, :, None, None], quad[:, :, None, None], longest[:, :, None, None]
+        lin3, quad3, longest3 = lin[:, None, :, None], quad[:, None, :, None], longest[:, None, :, None]
+        laps = np.arange(max_laps + 1, dtype=np.float64)[None, None, None, :]
+
+        low = np.maximum(1, laps - longest3)
+        high = np.minimum(laps - 1, longest2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            optimum = (lin3 - lin2 + 2 * quad3 * laps) / (2 * (quad2 + quad3))
+        # Both stints have zero wear - the cost is linear in the split, so one of the bounds wins
+        optimum = np.where(np.isfinite(optimum), optimum, np.where(lin2 <= lin3, high, low))
+
+        def _cost(split: np.ndarray) -> np.ndarray:
+            other = laps - split
+            return lin2 * split + quad2 * split * split + lin3 * other + quad3 * other * other
+
+        below = np.minimum(np.maximum(np.floor(optimum), low), high)
+        above = np.minimum(np.maximum(np.ceil(optimum), low), high)
+        below_cost = _cost(below)
+        above_cost = _cost(above)
+        use_above = above_cost < below_cost
+        best_cost = np.where(use_above, above_cost, below_cost)
+        best_len = np.where(use_above, above, below).astype(np.int64)
+        return np.where(low <= high, best_cost, np.inf), best_len
+
+    def _candidateArrays(self, inputs: Sequence[StrategyInput],
+                         num_compounds: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pack the candidate compounds into padded [driver, compound] arrays.
+        Padding entries are never selected since the rule masks only cover real candidates
+
+        Args:
+            inputs (Sequence[StrategyInput]): Driver inputs
+            num_compounds (int): Padded compound count
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: base lap time, wear rate, initial wear
+        """
+        shape = (len(inputs), num_compounds)
+        base = np.zeros(shape)
+        rate = np.zeros(shape)
+        initial_wear = np.zeros(shape)
+        for i, entry in enumerate(inputs):
+            for c, compound in enumerate(entry.candidate_compounds):
+                base[i, c] = compound.base_lap_time_s
+                rate[i, c] = compound.wear_rate
+                initial_wear[i, c] = compound.initial_wear
+        return base, rate, initial_wear
+
+    def _ruleMasks(self, inputs: Sequence[StrategyInput],
+                   num_compounds: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute which compound sequences are legal.
+
+        A dry race must use at least two different slick compounds, and a compound can only be fitted as
+        many times as there are sets of it. A sequence satisfies the first rule if the driver has already
+        satisfied it, or if any compound in it is a non-slick or a slick other than the fitted one.
+
+        Args:
+            inputs (Sequence[StrategyInput]): Driver inputs
+            num_compounds (int): Padded compound count
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: one stop [driver, c2], two stop [driver, c2, c3]
+                and zero stop [driver] masks
+        """
+        shape = (len(inputs), num_compounds)
+        real = np.zeros(shape, dtype=bool)
+        unlocks = np.zeros(shape, dtype=bool)
+        multi_set = np.zeros(shape, dtype=bool)
+        satisfied = np.zeros(len(inputs), dtype=bool)
+        for i, entry in enumerate(inputs):
+            current = entry.current_compound
+            satisfied[i] = (not current.is_dry) or len(entry.compounds_used | {current.name}) >= 2
+            for c, compound in enumerate(entry.candidate_compounds):
+                real[i, c] = True
+                unlocks[i, c] = (not compound.is_dry) or (compound.name != current.name)
+                multi_set[i, c] = compound.num_sets >= 2
+
+        one_stop = real & (satisfied[:, None] | unlocks)
+        two_stop = (
+            real[:, :, None] & real[:, None, :] &
+            (satisfied[:, None, None] | unlocks[:, :, None] | unlocks[:, None, :]) &
+            (~np.eye(num_compounds, dtype=bool)[None] | multi_set[:, :, None])
+        )
+        return one_stop, two_stop, satisfied
+
+    def _window(self, totals: np.ndarray, best: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the shortest and longest first stints whose total is within the tolerance of the optimum
+
+        Args:
+            totals (np.ndarray): [..., n1] best total per first stint length (index 0 = 1 lap)
+            best (np.ndarray): [...] optimum
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: [...] shortest and longest first stint lengths. 0 if none
+        """
+        mask = np.isfinite(totals) & (totals <= best[..., None] + self.m_window_tolerance)
+        found = mask.any(axis=-1)
+        low = mask.argmax(axis=-1) + 1
+        high = mask.shape[-1] - mask[..., ::-1].argmax(axis=-1)
+        return np.where(found, low, 0), np.where(found, high, 0)
+
+    def _makeOption(self, entry: StrategyInput, stint_lengths: List[int], compound_indices: List[int],
+                    race_time_s: float, pit_window: Optional[Tuple[int, int]]) -> StrategyOption:
+        """Build the StrategyOption object for a chosen sequence
+
+        Args:
+            entry (StrategyInput): Driver input
+            stint_lengths (List[int]): Length of every stint except the final one
+            compound_indices (List[int]): Candidate compound index for every stop
+            race_time_s (float): Predicted time excluding fuel
+            pit_window (Optional[Tuple[int, int]]): First stop window
+
+        Returns:
+            StrategyOption: The option
+        """
+        stops: List[PitStop] = []
+        lap = entry.current_lap - 1
+        for length, compound_index in zip(stint_lengths, compound_indices):
+            lap += length
+            stops.append(PitStop(lap=lap, compound=entry.candidate_compounds[compound_index].name))
+
+        final_compound = entry.candidate_compounds[compound_indices[-1]] if compound_indices \
+            else entry.current_compound
+        final_stint_length = entry.total_laps - lap
+        return StrategyOption(
+            start_compound=entry.current_compound.name,
+            stops=stops,
+            race_time_s=race_time_s,
+            pit_window=pit_window,
+            final_wear=final_compound.initial_wear + final_compound.wear_rate * final_stint_length,
+        )
+
+    def _fuelTime(self, entry: StrategyInput) -> float:
+        """Time spent carrying fuel over the remaining laps. Identical for every strategy of a driver
+
+        Args:
+            entry (StrategyInput): Driver input
+
+        Returns:
+            float: Time in seconds. 0 if fuel data is unavailable
+        """
+        if entry.fuel_kg is None or entry.fuel_rate_kg is None:
+            return 0.0
+        laps = entry.remaining_laps
+        # Fuel at the middle of lap k (k = 0..laps-1) is fuel - rate * (k + 0.5)
+        avg_fuel = max(0.0, entry.fuel_kg - entry.fuel_rate_kg * laps / 2)
+        return self.m_fuel_effect * avg_fuel * laps
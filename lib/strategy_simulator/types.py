@@ -0,0 +1,158 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# ------------------------- IMPORTS ------------------------------------------------------------------------------------
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# ------------------------- CLASS DEFINITIONS --------------------------------------------------------------------------
+
+@dataclass(slots=True)
+class CompoundModel:
+    """Pace and wear model of one tyre compound for a single driver.
+
+    Attributes:
+        name (str): Compound name (visual compound string, e.g. "Medium")
+        base_lap_time_s (float): Fuel and wear corrected lap time on this compound in seconds
+        wear_rate (float): Wear of the most worn corner per racing lap, in percent
+        initial_wear (float): Wear of the set at the start of the stint, in percent
+        is_dry (bool): Whether this is a slick compound. Counts towards the two-compound rule
+        num_sets (int): Number of usable sets of this compound. Defaults to 1
+    """
+    name: str
+    base_lap_time_s: float
+    wear_rate: float
+    initial_wear: float = 0.0
+    is_dry: bool = True
+    num_sets: int = 1
+
+@dataclass(slots=True)
+class StrategyInput:
+    """All the data the simulator needs for one driver.
+
+    Attributes:
+        index (int): Driver index
+        current_lap (int): The lap the driver is currently on
+        total_laps (int): Total laps in the race
+        current_compound (CompoundModel): The fitted set. initial_wear is the current wear
+        candidate_compounds (List[CompoundModel]): Sets that can be fitted at a pit stop
+        pit_time_loss_s (float): Time lost by a pit stop in seconds
+        compounds_used (FrozenSet[str]): Names of dry compounds already used in this race
+        fuel_kg (Optional[float]): Fuel in tank in kg
+        fuel_rate_kg (Optional[float]): Fuel used per racing lap in kg
+    """
+    index: int
+    current_lap: int
+    total_laps: int
+    current_compound: CompoundModel
+    candidate_compounds: List[CompoundModel]
+    pit_time_loss_s: float
+    compounds_used: FrozenSet[str] = field(default_factory=frozenset)
+    fuel_kg: Optional[float] = None
+    fuel_rate_kg: Optional[float] = None
+
+    @property
+    def remaining_laps(self) -> int:
+        """Number of laps still to be completed, including the current one"""
+        return self.total_laps - self.current_lap + 1
+
+@dataclass(slots=True)
+class PitStop:
+    """A single planned pit stop.
+
+    Attributes:
+        lap (int): The pit stop happens at the end of this lap
+        compound (str): The compound fitted at this stop
+    """
+    lap: int
+    compound: str
+
+    def toJSON(self) -> Dict[str, Any]:
+        """Get the JSON representation of this object
+
+        Returns:
+            Dict[str, Any]: The JSON representation
+        """
+        return {
+            "lap": self.lap,
+            "compound": self.compound,
+        }
+
+@dataclass(slots=True)
+class StrategyOption:
+    """One ranked strategy for a driver.
+
+    Attributes:
+        start_compound (str): The currently fitted compound
+        stops (List[PitStop]): The pit stops, in order
+        race_time_s (float): Predicted time to complete the remaining laps in seconds
+        delta_s (float): Time lost relative to the best strategy in seconds
+        pit_window (Tuple[int, int]): First stop laps that are within the window tolerance of this option
+        final_wear (float): Predicted wear of the most worn corner at the flag, in percent
+    """
+    start_compound: str
+    stops: List[PitStop]
+    race_time_s: float
+    delta_s: float = 0.0
+    pit_window: Optional[Tuple[int, int]] = None
+    final_wear: float = 0.0
+
+    @property
+    def num_stops(self) -> int:
+        """Number of pit stops in this strategy"""
+        return len(self.stops)
+
+    def toJSON(self) -> Dict[str, Any]:
+        """Get the JSON representation of this object
+
+        Returns:
+            Dict[str, Any]: The JSON representation
+        """
+        return {
+            "start-compound": self.start_compound,
+            "num-stops": self.num_stops,
+            "stops": [stop.toJSON() for stop in self.stops],
+            "race-time-ms": int(round(self.race_time_s * 1000)),
+            "delta-ms": int(round(self.delta_s * 1000)),
+            "pit-window": list(self.pit_window) if self.pit_window else None,
+            "final-wear": round(self.final_wear, 2),
+        }
+
+@dataclass(slots=True)
+class LapSample:
+    """A completed lap used to estimate compound pace.
+
+    Attributes:
+        lap_number (int): Lap number
+        lap_time_s (float): Lap time in seconds
+        compound (str): Compound used on this lap
+        wear (float): Wear of the most worn corner at the end of the lap, in percent
+        fuel_kg (Optional[float]): Fuel in tank at the end of the lap in kg
+        is_clean (bool): False for in/out laps, invalid laps and safety car laps
+    """
+    lap_number: int
+    lap_time_s: float
+    compound: str
+    wear: float
+    fuel_kg: Optional[float] = None
+    is_clean: bool = True
@@ -23,11 +23,15 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 import json
+import os
+import pickle
 from pathlib import Path
-from typing import Dict, Iterator, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pydantic
 
 from .segments import TrackSegments
-from .types import BaseSegmentInfo, SectorBoundaries
+from .types import BaseSegmentInfo, SectorBoundaries, TrackData
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
 
@@ -41,24 +45,73 @@ class TrackSegmentsDatabase:
     path : str | Path
         Directory containing JSON files, each with the structure expected by
         :meth:`TrackSegments.load_track_data`.
+    cache_path : str | Path, optional
+        File used to cache the validated track data. When the JSON files are
+        unchanged since the cache was written, they are not parsed or validated
+        again. The cache is rebuilt whenever it is missing, stale or unreadable.
     """
 
-    def __init__(self, path: "str | Path") -> None:
+    # Bump whenever the cached representation changes
+    CACHE_VERSION: int = 1
+
+    def __init__(self, path: "str | Path", cache_path: "Optional[str | Path]" = None) -> None:
         base_path = Path(path)
         if not base_path.exists():
             raise FileNotFoundError(f"Track segments directory does not exist: {base_path}")
         if not base_path.is_dir():
             raise NotADirectoryError(f"Track segments path is not a directory: {base_path}")
 
+        json_files = sorted(base_path.glob("*.json"))
+        fingerprint = self._fingerprint(json_files)
+        track_models = self._read_cache(Path(cache_path), fingerprint) if cache_path else None
+        if track_models is None:
+            track_models = []
+            for json_file in json_files:
+                with json_file.open("r", encoding="utf-8") as fh:
+                    data = json.load(fh)
+                track_models.append(TrackData.model_validate(data))
+            if cache_path:
+                self._write_cache(Path(cache_path), fingerprint, track_models)
+
         self._db: Dict[int, TrackSegments] = {}
-        for json_file in base_path.glob("*.json"):
-            with json_file.open("r", encoding="utf-8") as fh:
-                data = json.load(fh)
+        for track_data in track_models:
             ts = TrackSegments()
-            ts.load_track_data(data)
+            ts.load_validated_track_data(track_data)
             if ts.circuit_number is not None:
                 self._db[ts.circuit_number] = ts
 
+    @classmethod
+    def _fingerprint(cls, json_files: List[Path]) -> Tuple:
+        """Identify the exact set of source files (and the library versions) a cache was built from."""
+        files = []
+        for json_file in json_files:
+            stat = json_file.stat()
+            files.append((json_file.name, stat.st_size, stat.st_mtime_ns))
+        return (cls.CACHE_VERSION, pydantic.VERSION, tuple(files))
+
+    @staticmethod
+    def _read_cache(cache_path: Path, fingerprint: Tuple) -> Optional[List[TrackData]]:
+        """Return the cached track data, or None if the cache is missing, stale or unreadable."""
+        try:
+            with cache_path.open("rb") as fh:
+                cached_fingerprint, track_models = pickle.load(fh)
+        except Exception: # pylint: disable=broad-exception-caught
+            return None
+        if cached_fingerprint != fingerprint:
+            return None
+        return track_models
+
+    @staticmethod
+    def _write_cache(cache_path: Path, fingerprint: Tuple, track_models: List[TrackData]) -> None:
+        """Write the cache atomically. Failures are ignored, the cache is only an optimisation."""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open("wb") as fh:
+                pickle.dump((fingerprint, track_models), fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
     def get_segment_info(self, circuit_number: int, lap_distance: float) -> Optional[BaseSegmentInfo]:
         """
         Return segment info for *circuit_number* at *lap_distance*, or ``None``
@@ -69,6 +122,18 @@ class TrackSegmentsDatabase:
             return None
         return ts.get_segment_info(lap_distance)
 
+    def get_segments_info(self, circuit_number: int,
+                          lap_distances: Sequence[float]) -> List[Optional[BaseSegmentInfo]]:
+        """
+        Return segment info for every position in *lap_distances* (e.g. all cars)
+        in one vectorised lookup. Entries are ``None`` if the circuit is unknown
+        or the position falls outside any segment.
+        """
+        ts = self._db.get(circuit_number)
+        if ts is None:
+            return [None] * len(lap_distances)
+        return ts.get_segments_info(lap_distances)
+
     def get_sectors(self, circuit_number: int) -> Optional[SectorBoundaries]:
         """
         Return the sector boundaries (s1, s2) for *circuit_number*, or ``None``
@@ -23,7 +23,10 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 import bisect
-from typing import Any, Dict, List, Optional
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from lib.f1_types.packet_2_lap_data import LapData
 
@@ -37,12 +40,25 @@ class TrackSegments:
 
     This class is intentionally lightweight and contains no file I/O. The caller
     is responsible for loading JSON track data and providing it via `load_track_data`.
+
+    Lookups are served from a dense index built at load time, mapping every
+    ``INDEX_RESOLUTION_M`` metres of the lap to the segment covering it, so a
+    query costs a list access. Only the few buckets containing a segment
+    boundary (and positions outside the lap) fall back to a bisect.
     """
 
+    INDEX_RESOLUTION_M: float = 1.0
+    _AMBIGUOUS: int = -2 # index marker for buckets containing a segment boundary
+
     def __init__(self) -> None:
         self._track_data: Optional[TrackData] = None
         self._segments: List[BaseSegmentInfo] = []
         self._starts: List[float] = []  # sorted start_m values, parallel to _segments
+        self._starts_arr: np.ndarray = np.empty(0, dtype=np.float64)
+        self._ends_arr: np.ndarray = np.empty(0, dtype=np.float64)
+        self._index: np.ndarray = np.empty(0, dtype=np.int16)  # bucket -> segment id, -1 if none, or _AMBIGUOUS
+        self._index_segments: List[Any] = []  # same as _index, holding the segments themselves for scalar lookups
+        self._index_span: float = 0.0  # distance covered by the index
 
     @property
     def circuit_name(self) -> Optional[str]:
@@ -96,9 +112,54 @@ class TrackSegments:
                 corner_numbers : list[int]  (required)
         """
 
-        self._track_data = TrackData.model_validate(track_data)
-        self._segments = list(self._track_data.segments)
+        self.load_validated_track_data(TrackData.model_validate(track_data))
+
+    def load_validated_track_data(self, track_data: TrackData) -> None:
+        """
+        Load an already validated track knowledge base (e.g. restored from a cache),
+        skipping schema validation.
+
+        Parameters
+        ----------
+        track_data : TrackData
+            The validated track data.
+        """
+
+        self._track_data = track_data
+        self._segments = list(track_data.segments)
         self._starts = [seg.start_m for seg in self._segments]
+        self._starts_arr = np.array(self._starts, dtype=np.float64)
+        self._ends_arr = np.array([seg.end_m for seg in self._segments], dtype=np.float64)
+        self._build_index()
+
+    def _build_index(self) -> None:
+        """Build the dense distance -> segment id index over the whole lap."""
+
+        if not self._segments:
+            self._index = np.empty(0, dtype=np.int16)
+            self._index_segments = []
+            self._index_span = 0.0
+            return
+
+        span = max(self._track_data.track_length, float(self._ends_arr[-1]))
+        num_buckets = int(math.ceil(span / self.INDEX_RESOLUTION_M))
+        lo = np.arange(num_buckets, dtype=np.float64) * self.INDEX_RESOLUTION_M
+        hi = lo + self.INDEX_RESOLUTION_M
+
+        # Segment covering the start of each bucket, then flag buckets where a segment starts or ends within
+        num_segments = len(self._segments)
+        cand = np.searchsorted(self._starts_arr, lo, side="right") - 1
+        cand_end = self._ends_arr[np.maximum(cand, 0)]
+        covered = (cand >= 0) & (lo < cand_end)
+        next_start = self._starts_arr[np.minimum(cand + 1, num_segments - 1)]
+        ambiguous = ((cand + 1 < num_segments) & (next_start < hi)) | (covered & (cand_end < hi))
+
+        self._index = np.where(ambiguous, self._AMBIGUOUS, np.where(covered, cand, -1)).astype(np.int16)
+        self._index_segments = [
+            self._AMBIGUOUS if idx == self._AMBIGUOUS else (self._segments[idx] if idx >= 0 else None)
+            for idx in self._index.tolist()
+        ]
+        self._index_span = num_buckets * self.INDEX_RESOLUTION_M
 
     @property
     def sectors(self) -> Optional[SectorBoundaries]:
@@ -123,6 +184,11 @@ class TrackSegments:
             a defined segment, otherwise None.
         """
 
+        if 0 <= lap_distance < self._index_span:
+            seg = self._index_segments[int(lap_distance / self.INDEX_RESOLUTION_M)]
+            if seg is not self._AMBIGUOUS:
+                return seg
+
         if not self._starts:
             return None
 
@@ -132,11 +198,69 @@ class TrackSegments:
             return None
 
         seg = self._segments[idx]
-        if lap_distance >= seg.end_m:
+        if not lap_distance < seg.end_m: # NaN never matches
             return None
 
         return seg
 
+    def get_segment_ids(self, distances: np.ndarray) -> np.ndarray:
+        """
+        Vectorised form of :meth:`get_segment_info`, for resolving all cars at once.
+
+        Parameters
+        ----------
+        distances : np.ndarray
+            Lap positions in meters.
+
+        Returns
+        -------
+        np.ndarray
+            Integer array of the same shape, holding the index of the matching
+            segment in ``segments`` or -1 where the position is outside all segments
+            (or NaN).
+        """
+
+        distances = np.asarray(distances, dtype=np.float64)
+        if not self._segments:
+            return np.full(distances.shape, -1, dtype=np.int64)
+
+        indexed = (distances >= 0) & (distances < self._index_span) # NaN compares False
+        buckets = (np.where(indexed, distances, 0.0) // self.INDEX_RESOLUTION_M).astype(np.int64)
+        ids = self._index[buckets].astype(np.int64)
+
+        # Exact search for positions on a segment boundary or outside the indexed span
+        slow = ~indexed | (ids == self._AMBIGUOUS)
+        if slow.any():
+            slow_distances = distances[slow]
+            cand = np.searchsorted(self._starts_arr, slow_distances, side="right") - 1
+            inside = (cand >= 0) & (slow_distances < self._ends_arr[np.maximum(cand, 0)])
+            ids[slow] = np.where(inside, cand, -1)
+        return ids
+
+    def get_segments_info(self, distances: Sequence[float]) -> List[Optional[BaseSegmentInfo]]:
+        """
+        Return :meth:`get_segment_info` for every position in *distances*, resolved
+        with a single :meth:`get_segment_ids` call.
+
+        Parameters
+        ----------
+        distances : Sequence[float]
+            Lap positions in meters, e.g. one per car.
+
+        Returns
+        -------
+        List[Optional[BaseSegmentInfo]]
+            The matching segment for each position, or None where there is none.
+        """
+
+        segments = self._segments
+        return [segments[idx] if idx >= 0 else None for idx in self.get_segment_ids(distances).tolist()]
+
+    @property
+    def segments(self) -> List[BaseSegmentInfo]:
+        """Return the segments of this track, ordered by start_m (indexed by :meth:`get_segment_ids`)."""
+        return self._segments
+
     def get_sector(self, lap_distance: float) -> Optional[LapData.Sector]:
         """
         Return the sector corresponding to the given lap position.
@@ -23,13 +23,17 @@
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
 from .client_types import ClientType
+from .fanout import WEB_FANOUT_EVENTS, fanout_topic
 from .server import BaseWebServer
-from .socket import get_socket_for_uvicorn
+from .socket import get_socket_for_uvicorn, supports_reuse_port
 
 # -------------------------------------- EXPORTS -----------------------------------------------------------------------
 
 __all__ = [
     'BaseWebServer',
     'ClientType',
+    'WEB_FANOUT_EVENTS',
+    'fanout_topic',
     'get_socket_for_uvicorn',
+    'supports_reuse_port',
 ]
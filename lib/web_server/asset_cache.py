@@ -0,0 +1,130 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import mimetypes
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from werkzeug.utils import safe_join
+
+from .http_cache import (CACHED_GZIP_LEVEL, COMPRESS_MIN_BYTES, body_etag,
+                         gzip_body, is_compressible)
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+# Cache-Control of a URL carrying the content hash of what it serves. Any change gets a new URL
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Cache-Control of a fixed URL. The browser keeps the file but revalidates it (304) on every use
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class CachedAsset:
+    """A file as served: its bytes, gzip variant and content hash."""
+
+    __slots__ = ("body", "gzipped", "etag", "mimetype")
+
+    def __init__(self, body: bytes, mimetype: str):
+        """
+        Args:
+            body (bytes): File contents
+            mimetype (str): Type to serve the file as
+        """
+        self.body: bytes = body
+        self.mimetype: str = mimetype
+        self.etag: str = body_etag(body)
+        self.gzipped: Optional[bytes] = None
+        if is_compressible(mimetype) and len(body) >= COMPRESS_MIN_BYTES:
+            compressed = gzip_body(body, CACHED_GZIP_LEVEL)
+            if len(compressed) < len(body):
+                self.gzipped = compressed
+
+class AssetCache:
+    """In-memory cache of the files the web server serves as is (scripts, styles, icons, track maps).
+
+    The files don't change while the app runs, so each is read, hashed and compressed once. The content hash doubles
+    as the cache-busting version of its URL. With caching disabled (debug mode, to pick up edits) files are read on
+    every request.
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled (bool): Keep the files in memory. Defaults to True
+        """
+        self.m_enabled: bool = enabled
+        self.m_assets: Dict[str, CachedAsset] = {}
+
+    def get(self,
+            directory: Union[str, os.PathLike],
+            filename: str,
+            mimetype: Optional[str] = None) -> Optional[CachedAsset]:
+        """Get a file, reading it on first use. Blocks on disk reads, see warm().
+
+        Args:
+            directory (Union[str, os.PathLike]): Directory to serve from
+            filename (str): Path of the file within the directory. May come from the URL
+            mimetype (Optional[str]): Type to serve the file as. Guessed from the extension by default
+
+        Returns:
+            Optional[CachedAsset]: The file, None if it is outside the directory or doesn't exist
+        """
+        path = safe_join(os.fspath(directory), filename)
+        if path is None:
+            return None
+        if (asset := self.m_assets.get(path)) is not None:
+            return asset
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+        asset = CachedAsset(body, mimetype or mimetypes.guess_type(path)[0] or "application/octet-stream")
+        if self.m_enabled:
+            self.m_assets[path] = asset
+        return asset
+
+    def warm(self, directory: Union[str, os.PathLike]) -> int:
+        """Load every file under a directory, so that first requests don't wait on the disk.
+
+        Args:
+            directory (Union[str, os.PathLike]): Directory to load
+
+        Returns:
+            int: Number of files loaded
+        """
+        if not self.m_enabled:
+            return 0
+        root = Path(directory)
+        count = 0
+        for path in root.rglob("*"):
+            if path.is_file() and self.get(root, path.relative_to(root).as_posix()) is not None:
+                count += 1
+        return count
+
+    def __len__(self) -> int:
+        return len(self.m_assets)
@@ -0,0 +1,186 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import asyncio
+import itertools
+from typing import Any, Dict, Iterable, List, Set
+
+import orjson
+
+from lib.logger import PngLogger
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+PROTOCOL_VERSION = 1
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class BinaryStreamClient:
+    """One plain WebSocket subscriber: its topics and the latest unsent frame of each."""
+
+    __slots__ = (
+        'm_id',
+        'm_topics',
+        'm_pending',
+        'm_wakeup',
+        'm_sent_msgs',
+        'm_sent_bytes',
+        'm_coalesced_msgs',
+    )
+
+    def __init__(self, client_id: int) -> None:
+        self.m_id: int = client_id
+        self.m_topics: Set[str] = set()
+        # Topic ID -> frame. A newer frame replaces an unsent one, so a slow client only ever gets the latest
+        self.m_pending: Dict[int, bytes] = {}
+        self.m_wakeup: asyncio.Event = asyncio.Event()
+        self.m_sent_msgs: int = 0
+        self.m_sent_bytes: int = 0
+        self.m_coalesced_msgs: int = 0
+
+    def toJSON(self) -> Dict[str, Any]:
+        """Stats of this client."""
+        return {
+            'topics': sorted(self.m_topics),
+            'sent-msgs': self.m_sent_msgs,
+            'sent-bytes': self.m_sent_bytes,
+            'coalesced-msgs': self.m_coalesced_msgs,
+        }
+
+class BinaryStreamHub:
+    """Plain WebSocket fan-out of high-frequency topics, without Socket.IO's packet encoding and rooms.
+
+    Protocol:
+        - On connect the server sends a text frame {"protocol": 1, "topics": {"<topic>": <id>, ...}}
+        - The client sends text frames {"subscribe": ["<topic>", ...]} and {"unsubscribe": [...]}.
+          Unknown topics are ignored
+        - The server sends one binary frame per update: the topic ID (1 byte) followed by the msgpack payload
+
+    The payload is the one packed for the Socket.IO clients of the same update, framed once and shared by every
+    subscriber. Updates supersede each other, so a subscriber that can't keep up is sent the latest of each topic
+    when its socket is writable again, rather than a backlog.
+    """
+
+    def __init__(self, topics: Iterable[str], logger: PngLogger):
+        """
+        Args:
+            topics (Iterable[str]): Topics that can be subscribed to. At most 255
+            logger (PngLogger): Logger
+        """
+        self.m_logger: PngLogger = logger
+        self.m_topic_ids: Dict[str, int] = {topic: topic_id for topic_id, topic in enumerate(topics, start=1)}
+        assert len(self.m_topic_ids) <= 255, "Topic IDs are a single byte"
+        self.m_hello: str = orjson.dumps({'protocol': PROTOCOL_VERSION, 'topics': self.m_topic_ids}).decode()
+        self.m_subscribers: Dict[str, Set[BinaryStreamClient]] = {topic: set() for topic in self.m_topic_ids}
+        self.m_clients: Dict[int, BinaryStreamClient] = {}
+        self.m_next_id = itertools.count(1)
+        self.m_invalid_msgs: int = 0
+
+    def has_subscribers(self, topic: str) -> bool:
+        """Whether any client is subscribed to the topic."""
+        return bool(self.m_subscribers.get(topic))
+
+    def publish(self, topic: str, packed: bytes) -> None:
+        """Queue an update to every subscriber of the topic. Doesn't block on slow clients.
+
+        Args:
+            topic (str): Topic name
+            packed (bytes): msgpack payload
+        """
+        subscribers = self.m_subscribers.get(topic)
+        if not subscribers:
+            return
+        topic_id = self.m_topic_ids[topic]
+        frame = bytes((topic_id,)) + packed
+        for client in subscribers:
+            if topic_id in client.m_pending:
+                client.m_coalesced_msgs += 1
+            client.m_pending[topic_id] = frame
+            client.m_wakeup.set()
+
+    async def serve(self, websocket: Any) -> None:
+        """Serve one WebSocket connection until it closes.
+
+        Args:
+            websocket (Any): Accepted connection with async send(str | bytes) and receive()
+        """
+        client = BinaryStreamClient(next(self.m_next_id))
+        self.m_clients[client.m_id] = client
+        self.m_logger.debug("Binary stream client %d connected", client.m_id)
+        writer = asyncio.create_task(self._writer(websocket, client), name=f"Binary stream writer {client.m_id}")
+        try:
+            await websocket.send(self.m_hello)
+            while True:
+                self._handleControl(client, await websocket.receive())
+        finally:
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+            for topic in client.m_topics:
+                self.m_subscribers[topic].discard(client)
+            del self.m_clients[client.m_id]
+            self.m_logger.debug("Binary stream client %d disconnected", client.m_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Stats per client ID."""
+        stats: Dict[str, Any] = {str(client_id): client.toJSON() for client_id, client in self.m_clients.items()}
+        if self.m_invalid_msgs:
+            stats['invalid-msgs'] = self.m_invalid_msgs
+        return stats
+
+    def _handleControl(self, client: BinaryStreamClient, message: Any) -> None:
+        """Apply a subscribe/unsubscribe message."""
+        try:
+            request = orjson.loads(message)
+            subscribe: List[str] = request.get('subscribe', [])
+            unsubscribe: List[str] = request.get('unsubscribe', [])
+        except (orjson.JSONDecodeError, AttributeError, TypeError):
+            self.m_invalid_msgs += 1
+            return
+        if not all(isinstance(topics, list) and all(isinstance(topic, str) for topic in topics)
+                   for topics in (subscribe, unsubscribe)):
+            self.m_invalid_msgs += 1
+            return
+
+        for topic in subscribe:
+            if topic in self.m_subscribers:
+                client.m_topics.add(topic)
+                self.m_subscribers[topic].add(client)
+        for topic in unsubscribe:
+            if topic in self.m_subscribers:
+                client.m_topics.discard(topic)
+                self.m_subscribers[topic].discard(client)
+                client.m_pending.pop(self.m_topic_ids[topic], None)
+
+    @staticmethod
+    async def _writer(websocket: Any, client: BinaryStreamClient) -> None:
+        """Send the pending frames of a client, one send at a time."""
+        while True:
+            await client.m_wakeup.wait()
+            client.m_wakeup.clear()
+            frames, client.m_pending = client.m_pending, {}
+            for frame in frames.values():
+                await websocket.send(frame)
+                client.m_sent_msgs += 1
+                client.m_sent_bytes += len(frame)
@@ -0,0 +1,161 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+from typing import Any, Callable, Dict, Optional
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class ClientFlowState:
+    """Send accounting and the current update rate of one Socket.IO client."""
+
+    __slots__ = (
+        'm_rate_divisor',
+        'm_event_ticks',
+        'm_updates',
+        'm_last_shift',
+        'm_clear_streak',
+        'm_max_queued',
+        'm_sent_msgs',
+        'm_sent_bytes',
+        'm_dropped_msgs',
+        'm_downshifts',
+        'm_upshifts',
+    )
+
+    def __init__(self) -> None:
+        self.m_rate_divisor: int = 1
+        self.m_event_ticks: Dict[str, int] = {}
+        self.m_updates: int = 0
+        self.m_last_shift: int = 0
+        self.m_clear_streak: int = 0
+        self.m_max_queued: int = 0
+        self.m_sent_msgs: int = 0
+        self.m_sent_bytes: int = 0
+        self.m_dropped_msgs: int = 0
+        self.m_downshifts: int = 0
+        self.m_upshifts: int = 0
+
+    def toJSON(self, queued_packets: int, queued_bytes: int) -> Dict[str, Any]:
+        """Stats of this client, with the current contents of its send queue."""
+        return {
+            'rate-divisor': self.m_rate_divisor,
+            'queued-packets': queued_packets,
+            'queued-bytes': queued_bytes,
+            'max-queued-packets': self.m_max_queued,
+            'sent-msgs': self.m_sent_msgs,
+            'sent-bytes': self.m_sent_bytes,
+            'dropped-msgs': self.m_dropped_msgs,
+            'downshifts': self.m_downshifts,
+            'upshifts': self.m_upshifts,
+        }
+
+class ClientFlowControl:
+    """Per-client backpressure for periodic Socket.IO broadcasts.
+
+    A client's backlog is the number of packets waiting in its Engine.IO send queue. A client keeping up has an empty
+    queue at every update, one that can't (slow Wi-Fi, a busy OBS browser source) builds a backlog. A lagging client
+    skips updates until its queue drains (drop-to-latest, so it resumes with the newest state) and its update rate is
+    halved, down to 1/MAX_RATE_DIVISOR. The rate doubles again after UPSHIFT_AFTER updates with an empty queue.
+    The backlog of any client stays around LAG_DEPTH packets, whatever its link speed.
+
+    Only for updates where each one supersedes the last. Event messages must go out to every client.
+    """
+
+    # Queued packets at which a client counts as lagging. A binary message takes two Engine.IO packets and a client can
+    # be in more than one room, so a client keeping up may still have a few packets of the current tick queued
+    LAG_DEPTH = 8
+    MAX_RATE_DIVISOR = 8
+    # Updates between consecutive downshifts, so that one backlog halves the rate once rather than all the way down
+    SHIFT_HOLD = 10
+    UPSHIFT_AFTER = 50
+
+    def __init__(self,
+                 queue_depth: Callable[[str], Optional[int]],
+                 queued_bytes: Callable[[str], int]):
+        """
+        Args:
+            queue_depth (Callable[[str], Optional[int]]): Number of packets waiting to be sent to a client (by SID).
+                None if the client is unknown
+            queued_bytes (Callable[[str], int]): Bytes waiting to be sent to a client. Only used for the stats
+        """
+        self.m_queue_depth: Callable[[str], Optional[int]] = queue_depth
+        self.m_queued_bytes: Callable[[str], int] = queued_bytes
+        self.m_clients: Dict[str, ClientFlowState] = {}
+
+    def should_send(self, sid: str, event: str) -> bool:
+        """Decide whether the client gets this update of the event, adjusting its rate.
+
+        Args:
+            sid (str): Client SID
+            event (str): Event name
+
+        Returns:
+            bool: True if the update is to be sent to this client
+        """
+        state = self.m_clients.get(sid)
+        if state is None:
+            state = self.m_clients[sid] = ClientFlowState()
+        state.m_updates += 1
+        queued = self.m_queue_depth(sid) or 0
+        state.m_max_queued = max(state.m_max_queued, queued)
+
+        if queued >= self.LAG_DEPTH:
+            state.m_clear_streak = 0
+            if state.m_rate_divisor < self.MAX_RATE_DIVISOR and \
+                    state.m_updates - state.m_last_shift >= self.SHIFT_HOLD:
+                state.m_rate_divisor *= 2
+                state.m_downshifts += 1
+                state.m_last_shift = state.m_updates
+            state.m_dropped_msgs += 1
+            return False
+
+        if queued == 0:
+            state.m_clear_streak += 1
+            if state.m_rate_divisor > 1 and state.m_clear_streak >= self.UPSHIFT_AFTER:
+                state.m_rate_divisor //= 2
+                state.m_upshifts += 1
+                state.m_last_shift = state.m_updates
+                state.m_clear_streak = 0
+
+        tick = state.m_event_ticks.get(event, -1) + 1
+        state.m_event_ticks[event] = tick
+        if tick % state.m_rate_divisor:
+            state.m_dropped_msgs += 1
+            return False
+        return True
+
+    def on_sent(self, sid: str, size: int) -> None:
+        """Account an update sent to the client."""
+        if state := self.m_clients.get(sid):
+            state.m_sent_msgs += 1
+            state.m_sent_bytes += size
+
+    def forget(self, sid: str) -> None:
+        """Drop the state of a disconnected client."""
+        self.m_clients.pop(sid, None)
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Stats per client SID."""
+        return {sid: state.toJSON(self.m_queue_depth(sid) or 0, self.m_queued_bytes(sid))
+                for sid, state in self.m_clients.items()}
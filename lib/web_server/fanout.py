@@ -0,0 +1,44 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+# Socket.IO events the core publishes over IPC for the web fan-out processes. The payloads are published msgpack-packed,
+# exactly as emitted to the core's own clients, so the fan-out sends them on without re-encoding
+WEB_FANOUT_EVENTS = (
+    'race-table-update',
+    'stream-overlay-update',
+    'frontend-update',
+)
+
+_WEB_FANOUT_TOPIC_PREFIX = 'web-fanout/'
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def fanout_topic(event: str) -> str:
+    """IPC topic carrying a Socket.IO event to the web fan-out processes.
+
+    Prefixed, so that it neither matches nor is matched by the prefix subscriptions of the topics of the same name
+    published for the HUD and MCP server.
+    """
+    return f"{_WEB_FANOUT_TOPIC_PREFIX}{event}"
@@ -0,0 +1,94 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import gzip
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Optional
+
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+# Bodies smaller than this gain less from compression than the gzip header costs
+COMPRESS_MIN_BYTES = 1024
+
+# Live bodies are compressed on every request. Variants of immutable content are compressed once, so spend more on them
+DYNAMIC_GZIP_LEVEL = 4
+CACHED_GZIP_LEVEL = 9
+
+_COMPRESSIBLE_MIMETYPES = frozenset({
+    'application/json',
+    'application/javascript',
+    'image/svg+xml',
+})
+
+# -------------------------------------- CLASSES -----------------------------------------------------------------------
+
+class CompressedVariantCache:
+    """Byte-budgeted LRU of gzip-compressed bodies, keyed by the ETag of immutable content (files, saves)."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.m_max_bytes: int = max_bytes
+        self.m_bytes: int = 0
+        self.m_variants: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, etag: str) -> Optional[bytes]:
+        """Get the compressed body of this content, if stored."""
+        body = self.m_variants.get(etag)
+        if body is not None:
+            self.m_variants.move_to_end(etag)
+        return body
+
+    def put(self, etag: str, body: bytes) -> None:
+        """Store the compressed body of this content, evicting the least recently used beyond the budget."""
+        if len(body) > self.m_max_bytes:
+            return
+        if (old := self.m_variants.pop(etag, None)) is not None:
+            self.m_bytes -= len(old)
+        self.m_variants[etag] = body
+        self.m_bytes += len(body)
+        while self.m_bytes > self.m_max_bytes:
+            _, evicted = self.m_variants.popitem(last=False)
+            self.m_bytes -= len(evicted)
+
+    def __len__(self) -> int:
+        return len(self.m_variants)
+
+# -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
+
+def body_etag(body: bytes) -> str:
+    """ETag of a generated body (a hash of its content)."""
+    return hashlib.blake2b(body, digest_size=12).hexdigest()
+
+def file_etag(stat: os.stat_result) -> str:
+    """ETag of a file that only changes when it is rewritten (its mtime and size)."""
+    return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    """Whether responses of this type are worth compressing (text formats)."""
+    return bool(mimetype) and (mimetype.startswith('text/') or mimetype in _COMPRESSIBLE_MIMETYPES)
+
+def gzip_body(body: bytes, level: int) -> bytes:
+    """gzip a body. The mtime is left out of the header so equal bodies compress to equal bytes."""
+    return gzip.compress(body, compresslevel=level, mtime=0)
@@ -22,30 +22,53 @@
 
 # -------------------------------------- IMPORTS -----------------------------------------------------------------------
 
+import asyncio
 import os
+from collections import OrderedDict
 from functools import wraps
+from http import HTTPStatus
 from pathlib import Path
 from typing import (Any, Awaitable, Callable, Coroutine, Dict, List, Optional,
-                    Union)
+                    Set, Tuple, Union)
 
 import msgpack
+import orjson
 import socketio
 import uvicorn
 import wsproto
-from quart import Quart, Response
+from quart import Quart, Response, abort
 from quart import jsonify as quart_jsonify
 from quart import render_template as quart_render_template
 from quart import request as quart_request
 from quart import send_from_directory as quart_send_from_directory
 from quart import url_for
+from quart import websocket as quart_websocket
 
 from lib.error_status import PngHttpPortInUseError
 from lib.event_counter import EventCounter
 from lib.logger import PngLogger
 
+from .asset_cache import (IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL,
+                          AssetCache, CachedAsset)
+from .binary_stream import BinaryStreamHub
+from .client_flow import ClientFlowControl
 from .client_types import ClientType
+from .http_cache import (CACHED_GZIP_LEVEL, COMPRESS_MIN_BYTES,
+                         DYNAMIC_GZIP_LEVEL, CompressedVariantCache,
+                         body_etag, gzip_body, is_compressible)
 from .socket import get_socket_for_uvicorn
 
+# -------------------------------------- CONSTANTS ---------------------------------------------------------------------
+
+BINARY_STREAM_PATH = '/ws/stream'
+
+# Rendered pages kept, one per template and context
+MAX_RENDERED_PAGES = 64
+
+# Events queued for a batching client within this long of the first go out in one frame. The events of an update tick
+# are sent within a few ms of each other, while sending them to the other clients yields to the loop in between
+BATCH_WINDOW_SEC = 0.005
+
 # -------------------------------------- CLASSES -----------------------------------------------------------------------
 
 class BaseWebServer:
@@ -59,7 +82,10 @@ class BaseWebServer:
                  cert_path: Optional[str] = None,
                  key_path: Optional[str] = None,
                  debug_mode: bool = False,
-                 enable_socketio: bool = True):
+                 enable_socketio: bool = True,
+                 binary_stream_topics: Optional[List[str]] = None,
+                 reuse_port: bool = False,
+                 batch_emits: bool = False):
         """
         Initialize the BaseWebServer.
 
@@ -71,6 +97,12 @@ class BaseWebServer:
             cert_path (Optional[str], optional): Path to the certificate file. Defaults to None.
             key_path (Optional[str], optional): Path to the key file. Defaults to None.
             debug_mode (bool, optional): Enable or disable debug mode. Defaults to False.
+            binary_stream_topics (Optional[List[str]], optional): Events to also stream over the plain WebSocket
+                endpoint at BINARY_STREAM_PATH (see BinaryStreamHub). Defaults to None (no endpoint).
+            reuse_port (bool, optional): Share the port with other server processes (SO_REUSEPORT), so that they can
+                be replicated behind it. Defaults to False.
+            batch_emits (bool, optional): Let Socket.IO clients opt in to receiving the events of an update tick
+                in one "batch" frame (see _flushBatches). Defaults to False.
         """
         self.m_logger: PngLogger = logger
         self.m_port: int = port
@@ -79,6 +111,7 @@ class BaseWebServer:
         self.m_cert_path: Optional[str] = cert_path
         self.m_key_path: Optional[str] = key_path
         self.m_debug_mode: bool = debug_mode
+        self.m_reuse_port: bool = reuse_port
         if client_event_mappings:
             self.m_client_event_mappings: Dict[ClientType, List[str]] = client_event_mappings
         else:
@@ -87,6 +120,18 @@ class BaseWebServer:
         self._on_client_register_callback: Optional[Callable[[ClientType, str], Awaitable[None]]] = None
         self._on_client_disconnect_callback: Optional[Callable[[str], Awaitable[None]]] = None
         self.m_stats = EventCounter()
+        self.m_gzip_variants = CompressedVariantCache()
+        # Files served as is and rendered pages. Not kept in debug mode, so that edits show up on reload
+        self.m_assets = AssetCache(enabled=not debug_mode)
+        self.m_rendered_pages: "OrderedDict[tuple, CachedAsset]" = OrderedDict()
+        self.m_client_flow = ClientFlowControl(self._clientQueueDepth, self._clientQueuedBytes)
+        # Canonical JSON of the payload projection registered by a client (by SID). Clients without one get everything
+        self.m_client_projections: Dict[str, str] = {}
+        # Clients that registered for batched events, and the (event, packed payload) queued for each
+        self.m_batch_emits: bool = batch_emits
+        self.m_batching_sids: Set[str] = set()
+        self.m_pending_batches: Dict[str, List[Tuple[str, bytes]]] = {}
+        self.m_batch_flush: Optional[asyncio.Task] = None
 
         self.m_base_dir = Path(__file__).resolve().parent.parent.parent
         template_dir = self.m_base_dir / "apps" / "frontend" / "html"
@@ -101,6 +146,9 @@ class BaseWebServer:
             static_url_path='/static'
         )
         self.m_app.config['PROPAGATE_EXCEPTIONS'] = False
+        self.m_static_dir: Path = static_dir
+        # Serve the static folder from the asset cache instead of Quart's file sender
+        self.m_app.view_functions['static'] = self._serve_static
 
         if enable_socketio:
             self.m_sio = socketio.AsyncServer(
@@ -117,15 +165,26 @@ class BaseWebServer:
         self._server: Optional[uvicorn.Server] = None
         self._define_static_file_routes()
 
-        # Automatically append version string to all static URL's
-        # We're doing this because when version changes, we don't want the browser to load cached code
-        #    as the code may have changed in the update. When the browser sees a new version appended as arg,
-        #    it will actually request from the server, since the request is now different than what it has seen before
+        self.m_binary_stream: Optional[BinaryStreamHub] = None
+        if binary_stream_topics:
+            self.m_binary_stream = BinaryStreamHub(binary_stream_topics, logger)
+
+            @self.m_app.websocket(BINARY_STREAM_PATH)
+            async def binary_stream() -> None:
+                self.m_stats.track_event("__BINARY_STREAM__", "__CONNECT__")
+                await self.m_binary_stream.serve(quart_websocket)
+
+        # Automatically append the content hash to all static URL's
+        # We're doing this because when a file changes, we don't want the browser to load cached code
+        #    as the code may have changed in the update. When the browser sees a new hash appended as arg,
+        #    it will actually request from the server, since the request is now different than what it has seen before.
+        #    In turn, a URL with the hash can be cached for good (see send_asset)
         @self.m_app.context_processor
         def override_url_for():
             def dated_url_for(endpoint, **values):
                 if endpoint == 'static':
-                    values['v'] = self.m_ver_str
+                    asset = self.m_assets.get(static_dir, values.get('filename', ''))
+                    values['v'] = asset.etag if asset else self.m_ver_str
                 return url_for(endpoint, **values)
             return {"url_for": dated_url_for}
 
@@ -152,8 +211,14 @@ class BaseWebServer:
             self.m_logger.warning("404 %s %s — no matching route", quart_request.method, quart_request.path)
             return {"error": "Not found"}, 404
 
-    def http_route(self, path: str, **kwargs) -> Callable:
-        """Register a HTTP route."""
+    def http_route(self, path: str, conditional: bool = False, **kwargs) -> Callable:
+        """Register a HTTP route.
+
+        Args:
+            path (str): URL rule
+            conditional (bool): Serve the route's responses through make_conditional (ETag, 304, gzip)
+            **kwargs: Passed on to Quart's route()
+        """
         def decorator(func: Callable[..., Coroutine]) -> Callable:
             @wraps(func)
             async def wrapped(*args: Any, **inner_kwargs: Any):
@@ -163,6 +228,10 @@ class BaseWebServer:
                 self.m_stats.track_event("__HTTP__", route_key)
                 try:
                     result = await func(*args, **inner_kwargs)
+                    if conditional:
+                        result = await self.make_conditional(result)
+                        if result.status_code == HTTPStatus.NOT_MODIFIED:
+                            self.m_stats.track_event("__HTTP_NOT_MODIFIED__", route_key)
                     self.m_stats.track_event("__HTTP_OK__", route_key)
                     return result
                 except Exception:
@@ -217,6 +286,10 @@ class BaseWebServer:
             """
             self.m_stats.track_event("__SOCKET_IN__", "__DISCONNECT__")
             self.m_logger.debug("Client disconnected: %s", sid)
+            self.m_client_flow.forget(sid)
+            self.m_client_projections.pop(sid, None)
+            self.m_batching_sids.discard(sid)
+            self.m_pending_batches.pop(sid, None)
             if self._on_client_disconnect_callback:
                 await self._on_client_disconnect_callback(sid)
 
@@ -225,12 +298,23 @@ class BaseWebServer:
             """
             Handle client registration for specific client types. Add client to room named after client type.
             Also add client to room named after events it is interested in (if client event mappings are defined).
+            A client may register a "projection" object, describing the part of the payloads it needs (see the
+            projector of send_to_clients_interested_in_event), and "batch": true to receive its events in batches
+            if the server has batch_emits enabled.
 
             Args:
                 sid (str): Session ID of the registering client.
                 data (Dict[str, str]): Registration data containing client type.
             """
             client_type = data.get('type')
+            if isinstance(projection := data.get('projection'), dict):
+                self.m_client_projections[sid] = orjson.dumps(projection, option=orjson.OPT_SORT_KEYS).decode()
+            else:
+                self.m_client_projections.pop(sid, None)
+            if self.m_batch_emits and data.get('batch') is True:
+                self.m_batching_sids.add(sid)
+            else:
+                self.m_batching_sids.discard(sid)
             self.m_stats.track_event("__SOCKET_IN__", "register-client")
             self.m_logger.debug('[CLIENT_REG] Client registered. SID = %s Type = %s ID=%s',
                                 sid, client_type, data.get('id', 'N/A'))
@@ -265,32 +349,103 @@ class BaseWebServer:
                         room = self.m_sio.manager.rooms.get('/', {}).get(event)
                         self.m_logger.debug('[CLIENT_REG] Current members of %s: %s', event, room)
 
-    async def send_to_clients_of_type(self, event: str, data: Dict[str, Any], client_type: ClientType) -> None:
+    async def send_to_clients_of_type(self,
+                                      event: str,
+                                      data: Optional[Dict[str, Any]],
+                                      client_type: ClientType,
+                                      packed: Optional[bytes] = None) -> None:
         """
         Send data to clients in a specific room.
 
         Args:
             event (str): The event name to send.
-            data (Dict[str, Any]): The data to send with the event.
+            data (Optional[Dict[str, Any]]): The data to send with the event. May be None if packed is given.
             client_type (ClientType): The client type to send the event to.
+            packed (Optional[bytes]): The data already packed with msgpack, if the caller has it.
         """
         assert self.m_sio is not None, "send_to_clients_of_type called but Socket.IO is disabled"
-        packed = msgpack.packb(data, use_bin_type=True)
-        self._track_socket_emit_mcast(packed, room=str(client_type))
-        await self.m_sio.emit(event, packed, room=str(client_type))
-
-    async def send_to_clients_interested_in_event(self, event: str, data: Dict[str, Any]) -> None:
+        if packed is None:
+            packed = msgpack.packb(data, use_bin_type=True)
+        room = str(client_type)
+        if not self.m_batching_sids:
+            self._track_socket_emit_mcast(packed, room=room)
+            await self.m_sio.emit(event, packed, room=room)
+            return
+
+        participants = [sid for sid, _ in self.m_sio.manager.get_participants("/", room)]
+        direct, batched = self._queueForBatch(event, packed, participants)
+        if direct:
+            self.m_stats.track_packet("__SOCKET_OUT__", f"__EVENT_{room}__", len(packed) * len(direct))
+            await self.m_sio.emit(event, packed, room=room, skip_sid=batched or None)
+
+    async def send_to_clients_interested_in_event(self,
+                                                  event: str,
+                                                  data: Optional[Dict[str, Any]],
+                                                  projector: Optional[Callable[[Dict[str, Any], str], Any]] = None,
+                                                  packed: Optional[bytes] = None) -> None:
         """
         Send data to all clients interested in a particular event, based on given client_event_mappings.
 
+        Each update supersedes the previous one, so clients that can't keep up are sent fewer of them
+        (see ClientFlowControl).
+
+        Clients that registered a projection are sent projector(data, projection), where projection is the
+        canonical JSON of what they registered. Clients with the same projection are grouped, so each distinct payload
+        is built and packed once per update however many clients share it.
+
+        Subscribers of the binary stream are sent the full payload, packed once for both transports.
+
         Args:
             event (str): The event name to send.
-            data (Dict[str, Any]): The data to send with the event.
+            data (Optional[Dict[str, Any]]): The data to send with the event. May be None if packed is given,
+                it is then unpacked only if a projection needs it.
+            projector (Optional[Callable[[Dict[str, Any], str], Any]]): Builds the payload for a projection.
+                If None, every client is sent the full data.
+            packed (Optional[bytes]): The data already packed with msgpack, if the caller has it.
         """
-        assert self.m_sio is not None, "send_to_clients_interested_in_event called but Socket.IO is disabled"
-        packed = msgpack.packb(data, use_bin_type=True)
-        self._track_socket_emit_mcast(packed, room=event)
-        await self.m_sio.emit(event, packed, room=event)
+        assert self.m_sio is not None or self.m_binary_stream is not None, \
+            "send_to_clients_interested_in_event called but Socket.IO and the binary stream are disabled"
+        packed_full: Optional[bytes] = packed
+        if self.m_binary_stream and self.m_binary_stream.has_subscribers(event):
+            if packed_full is None:
+                packed_full = msgpack.packb(data, use_bin_type=True)
+            self.m_binary_stream.publish(event, packed_full)
+            self.m_stats.track_packet("__BINARY_STREAM_OUT__", f"__EVENT_{event}__", len(packed_full))
+        if self.m_sio is None:
+            return
+
+        full, skipped = [], []
+        projected: Dict[str, List[str]] = {}
+        for sid, _ in self.m_sio.manager.get_participants("/", event):
+            if not self.m_client_flow.should_send(sid, event):
+                skipped.append(sid)
+            elif projector and (projection := self.m_client_projections.get(sid)):
+                projected.setdefault(projection, []).append(sid)
+            else:
+                full.append(sid)
+
+        if full:
+            if packed_full is None:
+                packed_full = msgpack.packb(data, use_bin_type=True)
+            full, batched = self._queueForBatch(event, packed_full, full)
+            if full:
+                # Room broadcast, skipping the clients that get a projection, a batch or nothing this time
+                skip = skipped + batched + [sid for sids in projected.values() for sid in sids]
+                await self._emitToClients(event, packed_full, full, room=event, skip_sid=skip or None)
+        if projected and data is None:
+            data = msgpack.unpackb(packed_full)
+        for projection, sids in projected.items():
+            packed_projection = msgpack.packb(projector(data, projection), use_bin_type=True)
+            sids, _ = self._queueForBatch(event, packed_projection, sids)
+            if sids:
+                await self._emitToClients(event, packed_projection, sids, to=sids)
+
+    async def _emitToClients(self, event: str, packed: bytes, sids: List[str], **kwargs) -> None:
+        """Emit a packed update to the given clients, accounting for it. kwargs address the emit."""
+        for sid in sids:
+            self.m_client_flow.on_sent(sid, len(packed))
+        self.m_stats.track_packet("__SOCKET_OUT__", f"__EVENT_{event}__", len(packed) * len(sids))
+        await self.m_sio.emit(event, packed, **kwargs)
 
     async def send_to_client(self, event: str, data: Dict[str, Any], client_id: str) -> None:
         """
@@ -303,9 +458,66 @@ class BaseWebServer:
         """
         assert self.m_sio is not None, "send_to_client called but Socket.IO is disabled"
         packed = msgpack.packb(data, use_bin_type=True)
+        if client_id in self.m_batching_sids:
+            self._queueForBatch(event, packed, [client_id])
+            return
         self.m_stats.track_packet("__SOCKET_OUT__", "__UNICAST__", len(packed))
         await self.m_sio.emit(event, packed, to=client_id)
 
+    def _queueForBatch(self, event: str, packed: bytes, sids: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Queue an event for the clients among sids that receive batches. The caller sends it to the others.
+
+        Args:
+            event (str): The event name
+            packed (bytes): The packed payload
+            sids (List[str]): Clients the event is for
+
+        Returns:
+            Tuple[List[str], List[str]]: The clients to send the event to directly, and the clients it was queued for
+        """
+        if not self.m_batching_sids:
+            return sids, []
+        direct, batched = [], []
+        for sid in sids:
+            (batched if sid in self.m_batching_sids else direct).append(sid)
+        if not batched:
+            return direct, batched
+        for sid in batched:
+            self.m_pending_batches.setdefault(sid, []).append((event, packed))
+            self.m_client_flow.on_sent(sid, len(packed))
+        self.m_stats.track_packet("__SOCKET_OUT__", f"__EVENT_{event}__", len(packed) * len(batched))
+        if self.m_batch_flush is None or self.m_batch_flush.done():
+            self.m_batch_flush = asyncio.create_task(self._flushBatches(), name="Socket.IO Batch Flush")
+        return direct, batched
+
+    async def _flushBatches(self) -> None:
+        """
+        Send the events queued for each batching client in one frame: a msgpack array of [event, packed payload]
+        pairs, sent as the "batch" event. A single event is sent as is. Runs BATCH_WINDOW_SEC after the first event
+        was queued, and clients with the same events share the frame. Events queued while the frames are being
+        sent (this task isn't done yet, so no new one is scheduled) go out in the next window.
+        """
+        while True:
+            await asyncio.sleep(BATCH_WINDOW_SEC)
+            pending, self.m_pending_batches = self.m_pending_batches, {}
+            groups: Dict[Tuple[Tuple[str, int], ...], List[str]] = {}
+            for sid, items in pending.items():
+                groups.setdefault(tuple((event, id(packed)) for event, packed in items), []).append(sid)
+
+            for sids in groups.values():
+                items = pending[sids[0]]
+                if len(items) == 1:
+                    event, frame = items[0]
+                else:
+                    event, frame = 'batch', msgpack.packb(items, use_bin_type=True)
+                    self.m_stats.track_packet("__SOCKET_BATCH_OUT__", f"__EVENTS_{len(items)}__",
+                                              len(frame) * len(sids))
+                await self.m_sio.emit(event, frame, to=sids)
+
+            if not self.m_pending_batches:
+                return
+
     def _track_socket_emit_mcast(self,
                            payload: bytes,
                            room: str) -> None:
@@ -315,6 +527,27 @@ class BaseWebServer:
         # Account for each recipient separately so packet count reflects actual fan-out.
         self.m_stats.track_packet("__SOCKET_OUT__", f"__EVENT_{room}__", len(payload) * recipients)
 
+    def _clientQueueDepth(self, sid: str) -> Optional[int]:
+        """Number of Engine.IO packets waiting to be written to a client, None if it isn't connected."""
+        socket = self._clientEioSocket(sid)
+        return socket.queue.qsize() if socket else None
+
+    def _clientQueuedBytes(self, sid: str) -> int:
+        """Payload bytes waiting to be written to a client."""
+        socket = self._clientEioSocket(sid)
+        if not socket:
+            return 0
+        # asyncio.Queue has no public way to peek. Only used for the stats
+        return sum(len(pkt.data) for pkt in list(socket.queue._queue) # pylint: disable=protected-access
+                   if pkt is not None and isinstance(pkt.data, (bytes, str)))
+
+    def _clientEioSocket(self, sid: str) -> Any:
+        """The Engine.IO socket of a Socket.IO client, None if it isn't connected."""
+        if self.m_sio is None:
+            return None
+        eio_sid = self.m_sio.manager.eio_sid_from_sid(sid, "/")
+        return self.m_sio.eio.sockets.get(eio_sid) if eio_sid else None
+
     def is_client_of_type_connected(self, client_type: ClientType) -> bool:
         """Check if a client of a specific type is connected
 
@@ -335,7 +568,9 @@ class BaseWebServer:
         Returns:
             bool: True if any client is interested in the event
         """
-        return not self._is_room_empty(event)
+        if self.m_binary_stream and self.m_binary_stream.has_subscribers(event):
+            return True
+        return self.m_sio is not None and not self._is_room_empty(event)
 
     def _is_room_empty(self, room_name: str, namespace: Optional[str] = '/') -> bool:
         """Check if a room is empty"""
@@ -356,11 +591,13 @@ class BaseWebServer:
         @self.m_app.before_serving
         async def before_serving() -> None:
             self.m_logger.debug("In post init ...")
+            num_assets = await asyncio.to_thread(self.m_assets.warm, self.m_static_dir)
+            self.m_logger.debug("Loaded %d static files", num_assets)
             if self._post_start_callback:
                 await self._post_start_callback()
 
         try:
-            sock = get_socket_for_uvicorn(self.m_port, host=self.m_bind_address)
+            sock = get_socket_for_uvicorn(self.m_port, host=self.m_bind_address, reuse_port=self.m_reuse_port)
         except PngHttpPortInUseError as e:
             self.m_logger.exception("Port %d is already in use", self.m_port)
             raise e
@@ -475,7 +712,7 @@ class BaseWebServer:
                     Callable: An async function to serve the static file.
                 """
                 async def _static_route():
-                    return await self.send_from_directory(assets_dir, file_path, mimetype=mime_type)
+                    return self.send_asset(assets_dir, file_path, mimetype=mime_type)
 
                 _static_route.__name__ = f'serve_static_{route_path.replace("/", "_")}'
                 return _static_route
@@ -484,21 +721,18 @@ class BaseWebServer:
             self.m_app.route(route)(route_handler)
 
         # Dynamic routes for track map SVGs and transforms, organized by game year.
-        # send_from_directory handles path-traversal protection via safe_join.
+        # The asset cache handles path-traversal protection via safe_join.
         track_maps_dir = assets_dir / "track-maps"
 
         # Per-game SVG transforms: /track-maps/f1_2025/svg_transforms.json
         async def serve_svg_transforms(game_year: str):
-            game_dir = track_maps_dir / f"f1_{game_year}"
-            return await self.send_from_directory(game_dir, 'svg_transforms.json',
-                                                  mimetype='application/json')
+            return self.send_asset(track_maps_dir, f"f1_{game_year}/svg_transforms.json", mimetype='application/json')
 
         self.m_app.route('/track-maps/f1_<game_year>/svg_transforms.json')(serve_svg_transforms)
 
         # Per-game SVG track maps: /track-maps/f1_2025/Singapore.svg
         async def serve_track_map(game_year: str, filename: str):
-            game_dir = track_maps_dir / f"f1_{game_year}"
-            return await self.send_from_directory(game_dir, filename, mimetype='image/svg+xml')
+            return self.send_asset(track_maps_dir, f"f1_{game_year}/{filename}", mimetype='image/svg+xml')
 
         self.m_app.route('/track-maps/f1_<game_year>/<filename>')(serve_track_map)
 
@@ -541,7 +775,49 @@ class BaseWebServer:
         Returns:
             str: Rendered HTML string.
         """
-        return await quart_render_template(template_name, **context)
+        return (await self._render_cached(template_name, context)).body.decode()
+
+    async def render_page(self, template_name: str, **context: Any) -> Response:
+        """
+        Render an HTML template with context into a response, gzipped for clients that accept it.
+
+        Args:
+            template_name (str): Name of the template file.
+            **context: Key-value pairs passed to the template.
+
+        Returns:
+            Response: The page response.
+        """
+        return self._asset_response(await self._render_cached(template_name, context), cache_control=None)
+
+    async def _render_cached(self, template_name: str, context: Dict[str, Any]) -> CachedAsset:
+        """
+        Render a template, or get it as rendered before with the same context. The templates and the files they link
+        don't change while the app runs, so a page only depends on its context.
+
+        Args:
+            template_name (str): Name of the template file.
+            context (Dict[str, Any]): Key-value pairs passed to the template.
+
+        Returns:
+            CachedAsset: The rendered page.
+        """
+        key = (template_name, quart_request.root_path, tuple(sorted(context.items())))
+        try:
+            page = self.m_rendered_pages.get(key)
+        except TypeError: # Unhashable context value
+            key, page = None, None
+        if page is not None:
+            self.m_rendered_pages.move_to_end(key)
+            return page
+
+        html = await quart_render_template(template_name, **context)
+        page = CachedAsset(html.encode(), 'text/html; charset=utf-8')
+        if key is not None and self.m_assets.m_enabled:
+            self.m_rendered_pages[key] = page
+            if len(self.m_rendered_pages) > MAX_RENDERED_PAGES:
+                self.m_rendered_pages.popitem(last=False)
+        return page
 
     def jsonify(self, *args: Any, **kwargs: Any) -> Any:
         """
@@ -584,9 +860,142 @@ class BaseWebServer:
         self.m_stats.track_event("__STATIC__", filename)
         return await quart_send_from_directory(directory, filename, **kwargs)
 
+    def send_asset(self,
+                   directory: Union[str, os.PathLike],
+                   filename: str,
+                   mimetype: Optional[str] = None) -> Response:
+        """
+        Send a file that doesn't change while the app runs, from the asset cache.
+
+        A request carrying the file's content hash as the v parameter (see url_for in templates) may be cached for
+        good. Others have to revalidate, which costs a bodyless 304 if the file is unchanged.
+
+        Args:
+            directory (str | PathLike): The directory to serve from.
+            filename (str): The path of the file within the directory.
+            mimetype (Optional[str]): Type to serve the file as. Guessed from the extension by default.
+
+        Returns:
+            Response: The file response.
+
+        Raises:
+            NotFound: If the file doesn't exist or is outside the directory.
+        """
+        self.m_stats.track_event("__STATIC__", filename)
+        if (asset := self.m_assets.get(directory, filename, mimetype)) is None:
+            abort(HTTPStatus.NOT_FOUND)
+        immutable = quart_request.args.get('v') == asset.etag
+        return self._asset_response(asset, IMMUTABLE_CACHE_CONTROL if immutable else REVALIDATE_CACHE_CONTROL)
+
+    async def _serve_static(self, filename: str) -> Response:
+        """View of the static folder route."""
+        return self.send_asset(self.m_static_dir, filename)
+
+    def _asset_response(self, asset: CachedAsset, cache_control: Optional[str]) -> Response:
+        """
+        Response for a cached file or page: 304 if the client has it, else its precompressed variant if the client
+        accepts gzip, else its bytes.
+
+        Args:
+            asset (CachedAsset): The file or page
+            cache_control (Optional[str]): Cache-Control header, None to leave it to the after-request handler
+
+        Returns:
+            Response: The response to send
+        """
+        if quart_request.if_none_match.contains_weak(asset.etag):
+            response = Response(b'', status=HTTPStatus.NOT_MODIFIED)
+        elif asset.gzipped is not None and self._acceptsGzip():
+            response = Response(asset.gzipped, mimetype=asset.mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(asset.body, mimetype=asset.mimetype)
+        response.set_etag(asset.etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        if cache_control:
+            response.headers['Cache-Control'] = cache_control
+        return response
+
+    def cached_response(self, etag: str, mimetype: str) -> Optional[Response]:
+        """
+        Answer a request for content with this ETag without its body, where possible.
+
+        Lets a route skip building a body the client won't need.
+
+        Args:
+            etag (str): ETag of the content the route would serve
+            mimetype (str): Type of the content
+
+        Returns:
+            Optional[Response]: 304 Not Modified if the client has this content, its cached gzip variant if the client
+                accepts gzip, None if the body has to be built
+        """
+        if quart_request.if_none_match.contains_weak(etag):
+            response = Response(b'', status=HTTPStatus.NOT_MODIFIED)
+        elif self._acceptsGzip() and (compressed := self.m_gzip_variants.get(etag)) is not None:
+            response = Response(compressed, mimetype=mimetype)
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            return None
+        response.set_etag(etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        return response
+
+    async def make_conditional(self, rv: Any) -> Response:
+        """
+        Make a 200 response revalidatable and compressed.
+
+        Responses that already carry an ETag (files from send_from_directory, or set by the route from the identity of
+        immutable content) keep it, and their gzip variant is cached under it. Others get an ETag hashed from the body.
+        A request whose If-None-Match holds the ETag gets a bodyless 304. Otherwise the body is gzipped if the client
+        accepts it. The ETag is weak as it covers both encodings.
+
+        Args:
+            rv (Any): Anything a Quart route may return
+
+        Returns:
+            Response: The response to send
+        """
+        response: Response = await self.m_app.make_response(rv)
+        if response.status_code != HTTPStatus.OK:
+            return response
+
+        etag, _ = response.get_etag()
+        immutable = etag is not None
+        if not immutable:
+            etag = body_etag(await response.get_data())
+        if cached := self.cached_response(etag, response.mimetype):
+            return cached
+        response.set_etag(etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        if not is_compressible(response.mimetype) or not self._acceptsGzip():
+            return response
+
+        body = await response.get_data()
+        if len(body) < COMPRESS_MIN_BYTES:
+            return response
+        if immutable:
+            compressed = await asyncio.to_thread(gzip_body, body, CACHED_GZIP_LEVEL)
+            self.m_gzip_variants.put(etag, compressed)
+        else:
+            compressed = gzip_body(body, DYNAMIC_GZIP_LEVEL)
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = 'gzip'
+        return response
+
+    def _acceptsGzip(self) -> bool:
+        """Whether the client of the current request accepts gzip-encoded bodies."""
+        return quart_request.accept_encodings.quality('gzip') > 0
+
     def get_stats(self) -> dict:
-        """Get current web server stats snapshot."""
-        return self.m_stats.get_stats()
+        """Get current web server stats snapshot, with the send stats of each Socket.IO client under __CLIENTS__
+        and of each binary stream client under __BINARY_STREAM_CLIENTS__."""
+        stats = self.m_stats.get_stats()
+        if clients := self.m_client_flow.get_stats():
+            stats["__CLIENTS__"] = clients
+        if self.m_binary_stream and (clients := self.m_binary_stream.get_stats()):
+            stats["__BINARY_STREAM_CLIENTS__"] = clients
+        return stats
 
     async def stop(self) -> None:
         """Stop the web server."""
@@ -28,12 +28,17 @@ from lib.error_status import is_port_in_use_error, PngHttpPortInUseError
 
 # -------------------------------------- FUNCTIONS ---------------------------------------------------------------------
 
-def get_socket_for_uvicorn(port: int, host: str) -> socket.socket:
+def supports_reuse_port() -> bool:
+    """Whether several processes can listen on the same port, with the kernel balancing connections (SO_REUSEPORT)."""
+    return platform.system() != "Windows" and hasattr(socket, "SO_REUSEPORT")
+
+def get_socket_for_uvicorn(port: int, host: str, reuse_port: bool = False) -> socket.socket:
     """Get a socket for Uvicorn to use. Handles port in use error.
 
     Args:
         port (int): The port to bind to.
         host (str, optional): The host to bind to.
+        reuse_port (bool, optional): Share the port with other processes setting it (see supports_reuse_port).
 
     Returns:
         socket.socket: The socket object.
@@ -55,6 +60,8 @@ def get_socket_for_uvicorn(port: int, host: str) -> socket.socket:
     else:
         # Unix/Linux/macOS: SO_REUSEADDR allows binding to TIME_WAIT ports (safe for quick restart)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if reuse_port and supports_reuse_port():
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
 
     try:
         sock.bind((host, port))
@@ -0,0 +1,134 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark for the streaming capture writer.
+
+Feeds a synthetic telemetry stream (F1 25 packet mix, ~60 Hz) into either the streaming writer or the in-memory
+F1PacketCapture, at a multiple of real time, and reports the ingest (add) latency percentiles and the process RSS.
+
+Usage:
+  python scripts/bench_pcap_stream_writer.py [--minutes N] [--speed X] [--mode stream|memory] [--output PATH]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+import psutil
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.packet_cap import F1PacketCapture, F1PcapReader, F1PcapStreamWriter
+
+# packet id -> (size in bytes, packets per second)
+PACKET_MIX = {
+    0: (1349, 60), 1: (753, 2), 2: (1285, 60), 4: (1284, 1), 5: (1133, 2),
+    6: (1352, 60), 7: (1239, 60), 10: (953, 10), 13: (273, 60),
+}
+HEADER_STRUCT = struct.Struct("<HBBBBBQfIIBB")
+
+def synthetic_stream(seconds: int):
+    """Yield (timestamp, packet) tuples. Payloads are mostly static with a few changing bytes, like real telemetry"""
+    rng = random.Random(7)
+    templates = {pid: bytearray(rng.getrandbits(8) for _ in range(size - HEADER_STRUCT.size))
+                 for pid, (size, _) in PACKET_MIX.items()}
+    start = 1_700_000_000.0
+    for frame in range(seconds * 60):
+        session_time = frame / 60.0
+        for pid, (_, rate) in PACKET_MIX.items():
+            if frame % (60 // rate):
+                continue
+            body = templates[pid]
+            body[frame % len(body)] = frame & 0xFF
+            header = HEADER_STRUCT.pack(2025, 25, 1, 0, 1, pid, 1234, session_time, frame, frame, 0, 255)
+            yield start + session_time, header + bytes(body)
+
+def percentile(sorted_values, pct):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--minutes", type=int, default=120, help="Synthetic session length (default: 120)")
+    parser.add_argument("--speed", type=float, default=100.0,
+                        help="Feed rate as a multiple of real time, 0 for as fast as possible (default: 100)")
+    parser.add_argument("--mode", choices=("stream", "memory"), default="stream",
+                        help="Streaming writer or in-memory F1PacketCapture")
+    parser.add_argument("--output", default=None, help="Output file (default: temp file, deleted afterwards)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(tempfile.gettempdir(), f"bench_stream_{os.getpid()}.f1pcap")
+    # Preallocated so that the bookkeeping doesn't show up in the RSS growth
+    num_expected = args.minutes * 60 * sum(rate for _, rate in PACKET_MIX.values())
+    latencies = array('Q', bytes(8 * num_expected))
+    proc = psutil.Process()
+    rss_start = proc.memory_info().rss
+    peak_rss = rss_start
+
+    sink = F1PcapStreamWriter(output) if args.mode == "stream" else F1PacketCapture(compressed=True)
+    wall_start = time.perf_counter()
+    first_timestamp = None
+    for count, (timestamp, packet) in enumerate(synthetic_stream(args.minutes * 60)):
+        if first_timestamp is None:
+            first_timestamp = timestamp
+        if args.speed and count % 256 == 0:
+            # Pace in batches, like a socket draining its receive buffer
+            ahead = (timestamp - first_timestamp) / args.speed - (time.perf_counter() - wall_start)
+            if ahead > 0:
+                time.sleep(ahead)
+        t0 = time.perf_counter_ns()
+        sink.add(packet, timestamp)
+        latencies[count] = time.perf_counter_ns() - t0
+        if count % 50_000 == 0:
+            peak_rss = max(peak_rss, proc.memory_info().rss)
+    ingest_secs = time.perf_counter() - wall_start
+    peak_rss = max(peak_rss, proc.memory_info().rss)
+
+    close_start = time.perf_counter()
+    if args.mode == "stream":
+        num_packets, _ = sink.close()
+        print(f"dropped packets:      {sink.num_dropped}")
+    else:
+        _, num_packets, _ = sink.dumpToFile(output)
+    close_secs = time.perf_counter() - close_start
+
+    with F1PcapReader(output) as reader:
+        assert reader.getNumPackets() == num_packets
+    latencies = sorted(latencies)
+    print(f"packets:              {num_packets} ({args.minutes} min)")
+    print(f"ingest time:          {ingest_secs:.2f} s ({num_packets / ingest_secs:,.0f} packets/s)")
+    print(f"add() latency:        p50 {percentile(latencies, 50) / 1e3:.1f} us, "
+          f"p99 {percentile(latencies, 99) / 1e3:.1f} us, max {latencies[-1] / 1e3:.1f} us, "
+          f"mean {statistics.fmean(latencies) / 1e3:.1f} us")
+    print(f"close/dump time:      {close_secs:.2f} s")
+    print(f"RSS growth (peak):    {(peak_rss - rss_start) / 1e6:.1f} MB")
+    print(f"file size:            {os.path.getsize(output) / 1e6:.1f} MB")
+    if not args.output:
+        os.remove(output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark for the race control message store.
+
+Fills a SessionRaceControlManager with synthetic messages (22 drivers) and times the common read paths:
+full JSON export, per-driver export, incremental "since id" polling and lap/type queries.
+
+Usage:
+  python scripts/bench_race_ctrl_store.py [--messages N] [--max-in-memory N] [--no-spill]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.race_ctrl import (DriverRaceControlManager, MessageType,
+                           RaceCtrlMsgBase, SessionRaceControlManager)
+
+NUM_DRIVERS = 22
+
+def build(num_messages: int, max_in_memory: int | None, spill: bool) -> SessionRaceControlManager:
+    rng = random.Random(42)
+    session_mgr = SessionRaceControlManager(max_in_memory=max_in_memory, spill_to_disk=spill)
+    for index in range(NUM_DRIVERS):
+        session_mgr.register_driver(index, DriverRaceControlManager(index))
+    types = list(MessageType)
+    for i in range(num_messages):
+        involved = rng.sample(range(NUM_DRIVERS), rng.choice((0, 1, 1, 1, 2)))
+        session_mgr.add_message(RaceCtrlMsgBase(
+            timestamp=i * 0.5,
+            message_type=rng.choice(types),
+            involved_drivers=involved,
+            lap_number=1 + i // max(1, num_messages // 60),
+        ))
+    return session_mgr
+
+def bench(label: str, func, number: int) -> None:
+    secs = timeit.timeit(func, number=number) / number
+    print(f"{label:<40} {secs * 1e3:10.3f} ms")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10_000, help="Number of synthetic messages")
+    parser.add_argument("--max-in-memory", type=int, default=None, help="Bound the in-memory ring")
+    parser.add_argument("--no-spill", action="store_true", help="Discard evicted messages instead of spilling")
+    args = parser.parse_args()
+
+    bench("add messages", lambda: build(args.messages, args.max_in_memory, not args.no_spill), 3)
+    session_mgr = build(args.messages, args.max_in_memory, not args.no_spill)
+    last_id = session_mgr.last_id
+
+    bench("toJSON (all)", session_mgr.toJSON, 5)
+    bench("driver toJSON (index 7)", session_mgr.drivers[7].toJSON, 20)
+    bench("toJSON since last_id - 10", lambda: session_mgr.toJSON(since_id=last_id - 10), 1000)
+    bench("query driver 7 since last_id - 500",
+          lambda: session_mgr.query(since_id=last_id - 500, driver_index=7), 1000)
+    bench("query lap 30", lambda: session_mgr.query(lap_number=30), 1000)
+    bench("query OVERTAKE, limit 50",
+          lambda: session_mgr.query(message_type=MessageType.OVERTAKE, limit=50), 1000)
+    bench("query lap 30 + OVERTAKE", lambda: session_mgr.query(lap_number=30, message_type=MessageType.OVERTAKE), 1000)
+
+if __name__ == "__main__":
+    main()
@@ -95,7 +95,8 @@ hiddenimports = (
     collect_submodules("apps.save_viewer") +
     collect_submodules("apps.hud") +
     collect_submodules("apps.broker") +
-    collect_submodules("apps.mcp_server")
+    collect_submodules("apps.mcp_server") +
+    collect_submodules("apps.web_fanout")
 )
 
 # Automatically collect all assets and frontend files
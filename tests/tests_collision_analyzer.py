@@ -27,7 +27,10 @@ import sys
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lib.collisions_analyzer import CollisionRecord, CollisionPairKey, CollisionAnalyzer, CollisionAnalyzerMode
+import random
+
+from lib.collisions_analyzer import (CollisionRecord, CollisionPairKey, CollisionAnalyzer, CollisionAnalyzerMode,
+                                     StreamingCollisionAnalyzer)
 from tests_base import F1TelemetryUnitTestsBase
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -177,3 +180,39 @@ class TestCollisionAnalyzer(CollisionAnalyzerUT):
 
         self.assertEqual(len(json_output["records"]), 3)
         self.assertEqual(len(json_output["collision-pairs"]), 2)  # Hamilton-Verstappen and Leclerc-Sainz
+
+class TestStreamingCollisionAnalyzer(CollisionAnalyzerUT):
+    DRIVERS = [(44, "Hamilton"), (33, "Verstappen"), (16, "Leclerc"), (55, "Sainz"), (4, "Norris"), (81, "Piastri")]
+
+    def _random_records(self, seed, count):
+        rng = random.Random(seed)
+        records = []
+        for row_id in range(count):
+            (index_1, name_1), (index_2, name_2) = rng.sample(self.DRIVERS, 2)
+            lap = row_id // 3 + 1
+            records.append(CollisionRecord(name_1, lap, index_1, name_2, lap, index_2, row_id))
+        return records
+
+    def test_matches_batch_analyzer(self):
+        """Every intermediate state matches a batch analyzer rebuilt from the same records"""
+        for seed in range(5):
+            records = self._random_records(seed, 40)
+            streaming = StreamingCollisionAnalyzer()
+            for i, record in enumerate(records):
+                streaming.processCollisionRecord(record)
+                batch = CollisionAnalyzer(CollisionAnalyzerMode.INPUT_MODE_LIST_COLLISION_RECORDS, records[:i + 1])
+                self.assertEqual(streaming.toJSON(), batch.toJSON())
+                self.assertEqual(streaming.getMostCollisions(), batch.getMostCollisions())
+                self.assertEqual(streaming.getNumCollisions(), batch.getNumCollisions())
+
+    def test_empty(self):
+        streaming = StreamingCollisionAnalyzer()
+        self.assertEqual(streaming.getMostCollisions(), ([], 0))
+        self.assertEqual(streaming.getNumCollisions(), 0)
+        self.assertEqual(streaming.getMostCollidedPairsJSON(), {"count": 0, "collision-pairs": []})
+
+    def test_clear(self):
+        streaming = StreamingCollisionAnalyzer(self._random_records(3, 10))
+        streaming.clear()
+        self.assertEqual(streaming.toJSON(), StreamingCollisionAnalyzer().toJSON())
+        self.assertEqual(streaming.getNumCollisions(), 0)
@@ -0,0 +1,235 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import importlib.util
+import logging
+import os
+import struct
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.dev_tools.columnar_export import (CaptureTableDecoder, exportCapture,
+                                            formatResult, saveLapsTable)
+from apps.dev_tools.synthetic_session import SyntheticSession
+from lib.f1_types import F1PacketType
+from lib.telemetry_manager.factory import PacketParserFactory
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+CAPTURE_FILE = os.path.join(os.path.dirname(__file__), "data", "synthetic_race_10s.f1pcap")
+
+def _decodeAll(packets, batch_size: int = 5):
+    decoder = CaptureTableDecoder(batch_size)
+    batches = []
+    for timestamp, packet in packets:
+        batches += decoder.add(timestamp, packet)
+    batches += decoder.flush()
+    tables = {}
+    for batch in batches:
+        tables.setdefault(batch.table, []).append(batch.columns)
+    merged = {}
+    for table, chunks in tables.items():
+        merged[table] = {name: np.concatenate([np.asarray(chunk[name]) for chunk in chunks]) for name in chunks[0]}
+    return decoder, merged
+
+class TestCaptureTableDecoder(F1TelemetryUnitTestsBase):
+
+    def _checkAgainstParsers(self, packet_format: int):
+        session = SyntheticSession(num_cars=4, rate_hz=4, total_laps=1, packet_format=packet_format,
+                                   packet_types=SyntheticSession.ALL_PACKET_TYPES)
+        packets = list(session.packets(5))
+        decoder, tables = _decodeAll(packets)
+        self.assertEqual(decoder.m_num_skipped, 0)
+
+        factory = PacketParserFactory(set(F1PacketType), logging.getLogger(__name__))
+        parsed = {}
+        for _, packet in packets:
+            obj = factory.parse(packet)
+            parsed.setdefault(obj.m_header.m_packetId, []).append(obj)
+
+        motion = tables["motion"]
+        self.assertEqual(len(motion["car_index"]), len(parsed[F1PacketType.MOTION]) * 22)
+        self.assertEqual(motion["car_index"][:23].tolist(), list(range(22)) + [0])
+        expected = [car.m_worldPositionX for pkt in parsed[F1PacketType.MOTION] for car in pkt.m_carMotionData]
+        np.testing.assert_allclose(motion["world_position_x"], expected, rtol=1e-6)
+        expected = [pkt.m_header.m_frameIdentifier for pkt in parsed[F1PacketType.MOTION] for _ in range(22)]
+        self.assertEqual(motion["frame_identifier"].tolist(), expected)
+        self.assertTrue(np.all(motion["packet_format"] == packet_format))
+
+        lap_data = tables["lap_data"]
+        expected = [lap.m_currentLapNum for pkt in parsed[F1PacketType.LAP_DATA] for lap in pkt.m_lapData]
+        self.assertEqual(lap_data["current_lap_num"].tolist(), expected)
+        expected = [pkt.m_timeTrialPBCarIdx for pkt in parsed[F1PacketType.LAP_DATA] for _ in range(22)]
+        self.assertEqual(lap_data["time_trial_pb_car_idx"].tolist(), expected)
+
+        telemetry = tables["car_telemetry"]
+        pkts = parsed[F1PacketType.CAR_TELEMETRY]
+        self.assertEqual(telemetry["speed"].tolist(),
+                         [car.m_speed for pkt in pkts for car in pkt.m_carTelemetryData])
+        # Wheel order is RL, RR, FL, FR
+        self.assertEqual(telemetry["tyres_surface_temperature_fl"].tolist(),
+                         [car.m_tyresSurfaceTemperature[2] for pkt in pkts for car in pkt.m_carTelemetryData])
+        self.assertEqual(telemetry["suggested_gear"].tolist(), [pkt.m_suggestedGear for pkt in pkts for _ in range(22)])
+
+        status = tables["car_status"]
+        np.testing.assert_allclose(status["fuel_in_tank"], [car.m_fuelInTank for pkt in parsed[F1PacketType.CAR_STATUS]
+                                                            for car in pkt.m_carStatusData], rtol=1e-6)
+
+        damage = tables["car_damage"]
+        pkts = parsed[F1PacketType.CAR_DAMAGE]
+        np.testing.assert_allclose(damage["tyres_wear_rr"],
+                                   [car.m_tyresWear[1] for pkt in pkts for car in pkt.m_carDamageData], rtol=1e-6)
+        self.assertEqual("tyre_blisters_fl" in damage, packet_format >= 2025)
+
+        setups = tables["car_setups"]
+        pkts = parsed[F1PacketType.CAR_SETUPS]
+        np.testing.assert_allclose(setups["fuel_load"],
+                                   [car.m_fuelLoad for pkt in pkts for car in pkt.m_carSetups], rtol=1e-6)
+        np.testing.assert_allclose(setups["next_front_wing_value"],
+                                   [pkt.m_nextFrontWingValue for pkt in pkts for _ in range(22)], rtol=1e-6)
+
+        # The rest go through the packet parsers, one row per list item
+        participants = tables["participants"]
+        pkts = parsed[F1PacketType.PARTICIPANTS]
+        self.assertEqual(len(participants["name"]), sum(len(pkt.toJSON()["participants"]) for pkt in pkts))
+        self.assertEqual(len(tables["event"]["event_string_code"]), len(parsed[F1PacketType.EVENT]))
+        self.assertIn("session_uid", tables["session"])
+        self.assertIn("tyre_set_index", tables["tyre_sets"])
+
+    def test_2025_matches_parsers(self):
+        self._checkAgainstParsers(2025)
+
+    def test_2024_matches_parsers(self):
+        self._checkAgainstParsers(2024)
+
+    def test_batch_size_does_not_change_output(self):
+        session = SyntheticSession(num_cars=4, rate_hz=4, total_laps=1)
+        packets = list(session.packets(5))
+        _, small = _decodeAll(packets, batch_size=3)
+        _, large = _decodeAll(packets, batch_size=100000)
+        self.assertEqual(set(small), set(large))
+        for table in ("motion", "lap_data", "car_telemetry", "car_status", "car_damage"):
+            for name, values in large[table].items():
+                np.testing.assert_array_equal(small[table][name], values, err_msg=f"{table}.{name}")
+
+    def test_other_formats_use_parser(self):
+        session = SyntheticSession(num_cars=4, rate_hz=4, total_laps=1)
+        motion = next(packet for _, packet in session.packets(1) if packet[6] == F1PacketType.MOTION.value)
+        # F1 23 motion packets have the same layout, but only 24/25 are decoded vectorised
+        motion_23 = struct.pack("<HB", 2023, 23) + motion[3:]
+        decoder = CaptureTableDecoder()
+        self.assertEqual(decoder.add(0.0, motion_23), [])
+        self.assertEqual(decoder.add(0.0, b"\x00" * 10), [])
+        batches = decoder.flush()
+        self.assertEqual(decoder.m_num_vectorised, 0)
+        self.assertEqual(decoder.m_num_skipped, 1)
+        self.assertEqual([batch.table for batch in batches], ["motion"])
+        self.assertEqual(batches[0].num_rows, 22)
+        self.assertEqual(batches[0].packet_format, 2023)
+        self.assertEqual(batches[0].columns["packet_format"], [2023] * 22)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            CaptureTableDecoder(batch_size=0)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with self.assertRaises(ValueError):
+                exportCapture(CAPTURE_FILE, tmp_dir, file_format="csv")
+
+class TestSaveLapsTable(F1TelemetryUnitTestsBase):
+
+    def _lap(self, lap_time_ms: int):
+        return {
+            "lap-time-in-ms": lap_time_ms,
+            "lap-time-str": "ignored",
+            "sector-1-time-in-ms": lap_time_ms // 3,
+            "sector-1-time-minutes": 0,
+            "lap-valid-bit-flags": 15,
+        }
+
+    def test_laps_table(self):
+        save = {
+            "game-year": 25,
+            "packet-format": 2025,
+            "session-info": {"track-id": "Silverstone", "session-type": "Race"},
+            "classification-data": [
+                {
+                    "index": 0, "driver-name": "VERSTAPPEN", "team": "Red Bull Racing", "is-player": False,
+                    "track-position": 1,
+                    "session-history": {"num-laps": 2, "lap-history-data": [self._lap(90000), self._lap(89000),
+                                                                             self._lap(0)]},
+                    "per-lap-info": [{
+                        "lap-number": 1, "track-position": 2, "top-speed-kmph": 320,
+                        "ers-stats": {"ers-deployed-j": 1000.0},
+                        "car-damage-data": {"tyres-wear": [1.0, 2.0, 3.0, 4.0]},
+                        "tyre-sets-data": {"tyre-set-data": []},
+                    }],
+                },
+                {
+                    "index": 1, "driver-name": "HAMILTON", "team": "Ferrari", "is-player": True,
+                    "track-position": 2,
+                    "session-history": None,
+                },
+            ],
+        }
+        table = saveLapsTable(save)
+        self.assertEqual(table["driver_name"], ["VERSTAPPEN", "VERSTAPPEN"])
+        self.assertEqual(table["lap_number"], [1, 2])
+        self.assertEqual(table["lap_time_in_ms"], [90000, 89000])
+        self.assertEqual(table["track"], ["Silverstone", "Silverstone"])
+        self.assertEqual(table["track_position"], [2, None])
+        self.assertEqual(table["ers_stats_ers_deployed_j"], [1000.0, None])
+        self.assertEqual(table["car_damage_data_tyres_wear"], [[1.0, 2.0, 3.0, 4.0], None])
+        self.assertNotIn("lap_time_str", table)
+        self.assertNotIn("tyre_sets_data", table)
+
+    def test_empty_save(self):
+        self.assertEqual(saveLapsTable({}), {})
+
+@unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+class TestExportCapture(F1TelemetryUnitTestsBase):
+
+    def test_export_round_trip(self):
+        import pyarrow.ipc
+        import pyarrow.parquet
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for file_format in ("parquet", "arrow"):
+                result = exportCapture(CAPTURE_FILE, os.path.join(tmp_dir, file_format), file_format=file_format,
+                                       batch_size=16)
+                self.assertEqual(result.num_skipped, 0)
+                self.assertGreater(result.output_size, 0)
+                self.assertIn("motion", result.output_files)
+                path = result.output_files["car_telemetry"]
+                if file_format == "parquet":
+                    table = pyarrow.parquet.read_table(path)
+                else:
+                    table = pyarrow.ipc.open_file(path).read_all()
+                self.assertEqual(table.num_rows, result.num_rows["car_telemetry"])
+                self.assertIn("Decode rate", formatResult(result))
@@ -29,7 +29,7 @@ from pydantic import ValidationError
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lib.config import CaptureSettings
+from lib.config import CaptureSettings, SaveFileFormat
 
 from .tests_config_base import TestF1ConfigBase
 
@@ -161,4 +161,28 @@ class TestCaptureSettings(TestF1ConfigBase):
 
     def test_session_dir_whitespace_only_raises(self):
         with self.assertRaises(ValidationError):
-            CaptureSettings(session_dir="   ")
\ No newline at end of file
+            CaptureSettings(session_dir="   ")
+
+    def test_default_save_file_format(self):
+        self.assertEqual(CaptureSettings().save_file_format, SaveFileFormat.JSON)
+        self.assertEqual(CaptureSettings(save_file_format="Binary").save_file_format, SaveFileFormat.BINARY)
+        with self.assertRaises(ValidationError):
+            CaptureSettings(save_file_format="XML")
+
+    def test_default_session_journal(self):
+        self.assertFalse(CaptureSettings().session_journal)
+        self.assertTrue(CaptureSettings(session_journal=True).session_journal)
+
+    def test_default_packet_ring_buffer(self):
+        settings = CaptureSettings()
+        self.assertEqual(settings.packet_ring_buffer_mb, 0)
+        self.assertEqual(settings.packet_ring_buffer_dump_sec, 300)
+
+    def test_packet_ring_buffer_bounds(self):
+        self.assertEqual(CaptureSettings(packet_ring_buffer_mb=64).packet_ring_buffer_mb, 64)
+        with self.assertRaises(ValidationError):
+            CaptureSettings(packet_ring_buffer_mb=-1)
+        with self.assertRaises(ValidationError):
+            CaptureSettings(packet_ring_buffer_mb=2048)
+        with self.assertRaises(ValidationError):
+            CaptureSettings(packet_ring_buffer_dump_sec=0)
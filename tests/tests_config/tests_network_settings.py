@@ -308,3 +308,25 @@ class TestNetworkSettings(TestF1ConfigBase):
 
         with self.assertRaises(ValidationError):
             NetworkSettings(enable_pkt_ordering=69420)
+
+    def test_web_fanout(self):
+        net = NetworkSettings()
+        self.assertEqual(net.web_fanout_port, 4771)
+        self.assertEqual(net.web_fanout_processes, 0)
+
+        net = NetworkSettings(web_fanout_port=5000, web_fanout_processes=4)
+        self.assertEqual(net.web_fanout_port, 5000)
+        self.assertEqual(net.web_fanout_processes, 4)
+
+        # Boundary conditions
+        NetworkSettings(web_fanout_processes=16)
+        with self.assertRaises(ValidationError):
+            NetworkSettings(web_fanout_processes=17)
+        with self.assertRaises(ValidationError):
+            NetworkSettings(web_fanout_processes=-1)
+        with self.assertRaises(ValidationError):
+            NetworkSettings(web_fanout_port=69420)
+
+        # Shares the TCP port checks with the other servers
+        with self.assertRaises(ValidationError):
+            NetworkSettings(server_port=5000, web_fanout_port=5000)
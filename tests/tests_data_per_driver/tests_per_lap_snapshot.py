@@ -0,0 +1,216 @@
+# MIT License
+#
+# Copyright (c) [2024] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# -------------------------------------- IMPORTS -----------------------------------------------------------------------
+
+import copy
+
+from apps.backend.state_mgmt_layer.data_per_driver import (PerLapSnapshotEntry,
+                                                           SnapshotBlobPool)
+from lib.f1_types import (ActualTyreCompound, CarDamageData, CarStatusData,
+                          F1PacketType, PacketHeader, PacketTyreSetsData,
+                          SafetyCarType, SessionType23, SessionType24,
+                          TractionControlAssistMode, TyreSetData,
+                          VisualTyreCompound)
+
+# -------------------------------------- HELPERS -----------------------------------------------------------------------
+
+def _car_damage(packet_format: int, wear: float) -> CarDamageData:
+    return CarDamageData.from_values(
+        packet_format=packet_format,
+        tyres_wear=[wear, wear + 1.5, wear + 0.25, wear + 2.0],
+        tyres_damage=[1, 2, 3, 4],
+        brakes_damage=[5, 6, 7, 8],
+        tyre_blisters=[0, 1, 0, 1],
+        fl_wing_damage=3, fr_wing_damage=4, rear_wing_damage=0,
+        floor_damage=1, diffuser_damage=0, sidepod_damage=2,
+        drs_fault=False, ers_fault=True,
+        gear_box_damage=11, engine_damage=12,
+        engine_mguh_wear=13, engine_es_wear=14, engine_ce_wear=15,
+        engine_ice_wear=16, engine_mguk_wear=17, engine_tc_wear=18,
+        engine_blown=False, engine_seized=False,
+    )
+
+def _car_status(packet_format: int, fuel: float) -> CarStatusData:
+    return CarStatusData.from_values(
+        traction_control=TractionControlAssistMode.OFF,
+        anti_lock_brakes=False,
+        fuel_mix=CarStatusData.FuelMix.STANDARD,
+        front_brake_bias=56,
+        pit_limiter_status=False,
+        fuel_in_tank=fuel,
+        fuel_capacity=110.0,
+        fuel_remaining_laps=2.5,
+        max_rpm=13000,
+        idle_rpm=5000,
+        max_gears=8,
+        drs_allowed=1,
+        drs_activation_distance=0,
+        actual_tyre_compound=ActualTyreCompound.C3,
+        visual_tyre_compound=VisualTyreCompound.MEDIUM,
+        tyres_age_laps=7,
+        m_vehicle_fia_flags=CarStatusData.VehicleFIAFlags.GREEN,
+        engine_power_ice=600000.0,
+        engine_power_mguk=120000.0,
+        ers_store_energy=3000000.0,
+        ers_deploy_mode=CarStatusData.ERSDeployMode.MEDIUM,
+        ers_harvested_this_lap_mguk=1000.0,
+        ers_harvested_this_lap_mguh=2000.0,
+        ers_deployed_this_lap=3000.0,
+        network_paused=False,
+        packet_format=packet_format,
+        ers_harvested_limit_per_lap=4000000.0 if packet_format >= 2026 else 0.0,
+    )
+
+def _tyre_sets(packet_format: int, fitted_index: int, frame: int) -> PacketTyreSetsData:
+    header = PacketHeader.from_values(packet_format, packet_format % 100, 1, 2, 1, F1PacketType.TYRE_SETS,
+                                      0xDEADBEEF, frame / 60.0, frame, frame, 0, 255)
+    tyre_sets = [
+        TyreSetData.from_values(
+            packet_format=packet_format,
+            actual_tyre_compound=ActualTyreCompound.C3,
+            visual_tyre_compound=VisualTyreCompound.MEDIUM,
+            wear=index * 3,
+            available=index != fitted_index,
+            recommended_session=SessionType23.RACE if packet_format == 2023 else SessionType24.RACE,
+            life_span=25,
+            usable_life=20,
+            lap_delta_time=index * 100,
+            fitted=index == fitted_index,
+        )
+        for index in range(PacketTyreSetsData.MAX_TYRE_SETS)
+    ]
+    return PacketTyreSetsData.from_values(header, 3, tyre_sets, fitted_index)
+
+def _snapshot(packet_format: int, lap: int, pool: SnapshotBlobPool, fitted_index: int = 2) -> PerLapSnapshotEntry:
+    return PerLapSnapshotEntry(
+        car_damage=_car_damage(packet_format, float(lap)),
+        car_status=_car_status(packet_format, 100.0 - lap),
+        max_sc_status=SafetyCarType.NO_SAFETY_CAR,
+        tyre_sets=_tyre_sets(packet_format, fitted_index, frame=lap * 1000),
+        track_position=4,
+        top_speed_kmph=320,
+        ers_harv_mguh_j=1.0,
+        ers_harv_mguk_j=2.0,
+        ers_deployed_j=3.0,
+        ers_harv_limit_mguk_j=4.0,
+        blob_pool=pool,
+    )
+
+# -------------------------------------- TESTS -------------------------------------------------------------------------
+
+def test_snapshot_round_trip_all_formats():
+    for packet_format in (2023, 2024, 2025, 2026):
+        car_damage = _car_damage(packet_format, 12.5)
+        car_status = _car_status(packet_format, 42.0)
+        tyre_sets = _tyre_sets(packet_format, 5, frame=10)
+        entry = PerLapSnapshotEntry(car_damage, car_status, SafetyCarType.VIRTUAL_SAFETY_CAR, tyre_sets,
+                                    track_position=7, top_speed_kmph=300, ers_harv_mguh_j=0.0,
+                                    ers_harv_mguk_j=1.0, ers_deployed_j=2.0, ers_harv_limit_mguk_j=3.0)
+        assert entry.m_car_damage_packet == car_damage
+        assert entry.m_car_status_packet == car_status
+        assert entry.m_tyre_sets_packet == tyre_sets
+
+        json_obj = entry.toJSON(3)
+        assert json_obj["car-damage-data"] == car_damage.toJSON()
+        assert json_obj["car-status-data"] == car_status.toJSON()
+        assert json_obj["tyre-sets-data"] == tyre_sets.toJSON()
+        assert json_obj["max-safety-car-status"] == str(SafetyCarType.VIRTUAL_SAFETY_CAR)
+        assert json_obj["track-position"] == 7
+
+def test_snapshot_missing_packets():
+    entry = PerLapSnapshotEntry(None, None, None, None, track_position=0, top_speed_kmph=None,
+                                ers_harv_mguh_j=0.0, ers_harv_mguk_j=0.0, ers_deployed_j=0.0,
+                                ers_harv_limit_mguk_j=0.0, blob_pool=SnapshotBlobPool())
+    assert entry.m_car_damage_packet is None
+    assert entry.m_car_status_packet is None
+    assert entry.m_tyre_sets_packet is None
+    json_obj = entry.toJSON(0)
+    assert json_obj["car-damage-data"] is None
+    assert json_obj["tyre-sets-data"] is None
+    assert json_obj["track-position"] is None
+
+def test_tyre_sets_shared_across_laps():
+    pool = SnapshotBlobPool()
+    snapshots = [_snapshot(2025, lap, pool) for lap in range(1, 31)]
+
+    # Same tyre sets content every lap (only the header differs) - one shared blob
+    assert len(pool) == 1
+    assert all(entry.m_tyre_sets_blob is snapshots[0].m_tyre_sets_blob for entry in snapshots)
+    assert snapshots[10].m_tyre_sets_packet.m_header.m_frameIdentifier == 11000
+
+    # Tyre change - new content gets its own blob
+    pitted = _snapshot(2025, 31, pool, fitted_index=6)
+    assert len(pool) == 2
+    assert pitted.m_tyre_sets_packet.m_fittedIdx == 6
+    assert snapshots[-1].m_tyre_sets_packet.m_fittedIdx == 2
+
+def test_snapshot_does_not_alias_live_packets():
+    car_damage = _car_damage(2025, 1.0)
+    entry = PerLapSnapshotEntry(car_damage, None, None, None, track_position=1, top_speed_kmph=1,
+                                ers_harv_mguh_j=0.0, ers_harv_mguk_j=0.0, ers_deployed_j=0.0,
+                                ers_harv_limit_mguk_j=0.0)
+    expected = copy.deepcopy(car_damage.toJSON())
+    car_damage.m_tyresWear[0] = 99.0
+    assert entry.m_car_damage_packet.toJSON() == expected
+
+def test_unserialisable_packet_is_kept_as_object():
+    # Recommended session value unknown to the enum - parsed as a raw int, which to_bytes cannot pack
+    tyre_sets = _tyre_sets(2024, 1, frame=1)
+    tyre_sets.m_tyreSetData[0].m_recommendedSession = 250
+    entry = PerLapSnapshotEntry(None, None, None, tyre_sets, track_position=1, top_speed_kmph=1,
+                                ers_harv_mguh_j=0.0, ers_harv_mguk_j=0.0, ers_deployed_j=0.0,
+                                ers_harv_limit_mguk_j=0.0, blob_pool=SnapshotBlobPool())
+    assert entry.m_tyre_sets_packet is tyre_sets
+    assert entry.toJSON(1)["tyre-sets-data"] == tyre_sets.toJSON()
+
+def test_track_position_is_writable():
+    entry = _snapshot(2025, 1, SnapshotBlobPool())
+    entry.m_track_position = 1
+    assert entry.toJSON(1)["track-position"] == 1
+
+def test_json_cache_matches_packet_dump():
+    for packet_format in (2023, 2024, 2025, 2026):
+        entry = _snapshot(packet_format, 3, SnapshotBlobPool())
+        expected = entry.toJSON(3)
+        assert entry.m_packets_json_blob is not None
+        assert entry.toJSON(3) == expected
+        assert expected["tyre-sets-data"] == entry.m_tyre_sets_packet.toJSON()
+
+def test_json_cache_returns_copies():
+    entry = _snapshot(2025, 1, SnapshotBlobPool())
+    entry.buildJSONCache()
+    blob = entry.m_packets_json_blob
+    entry.toJSON(1)["car-damage-data"]["tyres-wear"] = None
+    assert entry.toJSON(1)["car-damage-data"] == entry.m_car_damage_packet.toJSON()
+    entry.buildJSONCache()
+    assert entry.m_packets_json_blob is blob
+
+def test_tyre_set_json():
+    entry = _snapshot(2025, 1, SnapshotBlobPool(), fitted_index=4)
+    assert entry.getTyreSetJSON(4) == entry.m_tyre_sets_packet.m_tyreSetData[4].toJSON()
+    assert entry.getTyreSetJSON(PacketTyreSetsData.MAX_TYRE_SETS) is None
+    assert entry.getTyreSetJSON(-1) is None
+    empty = PerLapSnapshotEntry(None, None, None, None, track_position=0, top_speed_kmph=None,
+                                ers_harv_mguh_j=0.0, ers_harv_mguk_j=0.0, ers_deployed_j=0.0,
+                                ers_harv_limit_mguk_j=0.0)
+    assert empty.getTyreSetJSON(0) is None
@@ -244,3 +244,22 @@ class TestF1Delta(F1TelemetryUnitTestsBase):
         res = mgr._interpolated_time_for_distance(1, 100.0)
 
         self.assertEqual(res, 5000.0)
+
+    # ---------------------------------------------------------
+    def test_restore_lap_from_saved_points(self):
+        mgr = LapDeltaManager()
+        mgr.record_data_point(1, 10.0, 1000)
+        mgr.record_data_point(1, 20.0, 2000)
+        mgr.set_best_lap(1)
+        mgr.record_data_point(2, 15.0, 1600)
+        self.assertEqual(mgr.best_lap_num, 1)
+
+        stripped = mgr.without_laps()
+        self.assertEqual(stripped.best_lap_num, 1)
+        self.assertEqual(stripped.get_lap_points(1), [])
+        self.assertIsNone(stripped.get_delta())
+
+        stripped.restore_lap(1, mgr.get_lap_points(1))
+        self.assertEqual(stripped.get_delta().delta_ms, mgr.get_delta().delta_ms)
+        stripped.record_data_point(1, 30.0, 3000)
+        self.assertEqual(len(mgr.get_lap_points(1)), 2)
@@ -0,0 +1,95 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import os
+import sys
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.leaderboard_counter import LeaderboardCounter
+
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class TestLeaderboardCounter(F1TelemetryUnitTestsBase):
+    def test_initially_empty(self) -> None:
+        counter = LeaderboardCounter[str]()
+
+        self.assertEqual(len(counter), 0)
+        self.assertEqual(counter.leaders(), ([], 0))
+        self.assertEqual(counter.total, 0)
+        self.assertEqual(counter.get("a"), 0)
+        self.assertNotIn("a", counter)
+
+    def test_increment_returns_count(self) -> None:
+        counter = LeaderboardCounter[str]()
+
+        self.assertEqual(counter.increment("a"), 1)
+        self.assertEqual(counter.increment("a"), 2)
+        self.assertEqual(counter.get("a"), 2)
+        self.assertIn("a", counter)
+
+    def test_leaders_follow_max(self) -> None:
+        counter = LeaderboardCounter[str]()
+
+        counter.increment("a")
+        counter.increment("b")
+        self.assertEqual(counter.leaders(), (["a", "b"], 1))
+
+        counter.increment("b")
+        self.assertEqual(counter.leaders(), (["b"], 2))
+
+        counter.increment("a")
+        self.assertEqual(counter.leaders(), (["a", "b"], 2))
+        self.assertEqual(counter.total, 4)
+
+    def test_leaders_in_first_counted_order(self) -> None:
+        counter = LeaderboardCounter[str]()
+
+        for key in ["c", "a", "b", "b", "a", "c"]:
+            counter.increment(key)
+        self.assertEqual(counter.leaders(), (["c", "a", "b"], 2))
+
+    def test_first_key_object_is_kept(self) -> None:
+        counter = LeaderboardCounter[frozenset]()
+        first = frozenset({"x", "y"})
+
+        counter.increment(first)
+        counter.increment(frozenset({"y", "x"}))
+        leaders, count = counter.leaders()
+        self.assertIs(leaders[0], first)
+        self.assertEqual(count, 2)
+
+    def test_clear(self) -> None:
+        counter = LeaderboardCounter[str]()
+        counter.increment("a")
+
+        counter.clear()
+        self.assertEqual(len(counter), 0)
+        self.assertEqual(counter.leaders(), ([], 0))
+        self.assertEqual(counter.total, 0)
+
+        counter.increment("b")
+        self.assertEqual(counter.leaders(), (["b"], 1))
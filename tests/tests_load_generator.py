@@ -0,0 +1,222 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import logging
+import os
+import socket
+import sys
+from collections import Counter
+
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.dev_tools.load_generator import LoadGenerator, formatResult
+from apps.dev_tools.synthetic_session import SyntheticSession
+from lib.f1_types import F1PacketType, PacketHeader, SessionType24
+from lib.ipc import IpcPubSubBroker
+from lib.socket_receiver import IpcTransport, TcpTransport
+from lib.telemetry_manager.factory import PacketParserFactory
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Packet lengths from the game's UDP spec
+PACKET_LENGTHS = {
+    2024: {
+        F1PacketType.MOTION: 1349, F1PacketType.SESSION: 753, F1PacketType.LAP_DATA: 1285, F1PacketType.EVENT: 45,
+        F1PacketType.PARTICIPANTS: 1350, F1PacketType.CAR_SETUPS: 1133, F1PacketType.CAR_TELEMETRY: 1352,
+        F1PacketType.CAR_STATUS: 1239, F1PacketType.FINAL_CLASSIFICATION: 1020, F1PacketType.LOBBY_INFO: 1306,
+        F1PacketType.CAR_DAMAGE: 953, F1PacketType.SESSION_HISTORY: 1460, F1PacketType.TYRE_SETS: 231,
+        F1PacketType.MOTION_EX: 237, F1PacketType.TIME_TRIAL: 101,
+    },
+    2025: {
+        F1PacketType.MOTION: 1349, F1PacketType.SESSION: 753, F1PacketType.LAP_DATA: 1285, F1PacketType.EVENT: 45,
+        F1PacketType.PARTICIPANTS: 1284, F1PacketType.CAR_SETUPS: 1133, F1PacketType.CAR_TELEMETRY: 1352,
+        F1PacketType.CAR_STATUS: 1239, F1PacketType.FINAL_CLASSIFICATION: 1042, F1PacketType.LOBBY_INFO: 954,
+        F1PacketType.CAR_DAMAGE: 1041, F1PacketType.SESSION_HISTORY: 1460, F1PacketType.TYRE_SETS: 231,
+        F1PacketType.MOTION_EX: 273, F1PacketType.TIME_TRIAL: 101, F1PacketType.LAP_POSITIONS: 1131,
+    },
+}
+
+def _freePort(kind: int = socket.SOCK_STREAM) -> int:
+    with socket.socket(socket.AF_INET, kind) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+class TestSyntheticSessionPacketTypes(F1TelemetryUnitTestsBase):
+
+    def _parseAll(self, session: SyntheticSession, duration: float) -> Counter:
+        factory = PacketParserFactory(set(F1PacketType), logging.getLogger(__name__))
+        counts = Counter()
+        for _, packet in session.packets(duration):
+            parsed = factory.parse(packet)
+            self.assertIsNotNone(parsed, factory._last_failure_reason)
+            packet_type = parsed.m_header.m_packetId
+            # The event packet is a union, the game always sends the full length
+            if packet_type != F1PacketType.EVENT:
+                self.assertEqual(len(packet), PACKET_LENGTHS[session.m_packet_format][packet_type], packet_type)
+            counts[packet_type] += 1
+        return counts
+
+    def test_all_packet_types(self):
+        for packet_format in SyntheticSession.SUPPORTED_PACKET_FORMATS:
+            with self.subTest(packet_format=packet_format):
+                # Low frame rate, so that the one lap race (and the final classification) is quick to generate
+                session = SyntheticSession(num_cars=4, total_laps=1, rate_hz=4, packet_format=packet_format,
+                                           session_type=SessionType24.TIME_TRIAL,
+                                           packet_types=SyntheticSession.ALL_PACKET_TYPES)
+                counts = self._parseAll(session, 100.0)
+                expected = set(PACKET_LENGTHS[packet_format])
+                self.assertEqual(set(counts), expected)
+                self.assertEqual(counts[F1PacketType.FINAL_CLASSIFICATION], 1)
+                self.assertEqual(counts[F1PacketType.LOBBY_INFO], 1)
+                self.assertEqual(counts[F1PacketType.SESSION_HISTORY], counts[F1PacketType.LAP_DATA])
+
+    def test_default_packet_types(self):
+        counts = self._parseAll(SyntheticSession(num_cars=4), 1.0)
+        self.assertEqual(set(counts), SyntheticSession.DEFAULT_PACKET_TYPES)
+
+    def test_motion_rate(self):
+        session = SyntheticSession(num_cars=2, rate_hz=20, motion_rate_hz=120,
+                                   packet_types={F1PacketType.MOTION, F1PacketType.MOTION_EX, F1PacketType.LAP_DATA})
+        packets = list(session.packets(1.0))
+        counts = Counter(PacketHeader(packet[:PacketHeader.PACKET_LEN]).m_packetId for _, packet in packets)
+        self.assertEqual(counts[F1PacketType.MOTION], 120)
+        self.assertEqual(counts[F1PacketType.MOTION_EX], 120)
+        self.assertEqual(counts[F1PacketType.LAP_DATA], 20)
+        self.assertAlmostEqual(packets[-1][0], 119 / 120)
+
+    def test_session_type(self):
+        session = SyntheticSession(num_cars=2, session_type=SessionType24.QUALIFYING_1,
+                                   packet_types=SyntheticSession.ALL_PACKET_TYPES)
+        self.assertNotIn(F1PacketType.TIME_TRIAL, session.m_packet_types)
+        factory = PacketParserFactory({F1PacketType.SESSION}, logging.getLogger(__name__))
+        sessions = [factory.parse(packet) for _, packet in session.packets(0.5)]
+        sessions = [packet for packet in sessions if packet]
+        self.assertTrue(sessions)
+        self.assertEqual(sessions[0].m_sessionType, SessionType24.QUALIFYING_1)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            SyntheticSession(packet_format=2023)
+        with self.assertRaises(ValueError):
+            SyntheticSession(rate_hz=20, motion_rate_hz=50)
+
+@pytest.mark.serial
+class TestLoadGenerator(F1TelemetryUnitTestsBase):
+
+    def test_udp(self):
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(0.2)
+        session = SyntheticSession(num_cars=4, motion_rate_hz=60, packet_types=SyntheticSession.ALL_PACKET_TYPES)
+        generator = LoadGenerator(session, 1.0, "udp", num_rigs=3, port=receiver.getsockname()[1], port_stride=0,
+                                  speed=10.0)
+        try:
+            result = asyncio.run(generator.run())
+            uids = Counter()
+            try:
+                while True:
+                    uids[PacketHeader(receiver.recv(4096)[:PacketHeader.PACKET_LEN]).m_sessionUID] += 1
+            except socket.timeout:
+                pass
+        finally:
+            receiver.close()
+
+        per_rig = sum(result.packet_types.values())
+        self.assertEqual(result.num_packets, 3 * per_rig)
+        self.assertEqual(result.num_errors, 0)
+        self.assertEqual(sorted(uids), [session.m_session_uid + rig for rig in range(3)])
+        self.assertEqual(set(uids.values()), {per_rig})
+        self.assertAlmostEqual(result.target_packets_per_sec, 30 * per_rig)
+        self.assertGreater(result.packets_per_sec, 0)
+        self.assertIn("Achieved rate", formatResult(result, generator))
+
+    def test_tcp(self):
+        async def run():
+            port = _freePort()
+            transport = TcpTransport(port, "127.0.0.1")
+            received = []
+
+            @transport.on_packet
+            async def _on_packet(packet: bytes) -> None:
+                received.append(packet)
+
+            task = asyncio.create_task(transport.run())
+            session = SyntheticSession(num_cars=2)
+            result = await LoadGenerator(session, 1.0, "tcp", port=port, speed=None).run()
+            for _ in range(100):
+                if len(received) == result.num_packets:
+                    break
+                await asyncio.sleep(0.01)
+            await transport.close()
+            task.cancel()
+            return result, received, list(SyntheticSession(num_cars=2).packets(1.0))
+
+        result, received, expected = asyncio.run(run())
+        self.assertIsNone(result.target_packets_per_sec)
+        self.assertEqual(received, [packet for _, packet in expected])
+
+    def test_ipc(self):
+        broker = IpcPubSubBroker(xsub_port=0, xpub_port=0)
+        broker.run_in_thread()
+
+        async def run():
+            transport = IpcTransport("127.0.0.1", broker.xpub_port, "raw-rig-1")
+            received = []
+
+            @transport.on_packet
+            async def _on_packet(packet: bytes) -> None:
+                received.append(packet)
+
+            task = asyncio.create_task(transport.run())
+            await asyncio.sleep(0.1)
+            session = SyntheticSession(num_cars=2)
+            generator = LoadGenerator(session, 1.0, "ipc", num_rigs=2, port=broker.xsub_port,
+                                      ipc_topic="raw-rig-{rig}", speed=4.0)
+            result = await generator.run()
+            await asyncio.sleep(0.2)
+            await transport.close()
+            task.cancel()
+            return result, received, session.m_session_uid
+
+        try:
+            result, received, base_uid = asyncio.run(run())
+        finally:
+            broker.close()
+        self.assertEqual(len(received), sum(result.packet_types.values()))
+        self.assertEqual({PacketHeader(packet[:PacketHeader.PACKET_LEN]).m_sessionUID for packet in received},
+                         {base_uid + 1})
+
+    def test_invalid_args(self):
+        session = SyntheticSession(num_cars=2)
+        with self.assertRaises(ValueError):
+            LoadGenerator(session, 1.0, "carrier-pigeon")
+        with self.assertRaises(ValueError):
+            LoadGenerator(session, 1.0, num_rigs=0)
+        with self.assertRaises(ValueError):
+            LoadGenerator(session, 1.0, speed=0)
@@ -30,7 +30,10 @@ import json
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lib.overtake_analyzer import OvertakeAnalyzer, OvertakeAnalyzerMode, OvertakeRecord, OvertakeRivalryKey
+import random
+
+from lib.overtake_analyzer import (OvertakeAnalyzer, OvertakeAnalyzerMode, OvertakeRecord, OvertakeRivalryKey,
+                                   StreamingOvertakeAnalyzer)
 from tests_base import F1TelemetryUnitTestsBase
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -362,3 +365,58 @@ class TestOvertakeAnalyzerInvalidData(OvertakeAnalyzerUT):
 
         # Clean up the temporary file
         os.remove(temp_file.name)
+
+class TestStreamingOvertakeAnalyzer(OvertakeAnalyzerUT):
+    DRIVERS = ["HAMILTON", "RUSSELL", "PIASTRI", "NORRIS", "LECLERC", "SAINZ", "ALONSO", "STROLL"]
+
+    def _random_records(self, seed, count):
+        rng = random.Random(seed)
+        records = []
+        for row_id in range(count):
+            overtaking, overtaken = rng.sample(self.DRIVERS, 2)
+            lap = row_id // 5 + 1
+            records.append(OvertakeRecord(overtaking, lap, overtaken, lap, row_id))
+        return records
+
+    def test_matches_batch_analyzer(self):
+        """Every intermediate state matches a batch analyzer rebuilt from the same records"""
+        for seed in range(5):
+            records = self._random_records(seed, 60)
+            streaming = StreamingOvertakeAnalyzer()
+            for i, record in enumerate(records):
+                streaming.processOvertakeRecord(record)
+                batch = OvertakeAnalyzer(OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS, records[:i + 1])
+                self.assertEqual(streaming.toJSON(), batch.toJSON())
+                for driver in self.DRIVERS + ["UNKNOWN"]:
+                    self.assertEqual(streaming.toJSON(driver, is_case_sensitive=True),
+                                     batch.toJSON(driver, is_case_sensitive=True))
+
+    def test_case_insensitive_driver_lookup(self):
+        records = self._random_records(7, 30)
+        streaming = StreamingOvertakeAnalyzer(records)
+        batch = OvertakeAnalyzer(OvertakeAnalyzerMode.INPUT_MODE_LIST_OVERTAKE_RECORDS, records)
+        self.assertEqual(streaming.getMostHeatedRivalries("hamilton", is_case_sensitive=False),
+                         batch.getMostHeatedRivalries("hamilton", is_case_sensitive=False))
+
+    def test_empty(self):
+        streaming = StreamingOvertakeAnalyzer()
+        self.assertEqual(streaming.getMostOvertakes(), ([], 0))
+        self.assertEqual(streaming.getMostOvertaken(), ([], 0))
+        self.assertEqual(streaming.getMostHeatedRivalries(), {})
+        self.assertEqual(streaming.getTotalNumberOfOvertakes(), 0)
+
+    def test_clear(self):
+        streaming = StreamingOvertakeAnalyzer(self._random_records(1, 20))
+        streaming.clear()
+        self.assertEqual(streaming.toJSON(), StreamingOvertakeAnalyzer().toJSON())
+
+        record = OvertakeRecord("HAMILTON", 1, "RUSSELL", 1, 0)
+        streaming.processOvertakeRecord(record)
+        self.assertEqual(streaming.getMostOvertakes(), (["HAMILTON"], 1))
+        self.assertEqual(streaming.getTotalNumberOfOvertakes(), 1)
+
+    def test_player_query_does_not_alter_counts(self):
+        streaming = StreamingOvertakeAnalyzer([OvertakeRecord("HAMILTON", 1, "RUSSELL", 1, 0)])
+        streaming.toJSON("NORRIS")
+        self.assertNotIn("NORRIS", streaming.m_overtaking_counts)
+        self.assertNotIn("NORRIS", streaming.m_being_overtaken_counts)
@@ -21,16 +21,24 @@
 # SOFTWARE.
 # pylint: skip-file
 
+import asyncio
 import os
 import random
+import struct
 import sys
 import time
 import tempfile
+import threading
+import unittest.mock
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from lib.packet_cap import F1PacketCapture, F1PktCapFileHeader, F1PktCapMessage
+from apps.dev_tools.compress_pcap import convert
+from lib.packet_cap import (F1PacketCapture, F1PacketRingBuffer,
+                            F1PcapBlockWriter, F1PcapReader,
+                            F1PcapStreamWriter, F1PktCapFileHeader,
+                            F1PktCapMessage)
 from tests_base import F1TelemetryUnitTestsBase
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -431,4 +439,284 @@ class TestF1PacketCaptureCompression(TestF1PacketCapture):
 
         # Clean up
         os.remove(uncompressed_filename)
-        os.remove(compressed_filename)
\ No newline at end of file
+        os.remove(compressed_filename)
+class _SyntheticPacketsMixin:
+
+    HEADER_STRUCT = struct.Struct("<HBBBBBQfIIBB")
+
+    def setUp(self):
+        self.m_created_files = []
+        # 600 packets, cycling through packet IDs 0..5, 10 packets per frame
+        self.packets = []
+        for i in range(600):
+            header = self.HEADER_STRUCT.pack(2025, 25, 1, 0, 1, i % 6, 1234, i / 60.0, i // 10, i // 10, 0, 255)
+            self.packets.append((1000.0 + i * 0.01, header + bytes([i % 256]) * (i % 50)))
+
+    def tearDown(self):
+        for file_name in self.m_created_files:
+            if os.path.exists(file_name):
+                os.remove(file_name)
+
+    def _tmpFile(self) -> str:
+        fd, file_name = tempfile.mkstemp(suffix=".f1pcap")
+        os.close(fd)
+        self.m_created_files.append(file_name)
+        return file_name
+
+    def _writeV2(self, compressed=True, block_size=2048) -> str:
+        file_name = self._tmpFile()
+        with F1PcapBlockWriter(file_name, compressed=compressed, block_size=block_size) as writer:
+            for timestamp, data in self.packets:
+                writer.add(data, timestamp)
+        return file_name
+
+class TestF1PcapV2(_SyntheticPacketsMixin, TestF1PacketCapture):
+
+    def test_round_trip(self):
+        for compressed in [True, False]:
+            with self.subTest(compressed=compressed):
+                file_name = self._writeV2(compressed=compressed)
+                with F1PcapReader(file_name) as reader:
+                    self.assertFalse(reader.is_recovered)
+                    self.assertEqual(reader.m_header.major_version, 2)
+                    self.assertEqual(reader.m_header.is_compressed, compressed)
+                    self.assertEqual(reader.getNumPackets(), len(self.packets))
+                    self.assertGreater(len(reader.m_blocks), 1)
+                    self.assertEqual(list(reader.getPackets()), self.packets)
+
+                # The existing in-memory container reads v2 too
+                capture = F1PacketCapture(file_name=file_name)
+                self.assertEqual(capture.getNumPackets(), len(self.packets))
+                self.assertEqual(list(capture.getPackets()), self.packets)
+
+    def test_dump_to_file_default_is_v2(self):
+        capture = F1PacketCapture(compressed=True)
+        for timestamp, data in self.packets:
+            capture.add(data, timestamp)
+        file_name = self._tmpFile()
+        _, num_packets, num_bytes = capture.dumpToFile(file_name)
+        self.assertEqual(num_packets, len(self.packets))
+        self.assertEqual(num_bytes, os.path.getsize(file_name) - F1PktCapFileHeader.HEADER_LEN)
+        with open(file_name, "rb") as f:
+            header = F1PktCapFileHeader.from_bytes(f.read(F1PktCapFileHeader.HEADER_LEN))
+        self.assertEqual(header.major_version, 2)
+        self.assertEqual(header.num_packets, len(self.packets))
+
+    def test_block_index(self):
+        file_name = self._writeV2()
+        with F1PcapReader(file_name) as reader:
+            expected_first = 0
+            for block in reader.m_blocks:
+                self.assertEqual(block.first_packet, expected_first)
+                first_ts, first_data = self.packets[block.first_packet]
+                self.assertEqual(block.first_timestamp, first_ts)
+                self.assertEqual(block.first_frame_id, block.first_packet // 10)
+                self.assertEqual(sum(block.packet_id_histogram), block.num_packets)
+                self.assertEqual(block.packet_id_histogram[6:], (0,) * 10)
+                expected_first += block.num_packets
+            self.assertEqual(expected_first, len(self.packets))
+
+    def test_random_access(self):
+        file_name = self._writeV2()
+        with F1PcapReader(file_name) as reader:
+            for index in (0, 599, 123, 124, 5, 400):
+                self.assertEqual(reader.getPacket(index), self.packets[index])
+            with self.assertRaises(IndexError):
+                reader.getPacket(600)
+            self.assertEqual(reader.getFirstTimestamp(), self.packets[0][0])
+
+            start_ts = self.packets[321][0]
+            self.assertEqual(list(reader.getPackets(start_timestamp=start_ts)), self.packets[321:])
+
+    def test_recover_truncated_file(self):
+        file_name = self._writeV2()
+        with F1PcapReader(file_name) as reader:
+            blocks = [(block.offset, block.first_packet) for block in reader.m_blocks]
+        # Chop the index and half of the 4th block
+        truncate_at = blocks[3][0] + 10
+        with open(file_name, "r+b") as f:
+            f.truncate(truncate_at)
+
+        with F1PcapReader(file_name) as reader:
+            self.assertTrue(reader.is_recovered)
+            self.assertEqual(reader.getNumPackets(), blocks[3][1])
+            self.assertEqual(list(reader.getPackets()), self.packets[:blocks[3][1]])
+            self.assertEqual(reader.m_blocks[1].first_timestamp, self.packets[blocks[1][1]][0])
+
+    def test_reader_v1(self):
+        capture = F1PacketCapture(compressed=True)
+        for timestamp, data in self.packets:
+            capture.add(data, timestamp)
+        file_name = self._tmpFile()
+        capture.dumpToFile(file_name, major_version=1)
+        with F1PcapReader(file_name) as reader:
+            self.assertEqual(reader.m_header.major_version, 1)
+            self.assertEqual(reader.getNumPackets(), len(self.packets))
+            self.assertEqual(reader.getPacket(42)[1], self.packets[42][1])
+            # v1 stores float32 timestamps
+            self.assertAlmostEqual(reader.getPacket(42)[0], self.packets[42][0], places=3)
+            self.assertEqual([data for _, data in reader.getPackets()], [data for _, data in self.packets])
+
+    def test_not_a_capture(self):
+        file_name = self._tmpFile()
+        with open(file_name, "wb") as f:
+            f.write(b"definitely not a capture file")
+        with self.assertRaises(ValueError):
+            F1PcapReader(file_name)
+
+    def test_convert(self):
+        v2_file = self._writeV2()
+        v1_file = self._tmpFile()
+        v2_again = self._tmpFile()
+        self.assertEqual(convert(v2_file, v1_file, major_version=1), len(self.packets))
+        self.assertEqual(convert(v1_file, v2_again, major_version=2, compressed=False), len(self.packets))
+        with F1PcapReader(v1_file) as reader:
+            self.assertEqual(reader.m_header.major_version, 1)
+        with F1PcapReader(v2_again) as reader:
+            self.assertEqual(reader.m_header.major_version, 2)
+            self.assertFalse(reader.m_header.is_compressed)
+            self.assertEqual([data for _, data in reader.getPackets()], [data for _, data in self.packets])
+
+class TestF1PcapStreamWriter(_SyntheticPacketsMixin, TestF1PacketCapture):
+
+    def test_round_trip(self):
+        file_name = self._tmpFile()
+        with F1PcapStreamWriter(file_name, block_size=2048) as writer:
+            for timestamp, data in self.packets:
+                self.assertTrue(writer.add(data, timestamp))
+        self.assertEqual(writer.getNumPackets(), len(self.packets))
+        self.assertEqual(writer.num_dropped, 0)
+        self.assertFalse(writer.add(b"late"))
+        self.assertEqual(writer.num_dropped, 1)
+
+        with F1PcapReader(file_name) as reader:
+            self.assertFalse(reader.is_recovered)
+            self.assertEqual(list(reader.getPackets()), self.packets)
+
+    def test_periodic_sync_is_recoverable(self):
+        file_name = self._tmpFile()
+        writer = F1PcapStreamWriter(file_name, block_size=1 << 20, sync_interval=0.02)
+        try:
+            for timestamp, data in self.packets:
+                writer.add(data, timestamp)
+
+            # Wait for the writer thread to sync everything, then read the file as if the process had died
+            deadline = time.monotonic() + 5.0
+            num_synced = 0
+            while time.monotonic() < deadline and num_synced != len(self.packets):
+                time.sleep(0.02)
+                with open(file_name, "rb") as f:
+                    header_bytes = f.read(F1PktCapFileHeader.HEADER_LEN)
+                if len(header_bytes) == F1PktCapFileHeader.HEADER_LEN: # Header may not have hit the disk yet
+                    num_synced = F1PktCapFileHeader.from_bytes(header_bytes).num_packets
+            self.assertEqual(num_synced, len(self.packets))
+
+            with F1PcapReader(file_name) as reader:
+                self.assertTrue(reader.is_recovered)
+                self.assertEqual(list(reader.getPackets()), self.packets)
+        finally:
+            writer.close()
+
+    def test_write_error(self):
+        writer = F1PcapStreamWriter(self._tmpFile())
+        writer._m_writer._m_file.close() # Simulate a failing disk
+        writer.add(self.packets[0][1])
+        with self.assertRaises(OSError):
+            writer.close()
+
+    def test_close_after_writer_thread_died(self):
+        writer = F1PcapStreamWriter(self._tmpFile(), queue_size=2)
+        stuck, crash = threading.Event(), threading.Event()
+        def add(*_args):
+            stuck.set()
+            crash.wait()
+            raise RuntimeError("writer crashed")
+        writer._m_writer.add = add
+
+        # Fill the queue while the writer thread is stuck on the first packet, then let it die
+        writer.add(self.packets[0][1])
+        self.assertTrue(stuck.wait(timeout=5.0))
+        while writer.add(self.packets[0][1]):
+            pass
+        with unittest.mock.patch.object(threading, "excepthook"):
+            crash.set()
+            writer._m_thread.join(timeout=5.0)
+            self.assertFalse(writer._m_thread.is_alive())
+        with self.assertRaises(OSError):
+            writer.close()
+
+class TestF1PacketRingBuffer(_SyntheticPacketsMixin, TestF1PacketCapture):
+
+    def _fill(self, ring: F1PacketRingBuffer):
+        for timestamp, data in self.packets:
+            ring.add(data, timestamp)
+
+    def test_holds_everything_when_large_enough(self):
+        ring = F1PacketRingBuffer(1 << 20)
+        self._fill(ring)
+        self.assertEqual(len(ring), len(self.packets))
+        self.assertEqual(list(ring.snapshot().getPackets()), self.packets)
+
+    def test_wrap_around_keeps_newest(self):
+        for budget in (1000, 4096, 9999):
+            ring = F1PacketRingBuffer(budget)
+            self._fill(ring)
+            packets = list(ring.snapshot().getPackets())
+            self.assertGreater(len(packets), 0)
+            self.assertLessEqual(sum(len(data) for _, data in packets), budget)
+            # Must be exactly the newest N packets, in order
+            self.assertEqual(packets, self.packets[-len(packets):])
+
+    def test_metadata_limit(self):
+        ring = F1PacketRingBuffer(256) # Room for 4 packets' metadata
+        for i in range(10):
+            ring.add(bytes([i]) * 8, float(i))
+        self.assertEqual(len(ring), ring.m_max_packets)
+        self.assertEqual(list(ring.snapshot().getPackets()), [(float(i), bytes([i]) * 8) for i in range(6, 10)])
+
+    def test_oversized_and_clear(self):
+        ring = F1PacketRingBuffer(64)
+        ring.add(b"x" * 65, 1.0)
+        self.assertEqual(ring.num_oversized, 1)
+        self.assertEqual(len(ring), 0)
+        ring.add(b"y" * 64, 2.0)
+        self.assertEqual(len(ring), 1)
+        ring.clear()
+        self.assertEqual(len(ring.snapshot()), 0)
+        with self.assertRaises(ValueError):
+            F1PacketRingBuffer(0)
+
+    def test_max_age(self):
+        ring = F1PacketRingBuffer(1 << 20)
+        self._fill(ring)
+        snapshot = ring.snapshot(max_age=1.0)
+        newest = self.packets[-1][0]
+        self.assertEqual(list(snapshot.getPackets()),
+                         [(ts, data) for ts, data in self.packets if ts >= newest - 1.0])
+
+    def test_snapshot_async_concurrent_adds(self):
+        ring = F1PacketRingBuffer(4096)
+        self._fill(ring)
+        expected = list(ring.snapshot().getPackets())
+
+        async def run():
+            task = asyncio.create_task(ring.snapshotAsync(chunk_size=512))
+            await asyncio.sleep(0) # Snapshot copies the first chunk
+            # Overwrite more than the copied chunk while the snapshot is in progress, those packets must be dropped
+            for i in range(15):
+                ring.add(b"\xff" * 100, 2000.0 + i)
+            return await task
+
+        packets = list(asyncio.run(run()).getPackets())
+        self.assertGreater(len(packets), 0)
+        self.assertLess(len(packets), len(expected))
+        self.assertEqual(packets, expected[-len(packets):])
+
+    def test_dump_to_file(self):
+        ring = F1PacketRingBuffer(8192)
+        self._fill(ring)
+        snapshot = asyncio.run(ring.snapshotAsync(chunk_size=1000))
+        file_name, num_packets, _ = snapshot.dumpToFile(self._tmpFile())
+        self.assertEqual(num_packets, len(snapshot))
+        with F1PcapReader(file_name) as reader:
+            self.assertEqual(list(reader.getPackets()), list(snapshot.getPackets()))
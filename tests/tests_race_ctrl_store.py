@@ -0,0 +1,190 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import os
+import sys
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tests_base import F1TelemetryUnitTestsBase
+
+from lib.race_ctrl import (DriverRaceControlManager, MessageType,
+                           RaceCtrlMsgBase, RaceCtrlMsgStore,
+                           SessionRaceControlManager)
+
+def _msg(ts, msg_type=MessageType.OVERTAKE, drivers=(), lap=1) -> RaceCtrlMsgBase:
+    return RaceCtrlMsgBase(timestamp=ts, message_type=msg_type, involved_drivers=list(drivers), lap_number=lap)
+
+class TestRaceCtrlMsgStore(F1TelemetryUnitTestsBase):
+
+    def setUp(self) -> None:
+        self.store = RaceCtrlMsgStore()
+        # 3 laps, 10 messages each, alternating types, drivers 0..4
+        for i in range(30):
+            self.store.append(_msg(
+                float(i),
+                MessageType.OVERTAKE if i % 2 else MessageType.PENALTY,
+                drivers=(i % 5,),
+                lap=1 + i // 10))
+
+    def _ids(self, msgs):
+        return [m._id for m in msgs]
+
+    def test_ids_are_sequential(self):
+        self.assertEqual(len(self.store), 30)
+        self.assertEqual(self.store.last_id, 29)
+        self.assertEqual(self._ids(self.store), list(range(30)))
+        self.assertEqual(self.store[-1]._id, 29)
+        self.assertIsNone(self.store.get(30))
+        with self.assertRaises(IndexError):
+            self.store[30]
+
+    def test_since_id_and_limit(self):
+        self.assertEqual(self._ids(self.store.query(since_id=25)), [26, 27, 28, 29])
+        self.assertEqual(self._ids(self.store.query(since_id=29)), [])
+        self.assertEqual(self._ids(self.store.query(limit=3)), [0, 1, 2])
+        self.assertEqual(self._ids(self.store.query(since_id=10, limit=2)), [11, 12])
+
+    def test_non_positive_limit(self):
+        self.assertEqual(self.store.queryIds(limit=0), [])
+        self.assertEqual(self.store.queryIds(limit=-1), [])
+        self.assertEqual(self.store.query(driver_index=2, limit=0), [])
+
+    def test_filters(self):
+        self.assertEqual(self._ids(self.store.query(driver_index=2)), [2, 7, 12, 17, 22, 27])
+        self.assertEqual(self._ids(self.store.query(lap_number=2)), list(range(10, 20)))
+        self.assertEqual(self._ids(self.store.query(lap_number=2, message_type=MessageType.OVERTAKE)),
+                         [11, 13, 15, 17, 19])
+        self.assertEqual(self._ids(self.store.query(driver_index=2, message_type=MessageType.OVERTAKE, since_id=7)),
+                         [17, 27])
+        self.assertEqual(self._ids(self.store.query(start_time=5.0, end_time=8.0)), [5, 6, 7])
+        self.assertEqual(self.store.query(driver_index=99), [])
+
+    def test_out_of_order_timestamps(self):
+        self.store.append(_msg(4.5))
+        self.assertEqual(self._ids(self.store.query(start_time=4.0, end_time=5.5)), [4, 5, 30])
+
+    def test_clear_keeps_views_live(self):
+        view = self.store.view(1)
+        self.assertEqual(len(view), 6)
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+        self.assertIsNone(self.store.last_id)
+        self.assertEqual(len(view), 0)
+        msg = _msg(0.0, drivers=(1,))
+        self.assertEqual(self.store.append(msg), 0)
+        self.assertIs(view[0], msg)
+        self.assertIn(msg, view)
+
+    def test_spill_to_disk(self):
+        store = RaceCtrlMsgStore(max_in_memory=4)
+        msgs = [_msg(float(i), drivers=(i % 2,), lap=i) for i in range(10)]
+        for msg in msgs:
+            store.append(msg)
+        self.assertEqual(len(store._recent), 4)
+        self.assertEqual(store.first_available_id, 0)
+        self.assertIs(store[9], msgs[9])
+        # Spilled messages come back as equal copies
+        self.assertIsNot(store[0], msgs[0])
+        self.assertEqual(store[0], msgs[0])
+        self.assertEqual([m.lap_number for m in store.query(driver_index=1)], [1, 3, 5, 7, 9])
+        self.assertIn(msgs[2], store)
+        store.clear()
+        self.assertEqual(len(store), 0)
+        self.assertIsNone(store._spill_file)
+        store.close()
+
+    def test_bounded_without_spill(self):
+        store = RaceCtrlMsgStore(max_in_memory=4, spill_to_disk=False)
+        for i in range(10):
+            store.append(_msg(float(i), drivers=(0,)))
+        self.assertEqual(len(store), 10)
+        self.assertEqual(store.first_available_id, 6)
+        self.assertIsNone(store.get(0))
+        self.assertEqual(self._ids(store), [6, 7, 8, 9])
+        self.assertEqual(self._ids(store.query(driver_index=0)), [6, 7, 8, 9])
+        self.assertEqual(self._ids(store.query(since_id=2, limit=2)), [6, 7])
+
+    def test_views_skip_discarded_messages(self):
+        store = RaceCtrlMsgStore(max_in_memory=4, spill_to_disk=False)
+        view = store.view(0)
+        for i in range(10):
+            store.append(_msg(float(i), drivers=(i % 2,)))
+        self.assertEqual(self._ids(view), [6, 8])
+        self.assertEqual(len(view), 2)
+        self.assertEqual(view[-1]._id, 8)
+        self.assertEqual(self._ids(view[:]), [6, 8])
+        with self.assertRaises(IndexError):
+            view[2]
+
+        session_mgr = SessionRaceControlManager(max_in_memory=4, spill_to_disk=False)
+        driver_mgr = DriverRaceControlManager(0)
+        session_mgr.register_driver(0, driver_mgr)
+        for i in range(10):
+            driver_mgr.add_message(_msg(float(i), drivers=(0,)))
+        self.assertEqual(len(driver_mgr.toJSON()), 4)
+
+    def test_indexes_trimmed_without_spill(self):
+        store = RaceCtrlMsgStore(max_in_memory=4, spill_to_disk=False)
+        for i in range(100):
+            store.append(_msg(float(i), drivers=(i % 2,), lap=i))
+        self.assertLessEqual(sum(len(ids) for ids in store._by_driver.values()), 8)
+        self.assertLessEqual(len(store._by_lap), 8)
+        self.assertLessEqual(len(store._by_time), 8)
+        self.assertEqual(self._ids(store.query(driver_index=1)), [97, 99])
+        self.assertEqual(self._ids(store.query(start_time=0.0)), [96, 97, 98, 99])
+        self.assertEqual(self._ids(store.query(lap_number=98)), [98])
+
+    def test_invalid_max_in_memory(self):
+        with self.assertRaises(ValueError):
+            RaceCtrlMsgStore(max_in_memory=0)
+
+class TestSessionRaceControlIncremental(F1TelemetryUnitTestsBase):
+
+    def setUp(self) -> None:
+        self.session_mgr = SessionRaceControlManager()
+        self.drivers = [DriverRaceControlManager(i) for i in range(3)]
+        for i, mgr in enumerate(self.drivers):
+            self.session_mgr.register_driver(i, mgr)
+
+    def test_to_json_since_id(self):
+        for i in range(5):
+            self.session_mgr.add_message(_msg(float(i), drivers=(i % 3,)))
+        self.assertEqual([m["id"] for m in self.session_mgr.toJSON(since_id=2)], [3, 4])
+        self.assertEqual([m["id"] for m in self.session_mgr.toJSON(since_id=0, driver_index=1)], [1, 4])
+        self.assertEqual(self.session_mgr.last_id, 4)
+
+    def test_propagated_message_filed_under_source_driver_only(self):
+        msg = _msg(1.0, drivers=(0, 1))
+        self.drivers[0].add_message(msg)
+        self.assertEqual(len(self.drivers[0].messages), 1)
+        self.assertEqual(len(self.drivers[1].messages), 0)
+        self.assertEqual(self.session_mgr.query(driver_index=0), [msg])
+
+    def test_unregistered_drivers_not_indexed(self):
+        self.session_mgr.add_message(_msg(1.0, drivers=(0, 7)))
+        self.assertEqual(self.session_mgr.query(driver_index=7), [])
+        late_mgr = DriverRaceControlManager(7)
+        self.session_mgr.register_driver(7, late_mgr)
+        self.assertEqual(len(late_mgr.messages), 0)
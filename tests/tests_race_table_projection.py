@@ -0,0 +1,121 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import copy
+import os
+import sys
+
+import orjson
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.backend.intf_layer.race_table_projection import projectRaceTable
+from apps.backend.state_mgmt_layer import SessionState
+from apps.backend.state_mgmt_layer.intf import PeriodicUpdateData
+from apps.backend.telemetry_layer import F1TelemetryHandler
+from apps.dev_tools.replay_benchmark import ReplayBenchmark
+from apps.dev_tools.synthetic_session import SyntheticSession
+from lib.logger import get_null_logger
+from lib.telemetry_manager.factory import PacketParserFactory
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+NUM_CARS = 10
+
+def _syntheticRaceTable():
+    """race-table-update payload a few laps into a synthetic race"""
+    async def run():
+        logger = get_null_logger()
+        settings = ReplayBenchmark().m_settings
+        session_state = SessionState(logger, settings, "dev")
+        handler = F1TelemetryHandler(settings, logger, session_state)
+        await handler.m_manager.m_transport.close()
+        manager = handler.m_manager
+        pkt_factory = PacketParserFactory(set(manager.m_callbacks.keys()), logger)
+        session = SyntheticSession(num_cars=NUM_CARS, rate_hz=5, total_laps=5,
+                                   packet_types=SyntheticSession.ALL_PACKET_TYPES)
+        for _, raw_packet in session.packets(120.0):
+            await manager._processPacket(pkt_factory, raw_packet)
+        return PeriodicUpdateData(session_state, send_position_data=True).toJSON()
+    return asyncio.run(run())
+
+def _key(projection):
+    return orjson.dumps(projection, option=orjson.OPT_SORT_KEYS).decode()
+
+class TestRaceTableProjection(F1TelemetryUnitTestsBase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.m_data = _syntheticRaceTable()
+
+    def setUp(self):
+        self.m_original = copy.deepcopy(self.m_data)
+
+    def tearDown(self):
+        self.assertEqual(self.m_data, self.m_original) # Projection never modifies the shared payload
+
+    def _player(self):
+        return next(entry for entry in self.m_data["table-entries"] if entry["driver-info"]["is-player"])
+
+    def test_empty_projection_is_full_payload(self):
+        self.assertEqual(projectRaceTable(self.m_data, _key({})), self.m_data)
+
+    def test_fields(self):
+        projected = projectRaceTable(self.m_data, _key({"fields": ["lap-info.best-lap", "tyre-info"]}))
+        self.assertEqual(len(projected["table-entries"]), NUM_CARS)
+        for entry, full in zip(projected["table-entries"], self.m_data["table-entries"]):
+            self.assertEqual(set(entry), {"driver-info", "lap-info", "tyre-info"})
+            self.assertEqual(entry["driver-info"], {"index": full["driver-info"]["index"]})
+            self.assertEqual(entry["lap-info"], {"best-lap": full["lap-info"]["best-lap"]})
+            self.assertEqual(entry["tyre-info"], full["tyre-info"])
+        self.assertEqual(projected["circuit"], self.m_data["circuit"])
+        self.assertLess(len(orjson.dumps(projected)), len(orjson.dumps(self.m_data)))
+
+    def test_whole_section_wins_over_keys(self):
+        projected = projectRaceTable(self.m_data, _key({"fields": ["driver-info.position", "driver-info"]}))
+        self.assertEqual(projected["table-entries"][0]["driver-info"], self.m_data["table-entries"][0]["driver-info"])
+
+    def test_session_fields(self):
+        projected = projectRaceTable(self.m_data, _key({"session-fields": ["circuit", "not-a-field"]}))
+        self.assertEqual(set(projected), {"circuit", "table-entries"})
+
+    def test_around_player(self):
+        player_pos = self._player()["driver-info"]["position"]
+        projected = projectRaceTable(self.m_data, _key({"around-player": 2}))
+        positions = sorted(entry["driver-info"]["position"] for entry in projected["table-entries"])
+        self.assertEqual(positions, [pos for pos in range(1, NUM_CARS + 1) if abs(pos - player_pos) <= 2])
+
+    def test_around_spectated_car(self):
+        spectated = next(entry for entry in self.m_data["table-entries"] if not entry["driver-info"]["is-player"])
+        data = dict(self.m_data, **{"is-spectating": True, "spectator-car-index": spectated["driver-info"]["index"]})
+        projected = projectRaceTable(data, _key({"around-player": 0}))
+        self.assertEqual(projected["table-entries"], [spectated])
+
+    def test_time_trial_and_malformed(self):
+        tt_data = {"circuit": "Monza", "tt-data": {"session-best": 1}}
+        self.assertEqual(projectRaceTable(tt_data, _key({"fields": ["lap-info"], "session-fields": []})),
+                         {"tt-data": {"session-best": 1}})
+        self.assertEqual(projectRaceTable(self.m_data, _key({"fields": "lap-info", "around-player": -1})), self.m_data)
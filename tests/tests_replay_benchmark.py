@@ -0,0 +1,83 @@
+
+# MIT License
+#
+# Copyright (c) [2025] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# pylint: skip-file
+
+import asyncio
+import os
+import sys
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.dev_tools.replay_benchmark import ReplayBenchmark, formatResult
+from apps.dev_tools.synthetic_session import SyntheticSession
+from lib.packet_cap import F1PcapReader
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+SAMPLE_CAPTURE = os.path.join(os.path.dirname(__file__), "data", "synthetic_race_10s.f1pcap")
+
+class TestReplayBenchmark(F1TelemetryUnitTestsBase):
+
+    def test_sample_capture_is_reproducible(self):
+        with F1PcapReader(SAMPLE_CAPTURE) as reader:
+            bundled = list(reader.getPackets())
+        self.assertEqual(bundled, list(SyntheticSession().packets(10.0)))
+
+    def test_sample_capture(self):
+        result = ReplayBenchmark().runFile(SAMPLE_CAPTURE)
+        with F1PcapReader(SAMPLE_CAPTURE) as reader:
+            self.assertEqual(result.num_packets, reader.getNumPackets())
+        self.assertEqual(result.num_dropped, 0)
+
+        # Every packet is parsed and handled
+        self.assertEqual(sum(stats.count for stats in result.packet_types.values()), result.num_packets)
+        for stats in result.packet_types.values():
+            self.assertGreater(stats.parse_time, 0.0)
+            self.assertGreater(stats.handler_time, 0.0)
+
+        # The UI tasks ran on the virtual clock, i.e. once per interval of capture time
+        for task in result.periodic_tasks:
+            self.assertAlmostEqual(task.calls, result.virtual_time / task.interval + 1, delta=1)
+        self.assertGreater(result.egress["ipc"]["messages"], 0)
+        self.assertGreater(result.egress["socketio"]["bytes"], 0)
+
+        # Very loose floor, so that only a gross regression fails on a slow CI runner
+        self.assertGreater(result.packets_per_sec, 50)
+        self.assertGreaterEqual(result.peak_rss, result.start_rss)
+        self.assertIn("LAP_DATA", formatResult(result))
+
+    def test_speed(self):
+        packets = list(SyntheticSession(num_cars=4).packets(1.0))
+        result = asyncio.run(ReplayBenchmark(speed=20.0).run(packets))
+        self.assertEqual(result.num_packets, len(packets))
+        # 1s of capture at 20x takes at least 1/20th of a second
+        self.assertGreaterEqual(result.wall_time, result.virtual_time / 20.0)
+
+        with self.assertRaises(ValueError):
+            ReplayBenchmark(speed=0)
+
+    def test_trace_memory(self):
+        packets = list(SyntheticSession(num_cars=2).packets(0.5))
+        result = asyncio.run(ReplayBenchmark(trace_memory=True).run(packets))
+        self.assertGreater(result.traced_peak, 0)
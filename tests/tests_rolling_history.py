@@ -60,6 +60,7 @@ class TestRollingHistory(F1TelemetryUnitTestsBase):
 
         self.assertEqual(len(history), 3)
         self.assertEqual(history.values(), [2, 3, 4])
+        self.assertEqual(history.maxlen, 3)
 
     def test_clear(self) -> None:
         history = RollingHistory[int](maxlen=2)
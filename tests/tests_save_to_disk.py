@@ -33,7 +33,9 @@ from unittest.mock import patch, MagicMock
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from tests_base import F1TelemetryUnitTestsBase
-from lib.save_to_disk import save_json_to_file
+from lib.config import SaveFileFormat
+from lib.save_to_disk import save_json_to_file, serialise_session
+from lib.sectioned_save import SectionedSave
 
 
 class TestSaveRaceInfo(F1TelemetryUnitTestsBase):
@@ -68,3 +70,14 @@ class TestSaveRaceInfo(F1TelemetryUnitTestsBase):
             with patch("aiofiles.open", return_value=mock_open):
                 with self.assertRaises(PermissionError):
                     asyncio.run(save_json_to_file(test_data, test_filename, base_path))
+
+    def test_serialise_session(self):
+        test_data = {"driver": "Leclerc", "laps": [1, 2, 3], 16: "int key"}
+        self.assertEqual(json.loads(serialise_session(test_data)),
+                         {"driver": "Leclerc", "laps": [1, 2, 3], "16": "int key"})
+
+        del test_data[16]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = Path(tmpdir) / "race.f1save"
+            file_path.write_bytes(serialise_session(test_data, SaveFileFormat.BINARY))
+            self.assertEqual(SectionedSave(str(file_path)).load(), test_data)
@@ -0,0 +1,186 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.dev_tools.convert_save import convertDirectory, convertSave
+from apps.save_viewer.session_discovery import find_json_files, read_session_file
+from lib.config import SaveFileFormat
+from lib.save_to_disk import get_save_file_name, save_session_to_file
+from lib.sectioned_save import (SECTIONED_SAVE_SUFFIX, LazySaveDict, SectionedSave,
+                                encodeSectionedSave)
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def _sampleSave():
+    return {
+        "version": "3.0.0",
+        "game-year": 25,
+        "session-info": {"track-id": "Monza", "session-type": "Race", "weather-forecast-samples": [{"t": 0}]},
+        "records": {"fastest": {"lap": {"driver-name": "NORRIS", "time": 81234}}},
+        "overtakes": [],
+        "classification-data": [
+            {
+                "index": i,
+                "driver-name": f"DRIVER{i}",
+                "track-position": i + 1,
+                "lap-time-history": {"lap-history-data": [{"lap-time-in-ms": 80000 + i}] * 3},
+                "per-lap-info": [{"lap-number": n, "car-damage-data": {"fl": n}} for n in range(3)],
+            }
+            for i in range(4)
+        ],
+        "empty-dict": {},
+        "nullable": None,
+    }
+
+class TestSectionedSave(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.data = _sampleSave()
+        self.path = os.path.join(self.tmp_dir.name, "save" + SECTIONED_SAVE_SUFFIX)
+        with open(self.path, "wb") as f:
+            f.write(encodeSectionedSave(self.data))
+
+    def test_round_trip(self):
+        self.assertEqual(SectionedSave(self.path).load(), self.data)
+
+    def test_round_trip_uncompressed(self):
+        with open(self.path, "wb") as f:
+            f.write(encodeSectionedSave(self.data, compress=False))
+        self.assertEqual(SectionedSave(self.path).load(), self.data)
+
+    def test_each_driver_has_own_sections(self):
+        names = SectionedSave(self.path).sectionNames()
+        self.assertIn("classification-data/2", names)
+        self.assertIn("classification-data/2/per-lap-info", names)
+        self.assertIn("session-info", names)
+
+    def test_lazy_reads_only_accessed_sections(self):
+        save = SectionedSave(self.path)
+        with patch.object(save, "readSection", wraps=save.readSection) as read:
+            lazy = save.lazy()
+            self.assertIsInstance(lazy, LazySaveDict)
+            self.assertEqual(lazy["session-info"]["track-id"], "Monza")
+            self.assertEqual(lazy["classification-data"][1]["driver-name"], "DRIVER1")
+            self.assertEqual(lazy["classification-data"][1]["driver-name"], "DRIVER1")
+            read_names = [call.args[0] for call in read.call_args_list]
+        self.assertNotIn("classification-data/1/per-lap-info", read_names)
+        self.assertNotIn("classification-data/0", read_names)
+        self.assertEqual(len(read_names), len(set(read_names)))
+
+    def test_lazy_behaves_like_dict(self):
+        lazy = SectionedSave(self.path).lazy()
+        self.assertEqual(set(lazy), set(self.data))
+        self.assertEqual(len(lazy), len(self.data))
+        self.assertIn("records", lazy)
+        self.assertIsNone(lazy.get("nullable"))
+        self.assertEqual(lazy.get("missing", 1), 1)
+        self.assertEqual(lazy.toDict(), self.data)
+
+    def test_lazy_mutation(self):
+        lazy = SectionedSave(self.path).lazy()
+        lazy["records"] = {"fastest": None}
+        lazy["added"] = 1
+        del lazy["overtakes"]
+        self.assertEqual(lazy["records"], {"fastest": None})
+        self.assertEqual(lazy["added"], 1)
+        self.assertNotIn("overtakes", lazy)
+
+    def test_bad_magic_raises(self):
+        with open(self.path, "r+b") as f:
+            f.write(b"NOTASAVE")
+        with self.assertRaises(ValueError):
+            SectionedSave(self.path)
+
+    def test_truncated_file_raises(self):
+        with open(self.path, "rb") as f:
+            blob = f.read()
+        with open(self.path, "wb") as f:
+            f.write(blob[:12])
+        with self.assertRaises(ValueError):
+            SectionedSave(self.path)
+
+class TestSectionedSaveWriting(F1TelemetryUnitTestsBase):
+
+    def test_file_name_suffix(self):
+        self.assertEqual(get_save_file_name("Race_Monza", SaveFileFormat.JSON), "Race_Monza.json")
+        self.assertEqual(get_save_file_name("Race_Monza", SaveFileFormat.BINARY), "Race_Monza.f1save")
+
+    def test_save_session_binary(self):
+        data = _sampleSave()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = asyncio.run(save_session_to_file(data, "x.f1save", SaveFileFormat.BINARY, Path(tmp_dir)))
+            self.assertEqual(path.parent.name, "race-info")
+            self.assertEqual(SectionedSave(str(path)).load(), data)
+
+    def test_save_session_json(self):
+        data = _sampleSave()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = asyncio.run(save_session_to_file(data, "x.json", SaveFileFormat.JSON, Path(tmp_dir)))
+            self.assertEqual(orjson.loads(path.read_bytes()), data)
+
+class TestSectionedSaveDiscovery(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.root = Path(self.tmp_dir.name)
+        (self.root / "race-info").mkdir()
+        self.json_path = self.root / "race-info" / "Race_Monza_2026_01_01_10_00_00.json"
+        self.json_path.write_bytes(orjson.dumps(_sampleSave()))
+
+    def test_convert_both_ways(self):
+        save_path = convertSave(str(self.json_path))
+        self.assertTrue(save_path.endswith(SECTIONED_SAVE_SUFFIX))
+        back = convertSave(save_path, str(self.root / "back.json"))
+        self.assertEqual(orjson.loads(Path(back).read_bytes()), _sampleSave())
+
+    def test_convert_directory_skips_converted(self):
+        self.assertEqual(len(convertDirectory(str(self.root))), 1)
+        self.assertEqual(convertDirectory(str(self.root)), [])
+
+    def test_discovery_prefers_sectioned(self):
+        (self.root / ".hidden.json").write_bytes(b"{}")
+        self.assertEqual(find_json_files(self.root), [self.json_path.relative_to(self.root)])
+        convertSave(str(self.json_path))
+        files = find_json_files(self.root)
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].suffix, SECTIONED_SAVE_SUFFIX)
+
+    def test_read_session_file(self):
+        save_path = Path(convertSave(str(self.json_path)))
+        self.assertIsInstance(read_session_file(save_path), LazySaveDict)
+        self.assertEqual(read_session_file(save_path)["session-info"], read_session_file(self.json_path)["session-info"])
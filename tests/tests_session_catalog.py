@@ -0,0 +1,294 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import orjson
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.save_viewer.session_catalog import CATALOG_FILE, SessionCatalog, SessionFilter
+from lib.logger import get_null_logger
+from lib.sectioned_save import SECTIONED_SAVE_SUFFIX, encodeSectionedSave
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def _lap(time_ms, valid=True):
+    return {
+        "lap-time-in-ms": time_ms,
+        "lap-valid-bit-flags": 15 if valid else 0,
+        "sector-1-time-in-ms": time_ms // 3 - 100,
+        "sector-2-time-in-ms": time_ms // 3,
+        "sector-3-time-in-ms": time_ms // 3 + 100,
+    }
+
+def _save(session_type, track, formula, player_laps, drivers=("PLAYER", "RIVAL")):
+    return {
+        "session-info": {"session-type": session_type, "track-id": track, "formula": formula},
+        "classification-data": [
+            {
+                "index": i,
+                "is-player": i == 0,
+                "driver-name": name,
+                "session-history": {
+                    "best-lap-time-lap-num": 1 + min(range(len(player_laps)), key=lambda n: player_laps[n]),
+                    "lap-history-data": [_lap(t) for t in player_laps],
+                },
+            }
+            for i, name in enumerate(drivers)
+        ],
+    }
+
+class TestSessionCatalog(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+        self.m_dir = Path(self.m_tmp_dir.name)
+        self.m_catalogs = []
+
+    def tearDown(self):
+        for catalog in self.m_catalogs:
+            catalog.close()
+        self.m_tmp_dir.cleanup()
+
+    def _write(self, name, data):
+        path = self.m_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == SECTIONED_SAVE_SUFFIX:
+            path.write_bytes(encodeSectionedSave(data))
+        else:
+            path.write_bytes(orjson.dumps(data))
+        return path
+
+    def _catalog(self):
+        catalog = SessionCatalog(self.m_dir, get_null_logger())
+        self.m_catalogs.append(catalog)
+        return catalog
+
+    def _sync(self, catalog):
+        async def run():
+            return [remaining async for remaining in catalog.sync()]
+        return asyncio.run(run())
+
+    def _list(self, catalog, limit=None, offset=0, **kwargs):
+        body, total = catalog.list_sessions(SessionFilter(**kwargs), limit, offset)
+        return orjson.loads(body), total
+
+    def _populate(self):
+        self._write("Qualifying_1_Monza_2026_01_01_10_00_00.json",
+                    _save("Qualifying 1", "Monza", "F1 Modern", [82000, 81000, 81500]))
+        self._write("Race_Monza_2026_01_02_10_00_00.json",
+                    _save("Race", "Monza", "F1 Modern", [90000, 85000, 84000, 84500]))
+        self._write("f2/Race_Monza_2026_01_03_10_00_00.json",
+                    _save("Race", "Monza", "F2", [95000, 91000], drivers=("PLAYER", "JUNIOR")))
+        self._write("Race_Silverstone_2026_01_04_10_00_00.json",
+                    _save("Race", "Silverstone", "F1 Classic", [92000, 88000]))
+
+    def test_sync_and_list(self):
+        self._populate()
+        catalog = self._catalog()
+        self.assertEqual(self._sync(catalog), [0])
+
+        sessions, total = self._list(catalog)
+        self.assertEqual(total, 4)
+        self.assertEqual([s["slug"] for s in sessions], [
+            "race-silverstone-2026-01-04-10-00-00",
+            "race-monza-2026-01-03-10-00-00",
+            "race-monza-2026-01-02-10-00-00",
+            "qualifying-1-monza-2026-01-01-10-00-00",
+        ])
+        quali = sessions[-1]
+        self.assertEqual(quali["sessionType"], "Qualifying 1")
+        self.assertEqual(quali["bestLapTimeMs"], 81000)
+        self.assertEqual(quali["lapIndicators"], ["valid", "best", "valid"])
+        self.assertNotIn("_rel_path", quali)
+        self.assertEqual(catalog.m_slug_map["race-monza-2026-01-03-10-00-00"],
+                         str(Path("f2/Race_Monza_2026_01_03_10_00_00.json")))
+
+    def test_filters_and_pagination(self):
+        self._populate()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        sessions, total = self._list(catalog, track="Monza", formula="F1 Classic")
+        self.assertEqual((len(sessions), total), (2, 2)) # All F1 formulas are one group
+        sessions, total = self._list(catalog, session_type="Race", limit=2, offset=1)
+        self.assertEqual(total, 3)
+        self.assertEqual([s["track"] for s in sessions], ["Monza", "Monza"])
+        sessions, total = self._list(catalog, driver="JUNIOR")
+        self.assertEqual([s["formula"] for s in sessions], ["F2"])
+        self.assertEqual(self._list(catalog, driver="NOBODY"), ([], 0))
+
+    def test_track_pbs(self):
+        self._populate()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        pbs = catalog.track_pbs("Monza", "F1 Modern")
+        self.assertEqual(pbs["sessionCount"], 2)
+        self.assertEqual(pbs["bestQualiLapMs"], 81000)
+        self.assertEqual(pbs["bestRaceLapMs"], 84000)
+        self.assertEqual(pbs["bestS1Ms"], 81000 // 3 - 100)
+        self.assertAlmostEqual(pbs["bestRacePaceMs"], (85000 + 84000 + 84500) / 3)
+
+        pbs = catalog.track_pbs("Monza", "F1 Modern", exclude_slug="qualifying-1-monza-2026-01-01-10-00-00")
+        self.assertEqual((pbs["sessionCount"], pbs["bestQualiLapMs"]), (1, 0))
+        self.assertEqual(catalog.track_pbs("Spa", "F1 Modern")["sessionCount"], 0)
+
+    def test_warm_start_parses_nothing(self):
+        self._populate()
+        self._sync(self._catalog())
+        self.assertTrue((self.m_dir / CATALOG_FILE).exists())
+
+        catalog = self._catalog()
+        self.assertEqual(len(catalog.m_slug_map), 4)
+        self.assertEqual(self._sync(catalog), [0])
+        self.assertEqual(len(catalog), 4)
+
+    def test_cold_start_first_yield_after_parse(self):
+        self._populate()
+        catalog = self._catalog()
+
+        async def run():
+            async for _ in catalog.sync():
+                return len(catalog) # The server releases waiting requests at the first yield
+        self.assertEqual(asyncio.run(run()), 4)
+
+    def test_sync_picks_up_offline_changes(self):
+        self._populate()
+        self._sync(self._catalog())
+        (self.m_dir / "Race_Silverstone_2026_01_04_10_00_00.json").unlink()
+        self._write("Race_Spa_2026_01_05_10_00_00.json", _save("Race", "Spa", "F1 Modern", [100000]))
+
+        catalog = self._catalog()
+        self.assertEqual(self._sync(catalog), [0])
+        sessions, _ = self._list(catalog)
+        self.assertEqual([s["track"] for s in sessions], ["Spa", "Monza", "Monza", "Monza"])
+
+    def test_apply_changes(self):
+        self._populate()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        # New file
+        path = self._write("Race_Spa_2026_01_05_10_00_00.json", _save("Race", "Spa", "F1 Modern", [100000]))
+        self.assertTrue(asyncio.run(catalog.apply_changes([path])))
+        self.assertEqual(catalog.track_pbs("Spa", "F1 Modern")["bestRaceLapMs"], 100000)
+        self.assertFalse(asyncio.run(catalog.apply_changes([path]))) # Unchanged
+
+        # Modified file
+        self._write(path.name, _save("Race", "Spa", "F1 Modern", [99000, 98000]))
+        self.assertTrue(asyncio.run(catalog.apply_changes([path])))
+        self.assertEqual(catalog.track_pbs("Spa", "F1 Modern")["bestRaceLapMs"], 98000)
+
+        # Converted to .f1save: the .f1save replaces the .json
+        f1save = self._write(path.with_suffix(SECTIONED_SAVE_SUFFIX).name,
+                             _save("Race", "Spa", "F1 Modern", [99000, 98000]))
+        self.assertTrue(asyncio.run(catalog.apply_changes([f1save])))
+        self.assertEqual(catalog.m_slug_map["race-spa-2026-01-05-10-00-00"], f1save.name)
+        self.assertEqual(len(catalog), 5)
+
+        # Deleted files
+        f1save.unlink()
+        path.unlink()
+        self.assertTrue(asyncio.run(catalog.apply_changes([f1save, path])))
+        self.assertNotIn("race-spa-2026-01-05-10-00-00", catalog.m_slug_map)
+        self.assertEqual(catalog.track_pbs("Spa", "F1 Modern")["sessionCount"], 0)
+        self.assertEqual(self._list(catalog, driver="RIVAL")[1], 3)
+
+    def test_apply_changes_directory(self):
+        self._populate()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        (self.m_dir / "f2").rename(self.m_dir / "feeder")
+        self.assertTrue(asyncio.run(catalog.apply_changes([self.m_dir / "f2", self.m_dir / "feeder"])))
+        self.assertEqual(catalog.m_slug_map["race-monza-2026-01-03-10-00-00"],
+                         str(Path("feeder/Race_Monza_2026_01_03_10_00_00.json")))
+
+    def _populate_races(self):
+        def stint(start, end, compound, wear_per_lap):
+            return {
+                "start-lap": start, "end-lap": end, "stint-length": end - start + 1,
+                "tyre-set-data": {"visual-tyre-compound": compound, "actual-tyre-compound": "C" + compound[0]},
+                "tyre-wear-history": [{"lap-number": n, "average": (n - start + 1) * wear_per_lap}
+                                      for n in range(start - 1, end + 1)],
+            }
+        for day, base in ((1, 90000), (15, 89000), (40, 88000)):
+            data = _save("Race", "Spa", "F1 Modern", [base + 5000] + [base + 100 * n for n in range(1, 8)])
+            for driver in data["classification-data"]:
+                driver["tyre-set-history"] = [stint(1, 4, "Medium", 2.0), stint(5, 8, "Soft", 3.0)]
+            date = f"2026_{1 + day // 31:02d}_{1 + day % 31:02d}"
+            self._write(f"Race_Spa_{date}_10_00_00.json", data)
+
+    def test_lap_progression(self):
+        self._populate_races()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        per_session = catalog.lap_progression(SessionFilter(track="Spa"))
+        self.assertEqual([p["bestLapMs"] for p in per_session], [90100, 89100, 88100])
+        self.assertEqual(per_session[0]["lapCount"], 8)
+        by_month = catalog.lap_progression(SessionFilter(track="Spa"), bucket="month")
+        self.assertEqual([(p["bucket"], p["sessionCount"]) for p in by_month], [("2026-01", 2), ("2026-02", 1)])
+
+        # Clean laps leave out lap 1 and the in/out laps of the pit stop
+        clean = catalog.lap_progression(SessionFilter(track="Spa", since="2026-02-01"), laps="clean")
+        self.assertEqual(clean[0]["lapCount"], 5)
+        self.assertEqual(clean[0]["avgLapMs"], 88000 + 100 * (1 + 2 + 5 + 6 + 7) / 5)
+        self.assertEqual(catalog.lap_progression(SessionFilter(track="Spa", until="2026-01-02")), per_session[:1])
+        with self.assertRaises(ValueError):
+            catalog.lap_progression(bucket="year")
+
+    def test_stint_summary_and_tyre_age(self):
+        self._populate_races()
+        catalog = self._catalog()
+        self._sync(catalog)
+
+        summary = {s["compound"]: s for s in catalog.stint_summary(SessionFilter(track="Spa"))}
+        self.assertEqual(summary["Soft"]["stintCount"], 6) # Both drivers, three races
+        self.assertEqual(summary["Soft"]["sessionCount"], 3)
+        self.assertAlmostEqual(summary["Soft"]["avgWearPerLap"], 3.0)
+        self.assertAlmostEqual(summary["Medium"]["avgWearPerLap"], 2.0)
+        self.assertEqual(summary["Medium"]["maxStintLength"], 4)
+        player = catalog.stint_summary(SessionFilter(track="Spa"), group_by="actual_compound", player_only=True)
+        self.assertEqual({s["compound"]: s["stintCount"] for s in player}, {"CM": 3, "CS": 3})
+
+        curves = catalog.tyre_age_curve(SessionFilter(track="Spa"), compound="Soft")
+        self.assertEqual(list(curves), ["Soft"])
+        self.assertEqual([p["tyreAge"] for p in curves["Soft"]], [2, 3, 4])
+        self.assertEqual(curves["Soft"][0]["lapCount"], 3)
+
+    def test_unparseable_file(self):
+        (self.m_dir / "Race_Monza_2026_01_02_10_00_00.json").write_bytes(b"{not json")
+        catalog = self._catalog()
+        self._sync(catalog)
+        sessions, _ = self._list(catalog)
+        self.assertEqual(sessions[0]["track"], "Monza")
+        self.assertEqual(sessions[0]["validLapCount"], 0)
@@ -0,0 +1,166 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import orjson
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.backend.state_mgmt_layer import SessionJournal, SessionState
+from apps.backend.telemetry_layer import F1TelemetryHandler
+from apps.dev_tools.replay_benchmark import ReplayBenchmark
+from apps.dev_tools.synthetic_session import SyntheticSession
+from lib.logger import get_null_logger
+from lib.telemetry_manager.factory import PacketParserFactory
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+_SESSION_KEYS = ("game-year", "packet-format", "session-info", "custom-markers", "overtakes")
+
+def _dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+def _driverJSON(session_state: SessionState, index: int) -> bytes:
+    return _dumps(session_state.m_driver_data[index].toJSON(index=index))
+
+def _sessionJSON(session_state: SessionState) -> bytes:
+    final_json = session_state.buildFinalClassificationJSON()
+    return _dumps({key: final_json[key] for key in _SESSION_KEYS})
+
+class _RecordingJournal(SessionJournal):
+    """Keeps the JSON of every driver as of its last full record, which is what recovery restores it to"""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.m_driver_json = {}
+
+    def _dumpDriver(self, driver, session_state):
+        # The JSON needs the session history, which arrives a little after the first lap has started
+        if driver.m_packet_copies.m_packet_session_history:
+            self.m_driver_json[driver.m_index] = _driverJSON(session_state, driver.m_index)
+        else:
+            self.m_driver_json.pop(driver.m_index, None)
+        return super()._dumpDriver(driver, session_state)
+
+class TestSessionJournal(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+        self.m_journal_dir = Path(self.m_tmp_dir.name)
+        self.m_settings = ReplayBenchmark().m_settings
+        self.m_logger = get_null_logger()
+
+    def tearDown(self):
+        self.m_tmp_dir.cleanup()
+
+    def _runSession(self, leader_laps: int, checkpoint_interval_laps: int = 10):
+        """Feed a synthetic session through a journaling handler until the leader starts the given lap. The session
+        record is written at that point, the drivers' records as they started their latest laps"""
+        async def run():
+            session_state = SessionState(self.m_logger, self.m_settings, "dev")
+            handler = F1TelemetryHandler(self.m_settings, self.m_logger, session_state)
+            await handler.m_manager.m_transport.close()
+            journal = _RecordingJournal(self.m_logger, self.m_journal_dir, checkpoint_interval_laps)
+            handler.m_journal = journal
+            manager = handler.m_manager
+            pkt_factory = PacketParserFactory(set(manager.m_callbacks.keys()), self.m_logger)
+            session = SyntheticSession(num_cars=4, rate_hz=5, total_laps=leader_laps + 5,
+                                       packet_types=SyntheticSession.ALL_PACKET_TYPES)
+            for _, raw_packet in session.packets(leader_laps * 100.0):
+                await manager._processPacket(pkt_factory, raw_packet)
+                if journal.m_leader_lap >= leader_laps:
+                    break
+            await asyncio.to_thread(journal.close)
+            return session_state, journal
+        return asyncio.run(run())
+
+    def _recover(self, session_uid: int):
+        async def run():
+            session_state = SessionState(self.m_logger, self.m_settings, "dev")
+            journal = SessionJournal(self.m_logger, self.m_journal_dir)
+            recovered = await journal.recover(session_uid, session_state)
+            await asyncio.to_thread(journal.close)
+            return recovered, session_state, journal
+        return asyncio.run(run())
+
+    def _assertRecovered(self, recovered_state, session_state, journal):
+        self.assertEqual(_sessionJSON(recovered_state), _sessionJSON(session_state))
+        self.assertEqual(len(journal.m_driver_json), 4)
+        for index, driver_json in journal.m_driver_json.items():
+            self.assertEqual(_driverJSON(recovered_state, index), driver_json)
+
+    def test_recovery_rebuilds_session(self):
+        session_state, journal = self._runSession(leader_laps=3, checkpoint_interval_laps=2)
+        stats = journal.getStats()
+        self.assertEqual(stats["checkpoints"], 1)
+        # One session record per leader lap, one driver record per lap started by each of the 4 drivers
+        self.assertEqual(stats["record-loop-ms"]["state"]["count"], 3)
+        self.assertGreaterEqual(stats["record-loop-ms"]["driver"]["count"], 4 * 2 + 1)
+        self.assertLessEqual(stats["record-loop-ms"]["driver"]["last"], stats["record-loop-ms"]["driver"]["max"])
+        session_uid = session_state.m_session_info.m_session_uid
+
+        recovered, recovered_state, recovered_journal = self._recover(session_uid)
+        self.assertTrue(recovered)
+        self.assertIsNotNone(recovered_journal.getStats()["last-recovery-ms"])
+        self._assertRecovered(recovered_state, session_state, journal)
+
+    def test_truncated_record_is_ignored(self):
+        session_state, journal = self._runSession(leader_laps=3)
+        session_uid = session_state.m_session_info.m_session_uid
+        journal_path = self.m_journal_dir / f"{session_uid}.journal"
+
+        # A crash in the middle of a write leaves a partial record at the end
+        with open(journal_path, "ab") as f:
+            f.write(b"\x40\x00\x00\x00\x01\x02")
+        recovered, recovered_state, _ = self._recover(session_uid)
+        self.assertTrue(recovered)
+        self._assertRecovered(recovered_state, session_state, journal)
+
+    def test_unknown_session_is_not_recovered(self):
+        session_state, _ = self._runSession(leader_laps=1)
+        session_uid = session_state.m_session_info.m_session_uid
+
+        recovered, recovered_state, _ = self._recover(session_uid + 1)
+        self.assertFalse(recovered)
+        self.assertFalse(any(recovered_state.m_driver_data))
+        # Journals of other sessions are dropped
+        self.assertEqual([path.name for path in self.m_journal_dir.iterdir()], [f"{session_uid + 1}.journal"])
+
+    def test_discard(self):
+        session_state, _ = self._runSession(leader_laps=1)
+        session_uid = session_state.m_session_info.m_session_uid
+
+        async def run():
+            journal = SessionJournal(self.m_logger, self.m_journal_dir)
+            self.assertTrue(await journal.recover(session_uid, SessionState(self.m_logger, self.m_settings, "dev")))
+            journal.discard()
+            await asyncio.to_thread(journal.close)
+        asyncio.run(run())
+        self.assertEqual(list(self.m_journal_dir.iterdir()), [])
@@ -0,0 +1,156 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import asyncio
+import copy
+import os
+import sys
+
+import orjson
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import apps.save_viewer.save_viewer_state as SaveViewerState
+from apps.backend.state_mgmt_layer import SessionState
+from apps.backend.telemetry_layer import F1TelemetryHandler
+from apps.dev_tools.replay_benchmark import ReplayBenchmark
+from apps.dev_tools.synthetic_session import SyntheticSession
+from apps.save_viewer.session_view_cache import (VIEW_DRIVER, VIEW_RACE,
+                                                 VIEW_TELEMETRY,
+                                                 SessionViewCache)
+from lib.logger import get_null_logger
+from lib.telemetry_manager.factory import PacketParserFactory
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+NUM_CARS = 4
+
+def _syntheticSave():
+    """Final classification JSON of a short synthetic race"""
+    async def run():
+        logger = get_null_logger()
+        settings = ReplayBenchmark().m_settings
+        session_state = SessionState(logger, settings, "dev")
+        handler = F1TelemetryHandler(settings, logger, session_state)
+        await handler.m_manager.m_transport.close()
+        manager = handler.m_manager
+        pkt_factory = PacketParserFactory(set(manager.m_callbacks.keys()), logger)
+        session = SyntheticSession(num_cars=NUM_CARS, rate_hz=5, total_laps=2,
+                                   packet_types=SyntheticSession.ALL_PACKET_TYPES)
+        for _, raw_packet in session.packets(250.0):
+            await manager._processPacket(pkt_factory, raw_packet)
+        return orjson.loads(orjson.dumps(session_state.buildFinalClassificationJSON(), option=orjson.OPT_NON_STR_KEYS))
+    return asyncio.run(run())
+
+class TestSessionViewCache(F1TelemetryUnitTestsBase):
+
+    @classmethod
+    def setUpClass(cls):
+        SaveViewerState.init_state(get_null_logger())
+        cls.m_save = _syntheticSave()
+
+    def setUp(self):
+        self.m_loads = 0
+
+    async def _load(self):
+        self.m_loads += 1
+        return copy.deepcopy(self.m_save)
+
+    def _expected(self, view, index=None):
+        data = copy.deepcopy(self.m_save)
+        if view == VIEW_TELEMETRY:
+            return orjson.dumps(SaveViewerState.getTelemetryInfoFrom(data))
+        if view == VIEW_RACE:
+            return orjson.dumps(SaveViewerState.getRaceInfoFrom(data))
+        return orjson.dumps(SaveViewerState.getDriverInfoFrom(data, index))
+
+    def test_first_access_builds_every_view(self):
+        async def run():
+            cache = SessionViewCache(get_null_logger())
+            self.assertEqual(await cache.get("s", 1, VIEW_TELEMETRY, None, self._load), self._expected(VIEW_TELEMETRY))
+            self.assertEqual(await cache.get("s", 1, VIEW_RACE, None, self._load), self._expected(VIEW_RACE))
+            for index in range(NUM_CARS):
+                self.assertEqual(await cache.get("s", 1, VIEW_DRIVER, index, self._load),
+                                 self._expected(VIEW_DRIVER, index))
+            self.assertIsNone(await cache.get("s", 1, VIEW_DRIVER, NUM_CARS + 5, self._load))
+            self.assertTrue(cache.has_session("s", 1))
+            self.assertEqual(self.m_loads, 1)
+            self.assertEqual(cache.get_stats()["misses"], 2) # The first request and the invalid index
+        asyncio.run(run())
+
+    def test_concurrent_cold_requests_share_one_build(self):
+        async def run():
+            cache = SessionViewCache(get_null_logger())
+            bodies = await asyncio.gather(*(cache.get("s", 1, VIEW_DRIVER, index, self._load)
+                                            for index in range(NUM_CARS)))
+            self.assertEqual(bodies, [self._expected(VIEW_DRIVER, index) for index in range(NUM_CARS)])
+            self.assertEqual(self.m_loads, 1)
+        asyncio.run(run())
+
+    def test_new_mtime_replaces_old_views(self):
+        async def run():
+            cache = SessionViewCache(get_null_logger())
+            await cache.get("s", 1, VIEW_RACE, None, self._load)
+            await cache.get("other", 1, VIEW_RACE, None, self._load)
+            await cache.get("s", 2, VIEW_RACE, None, self._load)
+            self.assertEqual(self.m_loads, 3)
+            self.assertFalse(cache.has_session("s", 1))
+            self.assertTrue(cache.has_session("other", 1))
+            self.assertFalse(any(key[:2] == ("s", 1) for key in cache.m_views))
+        asyncio.run(run())
+
+    def test_budget_evicts_and_prefetches_neighbours(self):
+        async def run():
+            driver_size = max(len(self._expected(VIEW_DRIVER, index)) for index in range(NUM_CARS))
+            cache = SessionViewCache(get_null_logger(), max_bytes=2 * driver_size)
+            # The requested view is served even if the budget can't hold the whole session
+            self.assertEqual(await cache.get("s", 1, VIEW_TELEMETRY, None, self._load), self._expected(VIEW_TELEMETRY))
+            self.assertLessEqual(cache.get_stats()["bytes"], 2 * driver_size)
+
+            # An evicted driver view is rebuilt together with its neighbours in classification order
+            first, second, third = cache.m_drivers[("s", 1)][1:4]
+            self.assertEqual(await cache.get("s", 1, VIEW_DRIVER, first, self._load),
+                             self._expected(VIEW_DRIVER, first))
+            self.assertEqual(self.m_loads, 2)
+            self.assertIn(("s", 1, VIEW_DRIVER, second), cache.m_views)
+
+            # A hit prefetches the evicted neighbours in the background
+            await cache.get("s", 1, VIEW_DRIVER, second, self._load)
+            await asyncio.gather(*cache.m_pending.values())
+            self.assertIn(("s", 1, VIEW_DRIVER, third), cache.m_views)
+            self.assertEqual(self.m_loads, 3)
+            self.assertEqual(await cache.get("s", 1, VIEW_DRIVER, third, self._load),
+                             self._expected(VIEW_DRIVER, third))
+            self.assertEqual(self.m_loads, 3)
+        asyncio.run(run())
+
+    def test_unreadable_session(self):
+        async def run():
+            async def load():
+                return None
+            cache = SessionViewCache(get_null_logger())
+            self.assertIsNone(await cache.get("s", 1, VIEW_DRIVER, 0, load))
+            self.assertFalse(cache.has_session("s", 1))
+        asyncio.run(run())
@@ -0,0 +1,242 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import itertools
+import os
+import random
+import sys
+import time
+
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from lib.strategy_simulator import (CompoundModel, LapSample, StrategyInput,
+                                    StrategySimulator, WEAR_EFFECT_S_PER_PCT,
+                                    estimateCompoundPace,
+                                    extrapolateCompoundPace,
+                                    extrapolateWearRate)
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+MAX_WEAR = 75.0
+
+def _make_input(index=0, current_lap=10, total_laps=30, current=None, candidates=None, used=frozenset(),
+                pit_loss=20.0) -> StrategyInput:
+    return StrategyInput(
+        index=index,
+        current_lap=current_lap,
+        total_laps=total_laps,
+        current_compound=current or CompoundModel("Medium", 90.0, 2.0, initial_wear=18.0),
+        candidate_compounds=candidates if candidates is not None else [
+            CompoundModel("Soft", 89.2, 3.0),
+            CompoundModel("Medium", 90.0, 2.0),
+            CompoundModel("Hard", 90.7, 1.4),
+        ],
+        pit_time_loss_s=pit_loss,
+        compounds_used=used,
+    )
+
+def _stint_cost(compound: CompoundModel, laps: int, force_first_lap: bool = False) -> float:
+    if laps == 0:
+        return 0.0
+    if compound.initial_wear + compound.wear_rate * laps > MAX_WEAR and not (force_first_lap and laps == 1):
+        return float("inf")
+    return sum(compound.base_lap_time_s + WEAR_EFFECT_S_PER_PCT * (compound.initial_wear + compound.wear_rate * k)
+               for k in range(1, laps + 1))
+
+def _brute_force_best(entry: StrategyInput) -> float:
+    """Reference implementation - enumerate every legal zero/one/two stop plan"""
+    current = entry.current_compound
+    remaining = entry.remaining_laps
+    candidates = entry.candidate_compounds
+
+    def legal(sequence) -> bool:
+        if current.is_dry:
+            dry = set(entry.compounds_used) | {c.name for c in sequence if c.is_dry}
+            if all(c.is_dry for c in sequence) and len(dry) < 2:
+                return False
+        new_sets = sequence[1:]
+        return all(new_sets.count(c) <= c.num_sets for c in new_sets)
+
+    best = float("inf")
+    if legal([current]):
+        best = _stint_cost(current, remaining, force_first_lap=True)
+    for c2 in candidates:
+        if not legal([current, c2]):
+            continue
+        for n1 in range(1, remaining):
+            best = min(best, _stint_cost(current, n1, True) + _stint_cost(c2, remaining - n1) + entry.pit_time_loss_s)
+    for c2, c3 in itertools.product(candidates, repeat=2):
+        if not legal([current, c2, c3]):
+            continue
+        for n1 in range(1, remaining):
+            for n2 in range(1, remaining - n1):
+                best = min(best, _stint_cost(current, n1, True) + _stint_cost(c2, n2) +
+                           _stint_cost(c3, remaining - n1 - n2) + 2 * entry.pit_time_loss_s)
+    return best
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def test_matches_brute_force():
+    simulator = StrategySimulator(max_wear=MAX_WEAR)
+    for _ in range(20):
+        entry = _make_input(
+            current_lap=random.randint(1, 20),
+            total_laps=random.randint(20, 30),
+            current=CompoundModel("Medium", 90.0, random.uniform(1.0, 3.0), initial_wear=random.uniform(0, 30)),
+            candidates=[
+                CompoundModel("Soft", random.uniform(88.5, 89.5), random.uniform(2.0, 5.0)),
+                CompoundModel("Medium", 90.0, random.uniform(1.0, 3.0), num_sets=random.randint(1, 2)),
+                CompoundModel("Hard", random.uniform(90.3, 91.0), random.uniform(0.5, 2.0)),
+            ],
+            pit_loss=random.uniform(15.0, 25.0),
+        )
+        options = simulator.evaluate([entry])[entry.index]
+        assert options
+        assert options[0].race_time_s == pytest.approx(_brute_force_best(entry))
+        assert options[0].delta_s == 0.0
+
+def test_options_sorted_and_deltas():
+    options = StrategySimulator().evaluate([_make_input()], top_n=5)[0]
+    assert len(options) == 5
+    times = [option.race_time_s for option in options]
+    assert times == sorted(times)
+    for option in options:
+        assert option.delta_s == pytest.approx(option.race_time_s - times[0])
+
+def test_two_compound_rule():
+    # Only mediums used so far - staying out or fitting another medium set is not legal
+    options = StrategySimulator().evaluate([_make_input()], top_n=50)[0]
+    for option in options:
+        assert option.num_stops >= 1
+        assert any(stop.compound != "Medium" for stop in option.stops)
+
+    # Already satisfied - no-stop becomes legal
+    options = StrategySimulator().evaluate([_make_input(current_lap=28, used=frozenset({"Hard"}))])[0]
+    assert options[0].num_stops == 0
+
+def test_wet_race_has_no_two_compound_rule():
+    entry = _make_input(
+        current_lap=25,
+        current=CompoundModel("Inters", 100.0, 1.0, is_dry=False),
+        candidates=[CompoundModel("Wet", 103.0, 0.5, is_dry=False)],
+    )
+    options = StrategySimulator().evaluate([entry])[0]
+    assert options[0].num_stops == 0
+
+def test_wear_limit_forces_stop():
+    # 40 laps at 2%/lap from 18% would reach 98% - a stop is required no matter what
+    entry = _make_input(current_lap=1, total_laps=40, used=frozenset({"Hard"}))
+    options = StrategySimulator(max_wear=MAX_WEAR).evaluate([entry], top_n=50)[0]
+    assert options
+    for option in options:
+        assert option.num_stops >= 1
+        assert option.final_wear <= MAX_WEAR
+
+def test_pit_stops_and_window():
+    entry = _make_input()
+    option = StrategySimulator().evaluate([entry])[0][0]
+    assert option.start_compound == "Medium"
+    laps = [stop.lap for stop in option.stops]
+    assert laps == sorted(laps)
+    assert all(entry.current_lap <= lap < entry.total_laps for lap in laps)
+    low, high = option.pit_window
+    assert low <= laps[0] <= high
+
+def test_final_lap_has_only_zero_stop():
+    entry = _make_input(current_lap=30, used=frozenset({"Soft"}))
+    options = StrategySimulator().evaluate([entry])[0]
+    assert len(options) == 1 and options[0].num_stops == 0
+
+def test_finished_driver_is_skipped():
+    assert StrategySimulator().evaluate([_make_input(current_lap=31)]) == {}
+
+def test_batch_matches_individual():
+    simulator = StrategySimulator()
+    inputs = [
+        _make_input(index=0, current_lap=5, total_laps=50),
+        _make_input(index=3, current_lap=12, total_laps=50, candidates=[CompoundModel("Hard", 90.7, 1.4)]),
+        _make_input(index=7, current_lap=40, total_laps=50, used=frozenset({"Soft"})),
+    ]
+    batch = simulator.evaluate(inputs)
+    for entry in inputs:
+        single = simulator.evaluate([entry])[entry.index]
+        assert [option.toJSON() for option in batch[entry.index]] == [option.toJSON() for option in single]
+
+def test_fuel_only_shifts_race_time():
+    simulator = StrategySimulator()
+    no_fuel = simulator.evaluate([_make_input()])[0]
+    entry = _make_input()
+    entry.fuel_kg = 60.0
+    entry.fuel_rate_kg = 1.8
+    with_fuel = simulator.evaluate([entry])[0]
+    shift = with_fuel[0].race_time_s - no_fuel[0].race_time_s
+    assert shift > 0
+    for a, b in zip(no_fuel, with_fuel):
+        assert b.race_time_s - a.race_time_s == pytest.approx(shift)
+        assert a.stops == b.stops
+
+def test_json_format():
+    option = StrategySimulator().evaluate([_make_input()])[0][0]
+    json_obj = option.toJSON()
+    assert set(json_obj.keys()) == {"start-compound", "num-stops", "stops", "race-time-ms", "delta-ms",
+                                    "pit-window", "final-wear"}
+    assert json_obj["num-stops"] == len(json_obj["stops"])
+    assert isinstance(json_obj["race-time-ms"], int)
+
+def test_full_field_is_fast():
+    simulator = StrategySimulator()
+    inputs = [_make_input(index=i, current_lap=1, total_laps=57) for i in range(22)]
+    simulator.evaluate(inputs) # warm up
+    start = time.perf_counter()
+    result = simulator.evaluate(inputs)
+    elapsed = time.perf_counter() - start
+    assert len(result) == 22
+    assert elapsed < 0.25
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+def test_estimate_compound_pace_drops_outliers_and_corrects():
+    samples = [
+        LapSample(lap_number=lap, lap_time_s=90.0 + 0.03 * lap, compound="Medium", wear=float(lap))
+        for lap in range(2, 12)
+    ]
+    samples.append(LapSample(lap_number=12, lap_time_s=120.0, compound="Medium", wear=12.0)) # traffic
+    samples.append(LapSample(lap_number=13, lap_time_s=80.0, compound="Medium", wear=13.0, is_clean=False))
+    pace = estimateCompoundPace(samples)
+    assert pace == {"Medium": pytest.approx(90.0)}
+
+def test_estimate_compound_pace_fuel_correction():
+    samples = [LapSample(lap_number=2, lap_time_s=91.5, compound="Soft", wear=0.0, fuel_kg=50.0)]
+    assert estimateCompoundPace(samples, fuel_effect_s_per_kg=0.03)["Soft"] == pytest.approx(90.0)
+
+def test_extrapolation_from_nearest_dry_compound():
+    assert extrapolateCompoundPace({"Medium": 90.0}, "Medium") == 90.0
+    assert extrapolateCompoundPace({"Medium": 90.0}, "Soft") < 90.0
+    assert extrapolateCompoundPace({"Medium": 90.0}, "Hard") > 90.0
+    assert extrapolateWearRate({"Medium": 2.0}, "Soft") > 2.0
+    assert extrapolateWearRate({"Medium": 2.0}, "Hard") < 2.0
+    assert extrapolateCompoundPace({"Medium": 90.0}, "Wet") is None
+    assert extrapolateWearRate({}, "Soft") is None
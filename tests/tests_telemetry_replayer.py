@@ -0,0 +1,151 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+# pylint: skip-file
+
+import argparse
+import math
+import os
+import socket
+import sys
+import tempfile
+import time
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.dev_tools.telemetry_replayer import (ReplayPacer, ReplayStats,
+                                               _parse_speed_multiplier,
+                                               send_telemetry_data)
+from lib.packet_cap import F1PacketCapture, F1PcapReader
+from tests_base import F1TelemetryUnitTestsBase
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+SAMPLE_CAPTURE = os.path.join(os.path.dirname(__file__), "data", "synthetic_race_10s.f1pcap")
+
+class TestTelemetryReplayer(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self.m_receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.m_receiver.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        self.m_receiver.bind(("127.0.0.1", 0))
+        self.m_receiver.settimeout(0.1)
+        self.m_port = self.m_receiver.getsockname()[1]
+        self.m_output = []
+        self.m_tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.m_receiver.close()
+        self.m_tmp_dir.cleanup()
+
+    def _drain(self) -> int:
+        count = 0
+        try:
+            while True:
+                self.m_receiver.recv(4096)
+                count += 1
+        except socket.timeout:
+            return count
+
+    def test_udp_replay_max_speed(self):
+        sent, total_bytes, dropped = send_telemetry_data(SAMPLE_CAPTURE, port=self.m_port, udp_mode=True,
+                                                         speed_multiplier=math.inf, printer=self.m_output.append,
+                                                         show_progress=False)
+        self.assertEqual(sent, 843)
+        self.assertGreater(total_bytes, 0)
+        self.assertEqual(dropped, 0)
+        self.assertGreater(self._drain(), 0)
+        self.assertTrue(any(line.startswith("Achieved rate") for line in self.m_output))
+        self.assertFalse(any("jitter" in line for line in self.m_output))
+
+    def test_udp_replay_paced(self):
+        # 10s capture at 20x -> ~0.5s
+        start = time.perf_counter()
+        sent, _, _ = send_telemetry_data(SAMPLE_CAPTURE, port=self.m_port, udp_mode=True, speed_multiplier=20.0,
+                                         printer=self.m_output.append, show_progress=False)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(sent, 843)
+        self.assertGreater(elapsed, 0.4)
+        self.assertEqual(self._drain(), 843)
+        self.assertTrue(any("jitter" in line for line in self.m_output))
+
+    def test_pacer_absolute_deadlines(self):
+        pacer = ReplayPacer(speed_multiplier=2.0, spin_threshold=0.002)
+        first = pacer.wait(100.0)
+        deadlines = [pacer.wait(100.0 + 0.01 * i) for i in range(1, 11)]
+        self.assertAlmostEqual(deadlines[-1] - first, 0.05, places=6)
+        self.assertGreaterEqual(time.perf_counter(), deadlines[-1])
+
+    def test_pacer_fallback_interval(self):
+        """Packets without a usable timestamp are paced at the 60 Hz interval"""
+        pacer = ReplayPacer(speed_multiplier=10.0)
+        first = pacer.wait(None)
+        last = pacer.wait(None)
+        self.assertAlmostEqual(last - first, ReplayPacer.FALLBACK_INTERVAL / 10.0, places=6)
+        self.assertAlmostEqual(pacer.wait(None) - first, 2 * ReplayPacer.FALLBACK_INTERVAL / 10.0, places=6)
+
+    def test_pacer_equal_timestamps_back_to_back(self):
+        """Packets sharing a timestamp (same frame) are due together, as are ones whose timestamp went back"""
+        pacer = ReplayPacer(speed_multiplier=10.0)
+        first = pacer.wait(100.0)
+        self.assertEqual(pacer.wait(100.0), first)
+        self.assertEqual(pacer.wait(99.0), first)
+        self.assertAlmostEqual(pacer.wait(99.5) - first, 0.05, places=6)
+
+    def test_udp_replay_v1_capture(self):
+        # v1 timestamps don't advance within a capture this short, so every packet gets the fallback interval
+        v1_capture = os.path.join(self.m_tmp_dir.name, "v1.f1pcap")
+        capture = F1PacketCapture(compressed=True)
+        with F1PcapReader(SAMPLE_CAPTURE) as reader:
+            for _, packet in reader.getPackets():
+                capture.add(packet, 1.7e9)
+        capture.dumpToFile(v1_capture, major_version=1)
+
+        speed = 40.0
+        start = time.perf_counter()
+        sent, _, _ = send_telemetry_data(v1_capture, port=self.m_port, udp_mode=True, speed_multiplier=speed,
+                                         printer=self.m_output.append, show_progress=False)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(sent, 843)
+        self.assertGreater(elapsed, 842 * ReplayPacer.FALLBACK_INTERVAL / speed)
+        self.assertEqual(self._drain(), 843)
+
+    def test_pacer_invalid_speed(self):
+        with self.assertRaises(ValueError):
+            ReplayPacer(speed_multiplier=0)
+
+    def test_stats(self):
+        stats = ReplayStats(speed_multiplier=1.0)
+        stats.record(0.0, 10.0, 10.0, 100)
+        stats.record(0.1, 10.1, 10.1005, 100)
+        stats.record(0.2, 10.2, 10.2, 100)
+        self.assertEqual(stats.m_num_packets, 3)
+        self.assertAlmostEqual(stats.duration, 0.2)
+        self.assertAlmostEqual(stats.packets_per_sec, 15.0)
+        self.assertAlmostEqual(max(abs(err) for err in stats.m_interval_errors), 0.0005, places=9)
+        self.assertEqual(len(stats.summary()), 3)
+
+    def test_parse_speed_multiplier(self):
+        self.assertEqual(_parse_speed_multiplier("max"), math.inf)
+        self.assertEqual(_parse_speed_multiplier("2.5"), 2.5)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            _parse_speed_multiplier("0")
@@ -25,10 +25,12 @@ import json
 import os
 import sys
 import tempfile
+from pathlib import Path
 
 # Add the parent directory to the Python path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import numpy as np
 from pydantic import ValidationError
 
 from lib.f1_types.packet_2_lap_data import LapData
@@ -610,6 +612,75 @@ class TestGetSector(F1TelemetryUnitTestsBase):
             tracker.load_track_data(self._track_with_sectors({"s1": 500, "s2": 4000}, track_length=3000))
 
 
+# ----------------------------------------------------------------------------------------------------------------------
+
+class TestSegmentIndex(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        # Fractional boundaries, gaps and several segments within one index bucket
+        self.tracker = TrackSegments()
+        self.tracker.load_track_data({
+            "circuit_name": "Index Circuit",
+            "circuit_number": 50,
+            "track_length": 1000,
+            "sectors": {"s1": 300, "s2": 700},
+            "segments": [
+                {"type": "straight", "name": "Start",  "start_m": 0,     "end_m": 100.25},
+                {"type": "corner",   "name": "",       "start_m": 100.5, "end_m": 100.75, "corner_number": 1},
+                {"type": "corner",   "name": "",       "start_m": 100.8, "end_m": 250.0,  "corner_number": 2},
+                {"type": "straight", "name": "Back",   "start_m": 400,   "end_m": 1000},
+            ],
+        })
+
+    def _scalar_ids(self, distances):
+        segments = self.tracker.segments
+        ids = []
+        for d in distances:
+            seg = self.tracker.get_segment_info(d)
+            ids.append(-1 if seg is None else segments.index(seg))
+        return ids
+
+    def test_segment_ids_match_scalar_lookup(self):
+        """get_segment_ids agrees with get_segment_info everywhere, including around boundaries."""
+        distances = np.concatenate([
+            np.linspace(-5, 1005, 4041),
+            [0, 100.25, 100.5, 100.6, 100.75, 100.8, 250.0, 399.99, 400, 1000, np.nan],
+        ])
+        ids = self.tracker.get_segment_ids(distances)
+        self.assertEqual(ids.tolist(), self._scalar_ids(distances))
+
+    def test_segment_ids_boundaries(self):
+        """Several segments starting within the same metre are resolved exactly."""
+        ids = self.tracker.get_segment_ids(np.array([100.1, 100.3, 100.5, 100.76, 100.8, 300.0, -1.0]))
+        self.assertEqual(ids.tolist(), [0, -1, 1, -1, 2, -1, -1])
+
+    def test_segment_ids_preserves_shape(self):
+        """Output has the same shape as the input."""
+        ids = self.tracker.get_segment_ids(np.full((2, 3), 50.0))
+        self.assertEqual(ids.shape, (2, 3))
+        self.assertTrue((ids == 0).all())
+
+    def test_segment_ids_without_segments(self):
+        """An empty tracker returns -1 for every position."""
+        self.assertEqual(TrackSegments().get_segment_ids(np.array([0.0, 10.0])).tolist(), [-1, -1])
+
+    def test_negative_start_segment(self):
+        """Segments starting before the line are still found by both lookups."""
+        tracker = TrackSegments()
+        tracker.load_track_data({
+            "circuit_name": "Neg", "circuit_number": 51, "track_length": 500,
+            "segments": [{"type": "corner", "name": "", "start_m": -20, "end_m": 30, "corner_number": 1}],
+        })
+        self.assertEqual(tracker.get_segment_info(-10).corner_number, 1)
+        self.assertEqual(tracker.get_segment_ids(np.array([-30.0, -10.0, 10.0, 40.0])).tolist(), [-1, 0, 0, -1])
+
+    def test_segments_info_matches_scalar_lookup(self):
+        """get_segments_info returns the same objects as get_segment_info, in input order."""
+        distances = [50.0, 300.0, 100.8, -1.0, float("nan"), 500.0]
+        self.assertEqual(self.tracker.get_segments_info(distances),
+                         [self.tracker.get_segment_info(d) for d in distances])
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 
 _CIRCUIT_A = {
@@ -719,6 +790,17 @@ class TestTrackSegmentsDatabase(F1TelemetryUnitTestsBase):
         seg = self.db.get_segment_info(999, 100)
         self.assertIsNone(seg)
 
+    # --- get_segments_info() ------------------------------------------------------------------
+
+    def test_get_segments_info_all_cars(self):
+        """get_segments_info resolves every position of a known circuit in order."""
+        segs = self.db.get_segments_info(1, [600, 250, 9999])
+        self.assertEqual([seg.name if seg else None for seg in segs], ["Turn One", "Main Straight", None])
+
+    def test_get_segments_info_unknown_circuit_returns_none(self):
+        """get_segments_info returns None for every position of an unknown circuit number."""
+        self.assertEqual(self.db.get_segments_info(999, [100, 200]), [None, None])
+
     # --- Empty directory ----------------------------------------------------------------------
 
     def test_empty_directory_has_zero_circuits(self):
@@ -771,3 +853,69 @@ class TestTrackSegmentsDatabase(F1TelemetryUnitTestsBase):
     def test_get_sector_no_sectors_in_circuit_returns_none(self):
         """get_sector returns None for a circuit with no sector data."""
         self.assertIsNone(self.db.get_sector(1, 100))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+class TestTrackSegmentsDatabaseCache(F1TelemetryUnitTestsBase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tracks_dir = Path(self._tmp.name) / "tracks"
+        self.tracks_dir.mkdir()
+        for circuit in (_CIRCUIT_A, _CIRCUIT_B, _CIRCUIT_C):
+            (self.tracks_dir / f"{circuit['circuit_name']}.json").write_text(json.dumps(circuit), encoding="utf-8")
+        self.cache_path = Path(self._tmp.name) / "tracks.cache"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_cache_is_written(self):
+        """Loading with a cache path writes the cache file."""
+        TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertTrue(self.cache_path.is_file())
+
+    def test_cache_hit_skips_json(self):
+        """A fresh cache is used without reading the JSON files."""
+        TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        # Same size and mtime, unparseable content: only the cache can satisfy this load
+        json_file = self.tracks_dir / "Alpha Circuit.json"
+        stat = json_file.stat()
+        json_file.write_text("x" * stat.st_size, encoding="utf-8")
+        os.utime(json_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        db = TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertEqual(set(db), {1, 2, 3})
+        self.assertEqual(db.get_segment_info(1, 600).corner_number, 1)
+
+    def test_cache_invalidated_on_change(self):
+        """Modifying a JSON file invalidates the cache."""
+        TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        changed = dict(_CIRCUIT_B, circuit_name="Beta Renamed")
+        (self.tracks_dir / "Beta Circuit.json").write_text(json.dumps(changed, indent=2), encoding="utf-8")
+
+        db = TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertEqual(db[2].circuit_name, "Beta Renamed")
+
+    def test_cache_invalidated_on_new_file(self):
+        """Adding a JSON file invalidates the cache."""
+        TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        extra = dict(_CIRCUIT_B, circuit_name="Delta Circuit", circuit_number=4)
+        (self.tracks_dir / "Delta Circuit.json").write_text(json.dumps(extra), encoding="utf-8")
+
+        db = TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertIn(4, db)
+
+    def test_corrupt_cache_is_rebuilt(self):
+        """An unreadable cache is ignored and replaced."""
+        self.cache_path.write_bytes(b"not a pickle")
+        db = TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertEqual(len(db), 3)
+        self.assertEqual(len(TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)), 3)
+
+    def test_invalid_json_not_cached(self):
+        """Validation errors still surface when a cache path is given."""
+        (self.tracks_dir / "bad.json").write_text("{ not-valid-json }", encoding="utf-8")
+        with self.assertRaises(json.JSONDecodeError):
+            TrackSegmentsDatabase(self.tracks_dir, cache_path=self.cache_path)
+        self.assertFalse(self.cache_path.exists())
@@ -0,0 +1,131 @@
+# MIT License
+#
+# Copyright (c) [2026] [Ashwin Natarajan]
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# pylint: skip-file
+
+import logging
+import os
+import sys
+
+import msgpack
+import pytest
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from apps.web_fanout.fanout_web_server import FanoutWebServer
+from lib.config import PngSettings
+from lib.ipc import PngAppId
+from lib.logger import PngLogger
+from lib.web_server import ClientType, fanout_topic
+
+# ----------------------------------------------------------------------------------------------------------------------
+
+logging.setLoggerClass(PngLogger)
+
+
+class _FakeDealer:
+    def __init__(self, reply):
+        self.reply = reply
+        self.requests = []
+
+    async def request(self, dest, topic, data):
+        self.requests.append((dest, topic, data))
+        return self.reply
+
+
+def _make_server(reply=None) -> FanoutWebServer:
+    return FanoutWebServer(
+        settings=PngSettings(),
+        ver_str="0.0.0-test",
+        logger=logging.getLogger("test_web_fanout"),
+        dealer=_FakeDealer(reply),
+    )
+
+
+class TestFanoutWebServer:
+
+    def test_serves_on_fanout_port(self):
+        assert _make_server().m_port == PngSettings().Network.web_fanout_port
+
+    def test_fanout_topics_dont_collide_with_polled_topics(self):
+        # ZMQ subscriptions match by prefix
+        for topic in FanoutWebServer.POLLED_ROUTE_TOPICS.values():
+            assert not fanout_topic(topic).startswith(topic)
+
+    async def test_polled_route_serves_latest_update(self):
+        server = _make_server()
+        client = server.m_app.test_client()
+        response = await client.get('/telemetry-info')
+        assert response.status_code == 503
+
+        server.setLatest('race-table-update', {"current-lap": 3})
+        response = await client.get('/telemetry-info')
+        assert response.status_code == 200
+        assert await response.get_json() == {"current-lap": 3}
+        etag = response.headers["ETag"]
+        response = await client.get('/telemetry-info', headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await client.get('/stream-overlay-info')
+        assert response.status_code == 503
+
+    async def test_request_forwarded_to_core(self):
+        server = _make_server({"ok": True, "data": {"driver": "VER"}})
+        response = await server.m_app.test_client().get('/driver-info?index=1')
+        assert response.status_code == 200
+        assert await response.get_json() == {"driver": "VER"}
+        assert server.m_dealer.requests == [(str(PngAppId.BACKEND), 'driver-info-request', {'index': '1'})]
+
+    @pytest.mark.parametrize("reply, status", [
+        ({"ok": False, "error": "No such driver", "error-type": "NOT_FOUND"}, 404),
+        ({"ok": False, "error": "Missing index", "error-type": "MISSING_PARAM"}, 400),
+        ({"ok": False, "error": "Bad index"}, 400),
+        ({"status": "error", "reason": "timeout"}, 503),
+    ])
+    async def test_forwarded_errors_map_to_http_status(self, reply, status):
+        response = await _make_server(reply).m_app.test_client().get('/strategy-info?index=1')
+        assert response.status_code == status
+        assert "error" in await response.get_json()
+
+    async def test_update_sent_on_packed(self):
+        server = _make_server()
+        server.send_to_clients_of_type = _record_calls(sent := [])
+        server.send_to_clients_interested_in_event = _record_calls(sent)
+        server.is_any_client_interested_in_event = lambda event: event == 'race-table-update'
+        packed = msgpack.packb({"a": 1}, use_bin_type=True)
+
+        await server.forwardUpdate('frontend-update', packed)
+        await server.forwardUpdate('race-table-update', packed)
+        await server.forwardUpdate('stream-overlay-update', packed) # No one interested
+
+        assert sent[0] == (('frontend-update', None, ClientType.RACE_TABLE), {"packed": packed})
+        assert sent[1][0] == ('race-table-update', None)
+        assert sent[1][1]["packed"] is packed
+        assert sent[1][1]["projector"] is not None
+        assert len(sent) == 2
+
+
+def _record_calls(calls):
+    async def record(*args, **kwargs):
+        calls.append((args, kwargs))
+    return record
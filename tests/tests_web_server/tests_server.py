@@ -21,14 +21,22 @@
 # SOFTWARE.
 # pylint: skip-file
 
+import asyncio
+import gzip
 import logging
 from unittest.mock import AsyncMock, MagicMock
 
+import msgpack
+import orjson
 import pytest
+from engineio.async_socket import AsyncSocket
 
 from lib.logger import PngLogger
+from lib.web_server.binary_stream import BinaryStreamHub
+from lib.web_server.client_flow import ClientFlowControl
 from lib.web_server.client_types import ClientType
-from lib.web_server.server import BaseWebServer
+from lib.web_server.http_cache import CompressedVariantCache
+from lib.web_server.server import BINARY_STREAM_PATH, BaseWebServer
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -160,3 +168,479 @@ class TestBaseWebServer:
     def test_validate_int_get_request_param_invalid_values(self, value):
         server = _make_server()
         assert server.validate_int_get_request_param(value, "param") is not None
+
+    # ---- make_conditional ----------------------------------------------------------------------
+
+    @staticmethod
+    def _conditional_server(payload):
+        server = _make_server(enable_socketio=False)
+
+        @server.http_route('/data', conditional=True)
+        async def data():
+            return payload, 200
+
+        @server.http_route('/missing', conditional=True)
+        async def missing():
+            return {"error": "Not found"}, 404
+        return server
+
+    async def test_conditional_route_sets_etag_and_answers_304(self):
+        payload = {"value": 1}
+        client = self._conditional_server(payload).m_app.test_client()
+        response = await client.get('/data')
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+        assert etag.startswith('W/"')
+
+        response = await client.get('/data', headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert await response.get_data() == b""
+        assert response.headers["ETag"] == etag
+
+        payload["value"] = 2
+        response = await client.get('/data', headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    async def test_conditional_route_gzips_for_clients_that_accept_it(self):
+        payload = {"laps": [{"lap": n, "time": 90000 + n} for n in range(200)]}
+        server = self._conditional_server(payload)
+        client = server.m_app.test_client()
+        plain = await client.get('/data')
+        assert "Content-Encoding" not in plain.headers
+        zipped = await client.get('/data', headers={"Accept-Encoding": "gzip, deflate"})
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in zipped.headers["Vary"]
+        assert gzip.decompress(await zipped.get_data()) == await plain.get_data()
+        assert zipped.headers["ETag"] == plain.headers["ETag"]
+        # Generated bodies aren't kept
+        assert len(server.m_gzip_variants) == 0
+
+        small = self._conditional_server({"value": 1}).m_app.test_client()
+        response = await small.get('/data', headers={"Accept-Encoding": "gzip"})
+        assert "Content-Encoding" not in response.headers
+
+    async def test_conditional_route_leaves_errors_alone(self):
+        client = self._conditional_server({}).m_app.test_client()
+        response = await client.get('/missing', headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 404
+        assert "ETag" not in response.headers
+
+    async def test_track_map_is_revalidated_and_compressed_once(self):
+        server = _make_server(enable_socketio=False)
+        client = server.m_app.test_client()
+        path = '/track-maps/f1_2025/Monza.svg'
+        svg = (server.m_base_dir / "assets" / "track-maps" / "f1_2025" / "Monza.svg").read_bytes()
+
+        response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert gzip.decompress(await response.get_data()) == svg
+        assert len(server.m_assets) == 1
+        etag = response.headers["ETag"]
+
+        response = await client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert gzip.decompress(await response.get_data()) == svg
+        assert len(server.m_assets) == 1
+        response = await client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+    async def test_static_urls_carry_content_hash_and_are_immutable(self):
+        server = _make_server(enable_socketio=False)
+        client = server.m_app.test_client()
+        asset = server.m_assets.get(server.m_static_dir, 'js/socketio.js')
+        js = (server.m_static_dir / 'js' / 'socketio.js').read_bytes()
+
+        response = await client.get(f'/static/js/socketio.js?v={asset.etag}', headers={"Accept-Encoding": "gzip"})
+        assert response.status_code == 200
+        assert gzip.decompress(await response.get_data()) == js
+        assert "immutable" in response.headers["Cache-Control"]
+
+        # Stale or missing hash: the browser has to revalidate
+        response = await client.get('/static/js/socketio.js?v=0.0.0')
+        assert await response.get_data() == js
+        assert response.headers["Cache-Control"] == "no-cache"
+        response = await client.get('/static/js/socketio.js', headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304
+
+        for path in ('/static/../server.py', '/static/js/missing.js', '/tyre-icons/../favicon.ico'):
+            assert (await client.get(path)).status_code == 404
+
+    async def test_pages_rendered_once_with_hashed_urls(self):
+        server = _make_server(enable_socketio=False)
+
+        @server.http_route('/page')
+        async def page():
+            return await server.render_page('eng-view.html', live_data_mode=True, version="1.0")
+
+        client = server.m_app.test_client()
+        response = await client.get('/page', headers={"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.headers["Cache-Control"].startswith("no-cache")
+        html = gzip.decompress(await response.get_data()).decode()
+        asset = server.m_assets.get(server.m_static_dir, 'js/engView.js')
+        assert f'/static/js/engView.js?v={asset.etag}' in html
+        assert len(server.m_rendered_pages) == 1
+
+        assert await (await client.get('/page')).get_data(as_text=True) == html
+        assert len(server.m_rendered_pages) == 1
+        async with server.m_app.test_request_context('/'):
+            await server.render_template('eng-view.html', live_data_mode=True, version="2.0")
+        assert len(server.m_rendered_pages) == 2
+
+    async def test_debug_mode_keeps_nothing(self):
+        server = _make_server(enable_socketio=False, debug_mode=True)
+        client = server.m_app.test_client()
+        assert (await client.get('/favicon.ico')).status_code == 200
+        async with server.m_app.test_request_context('/'):
+            await server.render_template('eng-view.html', live_data_mode=True, version="1.0")
+        assert len(server.m_assets) == 0
+        assert len(server.m_rendered_pages) == 0
+
+
+class TestCompressedVariantCache:
+
+    def test_evicts_least_recently_used_beyond_budget(self):
+        cache = CompressedVariantCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        assert cache.get("a") == b"1234"
+        cache.put("c", b"1234")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.m_bytes == 8
+
+    def test_skips_bodies_larger_than_budget(self):
+        cache = CompressedVariantCache(max_bytes=4)
+        cache.put("a", b"12345")
+        assert len(cache) == 0
+
+
+class TestClientFlowControl:
+    """Broadcasts to real Socket.IO rooms, with clients whose Engine.IO send queues are drained by the test"""
+
+    EVENT = "race-table-update"
+
+    @staticmethod
+    async def _connect(server):
+        eio = server.m_sio.eio
+        eio_sid = eio.generate_id()
+        eio.sockets[eio_sid] = AsyncSocket(eio, eio_sid)
+        sid = await server.m_sio.manager.connect(eio_sid, "/")
+        await server.m_sio.enter_room(sid, TestClientFlowControl.EVENT)
+        return sid, eio.sockets[eio_sid].queue
+
+    @staticmethod
+    def _drain(queue, max_packets=None):
+        drained = 0
+        while not queue.empty() and (max_packets is None or drained < max_packets):
+            queue.get_nowait()
+            drained += 1
+
+    async def test_slow_client_backlog_is_bounded_and_recovers(self):
+        server = _make_server()
+        fast_sid, fast_queue = await self._connect(server)
+        slow_sid, slow_queue = await self._connect(server)
+        payload = {"table": [{"position": n, "name": f"DRIVER{n}"} for n in range(20)]}
+
+        # A binary message takes two packets and the slow client writes one packet every other update,
+        # so it can take every fourth update
+        for tick in range(500):
+            await server.send_to_clients_interested_in_event(self.EVENT, payload)
+            self._drain(fast_queue)
+            self._drain(slow_queue, tick % 2)
+
+        clients = server.get_stats()["__CLIENTS__"]
+        assert clients[fast_sid]["sent-msgs"] == 500
+        assert clients[fast_sid]["rate-divisor"] == 1
+        slow = clients[slow_sid]
+        assert slow["max-queued-packets"] <= ClientFlowControl.LAG_DEPTH + 2
+        assert slow["rate-divisor"] == 4
+        assert slow["downshifts"] == 2
+        assert slow["sent-msgs"] + slow["dropped-msgs"] == 500
+        assert slow["queued-bytes"] > 0
+
+        # Once it keeps up again, the rate steps back up
+        for _ in range(4 * ClientFlowControl.UPSHIFT_AFTER):
+            await server.send_to_clients_interested_in_event(self.EVENT, payload)
+            self._drain(slow_queue)
+        slow = server.get_stats()["__CLIENTS__"][slow_sid]
+        assert slow["rate-divisor"] == 1
+        assert slow["upshifts"] == 2
+
+    async def test_disconnect_forgets_client(self):
+        server = _make_server()
+        sid, _ = await self._connect(server)
+        await server.send_to_clients_interested_in_event(self.EVENT, {"a": 1})
+        assert sid in server.get_stats()["__CLIENTS__"]
+        server.m_client_flow.forget(sid)
+        assert "__CLIENTS__" not in server.get_stats()
+
+class TestPayloadProjection:
+    """Clients registering a projection are sent it, built once per distinct projection"""
+
+    EVENT = "race-table-update"
+
+    @staticmethod
+    async def _register(server, projection=None):
+        sid, queue = await TestClientFlowControl._connect(server)
+        data = {"type": str(ClientType.RACE_TABLE), "id": sid}
+        if projection is not None:
+            data["projection"] = projection
+        await server.m_sio._trigger_event("register-client", "/", sid, data)
+        return sid, queue
+
+    @staticmethod
+    def _received(queue):
+        payloads = []
+        while not queue.empty():
+            pkt = queue.get_nowait()
+            if isinstance(pkt.data, bytes):
+                payloads.append(msgpack.unpackb(pkt.data))
+        return payloads
+
+    async def test_clients_grouped_by_projection(self):
+        server = _make_server()
+        full_sid, full_queue = await self._register(server)
+        a1_sid, a1_queue = await self._register(server, {"keep": ["a"], "x": 1})
+        a2_sid, a2_queue = await self._register(server, {"x": 1, "keep": ["a"]}) # Same projection, other key order
+        b_sid, b_queue = await self._register(server, {"keep": ["b"]})
+        assert server.m_client_projections[a1_sid] == server.m_client_projections[a2_sid]
+
+        calls = []
+        def projector(data, projection):
+            calls.append(projection)
+            return {key: data[key] for key in orjson.loads(projection)["keep"]}
+
+        payload = {"a": 1, "b": 2, "c": 3}
+        await server.send_to_clients_interested_in_event(self.EVENT, payload, projector=projector)
+        assert len(calls) == 2
+        assert self._received(full_queue) == [payload]
+        assert self._received(a1_queue) == [{"a": 1}]
+        assert self._received(a2_queue) == [{"a": 1}]
+        assert self._received(b_queue) == [{"b": 2}]
+
+        clients = server.get_stats()["__CLIENTS__"]
+        assert clients[a1_sid]["sent-bytes"] < clients[full_sid]["sent-bytes"]
+
+        # Without a projector, everyone gets the full payload
+        await server.send_to_clients_interested_in_event(self.EVENT, payload)
+        assert all(self._received(queue) == [payload] for queue in (full_queue, a1_queue, b_queue))
+
+    async def test_reregistration_and_disconnect_drop_projection(self):
+        server = _make_server()
+        sid, _ = await self._register(server, {"keep": ["a"]})
+        assert sid in server.m_client_projections
+        await server.m_sio._trigger_event("register-client", "/", sid, {"type": str(ClientType.RACE_TABLE)})
+        assert sid not in server.m_client_projections
+
+        await server.m_sio._trigger_event("register-client", "/", sid,
+                                          {"type": str(ClientType.RACE_TABLE), "projection": {"keep": ["a"]}})
+        await server.m_sio._trigger_event("disconnect", "/", sid, "client disconnect")
+        assert sid not in server.m_client_projections
+
+    async def test_prepacked_payload_sent_as_is(self):
+        server = _make_server()
+        _, full_queue = await self._register(server)
+        _, proj_queue = await self._register(server, {"keep": ["a"]})
+        payload = {"a": 1, "b": 2}
+        packed = msgpack.packb(payload, use_bin_type=True)
+
+        def projector(data, projection):
+            return {key: data[key] for key in orjson.loads(projection)["keep"]}
+
+        await server.send_to_clients_interested_in_event(self.EVENT, None, projector=projector, packed=packed)
+        sent = [pkt.data for pkt in full_queue._queue if isinstance(pkt.data, bytes)]
+        assert sent == [packed]
+        assert self._received(proj_queue) == [{"a": 1}]
+
+        await server.send_to_clients_of_type("frontend-update", None, ClientType.RACE_TABLE, packed=packed)
+        assert self._received(full_queue) == [payload, payload]
+
+class TestEmitBatching:
+    """Clients registering for batches get the events of a loop iteration in one frame"""
+
+    @staticmethod
+    async def _register(server, batch):
+        sid, queue = await TestClientFlowControl._connect(server)
+        await server.m_sio._trigger_event("register-client", "/", sid,
+                                          {"type": str(ClientType.RACE_TABLE), "batch": batch})
+        return sid, queue
+
+    @staticmethod
+    def _received(queue):
+        """(event, payload) of each Socket.IO message, batches unpacked into [[event, payload], ...]"""
+        messages = []
+        while not queue.empty():
+            pkt = queue.get_nowait()
+            if isinstance(pkt.data, str):
+                event = orjson.loads(pkt.data[pkt.data.index("["):])[0]
+            else:
+                messages.append((event, msgpack.unpackb(pkt.data)))
+        return messages
+
+    @staticmethod
+    async def _sendTick(server):
+        await server.send_to_clients_interested_in_event("race-table-update", {"lap": 1})
+        await server.send_to_clients_of_type("frontend-update", {"msg": "overtake"}, ClientType.RACE_TABLE)
+        if server.m_batch_flush:
+            await server.m_batch_flush
+
+    async def test_events_of_a_tick_sent_in_one_frame(self):
+        server = _make_server(batch_emits=True)
+        _, batch_queue = await self._register(server, True)
+        _, plain_queue = await self._register(server, False)
+        await self._sendTick(server)
+
+        assert self._received(plain_queue) == [("race-table-update", {"lap": 1}),
+                                               ("frontend-update", {"msg": "overtake"})]
+        [(event, batch)] = self._received(batch_queue)
+        assert event == "batch"
+        assert [(event, msgpack.unpackb(packed)) for event, packed in batch] == \
+            [("race-table-update", {"lap": 1}), ("frontend-update", {"msg": "overtake"})]
+
+    async def test_single_event_sent_as_is(self):
+        server = _make_server(batch_emits=True)
+        _, queue = await self._register(server, True)
+        await server.send_to_clients_interested_in_event("race-table-update", {"lap": 1})
+        assert self._received(queue) == []
+        await server.m_batch_flush
+        assert self._received(queue) == [("race-table-update", {"lap": 1})]
+
+    async def test_clients_with_same_events_share_the_frame(self):
+        server = _make_server(batch_emits=True)
+        queues = [(await self._register(server, True))[1] for _ in range(3)]
+        await self._sendTick(server)
+        frames = [pkt.data for queue in queues for pkt in queue._queue if isinstance(pkt.data, bytes)]
+        assert len(frames) == 3
+        assert all(frame is frames[0] for frame in frames)
+        assert server.get_stats()["__SOCKET_BATCH_OUT__"]["__EVENTS_2__"]["count"] == 1
+
+    async def test_event_queued_during_flush_is_sent(self):
+        server = _make_server(batch_emits=True)
+        _, queue = await self._register(server, True)
+        emit = server.m_sio.emit
+        async def emitAndQueue(*args, **kwargs):
+            server.m_sio.emit = emit
+            await emit(*args, **kwargs)
+            await server.send_to_clients_of_type("frontend-update", {"msg": "overtake"}, ClientType.RACE_TABLE)
+        server.m_sio.emit = emitAndQueue
+
+        await server.send_to_clients_interested_in_event("race-table-update", {"lap": 1})
+        await server.m_batch_flush
+        assert self._received(queue) == [("race-table-update", {"lap": 1}), ("frontend-update", {"msg": "overtake"})]
+        assert server.m_pending_batches == {}
+
+    async def test_batching_is_opt_in(self):
+        server = _make_server()
+        sid, queue = await self._register(server, True)
+        assert sid not in server.m_batching_sids
+        await self._sendTick(server)
+        assert len(self._received(queue)) == 2
+
+        server = _make_server(batch_emits=True)
+        sid, _ = await self._register(server, True)
+        await server.send_to_clients_interested_in_event("race-table-update", {"lap": 1})
+        await server.m_sio._trigger_event("disconnect", "/", sid, "client disconnect")
+        assert sid not in server.m_batching_sids
+        assert server.m_pending_batches == {}
+
+class TestBinaryStream:
+    """Plain WebSocket endpoint streaming the same updates as Socket.IO"""
+
+    EVENT = "race-table-update"
+
+    @staticmethod
+    async def _subscribe(ws, *topics):
+        hello = orjson.loads(await ws.receive())
+        await ws.send(orjson.dumps({"subscribe": list(topics)}).decode())
+        # Ordering barrier: the subscription is applied once the server reads the next message
+        await ws.send(orjson.dumps({"subscribe": []}).decode())
+        return hello
+
+    @staticmethod
+    async def _settle():
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    async def test_disabled_by_default(self):
+        server = _make_server()
+        assert server.m_binary_stream is None
+        assert not server.is_any_client_interested_in_event(self.EVENT)
+
+    async def test_subscribe_and_receive(self):
+        server = _make_server(binary_stream_topics=[self.EVENT, "other"])
+        payload = {"table-entries": [{"driver-info": {"index": n}} for n in range(20)]}
+        async with server.m_app.test_client().websocket(BINARY_STREAM_PATH) as ws:
+            hello = await self._subscribe(ws, self.EVENT, "unknown-topic")
+            assert hello == {"protocol": 1, "topics": {self.EVENT: 1, "other": 2}}
+            while not server.is_any_client_interested_in_event(self.EVENT):
+                await self._settle()
+            assert not server.is_any_client_interested_in_event("other")
+
+            await server.send_to_clients_interested_in_event(self.EVENT, payload)
+            frame = await ws.receive()
+            assert frame[0] == 1
+            assert msgpack.unpackb(frame[1:]) == payload
+
+            await server.send_to_clients_interested_in_event("other", {"a": 1}) # Not subscribed, not sent
+            await ws.send(orjson.dumps({"unsubscribe": [self.EVENT]}).decode())
+            while server.is_any_client_interested_in_event(self.EVENT):
+                await self._settle()
+
+            clients = server.get_stats()["__BINARY_STREAM_CLIENTS__"]
+            assert list(clients.values())[0]["sent-msgs"] == 1
+        await self._settle()
+        assert "__BINARY_STREAM_CLIENTS__" not in server.get_stats()
+
+    async def test_slow_subscriber_gets_latest(self):
+        hub = BinaryStreamHub([self.EVENT], logging.getLogger("test_web_server"))
+        sent = []
+        unblock = asyncio.Event()
+        incoming = asyncio.Queue()
+
+        class SlowSocket:
+            async def send(self, frame):
+                if isinstance(frame, bytes):
+                    await unblock.wait()
+                sent.append(frame)
+            async def receive(self):
+                return await incoming.get()
+
+        serving = asyncio.create_task(hub.serve(SlowSocket()))
+        await incoming.put(orjson.dumps({"subscribe": [self.EVENT]}))
+        await self._settle()
+        for n in range(100):
+            hub.publish(self.EVENT, msgpack.packb(n))
+            await self._settle()
+        unblock.set()
+        await self._settle()
+
+        # The first update was being written, the other 98 were replaced by the latest
+        assert [msgpack.unpackb(frame[1:]) for frame in sent[1:]] == [0, 99]
+        assert list(hub.get_stats().values())[0]["coalesced-msgs"] == 98
+        serving.cancel()
+        await asyncio.gather(serving, return_exceptions=True)
+        assert not hub.has_subscribers(self.EVENT)
+
+    async def test_malformed_control_messages(self):
+        hub = BinaryStreamHub([self.EVENT], logging.getLogger("test_web_server"))
+        incoming = asyncio.Queue()
+
+        class Socket:
+            async def send(self, frame):
+                pass
+            async def receive(self):
+                return await incoming.get()
+
+        serving = asyncio.create_task(hub.serve(Socket()))
+        for message in (b"not json", b"[1]", b'{"subscribe": 5}', b'{"subscribe": [[1]]}',
+                        b'{"unsubscribe": "race-table-update"}', b'{"subscribe": [null]}'):
+            await incoming.put(message)
+        await incoming.put(orjson.dumps({"subscribe": [self.EVENT]}))
+        await self._settle()
+
+        assert not serving.done()
+        assert hub.has_subscribers(self.EVENT)
+        assert hub.get_stats()["invalid-msgs"] == 6
+        serving.cancel()
+        await asyncio.gather(serving, return_exceptions=True)
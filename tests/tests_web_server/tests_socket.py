@@ -28,7 +28,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from lib.error_status import PngHttpPortInUseError
-from lib.web_server.socket import get_socket_for_uvicorn
+from lib.web_server.socket import get_socket_for_uvicorn, supports_reuse_port
 
 # ----------------------------------------------------------------------------------------------------------------------
 
@@ -79,3 +79,25 @@ class TestGetSocketForUvicorn:
             with pytest.raises(OSError) as exc_info:
                 get_socket_for_uvicorn(port=9999, host="127.0.0.1")
             assert exc_info.value is generic_err
+
+    @pytest.mark.skipif(not supports_reuse_port(), reason="SO_REUSEPORT not supported on this platform")
+    def test_reuse_port_shares_the_port(self):
+        first = get_socket_for_uvicorn(port=0, host="127.0.0.1", reuse_port=True)
+        try:
+            port = first.getsockname()[1]
+            second = get_socket_for_uvicorn(port=port, host="127.0.0.1", reuse_port=True)
+            try:
+                assert second.getsockname()[1] == port
+            finally:
+                second.close()
+        finally:
+            first.close()
+
+    @pytest.mark.skipif(not supports_reuse_port(), reason="SO_REUSEPORT not supported on this platform")
+    def test_reuse_port_needs_every_socket_to_opt_in(self):
+        first = get_socket_for_uvicorn(port=0, host="127.0.0.1", reuse_port=True)
+        try:
+            with pytest.raises(PngHttpPortInUseError):
+                get_socket_for_uvicorn(port=first.getsockname()[1], host="127.0.0.1")
+        finally:
+            first.close()